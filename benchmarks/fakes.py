@@ -0,0 +1,362 @@
+"""Local stand-ins for the platform APIs, feeds and media hosts used by the benchmarks."""
+
+from __future__ import annotations
+
+import email.utils
+import io
+import itertools
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator
+from urllib.parse import parse_qs, urlsplit
+
+# Hosts the platform clients call; requests to them are served locally.
+PLATFORM_HOSTS = (
+    "graph.facebook.com",
+    "graph-video.facebook.com",
+    "graph.instagram.com",
+    "graph.threads.net",
+    "api.linkedin.com",
+    "www.linkedin.com",
+    "open.tiktokapis.com",
+    "open-upload.tiktokapis.com",
+)
+
+
+@dataclass(frozen=True)
+class Conditions:
+    """Network and platform behaviour of the fake servers."""
+
+    latency: float = 0.05  # Seconds added to every API response
+    bandwidth: float | None = 8 * 1024 * 1024  # Bytes per second for media transfers, None for unlimited
+    processing: float = 1.5  # Seconds a video container stays in progress
+
+
+def make_image(size: int = 1080) -> bytes:
+    """Return a JPEG with enough detail to weigh like a real photo."""
+    from PIL import Image
+
+    noise = Image.effect_noise((size, size), 64).convert("RGB")
+    buffer = io.BytesIO()
+    noise.save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
+def make_video(seconds: int = 4, fps: int = 24, width: int = 540, height: int = 960) -> bytes:
+    """Return a short vertical MP4 accepted by every platform's video limits."""
+    import cv2
+    import numpy
+
+    descriptor, path = tempfile.mkstemp(suffix=".mp4")
+    os.close(descriptor)
+    try:
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+        for frame in range(seconds * fps):
+            image = numpy.full((height, width, 3), frame * 255 // (seconds * fps), dtype=numpy.uint8)
+            writer.write(image)
+        writer.release()
+        with open(path, "rb") as stream:
+            return stream.read()
+    finally:
+        os.remove(path)
+
+
+class FakeServer(ThreadingHTTPServer):
+    """HTTP server emulating the platform APIs, one RSS feed and a media host."""
+
+    daemon_threads = True
+
+    def __init__(self, conditions: Conditions):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.conditions = conditions
+        self.media = {"image.jpg": (make_image(), "image/jpeg"), "video.mp4": (make_video(), "video/mp4")}
+        self.containers: dict[str, float] = {}
+        self.requests = 0
+        self._ids = itertools.count(17841400000000000)
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self) -> "FakeServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def new_id(self, ready_in: float = 0.0) -> str:
+        with self._lock:
+            object_id = str(next(self._ids))
+            self.containers[object_id] = time.monotonic() + ready_in
+            return object_id
+
+    def is_ready(self, object_id: str) -> bool:
+        return time.monotonic() >= self.containers.get(object_id, 0.0)
+
+    def feed(self, items: int = 5) -> bytes:
+        now = email.utils.formatdate(time.time(), usegmt=True)
+        entries = "".join(
+            f"<item><title>Benchmark entry {index}</title><link>{self.url}/page/{index}</link>"
+            f"<guid>{self.url}/page/{index}</guid><pubDate>{now}</pubDate>"
+            f'<enclosure url="{self.url}/media/image.jpg?entry={index}" type="image/jpeg" length="0"/></item>'
+            for index in range(items)
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Benchmark</title>'
+            f"<link>{self.url}/</link><description>Benchmark feed</description>{entries}</channel></rss>"
+        ).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._handle()
+
+    def do_HEAD(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_PUT(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def _handle(self):
+        with self.server._lock:
+            self.server.requests += 1
+        parts = urlsplit(self.path)
+        body = self._read_body()
+        segments = [segment for segment in parts.path.split("/") if segment]
+        if segments and segments[0] in PLATFORM_HOSTS:
+            time.sleep(self.server.conditions.latency)
+            host, path = segments[0], parts.path[len(segments[0]) + 1 :]
+            params = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+            params.update(_form(body, self.headers.get("Content-Type", "")))
+            for pattern, route in ROUTES:
+                match = re.fullmatch(pattern, f"{self.command} {host}{path}")
+                if match:
+                    status, payload, headers = route(self.server, params, *match.groups())
+                    return self._send_json(status, payload, headers)
+            return self._send_json(404, {"error": {"message": f"No fake route for {self.command} {host}{path}"}})
+        if segments[:1] == ["media"] and len(segments) == 2 and segments[1] in self.server.media:
+            content, content_type = self.server.media[segments[1]]
+            return self._send(200, content, content_type, throttle=True)
+        if segments == ["feed.xml"]:
+            return self._send(200, self.server.feed(), "application/rss+xml")
+        if segments[:1] == ["page"]:
+            page = (
+                f'<html><head><title>Page</title><meta property="og:title" content="Page {segments[-1]}">'
+                f'<meta property="og:image" content="{self.server.url}/media/image.jpg"></head><body></body></html>'
+            )
+            return self._send(200, page.encode("utf-8"), "text/html")
+        return self._send_json(404, {"error": {"message": f"Not found: {self.path}"}})
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        bandwidth = self.server.conditions.bandwidth
+        if bandwidth and length > 64 * 1024:
+            time.sleep(length / bandwidth)
+        return body
+
+    def _send_json(self, status: int, payload, headers: dict | None = None):
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json", headers)
+
+    def _send(self, status: int, content: bytes, content_type: str, headers: dict | None = None, throttle=False):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command == "HEAD":
+            return
+        bandwidth = self.server.conditions.bandwidth if throttle else None
+        if not bandwidth:
+            self.wfile.write(content)
+            return
+        chunk = max(int(bandwidth / 20), 16 * 1024)
+        for offset in range(0, len(content), chunk):
+            self.wfile.write(content[offset : offset + chunk])
+            time.sleep(min(chunk, len(content) - offset) / bandwidth)
+
+
+def _form(body: bytes, content_type: str) -> dict:
+    if not body:
+        return {}
+    if content_type.startswith("application/json"):
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return {}
+        return payload if isinstance(payload, dict) else {}
+    if content_type.startswith("application/x-www-form-urlencoded"):
+        return {key: values[-1] for key, values in parse_qs(body.decode("utf-8")).items()}
+    return {}
+
+
+Route = Callable[..., tuple]
+
+TOKEN = {"access_token": "bench-token", "token_type": "bearer", "expires_in": 5184000}
+PROFILE = {"id": "17841400000000001", "username": "bench", "name": "Bench", "sub": "bench"}
+
+
+def _ok(payload, headers=None):
+    return 200, payload, headers or {}
+
+
+def _token(server, params):
+    return _ok({**TOKEN, "refresh_token": params.get("refresh_token", "bench-refresh")})
+
+
+def _profile(server, params, *_):
+    return _ok(PROFILE)
+
+
+def _graph_container(server, params, *_):
+    # Video containers are transcoded before they can be published; images are ready at once.
+    is_video = params.get("media_type") in ("VIDEO", "REELS") or "video_url" in params
+    return _ok({"id": server.new_id(server.conditions.processing if is_video else 0.0)})
+
+
+def _graph_status(server, params, object_id):
+    status = "FINISHED" if server.is_ready(object_id) else "IN_PROGRESS"
+    return _ok({"id": object_id, "status_code": status, "status": status})
+
+
+def _graph_publish(server, params, *_):
+    creation_id = params.get("creation_id", "")
+    if not server.is_ready(creation_id):
+        return 400, {"error": {"message": "Media ID is not available", "code": 9007}}, {}
+    return _ok({"id": server.new_id()})
+
+
+def _linkedin_image(server, params):
+    image = f"urn:li:image:{server.new_id()}"
+    upload = f"https://api.linkedin.com/mediaUpload/{image}"
+    return _ok({"value": {"uploadUrl": upload, "image": image, "uploadUrlExpiresAt": 0}})
+
+
+def _linkedin_video(server, params):
+    video = f"urn:li:video:{server.new_id(server.conditions.processing)}"
+    size = int(params.get("initializeUploadRequest", {}).get("fileSizeBytes") or 0)
+    part = 4 * 1024 * 1024
+    instructions = [
+        {
+            "uploadUrl": f"https://api.linkedin.com/mediaUpload/{video}/{index}",
+            "firstByte": offset,
+            "lastByte": min(offset + part, size) - 1,
+        }
+        for index, offset in enumerate(range(0, max(size, 1), part))
+    ]
+    return _ok({"value": {"video": video, "uploadInstructions": instructions, "uploadToken": ""}})
+
+
+def _linkedin_upload(server, params, urn):
+    # Image uploads answer 201; video parts answer 200 with the ETag the finalize call needs.
+    if urn.startswith("urn:li:image:"):
+        return 201, {}, {}
+    return _ok({}, {"ETag": f'"{server.new_id()}"'})
+
+
+def _linkedin_status(server, params, urn):
+    object_id = urn.rsplit(":", 1)[-1].replace("%3A", ":").rsplit(":", 1)[-1]
+    return _ok({"id": urn, "status": "AVAILABLE" if server.is_ready(object_id) else "PROCESSING"})
+
+
+def _linkedin_post(server, params):
+    return 201, {}, {"x-restli-id": f"urn:li:share:{server.new_id()}"}
+
+
+def _tiktok_creator(server, params):
+    return _ok(
+        {
+            "data": {
+                "creator_username": "bench",
+                "creator_nickname": "Bench",
+                "privacy_level_options": ["PUBLIC_TO_EVERYONE", "SELF_ONLY"],
+                "comment_disabled": False,
+                "duet_disabled": False,
+                "stitch_disabled": False,
+                "max_video_post_duration_sec": 600,
+            },
+            "error": {"code": "ok", "message": ""},
+        }
+    )
+
+
+def _tiktok_init(server, params):
+    publish_id = f"v_pub_url~{server.new_id(server.conditions.processing)}"
+    return _ok({"data": {"publish_id": publish_id}, "error": {"code": "ok", "message": ""}})
+
+
+def _tiktok_status(server, params):
+    object_id = params.get("publish_id", "").rsplit("~", 1)[-1]
+    status = "PUBLISH_COMPLETE" if server.is_ready(object_id) else "PROCESSING_DOWNLOAD"
+    return _ok({"data": {"status": status, "publicaly_available_post_id": [object_id]}, "error": {"code": "ok"}})
+
+
+# (pattern matched against "METHOD host/path", handler) in priority order.
+ROUTES: list[tuple[str, Route]] = [
+    (r"POST [\w.-]+/(?:v[\d.]+/)?(?:oauth/)?(?:access_token|refresh_access_token)", _token),
+    (r"GET [\w.-]+/(?:v[\d.]+/)?(?:oauth/)?(?:access_token|refresh_access_token)", _token),
+    (r"GET graph\.threads\.net/refresh_access_token", _token),
+    (r"POST www\.linkedin\.com/oauth/v2/accessToken", _token),
+    (r"POST open\.tiktokapis\.com/v2/oauth/token/", _token),
+    (r"GET graph[\w.-]+/(?:v[\d.]+/)?me", _profile),
+    (r"POST graph[\w.-]+/(?:v[\d.]+/)?[\w]+/(?:media|threads)", _graph_container),
+    (r"POST graph[\w.-]+/(?:v[\d.]+/)?[\w]+/(?:media_publish|threads_publish)", _graph_publish),
+    (r"GET graph[\w.-]+/(?:v[\d.]+/)?(\d+)", _graph_status),
+    (r"GET graph[\w.-]+/(?:v[\d.]+/)?[\w/]+", _profile),
+    (r"GET api\.linkedin\.com/(?:v2|rest)/(?:userinfo|me)", _profile),
+    (r"POST api\.linkedin\.com/rest/images", _linkedin_image),
+    (r"POST api\.linkedin\.com/rest/videos", _linkedin_video),
+    (r"PUT api\.linkedin\.com/mediaUpload/(.+)", _linkedin_upload),
+    (r"GET api\.linkedin\.com/rest/(?:images|videos)/(.+)", _linkedin_status),
+    (r"POST api\.linkedin\.com/rest/posts", _linkedin_post),
+    (r"POST open\.tiktokapis\.com/v2/post/publish/creator_info/query/", _tiktok_creator),
+    (r"POST open\.tiktokapis\.com/v2/post/publish/(?:video|content)/init/", _tiktok_init),
+    (r"POST open\.tiktokapis\.com/v2/post/publish/status/fetch/", _tiktok_status),
+]
+
+
+@contextmanager
+def redirect_platforms(server: FakeServer) -> Iterator[None]:
+    """Send every ``requests`` call for a platform host to the fake server instead."""
+    from requests.adapters import HTTPAdapter
+
+    original = HTTPAdapter.send
+
+    def send(adapter, request, *args, **kwargs):
+        parts = urlsplit(request.url)
+        if parts.hostname in PLATFORM_HOSTS:
+            query = f"?{parts.query}" if parts.query else ""
+            request.url = f"{server.url}/{parts.hostname}{parts.path}{query}"
+        elif parts.hostname != "127.0.0.1":
+            raise ConnectionError(f"Benchmarks run offline; unexpected request to {parts.hostname}")
+        return original(adapter, request, *args, **kwargs)
+
+    HTTPAdapter.send = send
+    try:
+        yield
+    finally:
+        HTTPAdapter.send = original
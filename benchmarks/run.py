@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""Measure end-to-end latency and throughput of Agoras actions against local fake platforms."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from fakes import Conditions, FakeServer, redirect_platforms
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+# Default regression threshold: a scenario fails when its mean latency grows,
+# or its throughput drops, by more than this fraction of the baseline. p50 and
+# p95 are reported but not gated: with a handful of operations contending for
+# per-client spacing they move between runs more than the mean does.
+TOLERANCE = 0.25
+
+# Client options of a fake account per network; each account gets its own suffix.
+ACCOUNTS: dict[str, dict[str, str]] = {
+    "threads": {
+        "threads_app_id": "bench-app",
+        "threads_app_secret": "bench-secret",
+        "threads_refresh_token": "bench-token",
+    },
+    "instagram": {
+        "instagram_client_id": "bench-app",
+        "instagram_client_secret": "bench-secret",
+        "instagram_refresh_token": "bench-token",
+        "instagram_object_id": "17841400000000001",
+    },
+    "linkedin": {
+        "linkedin_client_id": "bench-app",
+        "linkedin_client_secret": "bench-secret",
+        "linkedin_access_token": "bench-token",
+        "linkedin_object_id": "bench",
+    },
+    "tiktok": {
+        "tiktok_username": "bench",
+        "tiktok_client_key": "bench-app",
+        "tiktok_client_secret": "bench-secret",
+        "tiktok_refresh_token": "bench-token",
+        "tiktok_privacy_status": "SELF_ONLY",
+    },
+}
+
+# Networks each scenario runs against: the platforms whose flows differ the most.
+NETWORKS = {
+    "post": ("threads", "instagram", "linkedin"),
+    "video": ("threads", "instagram", "linkedin", "tiktok"),
+    "feed-publish": ("threads",),
+    "schedule-run": ("threads",),
+}
+
+
+@dataclass(frozen=True)
+class Load:
+    """How much work a scenario runs."""
+
+    count: int = 16  # Measured operations
+    concurrency: int = 4  # Operations in flight
+    accounts: int = 2  # Accounts the operations are spread over
+
+
+def _isolate() -> str:
+    # Tokens, checkpoints, journals and rate limits go to a throwaway directory, never ~/.agoras.
+    state = tempfile.mkdtemp(prefix="agoras-bench-")
+    os.environ["HOME"] = state
+    os.environ["AGORAS_STORAGE_DIR"] = state
+    os.environ["THREADS_USER_ID"] = "17841400000000001"
+    for name in ("AGORAS_METRICS_LOG", "AGORAS_METRICS_TEXTFILE", "AGORAS_IDEMPOTENCY_KEY"):
+        os.environ.pop(name, None)
+    return state
+
+
+def _account(network: str, index: int, load: Load) -> dict[str, str]:
+    suffix = index % load.accounts
+    account = dict(ACCOUNTS[network])
+    for key in account:
+        if key.endswith(("_app_id", "_client_id", "_client_key")):
+            account[key] = f"{account[key]}-{suffix}"
+    return account
+
+
+def _post_job(server: FakeServer, network: str, index: int, load: Load) -> dict[str, Any]:
+    return {
+        "network": network,
+        "action": "post",
+        "status_text": f"Benchmark post {index} {time.time_ns()}",
+        "status_link": f"{server.url}/page/{index}",
+        "status_image_url_1": f"{server.url}/media/image.jpg?post={index}",
+        **_account(network, index, load),
+    }
+
+
+def _video_job(server: FakeServer, network: str, index: int, load: Load) -> dict[str, Any]:
+    return {
+        "network": network,
+        "action": "video",
+        "status_text": f"Benchmark video {index} {time.time_ns()}",
+        "video_url": f"{server.url}/media/video.mp4?video={index}",
+        "video_title": f"Benchmark video {index}",
+        **_account(network, index, load),
+    }
+
+
+async def _timed(timings: list[float], operation: Awaitable[Any]) -> Any:
+    start = time.perf_counter()
+    result = await operation
+    timings.append(time.perf_counter() - start)
+    return result
+
+
+async def _pooled(server: FakeServer, network: str, load: Load, make_job) -> list[float]:
+    from agoras.cli.platform_runner import create_platform_instance
+    from agoras.core.concurrency import gather_bounded
+    from agoras.core.pool import ClientPool
+
+    pool = ClientPool(create_platform_instance, max_idle=None)
+    timings: list[float] = []
+    try:
+        # Log every account in first, like a long-running process does once.
+        for account in range(load.accounts):
+            await pool.acquire(network, _account(network, account, load))
+        await gather_bounded(
+            lambda index: _timed(timings, pool.run(make_job(server, network, index, load))),
+            range(load.count),
+            load.concurrency,
+        )
+    finally:
+        await pool.close()
+    return timings
+
+
+async def post(server: FakeServer, network: str, load: Load) -> list[float]:
+    """Posts with a link and an image on warm clients."""
+    return await _pooled(server, network, load, _post_job)
+
+
+async def video(server: FakeServer, network: str, load: Load) -> list[float]:
+    """Video posts, including download, validation, upload and processing, on warm clients."""
+    return await _pooled(server, network, load, _video_job)
+
+
+async def feed_publish(server: FakeServer, network: str, load: Load) -> list[float]:
+    """Cold ``last-from-feed`` runs that log in, read the feed and post, like a cron job."""
+    from agoras.cli.platform_runner import create_platform_instance
+    from agoras.core.concurrency import gather_bounded
+
+    async def run_once(index):
+        options = {**_account(network, index, load), "feed_url": f"{server.url}/feed.xml"}
+        instance = create_platform_instance(network, options)
+        try:
+            await instance.execute_action("last-from-feed")
+        finally:
+            await instance.disconnect()
+
+    timings: list[float] = []
+    await gather_bounded(lambda index: _timed(timings, run_once(index)), range(load.count), load.concurrency)
+    return timings
+
+
+async def schedule_run(server: FakeServer, network: str, load: Load) -> list[float]:
+    """A queue of due posts drained by the scheduler on a shared client pool."""
+    from agoras.cli.platform_runner import create_platform_instance
+    from agoras.core.pool import ClientPool
+    from agoras.core.scheduler import FAILED, JobQueue, Scheduler
+
+    queue = JobQueue(Path(os.environ["AGORAS_STORAGE_DIR"]) / f"jobs-{time.time_ns()}.db")
+    now = time.time()
+    for index in range(load.count):
+        queue.enqueue(_post_job(server, network, index, load), now)
+
+    pool = ClientPool(create_platform_instance, max_idle=None)
+    timings: list[float] = []
+
+    async def run(job):
+        return await _timed(timings, pool.run(job))
+
+    try:
+        counts = await Scheduler(queue, run, concurrency=load.concurrency).run_pending()
+    finally:
+        await pool.close()
+        queue.close()
+    if counts.get(FAILED):
+        raise Exception(f"{counts[FAILED]} scheduled jobs failed")
+    return timings
+
+
+SCENARIOS: dict[str, Callable[[FakeServer, str, Load], Awaitable[list[float]]]] = {
+    "post": post,
+    "video": video,
+    "feed-publish": feed_publish,
+    "schedule-run": schedule_run,
+}
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+async def measure(server: FakeServer, scenario: str, network: str, load: Load) -> dict[str, float]:
+    """Run one scenario on one network and summarize its latencies."""
+    start = time.perf_counter()
+    requests_before = server.requests
+    # Platform wrappers print post IDs and progress; keep the report readable.
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        timings = await SCENARIOS[scenario](server, network, load)
+    elapsed = time.perf_counter() - start
+    return {
+        "ops": len(timings),
+        "mean_ms": round(statistics.fmean(timings) * 1000, 1),
+        "p50_ms": round(statistics.median(timings) * 1000, 1),
+        "p95_ms": round(_percentile(timings, 0.95) * 1000, 1),
+        "max_ms": round(max(timings) * 1000, 1),
+        "throughput": round(len(timings) / elapsed, 2),
+        "requests_per_op": round((server.requests - requests_before) / len(timings), 1),
+    }
+
+
+def compare(results: dict[str, dict], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Return a message for every scenario that regressed past its tolerance."""
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get("results", {}).get(name)
+        if not expected:
+            continue
+        allowed = baseline.get("tolerance", {}).get(name, tolerance)
+        if result["mean_ms"] > expected["mean_ms"] * (1 + allowed):
+            regressions.append(f"{name}: mean {result['mean_ms']}ms > {expected['mean_ms']}ms (+{allowed:.0%})")
+        if result["throughput"] < expected["throughput"] * (1 - allowed):
+            regressions.append(f"{name}: {result['throughput']} ops/s < {expected['throughput']} (-{allowed:.0%})")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Scenario to run (repeatable)")
+    parser.add_argument("--network", action="append", choices=sorted(ACCOUNTS), help="Only run these networks")
+    parser.add_argument("--count", type=int, default=Load.count, help="Operations per scenario (default: 16)")
+    parser.add_argument("--concurrency", type=int, default=Load.concurrency, help="Operations in flight (default: 4)")
+    parser.add_argument("--accounts", type=int, default=Load.accounts, help="Accounts per network (default: 2)")
+    parser.add_argument(
+        "--latency", type=float, default=Conditions.latency, help="API response latency in seconds (default: 0.05)"
+    )
+    parser.add_argument(
+        "--bandwidth", type=float, default=8.0, help="Media transfer speed in MiB/s, 0 for unlimited (default: 8)"
+    )
+    parser.add_argument(
+        "--processing",
+        type=float,
+        default=Conditions.processing,
+        help="Seconds a video stays in processing on the platform (default: 1.5)",
+    )
+    parser.add_argument("--rate-limit", action="store_true", help="Also enforce the shared platform quota limiter")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--check", action="store_true", help="Exit with 1 if a scenario regressed past the baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="Allowed regression (default: 0.25)")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Write the results to {BASELINE.name}")
+    args = parser.parse_args(argv)
+
+    state = _isolate()
+    if not args.rate_limit:
+        # Quotas are the platforms' to enforce; the benchmark measures Agoras itself.
+        os.environ["AGORAS_RATE_LIMIT"] = "off"
+
+    load = Load(count=args.count, concurrency=args.concurrency, accounts=args.accounts)
+    conditions = Conditions(
+        latency=args.latency, bandwidth=args.bandwidth * 1024 * 1024 or None, processing=args.processing
+    )
+    server = FakeServer(conditions).start()
+    results: dict[str, dict] = {}
+    try:
+        with redirect_platforms(server):
+            for scenario in args.scenario or list(SCENARIOS):
+                for network in NETWORKS[scenario]:
+                    if args.network and network not in args.network:
+                        continue
+                    name = f"{scenario}/{network}"
+                    results[name] = row = asyncio.run(measure(server, scenario, network, load))
+                    if not args.json:
+                        print(
+                            f"{name:22} {row['ops']:3d} ops  mean {row['mean_ms']:7.1f}ms  p50 {row['p50_ms']:7.1f}ms  "
+                            f"p95 {row['p95_ms']:7.1f}ms  "
+                            f"{row['throughput']:6.2f} ops/s  {row['requests_per_op']:5.1f} req/op",
+                            flush=True,
+                        )
+    finally:
+        server.stop()
+        shutil.rmtree(state, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+    settings = {**asdict(load), **asdict(conditions), "rate_limit": args.rate_limit}
+    if args.save_baseline:
+        BASELINE.write_text(json.dumps({"settings": settings, "results": results}, indent=2) + "\n")
+
+    if args.check:
+        if not BASELINE.exists():
+            print(f"No {BASELINE.name}; run with --save-baseline first.", file=sys.stderr)
+            return 1
+        baseline = json.loads(BASELINE.read_text())
+        if baseline.get("settings") != settings:
+            print("Warning: settings differ from the baseline, so results are not comparable.", file=sys.stderr)
+        regressions = compare(results, baseline, args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -63,6 +63,48 @@ def block_http_requests(request):
             yield
 
 
+@pytest.fixture(autouse=True)
+def disable_shared_rate_limiter(monkeypatch):
+    """
+    Keep unit tests off the shared rate-limit database in ``~/.agoras``.
+
+    Tests that exercise rate limiting pass their own ``RateLimiter``.
+    """
+    monkeypatch.setenv("AGORAS_RATE_LIMIT", "off")
+
+
+@pytest.fixture(autouse=True)
+def disable_upload_checkpoints(monkeypatch):
+    """
+    Keep upload checkpoints of unit tests out of ``~/.agoras``.
+
+    Tests that exercise resuming pass their own ``KeyValueStore``.
+    """
+    monkeypatch.setenv("AGORAS_UPLOAD_RESUME", "off")
+
+
+@pytest.fixture(autouse=True)
+def disable_publish_journal(monkeypatch):
+    """
+    Keep publish journals of unit tests out of ``~/.agoras``.
+
+    Tests that exercise the journal pass their own ``KeyValueStore``.
+    """
+    monkeypatch.setenv("AGORAS_PUBLISH_JOURNAL", "off")
+
+
+@pytest.fixture(autouse=True)
+def disable_persistent_caches(monkeypatch):
+    """
+    Keep media references, resolved Discord IDs and link previews of unit tests out of ``~/.agoras``.
+
+    Each client then caches them in memory for its own lifetime; link previews are not cached.
+    """
+    monkeypatch.setenv("AGORAS_MEDIA_CACHE", "off")
+    monkeypatch.setenv("AGORAS_DISCORD_CACHE", "off")
+    monkeypatch.setenv("AGORAS_PREVIEW_CACHE", "off")
+
+
 # Custom markers
 def pytest_configure(config):
     """Configure custom pytest markers."""
@@ -67,3 +67,25 @@ def add_video_options(parser: ArgumentParser, platform: Optional[str] = None):
         metavar="<title>",
         help="Video title/description",
     )
+
+
+def add_broadcast_options(parser: ArgumentParser, destinations: str, help_text: str):
+    """
+    Add options for posting one message to several chats or channels.
+
+    Args:
+        parser: ArgumentParser to add options to
+        destinations: Name of the comma-separated destinations option, without dashes
+        help_text: Help for the destinations option
+    """
+    broadcast = parser.add_argument_group("Broadcast Options")
+    broadcast.add_argument(f"--{destinations}", required=True, metavar="<name,...>", help=help_text)
+    broadcast.add_argument("--video-url", metavar="<url>", help="Video to send instead of text and images")
+    broadcast.add_argument("--video-title", metavar="<title>", help="Video title/description")
+    broadcast.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        metavar="<number>",
+        help="Maximum destinations posted to at once (default: 8)",
+    )
@@ -87,6 +87,8 @@ class ParameterConverter:
             "bot_token": "discord_bot_token",
             "server_name": "discord_server_name",
             "channel_name": "discord_channel_name",
+            "channel_names": "discord_channel_names",
+            "concurrency": "discord_broadcast_concurrency",
             "post_id": "discord_post_id",
             "video_url": "discord_video_url",
             "video_title": "discord_video_title",
@@ -125,6 +127,8 @@ class ParameterConverter:
         "telegram": {
             "bot_token": "telegram_bot_token",
             "chat_id": "telegram_chat_id",
+            "chat_ids": "telegram_chat_ids",
+            "concurrency": "telegram_broadcast_concurrency",
             "parse_mode": "telegram_parse_mode",
             "message_id": "telegram_message_id",
             "post_id": "telegram_message_id",
@@ -140,6 +144,10 @@ class ParameterConverter:
             "template_name": "whatsapp_template_name",
             "language_code": "whatsapp_template_language",
             "template_components": "whatsapp_template_components",
+            "recipients": "whatsapp_recipients",
+            "output": "whatsapp_broadcast_output",
+            "concurrency": "whatsapp_broadcast_concurrency",
+            "messages_per_second": "whatsapp_messages_per_second",
             "video_url": "video_url",
             "video_title": "video_title",
         },
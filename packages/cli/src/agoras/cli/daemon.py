@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Minimal HTTP/1.1 job server used by ``agoras serve``.
+
+Jobs are legacy-shaped JSON objects (the same keys ``platform_runner``
+receives) and run on warm instances held by a ``ClientPool``.
+"""
+
+import asyncio
+import json
+import os
+from http import HTTPStatus
+
+from agoras.common.logger import logger
+from agoras.core.auth import AuthenticationError
+
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class JobServer:
+    """
+    Accept publish jobs over a Unix socket or a local TCP port.
+
+    Endpoints:
+        ``GET /health``: ``{"status": "ok", "clients": <warm instances>}``
+        ``POST /jobs``: run one job, respond with ``{"id": <result>}``
+    """
+
+    def __init__(self, pool):
+        """
+        Initialize the server.
+
+        Args:
+            pool (ClientPool): Pool used to run jobs
+        """
+        self.pool = pool
+
+    async def handle_connection(self, reader, writer):
+        """Serve a single request and close the connection."""
+        try:
+            status, payload = await self._handle_request(reader)
+        except Exception as exc:  # pragma: no cover - defensive; _handle_request maps errors
+            logger.exception(exc)
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(exc)}
+
+        body = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode("ascii") + body)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader):
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        parts = request_line.split()
+        if len(parts) != 3:
+            return HTTPStatus.BAD_REQUEST, {"error": "Malformed request line."}
+        method, path = parts[0].upper(), parts[1].split("?", 1)[0]
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if path == "/health" and method == "GET":
+            return HTTPStatus.OK, {"status": "ok", "clients": len(self.pool)}
+        if path != "/jobs":
+            return HTTPStatus.NOT_FOUND, {"error": f"Unknown path {path}."}
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use POST to submit jobs."}
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST, {"error": "Invalid Content-Length."}
+        if length > MAX_BODY_BYTES:
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Job body too large."}
+
+        try:
+            job = json.loads(await reader.readexactly(length))
+        except (asyncio.IncompleteReadError, ValueError):
+            return HTTPStatus.BAD_REQUEST, {"error": "Job body must be a JSON object."}
+        if not isinstance(job, dict):
+            return HTTPStatus.BAD_REQUEST, {"error": "Job body must be a JSON object."}
+
+        try:
+            result = await self.pool.run(job)
+        except AuthenticationError as exc:
+            return HTTPStatus.UNAUTHORIZED, {"error": str(exc)}
+        except Exception as exc:
+            logger.error(f"Job failed: {exc}")
+            return HTTPStatus.BAD_GATEWAY, {"error": str(exc)}
+        return HTTPStatus.OK, {"id": result}
+
+    async def start(self, socket_path=None, host="127.0.0.1", port=None):
+        """
+        Start listening.
+
+        Args:
+            socket_path (str, optional): Unix socket path (takes precedence over TCP)
+            host (str): TCP bind address when ``port`` is given
+            port (int, optional): TCP port
+
+        Returns:
+            asyncio.AbstractServer: The listening server
+        """
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            os.makedirs(os.path.dirname(os.path.abspath(socket_path)), mode=0o700, exist_ok=True)
+            server = await asyncio.start_unix_server(self.handle_connection, path=socket_path)
+            os.chmod(socket_path, 0o600)
+            return server
+        if port is None:
+            raise Exception("Either a socket path or a TCP port is required.")
+        return await asyncio.start_server(self.handle_connection, host=host, port=port)
+
+
+async def serve(pool, socket_path=None, host="127.0.0.1", port=None):
+    """
+    Run the job server until cancelled, then disconnect every warm client.
+
+    Args:
+        pool (ClientPool): Pool used to run jobs
+        socket_path (str, optional): Unix socket path
+        host (str): TCP bind address
+        port (int, optional): TCP port
+    """
+    server = await JobServer(pool).start(socket_path=socket_path, host=host, port=port)
+    where = socket_path or f"http://{host}:{port}"
+    logger.info(f"Serving jobs on {where}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await pool.close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
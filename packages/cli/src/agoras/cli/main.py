@@ -26,7 +26,9 @@ import re
 import sys
 from argparse import ArgumentParser
 
+from agoras.common.executors import executor_stats
 from agoras.common.logger import logger
+from agoras.common.metrics import metrics
 from agoras.common.version import __description__, __version__
 from agoras.core.auth import AuthenticationError
 
@@ -41,6 +43,7 @@ from .platforms.tiktok import create_tiktok_parser
 from .platforms.whatsapp import create_whatsapp_parser
 from .platforms.x import create_twitter_parser_alias, create_x_parser
 from .platforms.youtube import create_youtube_parser
+from .serve import create_serve_parser
 from .utils import create_utils_parser
 
 
@@ -78,6 +81,15 @@ def commandline(argv=None):
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
         help=("Logger verbosity level (default: INFO). Must be one of: DEBUG, INFO, WARNING, ERROR or CRITICAL."),
     )
+    gen_options.add_argument(
+        "--profile",
+        choices=["cpu", "memory", "both"],
+        metavar="<mode>",
+        help=(
+            "Profile the command: cpu (cProfile), memory (tracemalloc) or both. "
+            "Reports go to $AGORAS_PROFILE_DIR or ~/.agoras/profiles (default: $AGORAS_PROFILE)."
+        ),
+    )
 
     # Create subparsers for commands
     subparsers = parser.add_subparsers(title="Commands", metavar="")
@@ -98,12 +110,37 @@ def commandline(argv=None):
     # Register utils command group (automation tools)
     create_utils_parser(subparsers)
 
+    # Register daemon command
+    create_serve_parser(subparsers)
+
     # Register legacy publish command
     create_legacy_publish_parser(subparsers, __version__)
 
     return parser, parser.parse_args(argv)
 
 
+def _run_command(args):
+    """
+    Run the command handler, profiled if ``--profile`` or ``AGORAS_PROFILE`` asks for it.
+
+    :param args: parsed ``Namespace`` with the ``command`` handler.
+
+    :return: the handler's exit status.
+    """
+    from agoras.common.profiling import Profiler
+
+    profiler = Profiler(args.profile) if args.profile else Profiler.from_env()
+    if profiler is None:
+        return args.command(args)
+
+    try:
+        with profiler.profile():
+            return args.command(args)
+    finally:
+        for path in profiler.files:
+            logger.info(f"Profile written to {path}")
+
+
 def main(argv=None):
     """
     Handle arguments and commands.
@@ -132,7 +169,7 @@ def main(argv=None):
     try:
         # Call handler with args Namespace
         # Handlers expect a single args argument, not unpacked kwargs
-        status = args.command(args)
+        status = _run_command(args)
     except KeyboardInterrupt:
         logger.critical("Execution interrupted by user!")
         status = 1
@@ -146,6 +183,14 @@ def main(argv=None):
     else:
         logger.debug("Ending execution.")
 
+    try:
+        metrics.flush()
+    except Exception as e:
+        logger.warning(f"Could not write metrics: {e}")
+
+    for name, stats in executor_stats().items():
+        logger.debug(f"Executor {name}: " + ", ".join(f"{key} {value}" for key, value in stats.items()))
+
     logger.stop()
     return status
 
@@ -15,18 +15,30 @@
 
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
-"""Dispatch CLI actions to platform wrappers."""
+"""Dispatch CLI actions to platform wrappers.
 
-from agoras.platforms.discord.wrapper import main as discord
-from agoras.platforms.facebook.wrapper import main as facebook
-from agoras.platforms.instagram.wrapper import main as instagram
-from agoras.platforms.linkedin.wrapper import main as linkedin
-from agoras.platforms.telegram.wrapper import main as telegram
-from agoras.platforms.threads.wrapper import main as threads
-from agoras.platforms.tiktok.wrapper import main as tiktok
-from agoras.platforms.whatsapp.wrapper import main as whatsapp
-from agoras.platforms.x.wrapper import main as x
-from agoras.platforms.youtube.wrapper import main as youtube
+Platform modules are resolved through ``PlatformRegistry`` and imported on
+demand, so a run only loads the SDK of the network it targets.
+"""
+
+import importlib
+
+from .registry import PlatformRegistry
+
+
+def _load_platform_main(network):
+    """
+    Return the lazy wrapper entry point for a registered network.
+
+    Args:
+        network (str): Registered network name
+
+    Returns:
+        callable: ``<platform>_main(kwargs)`` from the platform CLI module
+    """
+    module_name = PlatformRegistry.PLATFORMS[network]["module"]
+    module = importlib.import_module(module_name)
+    return getattr(module, f"{module_name.rsplit('.', 1)[-1]}_main")
 
 
 def execute_platform_action(**kwargs):
@@ -38,29 +50,29 @@ def execute_platform_action(**kwargs):
     """
     network = kwargs.get("network")
 
-    if network == "x":
-        return x(kwargs)
     if network == "twitter":
-        kwargs["network"] = "x"
-        return x(kwargs)
-    if network == "facebook":
-        return facebook(kwargs)
-    if network == "instagram":
-        return instagram(kwargs)
-    if network == "linkedin":
-        return linkedin(kwargs)
-    if network == "discord":
-        return discord(kwargs)
-    if network == "youtube":
-        return youtube(kwargs)
-    if network == "tiktok":
-        return tiktok(kwargs)
-    if network == "threads":
-        return threads(kwargs)
-    if network == "telegram":
-        return telegram(kwargs)
-    if network == "whatsapp":
-        return whatsapp(kwargs)
+        kwargs["network"] = network = "x"
     if not network:
         raise Exception("--network is a required argument.")
-    raise Exception(f'"{network}" network not supported.')
+    if not PlatformRegistry.platform_exists(network):
+        raise Exception(f'"{network}" network not supported.')
+    return _load_platform_main(network)(kwargs)
+
+
+def create_platform_instance(network, options):
+    """
+    Build an uninitialized platform instance for the client pool.
+
+    Args:
+        network (str): Network name (``twitter`` maps to ``x``)
+        options (dict): Client options passed to the platform constructor
+
+    Returns:
+        SocialNetwork: Platform instance
+    """
+    if network == "twitter":
+        network = "x"
+    if not PlatformRegistry.platform_exists(network):
+        raise Exception(f'"{network}" network not supported.')
+    module = importlib.import_module(f"agoras.platforms.{network}")
+    return getattr(module, PlatformRegistry.PLATFORMS[network]["name"])(**options)
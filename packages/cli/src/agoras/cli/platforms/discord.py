@@ -23,13 +23,18 @@ This module provides the Discord command parser for the new CLI structure.
 
 from argparse import ArgumentParser, Namespace, _SubParsersAction
 
-from agoras.platforms.discord.wrapper import main as discord_main
-
-from ..base import add_common_content_options, add_video_options
+from ..base import add_broadcast_options, add_common_content_options, add_video_options
 from ..converter import ParameterConverter
 from ..validator import ActionValidator
 
 
+def discord_main(kwargs):
+    """Run the Discord wrapper, importing its SDK only when an action executes."""
+    from agoras.platforms.discord.wrapper import main
+
+    return main(kwargs)
+
+
 def create_discord_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     """
     Create Discord platform subcommand parser.
@@ -60,6 +65,14 @@ def create_discord_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     )
     _add_video_options(video)
 
+    # Broadcast action
+    broadcast = actions.add_parser(
+        "broadcast",
+        help="Send one message or video to several channels of the Discord server, uploading media once.",
+    )
+    add_broadcast_options(broadcast, "channel-names", "Comma-separated channel names in the server")
+    add_common_content_options(broadcast, images=4)
+
     # Delete action
     delete = actions.add_parser(
         "delete", help='Delete a Discord message. Requires prior authorization via "agoras discord authorize".'
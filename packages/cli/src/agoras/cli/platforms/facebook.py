@@ -23,14 +23,19 @@ This module provides the Facebook command parser for the new CLI structure.
 
 from argparse import ArgumentParser, Namespace, _SubParsersAction
 
-from agoras.platforms.facebook.wrapper import main as facebook_main
-
 from ..base import add_common_content_options
 from ..converter import ParameterConverter
 from ..media_help import video_url_help
 from ..validator import ActionValidator
 
 
+def facebook_main(kwargs):
+    """Run the Facebook wrapper, importing its SDK only when an action executes."""
+    from agoras.platforms.facebook.wrapper import main
+
+    return main(kwargs)
+
+
 def create_facebook_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     """
     Create Facebook platform subcommand parser.
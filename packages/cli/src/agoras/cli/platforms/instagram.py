@@ -23,14 +23,19 @@ This module provides the Instagram command parser for the new CLI structure.
 
 from argparse import ArgumentParser, Namespace, _SubParsersAction
 
-from agoras.platforms.instagram.wrapper import main as instagram_main
-
 from ..base import add_common_content_options
 from ..converter import ParameterConverter
 from ..media_help import video_url_help
 from ..validator import ActionValidator
 
 
+def instagram_main(kwargs):
+    """Run the Instagram wrapper, importing its SDK only when an action executes."""
+    from agoras.platforms.instagram.wrapper import main
+
+    return main(kwargs)
+
+
 def create_instagram_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     """
     Create Instagram platform subcommand parser.
@@ -23,13 +23,18 @@ This module provides the LinkedIn command parser for the new CLI structure.
 
 from argparse import ArgumentParser, Namespace, _SubParsersAction
 
-from agoras.platforms.linkedin.wrapper import main as linkedin_main
-
 from ..base import add_common_content_options, add_video_options
 from ..converter import ParameterConverter
 from ..validator import ActionValidator
 
 
+def linkedin_main(kwargs):
+    """Run the LinkedIn wrapper, importing its SDK only when an action executes."""
+    from agoras.platforms.linkedin.wrapper import main
+
+    return main(kwargs)
+
+
 def create_linkedin_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     """
     Create LinkedIn platform subcommand parser.
@@ -23,13 +23,18 @@ This module provides the Telegram command parser for the new CLI structure.
 
 from argparse import ArgumentParser, Namespace, _SubParsersAction
 
-from agoras.platforms.telegram.wrapper import main as telegram_main
-
-from ..base import add_common_content_options, add_video_options
+from ..base import add_broadcast_options, add_common_content_options, add_video_options
 from ..converter import ParameterConverter
 from ..validator import ActionValidator
 
 
+def telegram_main(kwargs):
+    """Run the Telegram wrapper, importing its SDK only when an action executes."""
+    from agoras.platforms.telegram.wrapper import main
+
+    return main(kwargs)
+
+
 def create_telegram_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     """
     Create Telegram platform subcommand parser.
@@ -62,6 +67,15 @@ def create_telegram_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     _add_telegram_action_options(video)
     add_video_options(video, platform="telegram")
 
+    # Broadcast action
+    broadcast = actions.add_parser(
+        "broadcast",
+        help="Send one message, image set or video to several Telegram chats, uploading media once.",
+    )
+    _add_telegram_action_options(broadcast)
+    add_broadcast_options(broadcast, "chat-ids", "Comma-separated chat IDs or channel usernames")
+    add_common_content_options(broadcast, images=4)
+
     # Delete action
     delete = actions.add_parser(
         "delete", help='Delete a Telegram message. Requires prior authorization via "agoras telegram authorize".'
@@ -23,13 +23,18 @@ This module provides the Threads command parser for the new CLI structure.
 
 from argparse import ArgumentParser, Namespace, _SubParsersAction
 
-from agoras.platforms.threads.wrapper import main as threads_main
-
 from ..base import add_common_content_options, add_video_options
 from ..converter import ParameterConverter
 from ..validator import ActionValidator
 
 
+def threads_main(kwargs):
+    """Run the Threads wrapper, importing its SDK only when an action executes."""
+    from agoras.platforms.threads.wrapper import main
+
+    return main(kwargs)
+
+
 def create_threads_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     """
     Create Threads platform subcommand parser.
@@ -23,14 +23,19 @@ This module provides the TikTok command parser for the new CLI structure.
 
 from argparse import ArgumentParser, Namespace, _SubParsersAction
 
-from agoras.platforms.tiktok.wrapper import main as tiktok_main
-
 from ..base import add_common_content_options
 from ..converter import ParameterConverter
 from ..media_help import video_url_help
 from ..validator import ActionValidator
 
 
+def tiktok_main(kwargs):
+    """Run the TikTok wrapper, importing its SDK only when an action executes."""
+    from agoras.platforms.tiktok.wrapper import main
+
+    return main(kwargs)
+
+
 def create_tiktok_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     """
     Create TikTok platform subcommand parser.
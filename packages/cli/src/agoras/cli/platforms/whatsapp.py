@@ -23,13 +23,18 @@ This module provides the WhatsApp command parser for the new CLI structure.
 
 from argparse import ArgumentParser, Namespace, _SubParsersAction
 
-from agoras.platforms.whatsapp.wrapper import main as whatsapp_main
-
 from ..base import add_common_content_options, add_video_options
 from ..converter import ParameterConverter
 from ..validator import ActionValidator
 
 
+def whatsapp_main(kwargs):
+    """Run the WhatsApp wrapper, importing its SDK only when an action executes."""
+    from agoras.platforms.whatsapp.wrapper import main
+
+    return main(kwargs)
+
+
 def create_whatsapp_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     """
     Create WhatsApp platform subcommand parser.
@@ -71,6 +76,15 @@ def create_whatsapp_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     _add_whatsapp_recipient_option(template)
     _add_template_options(template)
 
+    # Broadcast action
+    broadcast = actions.add_parser(
+        "broadcast",
+        help="Send one message or template to every recipient in a file over a single WhatsApp client.",
+    )
+    _add_broadcast_options(broadcast)
+    add_common_content_options(broadcast, images=4)
+    _add_template_options(broadcast, required=False)
+
     # Set handler
     parser.set_defaults(command=_handle_whatsapp_command)
 
@@ -107,15 +121,49 @@ def _add_whatsapp_recipient_option(parser: ArgumentParser):
     )
 
 
-def _add_template_options(parser: ArgumentParser):
+def _add_broadcast_options(parser: ArgumentParser):
+    """
+    Add broadcast recipient, output and throughput options.
+
+    Args:
+        parser: ArgumentParser to add options to
+    """
+    broadcast = parser.add_argument_group("Broadcast Options")
+    broadcast.add_argument(
+        "--recipients",
+        required=True,
+        metavar="<path>",
+        help="File with one recipient phone number per line (- for stdin)",
+    )
+    broadcast.add_argument("--output", metavar="<path>", help="Write JSONL results here (default: stdout)")
+    broadcast.add_argument(
+        "--concurrency",
+        type=int,
+        default=20,
+        metavar="<number>",
+        help="Maximum recipients in flight (default: 20)",
+    )
+    broadcast.add_argument(
+        "--messages-per-second",
+        type=float,
+        default=80,
+        metavar="<number>",
+        help="Throughput tier of the business phone number (default: 80)",
+    )
+
+
+def _add_template_options(parser: ArgumentParser, required: bool = True):
     """
     Add template-specific options.
 
     Args:
         parser: ArgumentParser to add options to
+        required: Whether the template name is required
     """
     template = parser.add_argument_group("Template Options")
-    template.add_argument("--template-name", required=True, metavar="<name>", help="Name of the pre-approved template")
+    template.add_argument(
+        "--template-name", required=required, metavar="<name>", help="Name of the pre-approved template"
+    )
     template.add_argument(
         "--language-code", default="en", metavar="<code>", help="Language code (ISO 639-1 format, default: en)"
     )
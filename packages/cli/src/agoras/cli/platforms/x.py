@@ -23,13 +23,18 @@ This module provides the X command parser for the new CLI structure.
 
 from argparse import ArgumentParser, Namespace, _SubParsersAction
 
-from agoras.platforms.x.wrapper import main as x_main
-
 from ..base import add_common_content_options, add_video_options
 from ..converter import ParameterConverter
 from ..validator import ActionValidator
 
 
+def x_main(kwargs):
+    """Run the X wrapper, importing its SDK only when an action executes."""
+    from agoras.platforms.x.wrapper import main
+
+    return main(kwargs)
+
+
 def create_x_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     """
     Create X platform subcommand parser.
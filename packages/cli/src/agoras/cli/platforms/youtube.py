@@ -24,13 +24,18 @@ Note: YouTube is a video-only platform, so no 'post' action is available.
 
 from argparse import ArgumentParser, Namespace, _SubParsersAction
 
-from agoras.platforms.youtube.wrapper import main as youtube_main
-
 from ..converter import ParameterConverter
 from ..media_help import video_url_help
 from ..validator import ActionValidator
 
 
+def youtube_main(kwargs):
+    """Run the YouTube wrapper, importing its SDK only when an action executes."""
+    from agoras.platforms.youtube.wrapper import main
+
+    return main(kwargs)
+
+
 def create_youtube_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     """
     Create YouTube platform subcommand parser.
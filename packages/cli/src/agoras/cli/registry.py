@@ -62,7 +62,7 @@ class PlatformRegistry:
         "discord": {
             "name": "Discord",
             "description": "Discord chat platform",
-            "actions": {"authorize", "post", "video", "delete"},
+            "actions": {"authorize", "post", "video", "delete", "broadcast"},
             "module": "agoras.cli.platforms.discord",
         },
         "youtube": {
@@ -86,13 +86,13 @@ class PlatformRegistry:
         "telegram": {
             "name": "Telegram",
             "description": "Telegram messaging platform",
-            "actions": {"authorize", "post", "video", "delete"},
+            "actions": {"authorize", "post", "video", "delete", "broadcast"},
             "module": "agoras.cli.platforms.telegram",
         },
         "whatsapp": {
             "name": "WhatsApp",
             "description": "WhatsApp Business API messaging platform",
-            "actions": {"authorize", "post", "video", "template"},
+            "actions": {"authorize", "post", "video", "template", "broadcast"},
             "module": "agoras.cli.platforms.whatsapp",
         },
     }
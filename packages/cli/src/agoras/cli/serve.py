@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Serve command.
+
+``agoras serve`` keeps authenticated platform clients warm and accepts
+publish jobs over a local Unix socket or HTTP port.
+"""
+
+import asyncio
+import os
+from argparse import ArgumentParser, Namespace, _SubParsersAction
+from pathlib import Path
+
+
+def default_socket_path() -> str:
+    """
+    Return the default Unix socket path under the Agoras storage directory.
+
+    Returns:
+        str: ``$AGORAS_STORAGE_DIR/agoras.sock`` or ``~/.agoras/agoras.sock``
+    """
+    storage_dir = os.environ.get("AGORAS_STORAGE_DIR")
+    base_dir = Path(storage_dir).expanduser().resolve() if storage_dir else Path.home() / ".agoras"
+    return str(base_dir / "agoras.sock")
+
+
+def create_serve_parser(subparsers: _SubParsersAction) -> ArgumentParser:
+    """
+    Create the serve command parser.
+
+    Args:
+        subparsers: Subparsers action from main parser
+
+    Returns:
+        ArgumentParser for the serve command
+    """
+    parser = subparsers.add_parser(
+        "serve",
+        help="Run a daemon that keeps platform clients warm and accepts publish jobs",
+        description=(
+            "Accept legacy-shaped JSON jobs on POST /jobs and run them on authenticated "
+            "platform clients kept warm between requests. Supported actions: post, video, like, share, delete."
+        ),
+    )
+    listen = parser.add_mutually_exclusive_group()
+    listen.add_argument(
+        "--socket",
+        metavar="<path>",
+        help="Unix socket path (default: agoras.sock in the Agoras storage directory)",
+    )
+    listen.add_argument(
+        "--port",
+        type=int,
+        metavar="<port>",
+        help="Listen on a TCP port instead of a Unix socket",
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        metavar="<address>",
+        help="TCP bind address when --port is given (default: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--max-idle",
+        type=float,
+        default=900.0,
+        metavar="<seconds>",
+        help="Disconnect clients unused for this many seconds (default: 900)",
+    )
+    parser.set_defaults(command=_handle_serve)
+    return parser
+
+
+def _handle_serve(args: Namespace):
+    from agoras.core.pool import ClientPool
+
+    from .daemon import serve
+    from .platform_runner import create_platform_instance
+
+    pool = ClientPool(create_platform_instance, max_idle=args.max_idle)
+    socket_path = None if args.port is not None else (args.socket or default_socket_path())
+    asyncio.run(serve(pool, socket_path=socket_path, host=args.host, port=args.port))
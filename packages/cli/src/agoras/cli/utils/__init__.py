@@ -18,14 +18,18 @@
 """
 Utility CLI commands.
 
-This module contains cross-platform utility commands like feed-publish
-and schedule-run for automation and orchestration.
+This module contains cross-platform utility commands like feed-publish,
+schedule-run, batch-publish, fan-out and the job queue for automation and
+orchestration.
 """
 
 from argparse import ArgumentParser, _SubParsersAction
 
+from .batch import create_batch_publish_parser
+from .fanout import create_fan_out_parser
 from .feed import create_feed_publish_parser
 from .media_limits import create_media_limits_parser
+from .queue import create_queue_parser
 from .schedule import create_schedule_run_parser
 from .tokens import create_tokens_parser
 
@@ -47,6 +51,9 @@ def create_utils_parser(subparsers: _SubParsersAction) -> ArgumentParser:
     # Add subcommands
     create_feed_publish_parser(utils_subparsers)
     create_schedule_run_parser(utils_subparsers)
+    create_queue_parser(utils_subparsers)
+    create_batch_publish_parser(utils_subparsers)
+    create_fan_out_parser(utils_subparsers)
     create_media_limits_parser(utils_subparsers)
     create_tokens_parser(utils_subparsers)
 
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Batch publish utility command.
+
+``agoras utils batch-publish`` streams post specs from JSONL or CSV, runs
+them on one authenticated client per account with bounded per-platform
+concurrency, and writes one JSON result line per spec.
+"""
+
+import asyncio
+import csv
+import json
+import sys
+from argparse import ArgumentParser, Namespace, _SubParsersAction
+from typing import Any, Dict, Iterator, Tuple
+
+# Friendly spec keys accepted in addition to the legacy-shaped ones.
+SPEC_ALIASES = {
+    "text": "status_text",
+    "link": "status_link",
+    "image_1": "status_image_url_1",
+    "image_2": "status_image_url_2",
+    "image_3": "status_image_url_3",
+    "image_4": "status_image_url_4",
+    "video": "video_url",
+    "title": "video_title",
+}
+
+
+def create_batch_publish_parser(subparsers: _SubParsersAction) -> ArgumentParser:
+    """
+    Create batch-publish utility command parser.
+
+    Args:
+        subparsers: Subparsers action from utils parser
+
+    Returns:
+        ArgumentParser for batch-publish command
+    """
+    parser = subparsers.add_parser(
+        "batch-publish",
+        help="Publish many posts from a JSONL or CSV file in one process",
+        description=(
+            "Each record needs a network and optional action (default: post), text, link, image_1..image_4 "
+            "(or an images list), video_url, video_title, post_id and options. Records for the same account "
+            "share one authenticated client."
+        ),
+    )
+    parser.add_argument(
+        "--input",
+        required=True,
+        metavar="<path>",
+        help="JSONL or CSV file with post specs (- for stdin)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["jsonl", "csv"],
+        metavar="<format>",
+        help="Input format (default: inferred from the file extension, jsonl for stdin)",
+    )
+    parser.add_argument("--output", metavar="<path>", help="Write JSONL results here (default: stdout)")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        metavar="<number>",
+        help="Maximum concurrent requests per platform (default: 4)",
+    )
+    parser.set_defaults(command=_handle_batch_publish)
+    return parser
+
+
+def normalize_spec(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert one post spec into a legacy-shaped job dictionary.
+
+    Args:
+        record (dict): Spec read from JSONL or CSV
+
+    Returns:
+        dict: Legacy-shaped job (``network``, ``action``, ``status_text``, ...)
+
+    Raises:
+        Exception: If the spec has no network or its options are not an object
+    """
+    job: Dict[str, Any] = {}
+    options = record.get("options") or {}
+    if isinstance(options, str):
+        options = json.loads(options)
+    if not isinstance(options, dict):
+        raise Exception("options must be a JSON object.")
+    job.update(options)
+
+    for key, value in record.items():
+        if key in ("options", "images") or value in (None, ""):
+            continue
+        job[SPEC_ALIASES.get(key, key)] = value
+
+    images = record.get("images") or []
+    if isinstance(images, str):
+        images = [image for image in images.split() if image]
+    for index, image in enumerate(images[:4], start=1):
+        job[f"status_image_url_{index}"] = image
+
+    if not job.get("network"):
+        raise Exception("network is required.")
+    job.setdefault("action", "post")
+    return job
+
+
+def read_specs(stream, input_format: str) -> Iterator[Tuple[int, Any]]:
+    """
+    Yield ``(line_number, record_or_exception)`` pairs from an input stream.
+
+    Args:
+        stream: Text stream to read
+        input_format (str): ``jsonl`` or ``csv``
+    """
+    if input_format == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield line_number, exc
+            continue
+        yield line_number, record
+
+
+async def run_batch(specs, pool, output, concurrency: int = 4) -> int:
+    """
+    Run post specs on a client pool and stream results as they finish.
+
+    Args:
+        specs: Iterable of ``(line_number, record_or_exception)`` pairs
+        pool (ClientPool): Pool providing one warm client per account
+        output: Text stream receiving one JSON result per spec
+        concurrency (int): Maximum in-flight jobs per platform
+
+    Returns:
+        int: Number of failed specs
+    """
+    semaphores: Dict[str, asyncio.Semaphore] = {}
+    pending = set()
+    failures = 0
+    # Bound how far the reader runs ahead so huge inputs stay streaming.
+    max_pending = max(concurrency, 1) * 16
+
+    async def run_one(line_number, record):
+        result: Dict[str, Any] = {"line": line_number}
+        try:
+            if isinstance(record, Exception):
+                raise Exception(f"Invalid record: {record}")
+            job = normalize_spec(record)
+            result.update(network=job["network"], action=job["action"])
+            semaphore = semaphores.setdefault(job["network"], asyncio.Semaphore(max(concurrency, 1)))
+            async with semaphore:
+                result["id"] = await pool.run(job)
+        except Exception as exc:
+            result["error"] = str(exc)
+        return result
+
+    def write(task):
+        nonlocal failures
+        result = task.result()
+        failures += "error" in result
+        output.write(json.dumps(result, default=str) + "\n")
+        output.flush()
+
+    try:
+        for line_number, record in specs:
+            pending.add(asyncio.ensure_future(run_one(line_number, record)))
+            if len(pending) >= max_pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    write(task)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                write(task)
+    finally:
+        await pool.close()
+
+    return failures
+
+
+def _input_format(args: Namespace) -> str:
+    if args.format:
+        return args.format
+    return "csv" if args.input.lower().endswith(".csv") else "jsonl"
+
+
+def _handle_batch_publish(args: Namespace):
+    """
+    Handle batch publish on a shared client pool.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        0 if every spec succeeded, 1 otherwise
+    """
+    from agoras.core.pool import ClientPool
+
+    from ..platform_runner import create_platform_instance
+
+    pool = ClientPool(create_platform_instance, max_idle=None)
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        specs = read_specs(source, _input_format(args))
+        failures = asyncio.run(run_batch(specs, pool, output, args.concurrency))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
+    return 1 if failures else 0
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Fan-out publish utility command.
+
+``agoras utils fan-out`` posts one announcement to several networks at once.
+Media is downloaded once and shared, and each network runs concurrently
+under its own timeout.
+"""
+
+import asyncio
+import json
+from argparse import ArgumentParser, ArgumentTypeError, Namespace, _SubParsersAction
+from typing import Any, Dict, List
+
+from ..base import add_common_content_options
+from ..registry import PlatformRegistry
+
+
+def _network_list(value: str) -> List[str]:
+    networks = []
+    for network in (item.strip() for item in value.split(",")):
+        if not network:
+            continue
+        if network == "twitter":
+            network = "x"
+        if not PlatformRegistry.validate_action(network, "post"):
+            raise ArgumentTypeError(f'"{network}" does not support the post action.')
+        if network not in networks:
+            networks.append(network)
+    if not networks:
+        raise ArgumentTypeError("at least one network is required.")
+    return networks
+
+
+def create_fan_out_parser(subparsers: _SubParsersAction) -> ArgumentParser:
+    """
+    Create fan-out utility command parser.
+
+    Args:
+        subparsers: Subparsers action from utils parser
+
+    Returns:
+        ArgumentParser for fan-out command
+    """
+    parser = subparsers.add_parser(
+        "fan-out",
+        help="Publish one post to several social networks concurrently",
+    )
+    parser.add_argument(
+        "--networks",
+        required=True,
+        type=_network_list,
+        metavar="<platform,...>",
+        help="Comma-separated networks to post to (e.g. x,facebook,linkedin)",
+    )
+    add_common_content_options(parser, images=4)
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=300.0,
+        metavar="<seconds>",
+        help="Per-network timeout in seconds (default: 300)",
+    )
+    parser.set_defaults(command=_handle_fan_out)
+    return parser
+
+
+async def fan_out(pool, networks: List[str], job: Dict[str, Any], timeout: float = 300.0) -> Dict[str, Dict[str, Any]]:
+    """
+    Run one job on several networks concurrently with shared media downloads.
+
+    Args:
+        pool (ClientPool): Pool that creates and initializes each network client
+        networks (list): Network names
+        job (dict): Legacy-shaped job without ``network``
+        timeout (float): Per-network timeout in seconds
+
+    Returns:
+        dict: ``{network: {"id": ...}}`` or ``{network: {"error": ...}}``
+    """
+    from agoras.media.cache import DownloadCache
+
+    async def run(network):
+        try:
+            post_id = await asyncio.wait_for(pool.run({**job, "network": network}), timeout)
+        except asyncio.TimeoutError:
+            return {"error": f"Timed out after {timeout:g}s."}
+        except Exception as exc:
+            return {"error": str(exc)}
+        return {"id": post_id}
+
+    try:
+        with DownloadCache().activate():
+            results = await asyncio.gather(*(run(network) for network in networks))
+    finally:
+        await pool.close()
+
+    return dict(zip(networks, results))
+
+
+def _handle_fan_out(args: Namespace):
+    """
+    Handle fan-out publish and print a combined JSON status.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        0 if every network succeeded, 1 otherwise
+    """
+    from agoras.core.pool import ClientPool
+
+    from ..platform_runner import create_platform_instance
+
+    job = {
+        "action": "post",
+        "status_text": args.text,
+        "status_link": args.link,
+        "status_image_url_1": args.image_1,
+        "status_image_url_2": args.image_2,
+        "status_image_url_3": args.image_3,
+        "status_image_url_4": args.image_4,
+    }
+    pool = ClientPool(create_platform_instance, max_idle=None)
+    results = asyncio.run(fan_out(pool, args.networks, job, args.timeout))
+    print(json.dumps(results, separators=(",", ":"), default=str))
+    return 1 if any("error" in result for result in results.values()) else 0
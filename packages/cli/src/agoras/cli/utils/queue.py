@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Job queue utility command.
+
+``agoras utils queue`` schedules posts in the local job queue and runs
+them at their exact time. Sync subcommands only enqueue new posts from a
+Google Sheet or a feed; ``run`` publishes them on warm clients.
+"""
+
+import asyncio
+import datetime
+import json
+from argparse import ArgumentParser, ArgumentTypeError, Namespace, _SubParsersAction
+from typing import Any, Dict
+
+from ..base import add_common_content_options
+from ..registry import PlatformRegistry
+from .schedule import _add_whatsapp_recipient_option
+
+
+def _timestamp(value: str) -> float:
+    try:
+        moment = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise ArgumentTypeError(f'"{value}" is not an ISO 8601 date and time (e.g. 2026-05-01T09:30).')
+    # Naive times are local, like the dates and hours of a schedule sheet.
+    return moment.timestamp()
+
+
+def _add_network_option(parser: ArgumentParser):
+    parser.add_argument(
+        "--network",
+        required=True,
+        choices=PlatformRegistry.get_platform_names(),
+        metavar="<platform>",
+        help="Target social network",
+    )
+
+
+def create_queue_parser(subparsers: _SubParsersAction) -> ArgumentParser:
+    """
+    Create queue utility command parser.
+
+    Args:
+        subparsers: Subparsers action from utils parser
+
+    Returns:
+        ArgumentParser for queue command
+    """
+    parser = subparsers.add_parser("queue", help="Schedule posts in the local job queue and run them on time")
+    commands = parser.add_subparsers(dest="queue_command", title="Queue Commands", required=True)
+
+    add = commands.add_parser("add", help="Schedule one post")
+    _add_network_option(add)
+    add.add_argument("--at", required=True, type=_timestamp, metavar="<datetime>", help="When to publish (ISO 8601)")
+    add.add_argument("--action", choices=["post", "video"], default="post", metavar="<action>", help="post or video")
+    add_common_content_options(add, images=4)
+    add.add_argument("--video-url", metavar="<url>", help="Video to upload for the video action")
+    add.add_argument("--video-title", metavar="<title>", help="Video title")
+    _add_whatsapp_recipient_option(add)
+    add.set_defaults(command=_handle_add)
+
+    sync_sheet = commands.add_parser("sync-sheet", help="Enqueue the unpublished posts of a Google Sheet")
+    _add_network_option(sync_sheet)
+    sheets = sync_sheet.add_argument_group("Google Sheets Options")
+    sheets.add_argument("--sheets-id", required=True, metavar="<id>", help="Google Sheets document ID")
+    sheets.add_argument("--sheets-name", required=True, metavar="<name>", help="Sheet name within document")
+    sheets.add_argument("--sheets-client-email", required=True, metavar="<email>", help="Google service account email")
+    sheets.add_argument(
+        "--sheets-private-key", required=True, metavar="<key>", help="Google service account private key"
+    )
+    _add_whatsapp_recipient_option(sync_sheet)
+    sync_sheet.set_defaults(command=_handle_sync_sheet)
+
+    sync_feed = commands.add_parser("sync-feed", help="Enqueue feed entries that were never queued before")
+    _add_network_option(sync_feed)
+    sync_feed.add_argument("--feed-url", required=True, metavar="<url>", help="URL of RSS/Atom feed")
+    sync_feed.add_argument(
+        "--max-count", type=int, default=1, metavar="<number>", help="Latest entries to consider (default: 1)"
+    )
+    sync_feed.set_defaults(command=_handle_sync_feed)
+
+    listing = commands.add_parser("list", help="Print queued jobs as JSON lines")
+    listing.add_argument(
+        "--state",
+        choices=["pending", "running", "done", "failed", "cancelled"],
+        metavar="<state>",
+        help="Only list jobs in this state",
+    )
+    listing.set_defaults(command=_handle_list)
+
+    cancel = commands.add_parser("cancel", help="Cancel a pending job")
+    cancel.add_argument("job_id", metavar="<id>", help="Job ID from queue list")
+    cancel.set_defaults(command=_handle_cancel)
+
+    run = commands.add_parser("run", help="Publish queued posts when they are due")
+    run.add_argument(
+        "--concurrency", type=int, default=4, metavar="<number>", help="Maximum posts in flight (default: 4)"
+    )
+    run.add_argument("--once", action="store_true", help="Publish the posts that are due now and exit")
+    run.add_argument(
+        "--poll-interval",
+        type=float,
+        default=30.0,
+        metavar="<seconds>",
+        help="Longest wait before checking for jobs added by other processes (default: 30)",
+    )
+    run.set_defaults(command=_handle_run)
+
+    return parser
+
+
+def _content_job(args: Namespace) -> Dict[str, Any]:
+    job = {
+        "network": args.network,
+        "action": getattr(args, "action", "post"),
+        "status_text": getattr(args, "text", None),
+        "status_link": getattr(args, "link", None),
+        "status_image_url_1": getattr(args, "image_1", None),
+        "status_image_url_2": getattr(args, "image_2", None),
+        "status_image_url_3": getattr(args, "image_3", None),
+        "status_image_url_4": getattr(args, "image_4", None),
+        "video_url": getattr(args, "video_url", None),
+        "video_title": getattr(args, "video_title", None),
+        "whatsapp_recipient": getattr(args, "whatsapp_recipient", None),
+    }
+    return {key: value for key, value in job.items() if value not in (None, "")}
+
+
+async def sync_sheet(queue, sheet, job: Dict[str, Any], now: datetime.datetime) -> int:
+    """
+    Enqueue sheet posts due in the current hour or later.
+
+    Rows keep the hour granularity of the sheet; a row edited after it was
+    queued is queued again as a new job.
+
+    Args:
+        queue (JobQueue): Queue to fill
+        sheet (ScheduleSheet): Authenticated schedule sheet
+        job (dict): Job fields shared by every post (``network``, options)
+        now (datetime): Current local time
+
+    Returns:
+        int: Number of new jobs
+    """
+    current_hour = now.replace(minute=0, second=0, microsecond=0)
+    added = 0
+    for due_at, post in await sheet.scheduled_posts():
+        if due_at < current_hour:
+            continue
+        content = {key: value for key, value in post.items() if value}
+        added += queue.enqueue({**job, **content}, due_at.timestamp())
+    return added
+
+
+def sync_feed(queue, feed, job: Dict[str, Any], max_count: int = 1) -> int:
+    """
+    Enqueue the latest feed entries that were never queued for this network.
+
+    Each entry is keyed by its link, so it is published once no matter how
+    often the feed is synced; no lookback window is needed.
+
+    Args:
+        queue (JobQueue): Queue to fill
+        feed (Feed): Downloaded feed
+        job (dict): Job fields shared by every post (``network``, options)
+        max_count (int): Latest entries to consider
+
+    Returns:
+        int: Number of new jobs
+    """
+    added = 0
+    now = datetime.datetime.now()
+    for item in feed.get_latest_items(max_count):
+        content = {
+            "status_text": item.title,
+            "status_link": item.get_timestamped_link(now.strftime("%Y%m%d%H%M%S")),
+            "status_image_url_1": item.image_url,
+        }
+        post = {**job, **{key: value for key, value in content.items() if value}}
+        added += queue.enqueue(post, now.timestamp(), key=f"feed:{job['network']}:{item.link or item.title}")
+    return added
+
+
+def _handle_add(args: Namespace):
+    from agoras.core.scheduler import JobQueue
+
+    queue = JobQueue()
+    added = queue.enqueue(_content_job(args), args.at)
+    print(json.dumps({"added": int(added)}))
+    return 0
+
+
+def _handle_sync_sheet(args: Namespace):
+    from agoras.core.scheduler import JobQueue
+    from agoras.core.sheet import ScheduleSheet
+
+    async def run():
+        sheet = ScheduleSheet(
+            args.sheets_id, args.sheets_client_email, args.sheets_private_key.replace("\\n", "\n"), args.sheets_name
+        )
+        await sheet.authenticate()
+        await sheet.get_worksheet()
+        return await sync_sheet(JobQueue(), sheet, _content_job(args), datetime.datetime.now())
+
+    print(json.dumps({"added": asyncio.run(run())}))
+    return 0
+
+
+def _handle_sync_feed(args: Namespace):
+    from agoras.core.feed import Feed
+    from agoras.core.scheduler import JobQueue
+
+    async def run():
+        feed = Feed(args.feed_url)
+        await feed.download()
+        return sync_feed(JobQueue(), feed, _content_job(args), args.max_count)
+
+    print(json.dumps({"added": asyncio.run(run())}))
+    return 0
+
+
+def _handle_list(args: Namespace):
+    from agoras.core.scheduler import JobQueue
+
+    for queued in JobQueue().jobs(args.state):
+        print(json.dumps(queued.to_dict(), default=str))
+    return 0
+
+
+def _handle_cancel(args: Namespace):
+    from agoras.core.scheduler import JobQueue
+
+    if not JobQueue().cancel(args.job_id):
+        raise Exception(f"No pending job {args.job_id}.")
+    return 0
+
+
+def _handle_run(args: Namespace):
+    """
+    Run the scheduler on a shared client pool.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        0, or 1 when ``--once`` left failed jobs
+    """
+    from agoras.core.pool import ClientPool
+    from agoras.core.scheduler import FAILED, JobQueue, Scheduler
+
+    from ..platform_runner import create_platform_instance
+
+    async def run():
+        pool = ClientPool(create_platform_instance, max_idle=None if args.once else 900.0)
+        scheduler = Scheduler(JobQueue(), pool.run, concurrency=args.concurrency, poll_interval=args.poll_interval)
+        try:
+            if args.once:
+                return await scheduler.run_pending()
+            await scheduler.run_forever()
+            return {}
+        finally:
+            await pool.close()
+
+    counts = asyncio.run(run())
+    if args.once:
+        print(json.dumps(counts))
+    return 1 if counts.get(FAILED) else 0
@@ -16,7 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-Tests for remaining platform parsers (Instagram, LinkedIn, Discord, YouTube, TikTok, Threads).
+Tests for remaining platform parsers (Instagram, LinkedIn, Discord, YouTube, TikTok, Threads, WhatsApp).
 """
 
 from argparse import ArgumentParser
@@ -227,3 +227,52 @@ def test_threads_share_action():
     ])
 
     assert args.post_id == 'post123'
+
+
+def test_whatsapp_broadcast_arguments():
+    """Test WhatsApp broadcast parses recipients and throughput options."""
+    from agoras.cli.converter import ParameterConverter
+    from agoras.cli.platforms.whatsapp import create_whatsapp_parser
+
+    root_parser = ArgumentParser()
+    subparsers = root_parser.add_subparsers(dest='platform')
+
+    create_whatsapp_parser(subparsers)
+
+    args = root_parser.parse_args([
+        'whatsapp', 'broadcast',
+        '--recipients', 'numbers.txt',
+        '--text', 'Hello everyone',
+        '--messages-per-second', '1000',
+    ])
+    assert args.action == 'broadcast'
+    assert args.concurrency == 20
+    assert args.template_name is None
+
+    legacy = ParameterConverter('whatsapp').convert_to_legacy(args)
+    assert legacy['whatsapp_recipients'] == 'numbers.txt'
+    assert legacy['whatsapp_messages_per_second'] == 1000
+    assert legacy['whatsapp_broadcast_concurrency'] == 20
+
+
+def test_telegram_broadcast_arguments():
+    """Test Telegram broadcast parses chat IDs and concurrency."""
+    from agoras.cli.converter import ParameterConverter
+    from agoras.cli.platforms.telegram import create_telegram_parser
+
+    root_parser = ArgumentParser()
+    subparsers = root_parser.add_subparsers(dest='platform')
+
+    create_telegram_parser(subparsers)
+
+    args = root_parser.parse_args([
+        'telegram', 'broadcast',
+        '--chat-ids=-100,@news',
+        '--text', 'Hello everyone',
+    ])
+    assert args.action == 'broadcast'
+    assert args.concurrency == 8
+
+    legacy = ParameterConverter('telegram').convert_to_legacy(args)
+    assert legacy['telegram_chat_ids'] == '-100,@news'
+    assert legacy['telegram_broadcast_concurrency'] == 8
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Tests for the agoras serve job server."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from agoras.cli.daemon import JobServer
+from agoras.cli.main import commandline
+from agoras.cli.platform_runner import create_platform_instance
+from agoras.cli.serve import default_socket_path
+from agoras.core.auth import AuthenticationError
+
+
+async def _request(server, raw):
+    reader = asyncio.StreamReader()
+    reader.feed_data(raw)
+    reader.feed_eof()
+    writer = MagicMock()
+    writer.drain = AsyncMock()
+    await server.handle_connection(reader, writer)
+    response = writer.write.call_args[0][0].decode("utf-8")
+    head, body = response.split("\r\n\r\n", 1)
+    return int(head.split()[1]), json.loads(body)
+
+
+def _post(payload):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+    return b"POST /jobs HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(body) + body
+
+
+@pytest.mark.asyncio
+async def test_health_reports_warm_clients():
+    pool = MagicMock()
+    pool.__len__.return_value = 2
+
+    status, body = await _request(JobServer(pool), b"GET /health HTTP/1.1\r\n\r\n")
+
+    assert status == 200
+    assert body == {"status": "ok", "clients": 2}
+
+
+@pytest.mark.asyncio
+async def test_post_job_runs_on_pool():
+    pool = MagicMock()
+    pool.run = AsyncMock(return_value="123")
+    job = {"network": "x", "action": "post", "status_text": "Hello"}
+
+    status, body = await _request(JobServer(pool), _post(job))
+
+    assert status == 200
+    assert body == {"id": "123"}
+    pool.run.assert_awaited_once_with(job)
+
+
+@pytest.mark.asyncio
+async def test_post_job_maps_errors():
+    pool = MagicMock()
+    pool.run = AsyncMock(side_effect=AuthenticationError("Run agoras x authorize."))
+    status, body = await _request(JobServer(pool), _post({"network": "x", "action": "post"}))
+    assert status == 401
+    assert "authorize" in body["error"]
+
+    pool.run = AsyncMock(side_effect=Exception("boom"))
+    status, body = await _request(JobServer(pool), _post({"network": "x", "action": "post"}))
+    assert status == 502
+    assert body == {"error": "boom"}
+
+
+@pytest.mark.asyncio
+async def test_post_job_rejects_invalid_body():
+    server = JobServer(MagicMock())
+
+    status, _ = await _request(server, _post(b"not json"))
+    assert status == 400
+
+    status, _ = await _request(server, _post([1, 2]))
+    assert status == 400
+
+    status, _ = await _request(server, b"GET /jobs HTTP/1.1\r\n\r\n")
+    assert status == 405
+
+    status, _ = await _request(server, b"GET /nope HTTP/1.1\r\n\r\n")
+    assert status == 404
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_round_trip(tmp_path):
+    pool = MagicMock()
+    pool.run = AsyncMock(return_value="42")
+    socket_path = str(tmp_path / "agoras.sock")
+
+    server = await JobServer(pool).start(socket_path=socket_path)
+    async with server:
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        writer.write(_post({"network": "x", "action": "like", "post_id": "42"}))
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+
+    assert response.startswith(b"HTTP/1.1 200 OK")
+    assert response.endswith(b'{"id":"42"}')
+
+
+def test_default_socket_path_uses_storage_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("AGORAS_STORAGE_DIR", str(tmp_path))
+    assert default_socket_path() == str(tmp_path.resolve() / "agoras.sock")
+
+
+def test_serve_parser_defaults():
+    _, args = commandline(["serve", "--port", "8765"])
+    assert args.port == 8765
+    assert args.host == "127.0.0.1"
+    assert args.max_idle == 900.0
+
+
+def test_create_platform_instance_maps_twitter_alias():
+    with patch("agoras.platforms.x.X", MagicMock(return_value="instance")) as mock_x:
+        assert create_platform_instance("twitter", {"a": 1}) == "instance"
+    mock_x.assert_called_once_with(a=1)
+
+    with pytest.raises(Exception, match="not supported"):
+        create_platform_instance("myspace", {})
@@ -125,7 +125,7 @@ def test_utils_feed_publish_rejects_cred_flags():
         ])
 
 
-@patch('agoras.cli.platform_runner.x')
+@patch('agoras.cli.platforms.x.x_main')
 def test_utils_feed_publish_main_reaches_platform_runner(mock_x):
     """Test utils feed-publish CLI entry dispatches through platform_runner."""
     mock_x.return_value = 0
@@ -191,7 +191,7 @@ def test_utils_schedule_run_rejects_cred_flags():
         ])
 
 
-@patch('agoras.cli.platform_runner.x')
+@patch('agoras.cli.platforms.x.x_main')
 def test_utils_schedule_run_main_reaches_platform_runner(mock_x):
     """Test utils schedule-run CLI entry dispatches through platform_runner."""
     mock_x.return_value = 0
@@ -264,3 +264,25 @@ def test_legacy_publish_with_migration_flag():
     assert args.network == 'twitter'
     assert args.action == 'post'
     assert args.show_migration is True
+
+
+@patch('agoras.cli.platforms.x.x_main')
+def test_profile_option_writes_reports_for_the_command(mock_x, tmp_path, monkeypatch):
+    """Test --profile wraps the command and writes the reports."""
+    monkeypatch.setenv('AGORAS_PROFILE_DIR', str(tmp_path))
+    mock_x.return_value = 0
+    status = main([
+        '--profile', 'both',
+        'utils', 'feed-publish',
+        '--network', 'x',
+        '--mode', 'last',
+        '--feed-url', 'https://example.com/feed.xml',
+    ])
+
+    assert status == 0
+    mock_x.assert_called_once()
+    names = sorted(path.name for path in tmp_path.iterdir())
+    assert len(names) == 3
+    assert names[0].endswith('-cpu.txt')
+    assert names[1].endswith('-memory.txt')
+    assert names[2].endswith('.pstats')
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Tests for platform_runner.execute_platform_action."""
 
+import subprocess
+import sys
 from io import StringIO
 from pathlib import Path
 from unittest.mock import patch
@@ -9,16 +11,16 @@ import pytest
 from agoras.cli.platform_runner import execute_platform_action
 
 NETWORK_WRAPPER_PATCHES = {
-    'x': 'agoras.cli.platform_runner.x',
-    'facebook': 'agoras.cli.platform_runner.facebook',
-    'instagram': 'agoras.cli.platform_runner.instagram',
-    'linkedin': 'agoras.cli.platform_runner.linkedin',
-    'discord': 'agoras.cli.platform_runner.discord',
-    'youtube': 'agoras.cli.platform_runner.youtube',
-    'tiktok': 'agoras.cli.platform_runner.tiktok',
-    'threads': 'agoras.cli.platform_runner.threads',
-    'telegram': 'agoras.cli.platform_runner.telegram',
-    'whatsapp': 'agoras.cli.platform_runner.whatsapp',
+    'x': 'agoras.cli.platforms.x.x_main',
+    'facebook': 'agoras.cli.platforms.facebook.facebook_main',
+    'instagram': 'agoras.cli.platforms.instagram.instagram_main',
+    'linkedin': 'agoras.cli.platforms.linkedin.linkedin_main',
+    'discord': 'agoras.cli.platforms.discord.discord_main',
+    'youtube': 'agoras.cli.platforms.youtube.youtube_main',
+    'tiktok': 'agoras.cli.platforms.tiktok.tiktok_main',
+    'threads': 'agoras.cli.platforms.threads.threads_main',
+    'telegram': 'agoras.cli.platforms.telegram.telegram_main',
+    'whatsapp': 'agoras.cli.platforms.whatsapp.whatsapp_main',
 }
 
 
@@ -30,7 +32,7 @@ def test_execute_platform_action_dispatches_to_wrapper(network, patch_target):
         mock_wrapper.assert_called_once_with(kwargs)
 
 
-@patch('agoras.cli.platform_runner.x')
+@patch('agoras.cli.platforms.x.x_main')
 def test_execute_platform_action_twitter_silent_alias(mock_x):
     kwargs = {'network': 'twitter', 'action': 'post'}
     execute_platform_action(**kwargs)
@@ -73,3 +75,21 @@ def test_publish_main_twitter_warns_then_delegates(mock_stderr, mock_execute):
     assert 'deprecated' in stderr_output.lower()
     mock_execute.assert_called_once()
     assert mock_execute.call_args[1]['network'] == 'twitter'
+
+
+def test_cli_startup_does_not_import_platform_sdks():
+    code = (
+        "import sys\n"
+        "from agoras.cli.main import commandline\n"
+        "commandline(['utils', 'media-limits'])\n"
+        "heavy = ['tweepy', 'discord', 'telegram', 'googleapiclient', 'gspread', 'cv2', 'PIL', 'agoras.platforms.x']\n"
+        "print(','.join(name for name in heavy if name in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
+
+
+@patch('agoras.platforms.x.wrapper.main')
+def test_execute_platform_action_imports_only_target_wrapper(mock_main):
+    execute_platform_action(network='x', action='post')
+    mock_main.assert_called_once_with({'network': 'x', 'action': 'post'})
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for batch publish utility command.
+"""
+
+import asyncio
+import json
+from io import StringIO
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from agoras.cli.main import commandline
+from agoras.cli.utils.batch import normalize_spec, read_specs, run_batch
+
+
+def test_normalize_spec_maps_aliases_and_options():
+    job = normalize_spec({
+        "network": "x",
+        "text": "Hello",
+        "link": "https://example.com",
+        "images": ["https://example.com/1.jpg", "https://example.com/2.jpg"],
+        "options": {"x_account": "main"},
+        "video_title": "",
+    })
+
+    assert job == {
+        "network": "x",
+        "action": "post",
+        "status_text": "Hello",
+        "status_link": "https://example.com",
+        "status_image_url_1": "https://example.com/1.jpg",
+        "status_image_url_2": "https://example.com/2.jpg",
+        "x_account": "main",
+    }
+
+
+def test_normalize_spec_accepts_csv_strings():
+    job = normalize_spec({"network": "facebook", "action": "like", "post_id": "1", "options": '{"a": "b"}'})
+    assert job == {"network": "facebook", "action": "like", "post_id": "1", "a": "b"}
+
+
+def test_normalize_spec_requires_network():
+    with pytest.raises(Exception, match="network is required"):
+        normalize_spec({"text": "Hello"})
+
+
+def test_read_specs_jsonl_reports_invalid_lines():
+    specs = list(read_specs(StringIO('{"network": "x"}\n\nnot json\n'), "jsonl"))
+
+    assert specs[0] == (1, {"network": "x"})
+    assert specs[1][0] == 3
+    assert isinstance(specs[1][1], ValueError)
+
+
+def test_read_specs_csv():
+    specs = list(read_specs(StringIO("network,text\nx,Hello\nfacebook,Hi\n"), "csv"))
+    assert specs == [(2, {"network": "x", "text": "Hello"}), (3, {"network": "facebook", "text": "Hi"})]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_streams_ids_and_errors():
+    async def run(job):
+        if job["status_text"] == "bad":
+            raise Exception("rejected")
+        return f"{job['network']}-{job['status_text']}"
+
+    pool = MagicMock()
+    pool.run = AsyncMock(side_effect=run)
+    pool.close = AsyncMock()
+    output = StringIO()
+    specs = [(1, {"network": "x", "text": "a"}), (2, {"network": "x", "text": "bad"}), (3, ValueError("oops"))]
+
+    failures = await run_batch(specs, pool, output)
+
+    results = sorted((json.loads(line) for line in output.getvalue().splitlines()), key=lambda r: r["line"])
+    assert failures == 2
+    assert results[0] == {"line": 1, "network": "x", "action": "post", "id": "x-a"}
+    assert results[1]["error"] == "rejected"
+    assert results[2]["error"].startswith("Invalid record")
+    pool.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_batch_limits_per_platform_concurrency():
+    active = {"x": 0, "facebook": 0}
+    peak = {"x": 0, "facebook": 0}
+
+    async def run(job):
+        network = job["network"]
+        active[network] += 1
+        peak[network] = max(peak[network], active[network])
+        await asyncio.sleep(0.01)
+        active[network] -= 1
+        return "ok"
+
+    pool = MagicMock()
+    pool.run = AsyncMock(side_effect=run)
+    pool.close = AsyncMock()
+    specs = [(i, {"network": "x" if i % 2 else "facebook"}) for i in range(20)]
+
+    failures = await run_batch(specs, pool, StringIO(), concurrency=2)
+
+    assert failures == 0
+    assert peak == {"x": 2, "facebook": 2}
+
+
+def test_batch_publish_command_writes_results(tmp_path):
+    input_path = tmp_path / "posts.jsonl"
+    input_path.write_text('{"network": "x", "text": "Hello"}\n', encoding="utf-8")
+    output_path = tmp_path / "results.jsonl"
+    _, args = commandline(["utils", "batch-publish", "--input", str(input_path), "--output", str(output_path)])
+
+    with patch("agoras.core.pool.ClientPool.run", new=AsyncMock(return_value="42")):
+        status = args.command(args)
+
+    assert status == 0
+    assert json.loads(output_path.read_text(encoding="utf-8")) == {
+        "line": 1, "network": "x", "action": "post", "id": "42",
+    }
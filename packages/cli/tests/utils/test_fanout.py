@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for fan-out publish utility command.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from agoras.cli.main import commandline
+from agoras.cli.utils.fanout import fan_out
+from agoras.media.cache import active_download_cache
+
+
+def test_networks_are_parsed_and_validated(capsys):
+    _, args = commandline(["utils", "fan-out", "--networks", "twitter, facebook,x", "--text", "Hi"])
+    assert args.networks == ["x", "facebook"]
+
+    with pytest.raises(SystemExit):
+        commandline(["utils", "fan-out", "--networks", "x,youtube", "--text", "Hi"])
+    assert "does not support the post action" in capsys.readouterr().err
+
+
+@pytest.mark.asyncio
+async def test_fan_out_runs_networks_concurrently_with_shared_cache():
+    started = []
+    caches = []
+
+    async def run(job):
+        started.append(job["network"])
+        caches.append(active_download_cache())
+        await asyncio.sleep(0.01)
+        if job["network"] == "facebook":
+            raise Exception("rejected")
+        assert len(started) == 2
+        return f"{job['network']}-1"
+
+    pool = MagicMock()
+    pool.run = AsyncMock(side_effect=run)
+    pool.close = AsyncMock()
+
+    results = await fan_out(pool, ["x", "facebook"], {"action": "post", "status_text": "Hi"})
+
+    assert results == {"x": {"id": "x-1"}, "facebook": {"error": "rejected"}}
+    assert caches[0] is not None and caches[0] is caches[1]
+    pool.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_applies_per_network_timeout():
+    async def run(job):
+        if job["network"] == "linkedin":
+            await asyncio.sleep(1)
+        return "ok"
+
+    pool = MagicMock()
+    pool.run = AsyncMock(side_effect=run)
+    pool.close = AsyncMock()
+
+    results = await fan_out(pool, ["x", "linkedin"], {"action": "post"}, timeout=0.05)
+
+    assert results["x"] == {"id": "ok"}
+    assert results["linkedin"]["error"].startswith("Timed out")
+
+
+def test_fan_out_command_prints_combined_status(capsys):
+    _, args = commandline(["utils", "fan-out", "--networks", "x,threads", "--text", "Hi", "--image-1", "a.jpg"])
+
+    with patch("agoras.core.pool.ClientPool.run", new=AsyncMock(return_value="42")) as mock_run:
+        status = args.command(args)
+
+    assert status == 0
+    assert json.loads(capsys.readouterr().out) == {"x": {"id": "42"}, "threads": {"id": "42"}}
+    job = mock_run.await_args_list[0].args[0]
+    assert job["status_text"] == "Hi"
+    assert job["status_image_url_1"] == "a.jpg"
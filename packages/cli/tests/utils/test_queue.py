@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Tests for the job queue utility command.
+"""
+
+import datetime
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from agoras.cli.main import commandline
+from agoras.cli.utils.queue import sync_feed, sync_sheet
+from agoras.core.scheduler import DONE, JobQueue
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setenv("AGORAS_STORAGE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_add_list_and_run_once(storage, capsys):
+    _, args = commandline([
+        "utils", "queue", "add", "--network", "x", "--at", "2020-01-01T09:30", "--text", "Hi", "--image-1", "a.jpg",
+    ])
+    assert args.command(args) == 0
+    assert json.loads(capsys.readouterr().out) == {"added": 1}
+
+    _, args = commandline(["utils", "queue", "run", "--once"])
+    with patch("agoras.core.pool.ClientPool.run", new=AsyncMock(return_value="42")) as mock_run:
+        assert args.command(args) == 0
+    assert json.loads(capsys.readouterr().out) == {DONE: 1}
+    job = mock_run.await_args.args[0]
+    assert job.pop("idempotency_key")
+    assert job == {"network": "x", "action": "post", "status_text": "Hi", "status_image_url_1": "a.jpg"}
+
+    _, args = commandline(["utils", "queue", "list", "--state", "done"])
+    args.command(args)
+    listed = json.loads(capsys.readouterr().out)
+    assert listed["result"] == "42"
+    assert listed["run_at"] == datetime.datetime(2020, 1, 1, 9, 30).timestamp()
+
+
+def test_add_rejects_invalid_time(capsys):
+    with pytest.raises(SystemExit):
+        commandline(["utils", "queue", "add", "--network", "x", "--at", "tomorrow", "--text", "Hi"])
+    assert "ISO 8601" in capsys.readouterr().err
+
+
+@pytest.mark.asyncio
+async def test_sync_sheet_enqueues_current_and_future_rows_once():
+    now = datetime.datetime(2026, 5, 1, 10, 25)
+    sheet = MagicMock()
+    sheet.scheduled_posts = AsyncMock(return_value=[
+        (datetime.datetime(2026, 5, 1, 9), {"status_text": "missed"}),
+        (datetime.datetime(2026, 5, 1, 10), {"status_text": "now", "status_link": ""}),
+        (datetime.datetime(2026, 5, 2, 8), {"status_text": "tomorrow"}),
+    ])
+    queue = JobQueue(":memory:")
+
+    assert await sync_sheet(queue, sheet, {"network": "telegram"}, now) == 2
+    assert await sync_sheet(queue, sheet, {"network": "telegram"}, now) == 0
+
+    jobs = queue.jobs()
+    assert [job.job["status_text"] for job in jobs] == ["now", "tomorrow"]
+    assert "status_link" not in jobs[0].job
+    assert jobs[1].run_at == datetime.datetime(2026, 5, 2, 8).timestamp()
+
+
+def test_sync_feed_queues_each_entry_once():
+    item = MagicMock(title="Post", link="https://example.com/post", image_url="")
+    item.get_timestamped_link.return_value = "https://example.com/post?t=1"
+    feed = MagicMock()
+    feed.get_latest_items.return_value = [item]
+    queue = JobQueue(":memory:")
+
+    assert sync_feed(queue, feed, {"network": "x"}, max_count=3) == 1
+    item.get_timestamped_link.return_value = "https://example.com/post?t=2"
+    assert sync_feed(queue, feed, {"network": "x"}, max_count=3) == 0
+    assert sync_feed(queue, feed, {"network": "threads"}, max_count=3) == 1
+
+    feed.get_latest_items.assert_called_with(3)
+    assert queue.jobs()[0].job == {
+        "network": "x", "action": "post", "status_text": "Post", "status_link": "https://example.com/post?t=1",
+    }
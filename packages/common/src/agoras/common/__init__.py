@@ -25,12 +25,28 @@ This package provides low-level utilities used throughout the Agoras ecosystem:
 - Logging infrastructure
 - URL manipulation utilities
 - Web scraping utilities
+- Shared on-disk key-value store
+- Phase timing metrics
+- CPU and memory profiling
+- Named thread pools for blocking work
 """
 
+from .lazy import lazy_exports
 from .logger import ControlableLogger, logger
-from .utils import add_url_timestamp, parse_metatags
 from .version import __author__, __description__, __email__, __url__, __version__
 
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "KeyValueStore": ".store",
+        "Metrics": ".metrics",
+        "NamedExecutor": ".executors",
+        "Profiler": ".profiling",
+        "add_url_timestamp": ".utils",
+        "parse_metatags": ".utils",
+    },
+)
+
 __all__ = [
     "__version__",
     "__author__",
@@ -39,6 +55,10 @@ __all__ = [
     "__description__",
     "logger",
     "ControlableLogger",
+    "KeyValueStore",
+    "Metrics",
+    "NamedExecutor",
+    "Profiler",
     "add_url_timestamp",
     "parse_metatags",
 ]
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.common.executors module.
+
+Named, bounded thread pools for blocking work. Short API calls, media
+transfers, status polls and CPU-bound media work each get their own
+pool, so a fan-out of long uploads cannot starve the polls and posts
+queued behind them on the event loop's default executor.
+
+Every pool reports how long work waited for a free thread as the
+``queue_wait`` phase of the metrics histogram, labelled with the pool.
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from .metrics import metrics
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Pools, by the kind of blocking work they run.
+API = "api"
+UPLOAD = "upload"
+POLL = "poll"
+CPU = "cpu"
+
+
+@dataclass(frozen=True)
+class ExecutorSpec:
+    """Default size and purpose of a named pool."""
+
+    workers: int
+    purpose: str
+
+
+EXECUTORS: Dict[str, ExecutorSpec] = {
+    API: ExecutorSpec(16, "Short platform API and SDK calls"),
+    UPLOAD: ExecutorSpec(8, "Media uploads and downloads"),
+    POLL: ExecutorSpec(8, "Status checks while platforms process media"),
+    CPU: ExecutorSpec(os.cpu_count() or 1, "Hashing and media validation"),
+}
+
+
+class NamedExecutor:
+    """Thread pool with a name, a fixed size and saturation counters."""
+
+    def __init__(self, name: str, workers: int):
+        """
+        Initialize the executor; threads start on first use.
+
+        Args:
+            name (str): Pool name, used for thread names and metrics labels
+            workers (int): Maximum threads
+        """
+        self.name = name
+        self.workers = max(1, int(workers))
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self.active = 0
+        self.queued = 0
+        self.submitted = 0
+        self.saturated = 0
+        self.peak_queued = 0
+
+    async def run(self, func: Callable[..., R], *args, **kwargs) -> R:
+        """
+        Run blocking ``func(*args, **kwargs)`` on this pool and await its result.
+
+        Like ``asyncio.to_thread``, the call sees the caller's context
+        variables (metrics labels, active journal).
+
+        Args:
+            func (callable): Blocking function
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The result of ``func``
+        """
+        return await asyncio.wrap_future(self._submit(func, *args, **kwargs))
+
+    def map(self, func: Callable[[T], R], items: Iterable[T], limit: int) -> List[R]:
+        """
+        Call blocking ``func(item)`` for every item, on at most ``limit`` threads.
+
+        The calling thread works through the items too and borrows up to
+        ``limit - 1`` threads of this pool, so a caller that already runs on
+        the pool, such as an upload fanning out its chunks, finishes even when
+        every other thread is busy. Borrowed threads that have not started
+        when the items run out are given back.
+
+        Args:
+            func (callable): Blocking function called with each item
+            items (iterable): Items to process
+            limit (int): Maximum threads, the calling one included
+
+        Returns:
+            list: Results in the same order as ``items``
+
+        Raises:
+            Exception: The first exception raised by ``func``, in item order;
+                no new items are started after a failure
+        """
+        items = list(items)
+        results: List[Any] = [None] * len(items)
+        errors: Dict[int, BaseException] = {}
+        pending = iter(range(len(items)))
+        lock = threading.Lock()
+
+        def work():
+            while True:
+                with lock:
+                    index = None if errors else next(pending, None)
+                if index is None:
+                    return
+                try:
+                    results[index] = func(items[index])
+                except BaseException as error:
+                    with lock:
+                        errors[index] = error
+
+        helpers = [self._submit(work) for _ in range(min(limit, len(items)) - 1)]
+        work()
+        for helper in helpers:
+            if not helper.cancel():
+                helper.result()
+        if errors:
+            raise errors[min(errors)]
+        return results
+
+    def _submit(self, func: Callable[..., R], *args, **kwargs) -> "Future[R]":
+        """Submit ``func`` in a copy of the caller's context, keeping the counters."""
+        context = contextvars.copy_context()
+        submitted = time.perf_counter()
+
+        def call():
+            started = time.perf_counter()
+            with self._lock:
+                self.queued -= 1
+                self.active += 1
+            metrics.observe("queue_wait", started - submitted, executor=self.name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.active -= 1
+
+        with self._lock:
+            self.queued += 1
+            self.submitted += 1
+            waiting = self.active + self.queued - self.workers
+            if waiting > 0:
+                self.saturated += 1
+                self.peak_queued = max(self.peak_queued, waiting)
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"agoras-{self.name}")
+            future = self._pool.submit(context.run, call)
+        future.add_done_callback(self._forget_cancelled)
+        return future
+
+    def _forget_cancelled(self, future: Future):
+        # Work cancelled before a thread picked it up never ran call().
+        if future.cancelled():
+            with self._lock:
+                self.queued -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the pool size and saturation counters.
+
+        Returns:
+            dict: ``workers``, ``active`` and ``queued`` now, ``submitted`` calls,
+            ``saturated`` calls that found every thread busy, and ``peak_queued``
+            calls waiting at once
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "active": self.active,
+                "queued": self.queued,
+                "submitted": self.submitted,
+                "saturated": self.saturated,
+                "peak_queued": self.peak_queued,
+            }
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the threads; the pool restarts on its next use.
+
+        Args:
+            wait (bool): Wait for running work to finish
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+_executors: Dict[str, NamedExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _spec(name: str) -> ExecutorSpec:
+    if name not in EXECUTORS:
+        raise Exception(f'Unknown executor "{name}". Must be one of: {", ".join(EXECUTORS)}.')
+    return EXECUTORS[name]
+
+
+def configured_workers(name: str) -> int:
+    """
+    Return the size of a pool: ``AGORAS_<NAME>_WORKERS`` or its default.
+
+    Args:
+        name (str): Pool name
+
+    Returns:
+        int: Maximum threads
+
+    Raises:
+        Exception: If the pool is unknown or the variable is not a positive integer
+    """
+    spec = _spec(name)
+    variable = f"AGORAS_{name.upper()}_WORKERS"
+    value = os.environ.get(variable)
+    if not value:
+        return spec.workers
+    if not value.isdigit() or int(value) < 1:
+        raise Exception(f'{variable} must be a positive integer, got "{value}".')
+    return int(value)
+
+
+def executor(name: str) -> NamedExecutor:
+    """
+    Return the process-wide pool with this name, creating it on first use.
+
+    Args:
+        name (str): :data:`API`, :data:`UPLOAD`, :data:`POLL` or :data:`CPU`
+
+    Returns:
+        NamedExecutor: The pool
+    """
+    with _executors_lock:
+        pool = _executors.get(name)
+        if pool is None:
+            pool = _executors[name] = NamedExecutor(name, configured_workers(name))
+        return pool
+
+
+def configure(name: str, workers: int):
+    """
+    Resize a pool, e.g. for a daemon that fans out to many accounts.
+
+    Work already running on the old threads finishes there.
+
+    Args:
+        name (str): Pool name
+        workers (int): Maximum threads
+    """
+    _spec(name)
+    with _executors_lock:
+        previous = _executors.pop(name, None)
+        _executors[name] = NamedExecutor(name, workers)
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+async def run_blocking(name: str, func: Callable[..., R], *args, **kwargs) -> R:
+    """
+    Run blocking ``func(*args, **kwargs)`` on the named pool.
+
+    This is the replacement for ``asyncio.to_thread`` in platform clients.
+
+    Args:
+        name (str): Pool name
+        func (callable): Blocking function
+        *args: Positional arguments for ``func``
+        **kwargs: Keyword arguments for ``func``
+
+    Returns:
+        The result of ``func``
+    """
+    return await executor(name).run(func, *args, **kwargs)
+
+
+def executor_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Return the counters of every pool used so far.
+
+    Returns:
+        dict: Pool name to :meth:`NamedExecutor.stats`
+    """
+    with _executors_lock:
+        pools = list(_executors.values())
+    return {pool.name: pool.stats() for pool in pools}
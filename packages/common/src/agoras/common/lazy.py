@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.common.lazy.
+
+Deferred package exports (PEP 562) so importing a package does not pull in
+every optional SDK behind it until one of its names is actually used.
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` hooks for a package.
+
+    Each exported name is imported from its submodule on first access and
+    then cached in the package namespace, so later lookups are plain
+    attribute reads.
+
+    Args:
+        package (str): Package name, usually ``__name__``
+        exports (dict): Mapping of exported name to relative submodule (e.g. ``".image"``)
+
+    Returns:
+        tuple: ``(__getattr__, __dir__)`` functions for the package module
+    """
+
+    def __getattr__(name: str) -> object:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
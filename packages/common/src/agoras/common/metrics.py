@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.common.metrics module.
+
+Timing spans for the phases of an action (auth, download, validate,
+upload, poll, publish). Completed spans can be written as JSON log lines
+(``AGORAS_METRICS_LOG``) and aggregated into latency histograms exported
+as a Prometheus textfile (``AGORAS_METRICS_TEXTFILE``). With neither set,
+spans cost one attribute check.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from .store import KeyValueStore, default_store
+
+METRIC_NAME = "agoras_phase_duration_seconds"
+NAMESPACE = "metrics"
+STORE_KEY = "phase_duration_seconds"
+
+# Upper bounds in seconds: API calls take milliseconds, video uploads and
+# container processing take minutes.
+BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+# Textfile rewrites from long-running processes are spaced at least this far apart.
+FLUSH_INTERVAL = 15.0
+
+_labels: ContextVar[Dict[str, str]] = ContextVar("agoras_metrics_labels", default={})
+
+Series = Tuple[Tuple[str, str], ...]
+
+# Called with the phase and its labels; the returned context wraps the span.
+Observer = Callable[[str, Dict[str, str]], ContextManager[Any]]
+
+
+class _Histogram:
+    """Bucket counts, sum and count of one label set."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, counts: Optional[List[int]] = None, total: float = 0.0, count: int = 0):
+        self.counts = counts or [0] * len(BUCKETS)
+        self.total = total
+        self.count = count
+
+    def observe(self, seconds: float):
+        for index, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.counts[index] += 1
+                break
+        self.total += seconds
+        self.count += 1
+
+    def merge(self, other: "_Histogram"):
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.count += other.count
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"counts": self.counts, "sum": self.total, "count": self.count}
+
+
+class Metrics:
+    """
+    Span recorder with JSON log and Prometheus textfile outputs.
+
+    The module-level :data:`metrics` instance is configured from the
+    environment; tests and embedders can build their own.
+    """
+
+    def __init__(
+        self,
+        log: Optional[str] = None,
+        textfile: Optional[str] = None,
+        store: Optional[KeyValueStore] = None,
+    ):
+        """
+        Initialize the recorder.
+
+        Args:
+            log (str, optional): JSON log destination, a file path or ``-`` for stderr
+            textfile (str, optional): Prometheus textfile to write on :meth:`flush`
+            store (KeyValueStore, optional): Where histograms accumulate across
+                processes; the shared state store by default
+        """
+        self.log = log
+        self.textfile = textfile
+        self._store = store
+        self.enabled = bool(log or textfile)
+        self._lock = threading.Lock()
+        self._pending: Dict[Series, _Histogram] = {}
+        self._last_flush = 0.0
+        self._observers: List[Observer] = []
+
+    @classmethod
+    def from_env(cls) -> "Metrics":
+        """
+        Build a recorder from ``AGORAS_METRICS_LOG`` and ``AGORAS_METRICS_TEXTFILE``.
+
+        Returns:
+            Metrics: Configured recorder, disabled when neither variable is set
+        """
+        return cls(log=os.environ.get("AGORAS_METRICS_LOG"), textfile=os.environ.get("AGORAS_METRICS_TEXTFILE"))
+
+    @contextmanager
+    def span(self, phase: str, **labels: Any) -> Iterator[None]:
+        """
+        Time a phase; the outcome is ``error`` if the block raises.
+
+        Labels bound with :func:`labels` (e.g. ``platform``) are added.
+
+        Args:
+            phase (str): Phase name (``auth``, ``download``, ``upload``, ...)
+            **labels: Extra labels for this span
+        """
+        if not self.enabled and not self._observers:
+            yield
+            return
+        with ExitStack() as stack:
+            if self._observers:
+                bound = {**_labels.get(), **{key: str(value) for key, value in labels.items() if value is not None}}
+                for observer in list(self._observers):
+                    stack.enter_context(observer(phase, bound))
+            start = time.perf_counter()
+            outcome = "ok"
+            try:
+                yield
+            except BaseException:
+                outcome = "error"
+                raise
+            finally:
+                self.observe(phase, time.perf_counter() - start, outcome, **labels)
+
+    def add_observer(self, observer: Observer):
+        """
+        Wrap every span in ``observer(phase, labels)``, e.g. to profile phases.
+
+        Args:
+            observer (callable): Returns a context manager entered for the span
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer: Observer):
+        """
+        Stop wrapping spans in ``observer``.
+
+        Args:
+            observer (callable): Observer passed to :meth:`add_observer`
+        """
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    def observe(self, phase: str, seconds: float, outcome: str = "ok", **labels: Any):
+        """
+        Record one completed phase.
+
+        Args:
+            phase (str): Phase name
+            seconds (float): Duration
+            outcome (str): ``ok`` or ``error``
+            **labels: Extra labels, added to the bound ones
+        """
+        if not self.enabled:
+            return
+        merged = {**_labels.get(), **{key: str(value) for key, value in labels.items() if value is not None}}
+        merged.update(phase=phase, outcome=outcome)
+
+        if self.log:
+            self._write_log({"ts": round(time.time(), 3), **merged, "duration_ms": round(seconds * 1000, 3)})
+        if self.textfile:
+            series = tuple(sorted(merged.items()))
+            with self._lock:
+                self._pending.setdefault(series, _Histogram()).observe(seconds)
+
+    def flush(self, force: bool = True):
+        """
+        Merge recorded histograms into the shared store and rewrite the textfile.
+
+        Args:
+            force (bool): Flush even if the last flush was less than :data:`FLUSH_INTERVAL` ago
+        """
+        if not self.textfile:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_flush < FLUSH_INTERVAL:
+                return
+            pending, self._pending = self._pending, {}
+            self._last_flush = now
+
+        store = self._store if self._store is not None else default_store()
+
+        def merge(current):
+            totals = {series: _Histogram(**values) for series, values in _decode(current)}
+            for series, histogram in pending.items():
+                totals.setdefault(series, _Histogram()).merge(histogram)
+            return [[list(map(list, series)), histogram.to_dict()] for series, histogram in totals.items()]
+
+        totals = store.update(NAMESPACE, STORE_KEY, merge)
+        _write_atomic(self.textfile, render(_decode(totals)))
+
+    def _write_log(self, record: Dict[str, Any]):
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self.log == "-":
+                sys.stderr.write(line)
+                sys.stderr.flush()
+            else:
+                with open(self.log, "a", encoding="utf-8") as stream:
+                    stream.write(line)
+
+
+def _decode(stored) -> Iterator[Tuple[Series, Dict[str, Any]]]:
+    for series, values in stored or []:
+        yield (
+            tuple(tuple(pair) for pair in series),
+            {
+                "counts": values["counts"],
+                "total": values["sum"],
+                "count": values["count"],
+            },
+        )
+
+
+def _format_labels(series: Series, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(series) + ([extra] if extra else [])
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(pairs, escaped)) + "}"
+
+
+def render(histograms) -> str:
+    """
+    Render histograms in the Prometheus text exposition format.
+
+    Args:
+        histograms: ``(series, {"counts", "total", "count"})`` pairs
+
+    Returns:
+        str: Text for a node_exporter textfile collector or a scrape endpoint
+    """
+    lines = [
+        f"# HELP {METRIC_NAME} Time spent in each phase of an Agoras action.",
+        f"# TYPE {METRIC_NAME} histogram",
+    ]
+    for series, values in sorted(histograms):
+        cumulative = 0
+        for bound, count in zip(BUCKETS, values["counts"]):
+            cumulative += count
+            lines.append(f"{METRIC_NAME}_bucket{_format_labels(series, ('le', f'{bound:g}'))} {cumulative}")
+        lines.append(f"{METRIC_NAME}_bucket{_format_labels(series, ('le', '+Inf'))} {values['count']}")
+        lines.append(f"{METRIC_NAME}_sum{_format_labels(series)} {values['total']:.6f}")
+        lines.append(f"{METRIC_NAME}_count{_format_labels(series)} {values['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def _write_atomic(path: str, text: str):
+    # The textfile collector may read at any time; never let it see a partial file.
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as stream:
+        stream.write(text)
+    os.replace(temporary, path)
+
+
+@contextmanager
+def labels(**values: Any) -> Iterator[None]:
+    """
+    Attach labels such as ``platform`` to every span started in this block.
+
+    Args:
+        **values: Label values; None values are ignored
+    """
+    token = _labels.set({**_labels.get(), **{key: str(value) for key, value in values.items() if value is not None}})
+    try:
+        yield
+    finally:
+        _labels.reset(token)
+
+
+metrics = Metrics.from_env()
+
+
+def span(phase: str, **values: Any):
+    """
+    Time a phase with the process-wide recorder.
+
+    Args:
+        phase (str): Phase name
+        **values: Extra labels for this span
+
+    Returns:
+        Context manager timing the block
+    """
+    return metrics.span(phase, **values)
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.common.profiling module.
+
+CPU and memory profiling of a whole command, enabled with ``agoras
+--profile`` or ``AGORAS_PROFILE``. CPU profiles are written as pstats
+files (for snakeviz, flameprof or gprof2dot) with a text summary; memory
+profiles report the peak and top allocation sites overall and for each
+metrics phase (auth, download, upload, ...).
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .metrics import metrics
+from .store import storage_dir
+
+MODES = ("cpu", "memory", "both")
+
+# Frames kept per allocation, so reports point at the caller and not only at bytes().
+TRACE_DEPTH = 25
+
+# Lines in each top-N section of the reports.
+TOP = 25
+PHASE_TOP = 5
+
+# The profiler's own bookkeeping and module imports are noise in allocation reports.
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+_phase_stack: ContextVar[Tuple["_PhaseFrame", ...]] = ContextVar("agoras_profile_phases", default=())
+
+
+class _PhaseFrame:
+    """Memory accounting of one running span."""
+
+    __slots__ = ("start", "peak", "snapshot")
+
+    def __init__(self, start: int, snapshot: Optional[tracemalloc.Snapshot]):
+        self.start = start
+        self.peak = start
+        self.snapshot = snapshot
+
+
+class _PhaseMemory:
+    """Worst call of one phase: highest peak, and where that call allocated."""
+
+    __slots__ = ("calls", "peak", "growth", "top")
+
+    def __init__(self):
+        self.calls = 0
+        self.peak = 0
+        self.growth = 0
+        self.top: List[tracemalloc.StatisticDiff] = []
+
+
+class Profiler:
+    """Profile a block of code and write the reports to a directory."""
+
+    def __init__(self, mode: str, directory: Optional[str] = None):
+        """
+        Initialize the profiler.
+
+        Args:
+            mode (str): ``cpu``, ``memory`` or ``both``
+            directory (str, optional): Where reports go; ``$AGORAS_PROFILE_DIR``
+                or ``profiles`` in the agoras state directory by default
+
+        Raises:
+            Exception: If the mode is unknown
+        """
+        if mode not in MODES:
+            raise Exception(f'Unknown profile mode "{mode}". Must be one of: {", ".join(MODES)}.')
+        self.mode = mode
+        self.cpu = mode in ("cpu", "both")
+        self.memory = mode in ("memory", "both")
+        configured = directory or os.environ.get("AGORAS_PROFILE_DIR")
+        self.directory = Path(configured).expanduser() if configured else storage_dir() / "profiles"
+        self.files: List[Path] = []
+        self._lock = threading.Lock()
+        self._phases: Dict[str, _PhaseMemory] = {}
+        self._thread_profiles: List[cProfile.Profile] = []
+
+    @classmethod
+    def from_env(cls) -> Optional["Profiler"]:
+        """
+        Build a profiler from ``AGORAS_PROFILE``, for cron jobs and daemons.
+
+        Returns:
+            Profiler or None: None when ``AGORAS_PROFILE`` is unset or ``off``
+        """
+        mode = os.environ.get("AGORAS_PROFILE", "").strip().lower()
+        if not mode or mode == "off":
+            return None
+        return cls(mode)
+
+    @contextmanager
+    def profile(self, name: str = "agoras") -> Iterator["Profiler"]:
+        """
+        Profile the block and write the reports when it ends, even if it raises.
+
+        Args:
+            name (str): Prefix of the report files, e.g. the command name
+
+        Yields:
+            Profiler: This profiler; :attr:`files` lists the reports afterwards
+        """
+        stem = f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        profile = cProfile.Profile() if self.cpu else None
+        started_tracing = False
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACE_DEPTH)
+                started_tracing = True
+            metrics.add_observer(self._phase)
+        if profile:
+            # Before 3.12 cProfile only sees the thread that enabled it; API
+            # calls run in worker threads, so give each new thread its own.
+            if sys.version_info < (3, 12):
+                threading.setprofile(self._profile_thread)
+            profile.enable()
+        try:
+            yield self
+        finally:
+            if profile:
+                profile.disable()
+                threading.setprofile(None)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if profile:
+                self._write_cpu(profile, stem)
+            if self.memory:
+                metrics.remove_observer(self._phase)
+                self._write_memory(stem)
+                if started_tracing:
+                    tracemalloc.stop()
+
+    def _profile_thread(self, frame, event, arg):
+        profile = cProfile.Profile()
+        with self._lock:
+            self._thread_profiles.append(profile)
+        profile.enable()
+
+    @contextmanager
+    def _phase(self, phase: str, labels: Dict[str, str]) -> Iterator[None]:
+        current = tracemalloc.get_traced_memory()[0]
+        frame = _PhaseFrame(current, _snapshot())
+        parents = _phase_stack.get()
+        # The peak counter is global: fold it into the enclosing span before reusing it.
+        if parents:
+            parents[-1].peak = max(parents[-1].peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        token = _phase_stack.set(parents + (frame,))
+        try:
+            yield
+        finally:
+            _phase_stack.reset(token)
+            end, peak = tracemalloc.get_traced_memory()
+            frame.peak = max(frame.peak, peak)
+            if parents:
+                parents[-1].peak = max(parents[-1].peak, frame.peak)
+            self._record(phase, labels, frame, end)
+
+    def _record(self, phase: str, labels: Dict[str, str], frame: _PhaseFrame, end: int):
+        key = ":".join([labels["platform"], phase] if labels.get("platform") else [phase])
+        peak = frame.peak - frame.start
+        with self._lock:
+            stats = self._phases.setdefault(key, _PhaseMemory())
+            stats.calls += 1
+            if peak < stats.peak:
+                return
+            stats.peak = peak
+            stats.growth = end - frame.start
+        top = _snapshot().compare_to(frame.snapshot, "lineno")[:PHASE_TOP]
+        with self._lock:
+            if stats.peak == peak:
+                stats.top = top
+
+    def _write_cpu(self, profile: cProfile.Profile, stem: str):
+        path = self.directory / f"{stem}.pstats"
+        summary = io.StringIO()
+        stats = pstats.Stats(profile, stream=summary)
+        with self._lock:
+            threads, self._thread_profiles = self._thread_profiles, []
+        for thread_profile in threads:
+            thread_profile.disable()
+            stats.add(thread_profile)
+        stats.dump_stats(str(path))
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(TOP)
+        text = self.directory / f"{stem}-cpu.txt"
+        text.write_text(summary.getvalue(), encoding="utf-8")
+        self.files += [path, text]
+
+    def _write_memory(self, stem: str):
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"Traced memory: {_size(current)} at exit, {_size(peak)} peak since the last phase", ""]
+        lines.append(f"Top {TOP} allocation sites still alive at exit:")
+        for stat in _snapshot().statistics("lineno")[:TOP]:
+            lines.append(f"  {_size(stat.size):>10}  {stat.count:>7} blocks  {stat.traceback[0]}")
+
+        with self._lock:
+            phases = sorted(self._phases.items(), key=lambda item: item[1].peak, reverse=True)
+        lines += [
+            "",
+            "Phases by worst peak above the memory in use when they started,",
+            f"with the top {PHASE_TOP} sites of memory still held when that call ended:",
+        ]
+        for key, stats in phases:
+            lines.append(
+                f"{key}: {stats.calls} calls, peak +{_size(stats.peak)}, "
+                f"{'+' if stats.growth >= 0 else '-'}{_size(abs(stats.growth))} kept"
+            )
+            for diff in stats.top:
+                lines.append(f"  {_size(diff.size_diff):>10}  {diff.count_diff:>+7} blocks  {diff.traceback[0]}")
+        path = self.directory / f"{stem}-memory.txt"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        self.files.append(path)
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_IGNORED)
+
+
+def _size(value: int) -> str:
+    size = float(value)
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
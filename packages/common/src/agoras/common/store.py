@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.common.store module.
+
+Small SQLite key-value store for state shared between agoras processes
+(rate-limit budgets, caches). Values are JSON encoded, grouped by namespace
+and may expire.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+MEMORY = ":memory:"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+_default_stores: Dict[str, "KeyValueStore"] = {}
+_default_lock = threading.Lock()
+
+
+def storage_dir() -> Path:
+    """
+    Return the agoras state directory.
+
+    Returns:
+        Path: ``$AGORAS_STORAGE_DIR`` or ``~/.agoras``
+    """
+    configured = os.environ.get("AGORAS_STORAGE_DIR")
+    if configured:
+        return Path(configured).expanduser().resolve()
+    return Path.home() / ".agoras"
+
+
+class KeyValueStore:
+    """
+    Namespaced key-value store backed by SQLite.
+
+    One database file can be shared by concurrent processes: writes run in
+    immediate transactions and readers wait on locks instead of failing.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, timeout: float = 10.0):
+        """
+        Open (and create if needed) the store.
+
+        Args:
+            path (str or Path, optional): Database file, or ``":memory:"``.
+                Defaults to ``state.db`` in :func:`storage_dir`.
+            timeout (float): Seconds to wait for another process's lock
+        """
+        if path is None:
+            path = storage_dir() / "state.db"
+        self.path = str(path)
+        if self.path != MEMORY:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        if self.path != MEMORY:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            os.chmod(self.path, 0o600)
+        self._conn.execute(_SCHEMA)
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """
+        Return a stored value.
+
+        Args:
+            namespace (str): Value group, e.g. ``"ratelimit"``
+            key (str): Key within the namespace
+            default: Returned when the key is missing or expired
+
+        Returns:
+            The decoded value or ``default``
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM kv WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, key, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Store a JSON-serializable value.
+
+        Args:
+            namespace (str): Value group
+            key (str): Key within the namespace
+            value: JSON-serializable value
+            ttl (float, optional): Seconds until the value expires
+        """
+        with self._lock:
+            self._write(namespace, key, value, ttl)
+
+    def delete(self, namespace: str, key: str):
+        """
+        Remove a key if present.
+
+        Args:
+            namespace (str): Value group
+            key (str): Key within the namespace
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM kv WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def update(self, namespace: str, key: str, func: Callable[[Any], Any], ttl: Optional[float] = None) -> Any:
+        """
+        Atomically replace a value with ``func(current)``.
+
+        The read and write run in one immediate transaction, so concurrent
+        processes updating the same key never lose each other's changes.
+
+        Args:
+            namespace (str): Value group
+            key (str): Key within the namespace
+            func (callable): Receives the current value (or None) and returns the new one
+            ttl (float, optional): Seconds until the new value expires
+
+        Returns:
+            The value returned by ``func``
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT value FROM kv WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                    (namespace, key, time.time()),
+                ).fetchone()
+                value = func(json.loads(row[0]) if row else None)
+                self._write(namespace, key, value, ttl)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return value
+
+    def purge(self, namespace: Optional[str] = None) -> int:
+        """
+        Delete expired entries.
+
+        Args:
+            namespace (str, optional): Only purge this namespace
+
+        Returns:
+            int: Number of entries removed
+        """
+        query = "DELETE FROM kv WHERE expires_at IS NOT NULL AND expires_at <= ?"
+        params: tuple = (time.time(),)
+        if namespace is not None:
+            query += " AND namespace = ?"
+            params += (namespace,)
+        with self._lock:
+            return self._conn.execute(query, params).rowcount
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _write(self, namespace: str, key: str, value: Any, ttl: Optional[float]):
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._conn.execute(
+            "INSERT OR REPLACE INTO kv (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+            (namespace, key, json.dumps(value), expires_at),
+        )
+
+
+def default_store() -> KeyValueStore:
+    """
+    Return the process-wide store for the current storage directory.
+
+    Returns:
+        KeyValueStore: Shared store at ``<storage dir>/state.db``
+    """
+    path = str(storage_dir() / "state.db")
+    with _default_lock:
+        store = _default_stores.get(path)
+        if store is None:
+            store = _default_stores[path] = KeyValueStore(path)
+        return store
@@ -22,10 +22,25 @@ agoras.common.utils.
 This module contains common and low level functions to all modules in agoras.
 """
 
+import codecs
+import os
+import sqlite3
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Optional
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+
+from .store import KeyValueStore, default_store
+
+# Previews are looked up in the document head; stop reading pages without one here.
+MAX_HEAD_BYTES = 1024 * 1024
+READ_CHUNK_SIZE = 16 * 1024
+
+PREVIEW_NAMESPACE = "previews"
+PREVIEW_TTL = 86400.0
+# Pages without preview tags (or failing ones) are retried sooner.
+EMPTY_PREVIEW_TTL = 300.0
 
 
 def add_url_timestamp(url, timestamp):
@@ -42,35 +57,96 @@ def metatag(tag):
     return tag.name == "meta" and tag.has_attr("content") and (tag.has_attr("property") or tag.has_attr("name"))
 
 
-def find_metatags(url, search):
-    """Fetch a URL and return matching Open Graph or Twitter meta tag values."""
-    found = {}
-
-    response = requests.get(url, timeout=20)
+class _HeadMetaParser(HTMLParser):
+    """Collect meta tag contents in one pass, stopping at the end of the head."""
 
-    if response.status_code != 200:
-        return found
+    def __init__(self, search: Iterable[str]):
+        super().__init__(convert_charrefs=True)
+        self.search = set(search)
+        self.found: Dict[str, str] = {}
+        self.done = False
 
-    soup = BeautifulSoup(response.content, "html.parser")
+    def handle_starttag(self, tag, attrs):
+        if tag == "body":
+            self.done = True
+            return
+        if tag != "meta":
+            return
+        values = dict(attrs)
+        if values.get("content") is None:
+            return
+        for key in (values.get("property"), values.get("name")):
+            if key in self.search:
+                self.found[key] = values["content"] or ""
 
-    for target in search:
-        found_meta_tag = soup.find_all(metatag)
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
 
-        if not found_meta_tag:
-            continue
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.done = True
 
-        for meta_tag in found_meta_tag:
-            prop = meta_tag.get("property", "")
-            name = meta_tag.get("name", "")
 
-            if prop == target or name == target:
-                found[target] = meta_tag.get("content", "")
+def find_metatags(url, search):
+    """
+    Fetch a URL and return matching Open Graph or Twitter meta tag values.
 
-    return found
+    The page is streamed and parsed only up to ``</head>``, so large pages
+    cost one small read instead of a full download.
+    """
+    response = requests.get(url, timeout=20, stream=True)
+    try:
+        if response.status_code != 200:
+            return {}
+
+        try:
+            decoder = codecs.getincrementaldecoder(_charset(response))(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        parser = _HeadMetaParser(search)
+        read = 0
+        for chunk in response.iter_content(chunk_size=READ_CHUNK_SIZE):
+            parser.feed(decoder.decode(chunk))
+            read += len(chunk)
+            if parser.done or read >= MAX_HEAD_BYTES:
+                break
+        return parser.found
+    finally:
+        response.close()
+
+
+def _charset(response) -> str:
+    content_type = str((response.headers or {}).get("Content-Type", ""))
+    for parameter in content_type.split(";")[1:]:
+        key, _, value = parameter.partition("=")
+        if key.strip().lower() == "charset" and value.strip():
+            return value.strip().strip("\"'")
+    return "utf-8"
+
+
+def _preview_store() -> Optional[KeyValueStore]:
+    """Return the store for link previews, or None when ``AGORAS_PREVIEW_CACHE=off``."""
+    if os.environ.get("AGORAS_PREVIEW_CACHE", "on").lower() == "off":
+        return None
+    try:
+        return default_store()
+    except (OSError, sqlite3.Error):
+        return None
 
 
 def parse_metatags(url):
-    """Parse common social preview meta tags from a URL."""
+    """
+    Parse common social preview meta tags from a URL.
+
+    Results are cached per URL for a day in the shared state store, so a
+    link posted again (or to several networks) is not fetched twice.
+    """
+    store = _preview_store()
+    cached: Optional[dict] = store.get(PREVIEW_NAMESPACE, url) if store is not None else None
+    if cached is not None:
+        return cached
+
     KNOWN_TAGS = [
         "og:title",
         "og:image",
@@ -85,8 +161,11 @@ def parse_metatags(url):
     except Exception:
         data = {}
 
-    return {
+    preview = {
         "title": data.get("og:title", data.get("twitter:title", "")),
         "image": data.get("og:image", data.get("twitter:image", "")),
         "description": data.get("og:description", data.get("twitter:description", "")),
     }
+    if store is not None:
+        store.set(PREVIEW_NAMESPACE, url, preview, ttl=PREVIEW_TTL if any(preview.values()) else EMPTY_PREVIEW_TTL)
+    return preview
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import json
+import threading
+from contextvars import ContextVar
+
+import pytest
+
+from agoras.common import executors
+from agoras.common.executors import NamedExecutor, configured_workers
+from agoras.common.metrics import Metrics, labels
+
+
+@pytest.mark.asyncio
+async def test_run_uses_named_threads_and_caller_context():
+    pool = NamedExecutor('upload', 2)
+
+    request_id = ContextVar('request_id')
+    request_id.set('abc')
+
+    def work():
+        return threading.current_thread().name, request_id.get()
+
+    name, seen = await pool.run(work)
+    pool.shutdown()
+
+    assert name.startswith('agoras-upload')
+    assert seen == 'abc'
+    assert pool.stats()['submitted'] == 1
+
+
+@pytest.mark.asyncio
+async def test_saturation_is_counted_and_queue_wait_observed(tmp_path, monkeypatch):
+    log = tmp_path / 'metrics.jsonl'
+    monkeypatch.setattr(executors, 'metrics', Metrics(log=str(log)))
+    pool = NamedExecutor('poll', 1)
+    release = threading.Event()
+
+    with labels(platform='linkedin'):
+        first = asyncio.ensure_future(pool.run(release.wait, 5))
+        second = asyncio.ensure_future(pool.run(lambda: 'done'))
+        await asyncio.sleep(0.05)
+        stats = pool.stats()
+        release.set()
+        assert await second == 'done'
+        await first
+    pool.shutdown()
+
+    assert stats['active'] == 1
+    assert stats['queued'] == 1
+    assert stats['saturated'] == 1
+    assert stats['peak_queued'] == 1
+    records = [json.loads(line) for line in log.read_text().splitlines()]
+    assert [record['phase'] for record in records] == ['queue_wait', 'queue_wait']
+    assert {record['executor'] for record in records} == {'poll'}
+    assert {record['platform'] for record in records} == {'linkedin'}
+    assert records[1]['duration_ms'] >= 40
+
+
+def test_map_borrows_named_threads_and_preserves_order():
+    pool = NamedExecutor('upload', 4)
+    active = {'now': 0, 'peak': 0}
+    names = set()
+    lock = threading.Lock()
+    release = threading.Barrier(2, timeout=5)
+
+    def work(item):
+        with lock:
+            active['now'] += 1
+            active['peak'] = max(active['peak'], active['now'])
+            names.add(threading.current_thread().name)
+        if item < 2:
+            release.wait()
+        with lock:
+            active['now'] -= 1
+        return item * 2
+
+    results = pool.map(work, [0, 1, 2, 3, 4], limit=2)
+    pool.shutdown()
+
+    assert results == [0, 2, 4, 6, 8]
+    assert active['peak'] == 2
+    assert threading.current_thread().name in names
+    assert any(name.startswith('agoras-upload') for name in names)
+
+
+@pytest.mark.asyncio
+async def test_map_from_a_busy_pool_runs_on_the_calling_thread():
+    pool = NamedExecutor('upload', 1)
+
+    def upload():
+        return pool.map(lambda item: (item, threading.current_thread().name), ['a', 'b', 'c'], limit=4)
+
+    results = await asyncio.wait_for(pool.run(upload), 5)
+    pool.shutdown()
+
+    assert [item for item, _ in results] == ['a', 'b', 'c']
+    assert len({name for _, name in results}) == 1
+    assert pool.stats()['queued'] == 0
+
+
+def test_map_raises_the_first_error_and_starts_no_new_items():
+    pool = NamedExecutor('upload', 1)
+    started = []
+
+    def work(item):
+        started.append(item)
+        if item == 1:
+            raise ValueError('bad part')
+        return item
+
+    with pytest.raises(ValueError, match='bad part'):
+        pool.map(work, [0, 1, 2, 3], limit=1)
+    pool.shutdown()
+
+    assert started == [0, 1]
+
+
+def test_configured_workers(monkeypatch):
+    monkeypatch.delenv('AGORAS_UPLOAD_WORKERS', raising=False)
+    assert configured_workers('upload') == executors.EXECUTORS['upload'].workers
+    monkeypatch.setenv('AGORAS_UPLOAD_WORKERS', '3')
+    assert configured_workers('upload') == 3
+    monkeypatch.setenv('AGORAS_UPLOAD_WORKERS', '0')
+    with pytest.raises(Exception, match='AGORAS_UPLOAD_WORKERS must be a positive integer'):
+        configured_workers('upload')
+    with pytest.raises(Exception, match='Unknown executor "disk"'):
+        configured_workers('disk')
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import subprocess
+import sys
+
+import pytest
+
+import agoras.common
+from agoras.common.utils import parse_metatags
+
+
+def test_lazy_export_resolves_and_caches():
+    assert agoras.common.parse_metatags is parse_metatags
+    assert "parse_metatags" in vars(agoras.common)
+    assert "parse_metatags" in dir(agoras.common)
+
+
+def test_lazy_export_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        agoras.common.missing
+
+
+def test_import_does_not_load_deferred_dependencies():
+    code = "import sys, agoras.common; print('bs4' in sys.modules, 'agoras.common.utils' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False False"
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+
+import pytest
+
+from agoras.common.metrics import METRIC_NAME, Metrics, labels
+from agoras.common.store import MEMORY, KeyValueStore
+
+
+def test_span_logs_phase_outcome_and_bound_labels(tmp_path):
+    log = tmp_path / 'metrics.jsonl'
+    recorder = Metrics(log=str(log))
+
+    with labels(platform='x'):
+        with recorder.span('upload', media='video'):
+            pass
+        with pytest.raises(ValueError):
+            with recorder.span('publish'):
+                raise ValueError('rejected')
+
+    first, second = [json.loads(line) for line in log.read_text().splitlines()]
+    assert first['phase'] == 'upload'
+    assert first['platform'] == 'x'
+    assert first['media'] == 'video'
+    assert first['outcome'] == 'ok'
+    assert first['duration_ms'] >= 0
+    assert second['phase'] == 'publish'
+    assert second['outcome'] == 'error'
+
+
+def test_flush_writes_histograms_accumulated_across_processes(tmp_path):
+    store = KeyValueStore(MEMORY)
+    textfile = tmp_path / 'agoras.prom'
+
+    first = Metrics(textfile=str(textfile), store=store)
+    first.observe('auth', 3.0, platform='x')
+    first.flush()
+    second = Metrics(textfile=str(textfile), store=store)
+    second.observe('auth', 0.2, platform='x')
+    second.flush()
+
+    lines = textfile.read_text().splitlines()
+    series = 'outcome="ok",phase="auth",platform="x"'
+    assert f'# TYPE {METRIC_NAME} histogram' in lines
+    assert f'{METRIC_NAME}_bucket{{{series},le="0.25"}} 1' in lines
+    assert f'{METRIC_NAME}_bucket{{{series},le="5"}} 2' in lines
+    assert f'{METRIC_NAME}_bucket{{{series},le="+Inf"}} 2' in lines
+    assert f'{METRIC_NAME}_sum{{{series}}} 3.200000' in lines
+    assert f'{METRIC_NAME}_count{{{series}}} 2' in lines
+
+
+def test_disabled_recorder_records_nothing(tmp_path):
+    store = KeyValueStore(MEMORY)
+    recorder = Metrics(store=store)
+
+    with recorder.span('auth'):
+        pass
+    recorder.flush()
+
+    assert not recorder.enabled
+    assert store.get('metrics', 'phase_duration_seconds') is None
+    assert list(tmp_path.iterdir()) == []
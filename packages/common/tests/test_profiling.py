@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pstats
+import threading
+
+import pytest
+
+from agoras.common.metrics import labels, metrics, span
+from agoras.common.profiling import Profiler
+
+
+def _busy_work():
+    return sum(i * i for i in range(20000))
+
+
+def test_cpu_profile_writes_loadable_pstats_including_worker_threads(tmp_path):
+    profiler = Profiler('cpu', directory=str(tmp_path))
+
+    with profiler.profile('test'):
+        worker = threading.Thread(target=_busy_work)
+        worker.start()
+        worker.join()
+
+    pstats_file, summary = profiler.files
+    assert pstats_file.suffix == '.pstats'
+    functions = {name for _, _, name in pstats.Stats(str(pstats_file)).stats}
+    assert '_busy_work' in functions
+    assert 'cumulative' in summary.read_text()
+
+
+def test_memory_profile_reports_each_phase(tmp_path):
+    profiler = Profiler('memory', directory=str(tmp_path))
+
+    with profiler.profile('test'):
+        with labels(platform='x'):
+            with span('upload'):
+                kept = [bytearray(1024) for _ in range(256)]
+
+    (report,) = profiler.files
+    text = report.read_text()
+    assert 'x:upload: 1 calls, peak +' in text
+    assert 'test_profiling.py' in text
+    assert kept
+    assert not metrics._observers
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.delenv('AGORAS_PROFILE', raising=False)
+    assert Profiler.from_env() is None
+    monkeypatch.setenv('AGORAS_PROFILE', 'off')
+    assert Profiler.from_env() is None
+    monkeypatch.setenv('AGORAS_PROFILE', 'Both')
+    assert Profiler.from_env().mode == 'both'
+    monkeypatch.setenv('AGORAS_PROFILE', 'disk')
+    with pytest.raises(Exception, match='Unknown profile mode'):
+        Profiler.from_env()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import multiprocessing
+
+import pytest
+
+from agoras.common.store import MEMORY, KeyValueStore, default_store, storage_dir
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = KeyValueStore(tmp_path / 'state.db')
+    yield store
+    store.close()
+
+
+def test_store_get_set_delete_by_namespace(store):
+    store.set('a', 'key', {'value': 1})
+    store.set('b', 'key', [1, 2])
+
+    assert store.get('a', 'key') == {'value': 1}
+    assert store.get('b', 'key') == [1, 2]
+    assert store.get('a', 'missing', 'default') == 'default'
+
+    store.delete('a', 'key')
+    assert store.get('a', 'key') is None
+    assert store.get('b', 'key') == [1, 2]
+
+
+def test_store_ttl_expires_and_purges(store, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('agoras.common.store.time.time', lambda: now[0])
+
+    store.set('ns', 'short', 1, ttl=10)
+    store.set('ns', 'forever', 2)
+    now[0] += 11
+
+    assert store.get('ns', 'short') is None
+    assert store.get('ns', 'forever') == 2
+    assert store.purge() == 1
+
+
+def test_store_update_is_atomic_read_modify_write(store):
+    assert store.update('ns', 'count', lambda value: (value or 0) + 1) == 1
+    assert store.update('ns', 'count', lambda value: (value or 0) + 1) == 2
+
+    with pytest.raises(ValueError):
+        store.update('ns', 'count', lambda value: (_ for _ in ()).throw(ValueError('boom')))
+    assert store.get('ns', 'count') == 2
+
+
+def _increment(path, times):
+    store = KeyValueStore(path)
+    for _ in range(times):
+        store.update('ns', 'count', lambda value: (value or 0) + 1)
+    store.close()
+
+
+def test_store_is_shared_between_processes(tmp_path):
+    path = str(tmp_path / 'state.db')
+    KeyValueStore(path).close()
+    context = multiprocessing.get_context('spawn')
+    workers = [context.Process(target=_increment, args=(path, 25)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+
+    store = KeyValueStore(path)
+    assert store.get('ns', 'count') == 75
+    store.close()
+
+
+def test_store_in_memory():
+    store = KeyValueStore(MEMORY)
+    store.set('ns', 'key', 'value')
+
+    assert store.get('ns', 'key') == 'value'
+
+
+def test_default_store_follows_storage_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('AGORAS_STORAGE_DIR', str(tmp_path))
+
+    assert storage_dir() == tmp_path.resolve()
+    assert default_store() is default_store()
+    assert default_store().path == str(tmp_path.resolve() / 'state.db')
@@ -23,7 +23,15 @@ from unittest.mock import Mock, patch
 
 from bs4 import BeautifulSoup
 
-from agoras.common.utils import add_url_timestamp, find_metatags, metatag, parse_metatags
+from agoras.common.store import MEMORY, KeyValueStore
+from agoras.common.utils import (
+    EMPTY_PREVIEW_TTL,
+    _preview_store,
+    add_url_timestamp,
+    find_metatags,
+    metatag,
+    parse_metatags,
+)
 
 
 class TestAddUrlTimestamp(unittest.TestCase):
@@ -117,7 +125,7 @@ class TestFindMetatags(unittest.TestCase):
         """Test successful meta tag extraction."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = b'<html><meta property="og:title" content="My Title"></html>'
+        mock_response.iter_content.return_value = [b'<html><meta property="og:title" content="My Title"></html>']
         mock_get.return_value = mock_response
 
         result = find_metatags('https://example.com', ['og:title'])
@@ -133,7 +141,7 @@ class TestFindMetatags(unittest.TestCase):
         </html>'''
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = html.encode()
+        mock_response.iter_content.return_value = [html.encode()]
         mock_get.return_value = mock_response
 
         result = find_metatags('https://example.com',
@@ -157,7 +165,7 @@ class TestFindMetatags(unittest.TestCase):
         """Test HTML without matching meta tags."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = b'<html><p>No meta tags here</p></html>'
+        mock_response.iter_content.return_value = [b'<html><p>No meta tags here</p></html>']
         mock_get.return_value = mock_response
 
         result = find_metatags('https://example.com', ['og:title'])
@@ -169,13 +177,46 @@ class TestFindMetatags(unittest.TestCase):
         html = '<html><meta name="twitter:title" content="Twitter Title"></html>'
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = html.encode()
+        mock_response.iter_content.return_value = [html.encode()]
         mock_get.return_value = mock_response
 
         result = find_metatags('https://example.com', ['twitter:title'])
         self.assertEqual(result, {'twitter:title': 'Twitter Title'})
 
 
+    @patch('agoras.common.utils.requests.get')
+    def test_stops_reading_after_head(self, mock_get):
+        """Test the page is streamed only until the end of the head."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        body_chunks = Mock(side_effect=AssertionError('body chunk read'))
+        mock_response.iter_content.return_value = iter([
+            b'<html><head><meta property="og:title" content="Caf\xc3\xa9">',
+            b'<meta property="og:image" content="a.jpg"></head>',
+            body_chunks,
+        ])
+        mock_get.return_value = mock_response
+
+        result = find_metatags('https://example.com', ['og:title', 'og:image'])
+
+        self.assertEqual(result, {'og:title': 'Caf\u00e9', 'og:image': 'a.jpg'})
+        mock_get.assert_called_once_with('https://example.com', timeout=20, stream=True)
+        mock_response.close.assert_called_once()
+
+    @patch('agoras.common.utils.requests.get')
+    def test_declared_charset_is_used(self, mock_get):
+        """Test pages are decoded with the charset from Content-Type."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'text/html; charset="iso-8859-1"'}
+        mock_response.iter_content.return_value = ['<meta name="twitter:title" content="Caf\u00e9">'.encode('latin-1')]
+        mock_get.return_value = mock_response
+
+        result = find_metatags('https://example.com', ['twitter:title'])
+        self.assertEqual(result, {'twitter:title': 'Caf\u00e9'})
+
+
 class TestParseMetatags(unittest.TestCase):
     """Tests for parse_metatags function."""
 
@@ -250,6 +291,44 @@ class TestParseMetatags(unittest.TestCase):
         })
 
 
+class TestPreviewCache(unittest.TestCase):
+    """Tests for the persistent link preview cache."""
+
+    def setUp(self):
+        self.store = KeyValueStore(MEMORY)
+        patcher = patch('agoras.common.utils._preview_store', return_value=self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('agoras.common.utils.find_metatags')
+    def test_repeated_links_are_served_from_cache(self, mock_find):
+        """Test a link is fetched once while its preview is cached."""
+        mock_find.return_value = {'og:title': 'Title', 'og:image': 'image.jpg'}
+
+        first = parse_metatags('https://example.com/post')
+        second = parse_metatags('https://example.com/post')
+
+        self.assertEqual(first, second)
+        self.assertEqual(second['title'], 'Title')
+        mock_find.assert_called_once()
+
+    @patch('agoras.common.utils.find_metatags')
+    def test_empty_previews_expire_sooner(self, mock_find):
+        """Test failed lookups are cached only briefly."""
+        mock_find.side_effect = Exception('Network error')
+
+        with patch.object(self.store, 'set', wraps=self.store.set) as mock_set:
+            parse_metatags('https://example.com/down')
+
+        self.assertEqual(mock_set.call_args[1]['ttl'], EMPTY_PREVIEW_TTL)
+
+    def test_cache_can_be_disabled(self):
+        """Test AGORAS_PREVIEW_CACHE=off disables the cache."""
+        patch.stopall()
+        with patch.dict('os.environ', {'AGORAS_PREVIEW_CACHE': 'off'}):
+            self.assertIsNone(_preview_store())
+
+
 def load_tests(loader, tests, pattern):
     tests.addTests(doctest.DocTestSuite('agoras.common.utils'))
     return tests
@@ -26,13 +26,32 @@ This package provides the foundation for all Agoras platform implementations:
 - Authentication infrastructure (OAuth2, token storage, callback server)
 - Feed management for RSS feeds
 - Sheet management for Google Sheets scheduling
+- Client pool that keeps authenticated platform instances warm
+- Shared token-bucket rate limiter with platform quota awareness
+- Persistent job queue and scheduler for posts due at exact times
 """
 
-from .api_base import BaseAPI
-from .auth import AuthenticationError, BaseAuthManager, OAuthCallbackServer, SecureTokenStorage
-from .feed import Feed, FeedItem
-from .interfaces import SocialNetwork
-from .sheet import ScheduleSheet, Sheet
+from agoras.common.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseAPI": ".api_base",
+        "AuthenticationError": ".auth",
+        "BaseAuthManager": ".auth",
+        "OAuthCallbackServer": ".auth",
+        "SecureTokenStorage": ".auth",
+        "Feed": ".feed",
+        "FeedItem": ".feed",
+        "SocialNetwork": ".interfaces",
+        "ClientPool": ".pool",
+        "RateLimiter": ".ratelimit",
+        "JobQueue": ".scheduler",
+        "Scheduler": ".scheduler",
+        "ScheduleSheet": ".sheet",
+        "Sheet": ".sheet",
+    },
+)
 
 __all__ = [
     "SocialNetwork",
@@ -45,4 +64,8 @@ __all__ = [
     "FeedItem",
     "ScheduleSheet",
     "Sheet",
+    "ClientPool",
+    "RateLimiter",
+    "JobQueue",
+    "Scheduler",
 ]
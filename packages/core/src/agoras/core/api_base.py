@@ -18,8 +18,13 @@
 """agoras.core.api_base module."""
 
 import asyncio
+import hashlib
+import json
 import time
 from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+from .ratelimit import DESTINATION, RateLimiter, get_rate_limiter
 
 
 class BaseAPI(ABC):
@@ -30,6 +35,12 @@ class BaseAPI(ABC):
     including authentication, rate limiting, and error handling.
     """
 
+    # Platform name used for shared rate-limit buckets (see agoras.core.ratelimit).
+    platform: Optional[str] = None
+    # Credentials naming a chat or channel rather than the account; left out of
+    # the rate-limit account so every destination draws from the same budget.
+    destination_credentials: Tuple[str, ...] = ()
+
     def __init__(self, **credentials):
         """
         Initialize API instance with credentials.
@@ -42,6 +53,8 @@ class BaseAPI(ABC):
         self._authenticated = False
         self._rate_limit_cache = {}
         self._last_request_time = 0
+        # None uses the process-wide limiter from get_rate_limiter().
+        self.rate_limiter: Optional[RateLimiter] = None
 
     @abstractmethod
     async def authenticate(self):
@@ -70,22 +83,59 @@ class BaseAPI(ABC):
         """
         return self._authenticated
 
-    async def _rate_limit_check(self, operation_type="default", min_interval=1.0):
+    async def _rate_limit_check(self, operation_type="default", min_interval=1.0, destination=None):
         """
         Perform rate limiting check before API operations.
 
+        Spaces calls of the same operation by ``min_interval`` and, for
+        platforms with known quotas, waits for a token from the shared
+        rate limiter for this account.
+
         Args:
             operation_type (str): Type of operation for specific limits
             min_interval (float): Minimum interval between requests in seconds
+            destination (str, optional): Chat or channel the call targets. Spacing is then
+                kept per destination, and the platform's ``destination`` limit applies to it.
         """
+        cache_key = operation_type if destination is None else f"{operation_type}:{destination}"
         current_time = time.time()
-        last_time = self._rate_limit_cache.get(operation_type, 0)
+        last_time = self._rate_limit_cache.get(cache_key, 0)
 
         if current_time - last_time < min_interval:
             sleep_time = min_interval - (current_time - last_time)
             await asyncio.sleep(sleep_time)
 
-        self._rate_limit_cache[operation_type] = time.time()
+        limiter = self.rate_limiter or get_rate_limiter()
+        if limiter is not None and self.platform:
+            account = self._rate_limit_account()
+            for session in self._http_sessions():
+                limiter.attach(session, self.platform, account)
+            await limiter.acquire(self.platform, operation_type, account)
+            if destination is not None and limiter.has_limit(self.platform, DESTINATION):
+                await limiter.acquire(self.platform, DESTINATION, f"{account}:{destination}")
+
+        self._rate_limit_cache[cache_key] = time.time()
+
+    def _rate_limit_account(self) -> str:
+        """
+        Return a stable, non-reversible identifier for this account's quotas.
+
+        Returns:
+            str: Hash of the credentials (refresh tokens and destination credentials excluded)
+        """
+        excluded = {"refresh_token", *self.destination_credentials}
+        identity = {key: value for key, value in self.credentials.items() if key not in excluded and value}
+        return hashlib.sha256(json.dumps(identity, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+    def _http_sessions(self) -> List:
+        """
+        Return the ``requests`` sessions whose responses carry rate-limit headers.
+
+        Returns:
+            list: The client's ``session`` if it has one
+        """
+        session = getattr(self.client, "session", None)
+        return [session] if session is not None and hasattr(session, "hooks") else []
 
     def _handle_api_error(self, error, operation_name):
         """
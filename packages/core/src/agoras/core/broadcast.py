@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.core.broadcast module.
+
+Sends one post to many chats or channels of the same platform account.
+Media is uploaded to the first destination only, so the platform's
+reference to it (a Telegram ``file_id``, a Discord attachment URL) is
+cached before the remaining destinations are posted to concurrently.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Union
+
+from .concurrency import gather_bounded
+
+# Destinations posted to at once; rate limits pace them further.
+DEFAULT_CONCURRENCY = 8
+
+
+def split_destinations(value: Union[str, Iterable[str], None]) -> List[str]:
+    """
+    Return chat or channel names from a comma-separated string or a list, without duplicates.
+
+    Args:
+        value (str or iterable): ``"a,b,c"`` or ``["a", "b", "c"]``
+
+    Returns:
+        list: Destinations in their original order
+    """
+    if not value:
+        return []
+    items = value.split(",") if isinstance(value, str) else value
+    destinations: List[str] = []
+    for item in (str(item).strip() for item in items):
+        if item and item not in destinations:
+            destinations.append(item)
+    return destinations
+
+
+async def broadcast(
+    destinations: Iterable[str],
+    send: Callable[[str], Awaitable[Any]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    upload_first: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Await ``send(destination)`` for every destination and collect the outcomes.
+
+    Args:
+        destinations (iterable): Chat IDs or channel names
+        send (callable): Coroutine function posting to one destination and returning the post ID
+        concurrency (int): Maximum destinations posted to at once
+        upload_first (bool): Post to destinations one at a time until one succeeds, so
+            media is uploaded once, then post to the rest concurrently
+
+    Returns:
+        dict: ``{destination: {"id": ...}}`` or ``{destination: {"error": ...}}``, in input order
+    """
+    destinations = split_destinations(destinations)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    async def deliver(destination):
+        try:
+            results[destination] = {"id": await send(destination)}
+        except Exception as error:
+            results[destination] = {"error": str(error)}
+
+    remaining = destinations
+    if upload_first:
+        for index, destination in enumerate(destinations):
+            await deliver(destination)
+            remaining = destinations[index + 1 :]
+            if "id" in results[destination]:
+                break
+
+    await gather_bounded(deliver, remaining, concurrency)
+    return {destination: results[destination] for destination in destinations}
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.core.concurrency module.
+
+Order-preserving helpers for running a bounded number of media operations
+at once, for both async wrappers and synchronous API clients.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, List, TypeVar
+
+from agoras.common.executors import UPLOAD, executor
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Posts carry at most four images on every supported platform.
+MEDIA_CONCURRENCY = 4
+
+
+async def gather_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: int = MEDIA_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Await ``func(item)`` for every item with at most ``limit`` running at once.
+
+    Args:
+        func (callable): Coroutine function called with each item
+        items (iterable): Items to process
+        limit (int): Maximum concurrent calls
+        return_exceptions (bool): Return exceptions in place of results instead of raising
+
+    Returns:
+        list: Results in the same order as ``items``
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(item):
+        async with semaphore:
+            return await func(item)
+
+    return list(await asyncio.gather(*(run(item) for item in items), return_exceptions=return_exceptions))
+
+
+def map_bounded(
+    func: Callable[[T], R], items: Iterable[T], limit: int = MEDIA_CONCURRENCY, pool: str = UPLOAD
+) -> List[R]:
+    """
+    Call blocking ``func(item)`` for every item on a named thread pool.
+
+    The calling thread takes part, see
+    :meth:`agoras.common.executors.NamedExecutor.map`, so this is safe to
+    call from work already running on ``pool``.
+
+    Args:
+        func (callable): Function called with each item
+        items (iterable): Items to process
+        limit (int): Maximum concurrent threads, the calling one included
+        pool (str): Pool from :mod:`agoras.common.executors` lending the other threads
+
+    Returns:
+        list: Results in the same order as ``items``
+
+    Raises:
+        Exception: The first exception raised by ``func``, in item order
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    return executor(pool).map(func, items, max(1, limit))
@@ -17,7 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.core.feed.feed module."""
 
-import asyncio
 import datetime
 import random
 from urllib.request import Request, urlopen
@@ -25,6 +24,7 @@ from urllib.request import Request, urlopen
 from atoma import parse_rss_bytes
 
 from agoras.common import __version__
+from agoras.common.executors import API, run_blocking
 
 from .item import FeedItem
 
@@ -69,7 +69,7 @@ class Feed:
             request = Request(url=self.url, headers={"User-Agent": f"Agoras/{__version__}"})
             return parse_rss_bytes(urlopen(request).read())
 
-        self._feed_data = await asyncio.to_thread(_sync_download)
+        self._feed_data = await run_blocking(API, _sync_download)
         self._items = [FeedItem(item) for item in self._feed_data.items]
         self._downloaded = True
 
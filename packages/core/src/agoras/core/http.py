@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.core.http module.
+
+Pooled ``requests`` sessions shared by the HTTP-based platform clients, so
+multi-step flows (init, upload, finalize, poll) reuse warm connections.
+"""
+
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from agoras.common import __version__
+
+# Connections kept per host. Carousel and chunked uploads run up to four
+# requests at once, so leave headroom above that.
+DEFAULT_POOL_SIZE = 10
+
+# Methods that are safe to repeat; agoras.core.retry retries their failed
+# responses. POSTs are only retried when the platform rejected them (429).
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def create_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    headers: Optional[dict] = None,
+) -> requests.Session:
+    """
+    Build a keep-alive ``requests.Session`` with a tuned connection pool.
+
+    The transport only retries failed connection attempts, which never reach
+    the server and are safe for every method. Status and read-error retries
+    are decided per call by :func:`agoras.core.retry.request_with_retry`.
+
+    Args:
+        pool_size (int): Connections kept per host
+        retries (int): Transport retries for connection errors
+        backoff_factor (float): urllib3 exponential backoff factor between retries
+        headers (dict, optional): Default headers added to every request
+
+    Returns:
+        requests.Session: Session to reuse for the lifetime of a client
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=0,
+        status=0,
+        other=0,
+        backoff_factor=backoff_factor,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = f"Agoras/{__version__}"
+    if headers:
+        session.headers.update(headers)
+    return session
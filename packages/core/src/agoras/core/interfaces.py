@@ -20,12 +20,16 @@ Core interfaces and shared social network abstractions for Agoras.
 """
 
 import datetime
+import hashlib
 import json
 import os
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Awaitable, Callable, Dict, Optional
 
+from agoras.common.logger import logger
+from agoras.common.metrics import labels, span
 from agoras.core.feed import Feed
+from agoras.core.journal import PUBLISHED, PublishJournal, idempotency_key, journal_store
 from agoras.core.sheet import ScheduleSheet
 from agoras.media import MediaFactory
 from agoras.media.constraints import resolve_platform
@@ -40,6 +44,10 @@ class SocialNetwork(ABC):
     are asynchronous by default.
     """
 
+    # Set to False by long-running callers (e.g. the client pool) that
+    # collect action results instead of printing them to stdout.
+    emit_status = True
+
     def __init__(self, **kwargs):
         """
         Initialize the social network instance with configuration.
@@ -308,6 +316,8 @@ class SocialNetwork(ABC):
         Args:
             post_id (str): ID of the created/modified post
         """
+        if not self.emit_status:
+            return
         status = {"id": post_id}
         print(json.dumps(status, separators=(",", ":")))
 
@@ -357,9 +367,15 @@ class SocialNetwork(ABC):
         if action == "":
             raise Exception("Action is a required argument.")
 
-        # Initialize client before executing other actions
-        await self._initialize_client()
+        with labels(platform=self.get_platform_name().lower()), span("action", action=action):
+            # Initialize client before executing other actions
+            with span("auth"):
+                await self._initialize_client()
+
+            await self._dispatch_action(action)
 
+    async def _dispatch_action(self, action):
+        """Route an action to its handler; platforms override this to add actions."""
         if action == "post":
             await self._handle_post_action()
         elif action == "like":
@@ -376,6 +392,8 @@ class SocialNetwork(ABC):
             await self._handle_random_from_feed_action()
         elif action == "schedule":
             await self._handle_schedule_action()
+        elif action == "broadcast":
+            await self._handle_broadcast_action()
         else:
             raise Exception(f'"{action}" action not supported.')
 
@@ -388,8 +406,12 @@ class SocialNetwork(ABC):
         status_image_url_3 = self._get_config_value("status_image_url_3", "STATUS_IMAGE_URL_3")
         status_image_url_4 = self._get_config_value("status_image_url_4", "STATUS_IMAGE_URL_4")
 
-        await self.post(
-            status_text, status_link, status_image_url_1, status_image_url_2, status_image_url_3, status_image_url_4
+        await self.publish_once(
+            "post",
+            lambda: self.post(
+                status_text, status_link, status_image_url_1, status_image_url_2, status_image_url_3, status_image_url_4
+            ),
+            self._get_config_value("idempotency_key", "AGORAS_IDEMPOTENCY_KEY"),
         )
 
     async def _handle_like_action(self):
@@ -422,7 +444,89 @@ class SocialNetwork(ABC):
         if not video_url:
             raise Exception("Video URL is required for video action.")
 
-        await self.video(status_text, video_url, video_title)
+        await self.publish_once(
+            "video",
+            lambda: self.video(status_text, video_url, video_title),
+            self._get_config_value("idempotency_key", "AGORAS_IDEMPOTENCY_KEY"),
+        )
+
+    async def publish_once(
+        self,
+        action: str,
+        publish: Callable[[], Awaitable[Any]],
+        key: Optional[str] = None,
+    ) -> Any:
+        """
+        Run a publish through the publish journal.
+
+        Only publishes given an idempotency ``key`` are journaled, so posting
+        the same content twice on purpose needs no extra setup. A keyed
+        publish that already completed on the same network and account is
+        reported with its recorded ID instead of being published again.
+        Otherwise the journal is active while ``publish`` runs, so platform
+        code can resume completed stages with
+        :func:`agoras.core.journal.journal_step`.
+
+        Args:
+            action (str): ``post`` or ``video``
+            publish (callable): Coroutine function performing the publish
+            key (str, optional): Caller-chosen idempotency key, e.g. a job ID
+
+        Returns:
+            The post ID
+        """
+        store = journal_store() if key else None
+        if store is None:
+            return await publish()
+
+        identity = {"action": action, "idempotency_key": key}
+        journal = PublishJournal(idempotency_key(type(self).__name__.lower(), self._publish_account(), identity), store)
+        resumed = journal.stages()
+
+        post_id = resumed.get(PUBLISHED)
+        if post_id is not None:
+            logger.info(f"Already published as {post_id}; not publishing again.")
+            self._output_status(post_id)
+            return post_id
+
+        try:
+            with journal.activate():
+                post_id = await publish()
+        except Exception:
+            if resumed:
+                # The recorded IDs may have expired; start over on the next attempt.
+                journal.clear()
+            raise
+        journal.record(PUBLISHED, post_id)
+        return post_id
+
+    def _publish_account(self) -> str:
+        """
+        Return a stable, non-reversible identifier of the account and destination.
+
+        Returns:
+            str: Hash of the API credentials (refresh tokens excluded) and of
+            :meth:`_publish_destination`
+        """
+        credentials = getattr(getattr(self, "api", None), "credentials", None) or {}
+        identity = {key: value for key, value in credentials.items() if key != "refresh_token" and value}
+        destination = {key: value for key, value in self._publish_destination().items() if value}
+        if destination:
+            identity["destination"] = destination
+        return hashlib.sha256(json.dumps(identity, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+    def _publish_destination(self) -> Dict[str, Any]:
+        """
+        Return the configured target of a publish that the credentials do not name.
+
+        Platforms that post to a page, profile or recipient chosen outside their
+        credentials override this, so the same content sent to two targets is
+        journaled as two publishes.
+
+        Returns:
+            dict: Target names to values; empty when the credentials identify the target
+        """
+        return {}
 
     async def _handle_last_from_feed_action(self):
         """Handle last-from-feed action with common parameter extraction."""
@@ -450,3 +554,7 @@ class SocialNetwork(ABC):
         await self.schedule(
             google_sheets_id, google_sheets_name, google_sheets_client_email, google_sheets_private_key, max_count
         )
+
+    async def _handle_broadcast_action(self):
+        """Handle broadcast action; platforms that post to several chats or channels override this."""
+        raise Exception('"broadcast" action not supported.')
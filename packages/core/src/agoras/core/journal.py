@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.core.journal module.
+
+Write-ahead journal of publish attempts. Each attempt is identified by an
+idempotency key (network, account and the key the caller chose) and records
+the IDs of the stages it completed: media uploaded, container created,
+published. A retry after a crash resumes from the last completed stage, and a
+post that was already published is reported instead of being published twice.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from agoras.common.metrics import span
+from agoras.common.store import MEMORY, KeyValueStore, default_store
+
+NAMESPACE = "journal"
+
+# Stages, in the order a publish goes through them.
+MEDIA = "media"
+CONTAINER = "container"
+PUBLISHED = "published"
+
+# Metrics phase of each stage.
+PHASES = {MEDIA: MEDIA, CONTAINER: CONTAINER, PUBLISHED: "publish"}
+
+# Uploaded media and unpublished containers expire on the platforms within
+# a day, so older entries could not be resumed anyway.
+JOURNAL_TTL = 86400.0
+
+_active_journal: ContextVar[Optional["PublishJournal"]] = ContextVar("agoras_publish_journal", default=None)
+
+
+def journal_store() -> Optional[KeyValueStore]:
+    """
+    Return the store for publish journals.
+
+    Set ``AGORAS_PUBLISH_JOURNAL=off`` to publish without a journal.
+
+    Returns:
+        KeyValueStore or None: None when publishing is not journaled
+    """
+    if os.environ.get("AGORAS_PUBLISH_JOURNAL", "on").lower() == "off":
+        return None
+    try:
+        return default_store()
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def idempotency_key(network: str, account: str, content: Dict[str, Any]) -> str:
+    """
+    Return the idempotency key of one publish.
+
+    Args:
+        network (str): Network name
+        account (str): Account identifier (a hash, never a credential)
+        content (dict): What identifies the publish: the action and the
+            ``idempotency_key`` chosen by the caller
+
+    Returns:
+        str: Hex digest
+    """
+    encoded = json.dumps([network, account, content], sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def active_journal() -> Optional["PublishJournal"]:
+    """
+    Return the journal of the publish running in the current task, if any.
+
+    Returns:
+        PublishJournal or None: Journal activated with :meth:`PublishJournal.activate`
+    """
+    return _active_journal.get()
+
+
+async def journal_step(stage: str, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+    """
+    Run one publish stage through the active journal.
+
+    Without an active journal this simply awaits ``func(*args, **kwargs)``,
+    so platform code can call it unconditionally.
+
+    Args:
+        stage (str): Stage name (:data:`MEDIA`, :data:`CONTAINER`, :data:`PUBLISHED`)
+        func (callable): Coroutine function performing the stage
+        *args: Positional arguments for ``func``
+        **kwargs: Keyword arguments for ``func``
+
+    Returns:
+        The recorded result of an earlier attempt, or the result of ``func``
+    """
+    journal = active_journal()
+    if journal is None:
+        with span(PHASES.get(stage, stage)):
+            return await func(*args, **kwargs)
+    return await journal.step(stage, func, *args, **kwargs)
+
+
+class PublishJournal:
+    """Completed stages of one publish, keyed by its idempotency key."""
+
+    def __init__(self, key: str, store: Optional[KeyValueStore] = None, ttl: float = JOURNAL_TTL):
+        """
+        Initialize the journal.
+
+        Args:
+            key (str): :func:`idempotency_key` of the publish
+            store (KeyValueStore, optional): Where to persist; :func:`journal_store` by default,
+                or an in-memory store when journals are not persisted
+            ttl (float): Seconds an entry is kept after its last stage
+        """
+        self.key = key
+        store = store if store is not None else journal_store()
+        self.store = store if store is not None else KeyValueStore(MEMORY)
+        self.ttl = ttl
+
+    def stages(self) -> Dict[str, Any]:
+        """
+        Return every completed stage.
+
+        Returns:
+            dict: Stage name to recorded result
+        """
+        return self.store.get(NAMESPACE, self.key) or {}
+
+    def get(self, stage: str) -> Any:
+        """
+        Return the recorded result of a stage.
+
+        Args:
+            stage (str): Stage name
+
+        Returns:
+            The result, or None if the stage has not completed
+        """
+        return self.stages().get(stage)
+
+    def record(self, stage: str, result: Any):
+        """
+        Record a completed stage before moving to the next one.
+
+        Args:
+            stage (str): Stage name
+            result: JSON-serializable result (IDs returned by the platform)
+        """
+        if result is None:
+            return
+        self.store.update(NAMESPACE, self.key, lambda current: {**(current or {}), stage: result}, ttl=self.ttl)
+
+    def clear(self):
+        """Forget the publish, e.g. after the platform rejected a resumed stage."""
+        self.store.delete(NAMESPACE, self.key)
+
+    async def step(self, stage: str, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Return the recorded result of ``stage`` or run it and record the result.
+
+        Args:
+            stage (str): Stage name
+            func (callable): Coroutine function performing the stage
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The stage result
+        """
+        result = self.get(stage)
+        if result is not None:
+            return result
+        with span(PHASES.get(stage, stage)):
+            result = await func(*args, **kwargs)
+        self.record(stage, result)
+        return result
+
+    @contextmanager
+    def activate(self):
+        """
+        Make this journal the one :func:`journal_step` uses in the current task.
+
+        Yields:
+            PublishJournal: This journal
+        """
+        token = _active_journal.set(self)
+        try:
+            yield self
+        finally:
+            _active_journal.reset(token)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.core.mediacache module.
+
+Remembers what a platform returned for media it already received (a
+Telegram ``file_id``, a Discord attachment URL), keyed by the SHA-256 of
+the content. Posting the same image or video again, to the same or another
+chat, then sends the reference instead of re-uploading the bytes.
+"""
+
+import hashlib
+import os
+import sqlite3
+from typing import Any, Optional
+
+from agoras.common.store import MEMORY, KeyValueStore, default_store
+
+from .upload import UploadSource
+
+NAMESPACE = "media"
+
+# Telegram file_ids do not expire; still drop references nobody reused in a month.
+REFERENCE_TTL = 30 * 86400.0
+
+
+def media_cache_store() -> Optional[KeyValueStore]:
+    """
+    Return the store for media references.
+
+    Set ``AGORAS_MEDIA_CACHE=off`` to keep references for the current process only.
+
+    Returns:
+        KeyValueStore or None: None when references are not persisted
+    """
+    if os.environ.get("AGORAS_MEDIA_CACHE", "on").lower() == "off":
+        return None
+    try:
+        return default_store()
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def content_digest(content: Any) -> Optional[str]:
+    """
+    Return the SHA-256 identifying media content.
+
+    Args:
+        content: Bytes, a file path, or an in-memory buffer with ``getvalue()``
+
+    Returns:
+        str or None: Hex digest, or None for content that cannot be hashed
+        without consuming it (URLs, file_ids, open streams)
+    """
+    if hasattr(content, "getvalue"):
+        content = content.getvalue()
+    if isinstance(content, (bytes, bytearray)):
+        return hashlib.sha256(content).hexdigest()
+    if isinstance(content, (str, os.PathLike)) and os.path.isfile(content):
+        return UploadSource(content).digest()
+    return None
+
+
+def account_key(secret: str) -> str:
+    """
+    Return a stable identifier for an account without storing its credential.
+
+    Args:
+        secret (str): Bot token or other per-account credential
+
+    Returns:
+        str: Short hash of ``secret``
+    """
+    return hashlib.sha256(secret.encode()).hexdigest()[:16]
+
+
+class MediaReferenceCache:
+    """Content digest to platform reference map for one platform account."""
+
+    def __init__(self, platform: str, account: str, store: Optional[KeyValueStore] = None, ttl=REFERENCE_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            platform (str): Platform name
+            account (str): Account the references belong to (see :func:`account_key`)
+            store (KeyValueStore, optional): Where to persist; :func:`media_cache_store` by default,
+                or an in-memory store when references are not persisted
+            ttl (float): Seconds a reference is kept
+        """
+        self.platform = platform
+        self.account = account
+        store = store if store is not None else media_cache_store()
+        self.store = store if store is not None else KeyValueStore(MEMORY)
+        self.ttl = ttl
+
+    def _key(self, digest: str) -> str:
+        return f"{self.platform}:{self.account}:{digest}"
+
+    def get(self, digest: Optional[str]) -> Optional[str]:
+        """
+        Return the reference for previously sent content.
+
+        Args:
+            digest (str, optional): :func:`content_digest` of the content
+
+        Returns:
+            str or None: Platform reference, if the content was sent before
+        """
+        if not digest:
+            return None
+        return self.store.get(NAMESPACE, self._key(digest))
+
+    def put(self, digest: Optional[str], reference: Any, ttl: Optional[float] = None):
+        """
+        Remember the platform's reference for content.
+
+        Args:
+            digest (str, optional): :func:`content_digest` of the content
+            reference: Value returned by the platform; ignored unless a non-empty string
+            ttl (float, optional): Seconds to keep it, when shorter than the default
+        """
+        if not digest or not isinstance(reference, str) or not reference:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl > 0:
+            self.store.set(NAMESPACE, self._key(digest), reference, ttl=ttl)
+
+    def forget(self, digest: Optional[str]):
+        """
+        Drop a reference the platform no longer accepts.
+
+        Args:
+            digest (str, optional): :func:`content_digest` of the content
+        """
+        if digest:
+            self.store.delete(NAMESPACE, self._key(digest))
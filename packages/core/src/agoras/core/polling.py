@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.core.polling module.
+
+Async status polling for platforms that process media after upload. Waits
+happen on the event loop, so concurrent uploads do not each hold a worker
+thread while sleeping.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+from agoras.common.metrics import span
+
+
+@dataclass(frozen=True)
+class PollSchedule:
+    """Adaptive polling intervals: quick first checks, then exponential backoff."""
+
+    initial: float = 1.0
+    factor: float = 2.0
+    max_interval: float = 15.0
+    timeout: float = 300.0
+
+    def intervals(self) -> Iterator[float]:
+        """
+        Yield the delay before each successive check.
+
+        Returns:
+            iterator: ``initial``, ``initial * factor``, ... capped at ``max_interval``
+        """
+        interval = self.initial
+        while True:
+            yield min(interval, self.max_interval)
+            interval *= self.factor
+
+
+async def poll_until(
+    check: Callable[[], Awaitable[Any]],
+    schedule: Optional[PollSchedule] = None,
+    timeout_message: str = "Timed out waiting for platform processing",
+    initial_delay: float = 0.0,
+) -> Any:
+    """
+    Call ``check`` until it returns a truthy value or the deadline passes.
+
+    ``check`` raises to abort (e.g. when the platform reports a failure) and
+    returns a falsy value to keep waiting. Blocking checks should run on the
+    ``poll`` executor (``run_blocking(POLL, ...)``) so only the request itself
+    uses a thread, and long uploads cannot delay it.
+
+    Args:
+        check (callable): Coroutine function returning the finished result or a falsy value
+        schedule (PollSchedule, optional): Intervals and deadline; defaults to ``PollSchedule()``
+        timeout_message (str): Exception message when the deadline passes
+        initial_delay (float): Seconds to wait before the first check
+
+    Returns:
+        The first truthy value returned by ``check``
+
+    Raises:
+        Exception: ``timeout_message`` when the deadline passes, or whatever ``check`` raises
+    """
+    schedule = schedule or PollSchedule()
+    with span("poll"):
+        return await _poll(check, schedule, timeout_message, initial_delay)
+
+
+async def _poll(check, schedule: PollSchedule, timeout_message: str, initial_delay: float) -> Any:
+    deadline = time.monotonic() + schedule.timeout
+    intervals = schedule.intervals()
+
+    if initial_delay > 0:
+        await asyncio.sleep(min(initial_delay, schedule.timeout))
+
+    while True:
+        result = await check()
+        if result:
+            return result
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise Exception(timeout_message)
+        # Never sleep past the deadline, so the last check happens right at it.
+        await asyncio.sleep(min(next(intervals), remaining))
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.core.pool module.
+
+Keeps initialized ``SocialNetwork`` instances warm between jobs so a
+long-running process pays platform login and SDK setup once per account.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from agoras.common.metrics import labels, metrics, span
+from agoras.core.auth import AuthenticationError
+
+if TYPE_CHECKING:
+    from agoras.core.interfaces import SocialNetwork
+
+# Legacy-shaped keys that describe a single job rather than the account
+# the job runs against. Everything else is treated as client options.
+JOB_KEYS = (
+    "network",
+    "action",
+    "status_text",
+    "status_link",
+    "status_image_url_1",
+    "status_image_url_2",
+    "status_image_url_3",
+    "status_image_url_4",
+    "video_url",
+    "video_title",
+    "post_id",
+    "idempotency_key",
+)
+
+POOL_ACTIONS = ("post", "video", "like", "share", "delete")
+
+
+def split_job(kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Split a legacy-shaped kwargs dict into job parameters and client options.
+
+    Args:
+        kwargs (dict): Legacy-shaped arguments (``network``, ``action``, ...)
+
+    Returns:
+        tuple: ``(job, options)`` dictionaries
+    """
+    job = {key: kwargs[key] for key in JOB_KEYS if key in kwargs}
+    options = {key: value for key, value in kwargs.items() if key not in JOB_KEYS and value is not None}
+    return job, options
+
+
+def pool_key(network: str, options: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Build the cache key identifying one account on one network.
+
+    Args:
+        network (str): Network name
+        options (dict): Client options (credentials and platform settings)
+
+    Returns:
+        tuple: ``(network, digest)`` where digest hashes the options
+    """
+    encoded = json.dumps(options, sort_keys=True, default=str).encode("utf-8")
+    return network, hashlib.sha256(encoded).hexdigest()
+
+
+class _PoolEntry:
+    """A warm instance plus the bookkeeping needed to evict it."""
+
+    def __init__(self, instance: "SocialNetwork"):
+        self.instance = instance
+        self.last_used = time.monotonic()
+        self.in_use = 0
+        # Set once evicted; the last job still using the instance disconnects it.
+        self.evicted = False
+
+
+class ClientPool:
+    """
+    Cache of initialized social network instances keyed by account.
+
+    Instances are created by ``factory(network, options)``, initialized once
+    with ``_initialize_client()`` and reused by later jobs for the same
+    network and options. Jobs call the public action methods with explicit
+    arguments, so concurrent jobs never share per-job configuration.
+    """
+
+    def __init__(self, factory: Callable[[str, Dict[str, Any]], "SocialNetwork"], max_idle: Optional[float] = 900.0):
+        """
+        Initialize the pool.
+
+        Args:
+            factory (callable): Builds a ``SocialNetwork`` for ``(network, options)``
+            max_idle (float, optional): Seconds an unused instance stays warm.
+                ``None`` keeps instances until the pool is closed.
+        """
+        self.factory = factory
+        self.max_idle = max_idle
+        self._entries: Dict[Tuple[str, str], _PoolEntry] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    def __len__(self):
+        """Return the number of warm instances."""
+        return len(self._entries)
+
+    async def acquire(self, network: str, options: Dict[str, Any]) -> "SocialNetwork":
+        """
+        Return a warm instance for the account, creating it on first use.
+
+        Args:
+            network (str): Network name
+            options (dict): Client options
+
+        Returns:
+            SocialNetwork: Initialized instance
+        """
+        return (await self._acquire_entry(network, options)).instance
+
+    async def _acquire_entry(self, network: str, options: Dict[str, Any]) -> _PoolEntry:
+        await self.prune()
+
+        key = pool_key(network, options)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                instance = self.factory(network, dict(options))
+                instance.emit_status = False
+                with labels(platform=network), span("auth"):
+                    await instance._initialize_client()
+                entry = _PoolEntry(instance)
+                self._entries[key] = entry
+
+        entry.last_used = time.monotonic()
+        return entry
+
+    async def run(self, kwargs: Dict[str, Any]) -> Any:
+        """
+        Run one legacy-shaped job on a warm instance.
+
+        Args:
+            kwargs (dict): Legacy-shaped arguments including ``network`` and ``action``
+
+        Returns:
+            The value returned by the platform action (usually a post ID)
+
+        Raises:
+            Exception: If the network or action is missing or unsupported
+            AuthenticationError: If the account needs to be authorized again
+        """
+        job, options = split_job(kwargs)
+        network = job.get("network")
+        action = job.get("action")
+
+        if not network:
+            raise Exception("network is a required argument.")
+        if network == "twitter":
+            network = "x"
+        if action not in POOL_ACTIONS:
+            raise Exception(f'"{action}" action not supported by the client pool.')
+
+        key = pool_key(network, options)
+        entry = await self._acquire_entry(network, options)
+        entry.in_use += 1
+        try:
+            with labels(platform=network), span("action", action=action):
+                return await self._dispatch(entry.instance, action, job)
+        except AuthenticationError:
+            # Only the entry this job used; another job may already have replaced it.
+            if self._entries.get(key) is entry:
+                await self.evict(key)
+            raise
+        finally:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+            if entry.evicted and entry.in_use == 0:
+                await entry.instance.disconnect()
+            metrics.flush(force=False)
+
+    async def _dispatch(self, instance: "SocialNetwork", action: str, job: Dict[str, Any]) -> Any:
+        if action == "post":
+            text, link = job.get("status_text") or "", job.get("status_link") or ""
+            images = [job.get(f"status_image_url_{index}") for index in range(1, 5)]
+            return await instance.publish_once(
+                action, lambda: instance.post(text, link, *images), job.get("idempotency_key")
+            )
+        if action == "video":
+            text, url, title = job.get("status_text") or "", job.get("video_url"), job.get("video_title")
+            return await instance.publish_once(
+                action, lambda: instance.video(text, url, title), job.get("idempotency_key")
+            )
+
+        post_id = job.get("post_id")
+        if not post_id:
+            raise Exception(f"Post ID is required for {action} action.")
+        return await getattr(instance, action)(post_id)
+
+    async def evict(self, key: Tuple[str, str]):
+        """
+        Drop an instance from the pool and disconnect it.
+
+        No new job gets the instance. Jobs still running on it finish, and
+        the last of them disconnects it.
+
+        Args:
+            key (tuple): Key returned by ``pool_key``
+        """
+        entry = self._entries.pop(key, None)
+        self._locks.pop(key, None)
+        if entry is None:
+            return
+        entry.evicted = True
+        if entry.in_use == 0:
+            await entry.instance.disconnect()
+
+    async def prune(self):
+        """Disconnect instances that have been idle longer than ``max_idle``."""
+        if self.max_idle is None:
+            return
+        now = time.monotonic()
+        stale = [
+            key for key, entry in self._entries.items() if entry.in_use == 0 and now - entry.last_used > self.max_idle
+        ]
+        for key in stale:
+            await self.evict(key)
+
+    async def close(self):
+        """Disconnect every warm instance."""
+        for key in list(self._entries):
+            await self.evict(key)
@@ -0,0 +1,424 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.core.ratelimit module.
+
+Token buckets per platform, operation and account, seeded from documented
+platform quotas and tightened by the rate-limit headers platforms return.
+Bucket state lives in the shared :class:`agoras.common.store.KeyValueStore`
+so concurrent agoras processes draw from the same budget.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from agoras.common.logger import logger
+from agoras.common.store import MEMORY, KeyValueStore, default_store
+
+NAMESPACE = "ratelimit"
+
+# Operation name of the per-chat or per-channel bucket in RATE_LIMITS.
+DESTINATION = "destination"
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Token bucket refilling ``capacity`` requests every ``period`` seconds.
+
+    Operations naming the same ``bucket`` draw from one budget, e.g. every
+    call that publishes against a daily publishing quota.
+    """
+
+    capacity: int
+    period: float
+    bucket: Optional[str] = None
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self.capacity / self.period
+
+
+HOUR = 3600.0
+DAY = 86400.0
+
+# Conservative per-account quotas from each platform's published limits.
+# Keys match the operation names passed to BaseAPI._rate_limit_check;
+# "default" covers every other operation on that platform. A "destination"
+# limit is applied per chat or channel on top of the account's own buckets.
+INSTAGRAM_PUBLISHING = RateLimit(100, DAY, bucket="publish")
+THREADS_PUBLISHING = RateLimit(250, DAY, bucket="publish")
+
+RATE_LIMITS: Dict[str, Dict[str, RateLimit]] = {
+    # X API v2 per-user limits (Basic tier)
+    "x": {
+        "post": RateLimit(100, DAY),
+        "like": RateLimit(200, DAY),
+        "share": RateLimit(5, 900),
+        "delete": RateLimit(50, 900),
+        "upload_media": RateLimit(415, 900),
+        "default": RateLimit(50, 900),
+    },
+    # Graph API platform limit: 200 calls per user per hour
+    "facebook": {"default": RateLimit(200, HOUR)},
+    # Content publishing: 100 API-published posts per 24 hours
+    "instagram": {"post": INSTAGRAM_PUBLISHING, "publish_media": INSTAGRAM_PUBLISHING, "default": RateLimit(200, HOUR)},
+    # 150 member shares per day
+    "linkedin": {"post": RateLimit(150, DAY), "default": RateLimit(500, DAY)},
+    # Content publishing: 250 posts and 1000 replies per 24 hours
+    "threads": {
+        "create_post": THREADS_PUBLISHING,
+        "create_video_post": THREADS_PUBLISHING,
+        "default": RateLimit(1000, DAY),
+    },
+    # Content posting init endpoints: 6 requests per minute per user token
+    "tiktok": {"upload_video": RateLimit(6, 60), "upload_photo": RateLimit(6, 60), "default": RateLimit(600, 60)},
+    # 10,000 quota units per day; a video upload costs 1,600
+    "youtube": {"upload_video": RateLimit(6, DAY), "default": RateLimit(10000, DAY)},
+    # Global limit: 50 requests per second; each channel: 5 messages per 5 seconds
+    "discord": {"default": RateLimit(50, 1), "destination": RateLimit(5, 5)},
+    # Bot-wide: 30 messages per second; each group: 20 messages per minute
+    "telegram": {"default": RateLimit(30, 1), "destination": RateLimit(20, 60)},
+    # Cloud API default throughput: 80 messages per second per phone number
+    "whatsapp": {"default": RateLimit(80, 1)},
+}
+
+# Used when Meta reports 100% usage without an estimated recovery time.
+USAGE_COOLDOWN = 300.0
+
+# Longest wait acquire() sleeps through before failing instead.
+MAX_WAIT = 300.0
+# Waits longer than this are logged, so a paused run does not look hung.
+LOG_WAIT = 5.0
+
+_default_limiters: Dict[str, "RateLimiter"] = {}
+_default_lock = threading.Lock()
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _float(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _meta_usage(value: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not value:
+        return None
+    try:
+        usage = json.loads(value)
+    except ValueError:
+        return None
+    if isinstance(usage, dict) and usage and all(isinstance(item, list) for item in usage.values()):
+        # x-business-use-case-usage: {"<business id>": [{...}, ...]}
+        entries = [entry for items in usage.values() for entry in items if isinstance(entry, dict)]
+        if not entries:
+            return None
+        return max(entries, key=lambda entry: _usage_percent(entry))
+    return usage if isinstance(usage, dict) else None
+
+
+def _usage_percent(usage: Dict[str, Any]) -> float:
+    return max((float(usage.get(key) or 0) for key in ("call_count", "total_time", "total_cputime")), default=0.0)
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Return the time until which a platform asked callers to stop, if any.
+
+    Understands ``Retry-After``, X/Discord style ``x-rate-limit-remaining`` /
+    ``x-ratelimit-remaining`` with their reset headers, and Meta's
+    ``x-app-usage`` / ``x-business-use-case-usage`` percentages.
+
+    Args:
+        headers (mapping): Response headers
+        now (float, optional): Current epoch time
+
+    Returns:
+        float or None: Epoch time before which no request should be sent
+    """
+    now = time.time() if now is None else now
+    blocked_until = None
+
+    retry_after = _header(headers, "retry-after")
+    if retry_after:
+        delay = _float(retry_after)
+        if delay is None:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - now
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            blocked_until = now + max(delay, 0.0)
+
+    for prefix in ("x-rate-limit-", "x-ratelimit-"):
+        remaining = _float(_header(headers, prefix + "remaining"))
+        if remaining is None or remaining > 0:
+            continue
+        reset_after = _float(_header(headers, prefix + "reset-after"))
+        reset = _float(_header(headers, prefix + "reset"))
+        if reset_after is not None:
+            until = now + reset_after
+        elif reset is not None:
+            # Absolute epoch seconds on X and Discord; tolerate relative values.
+            until = reset if reset > now - DAY else now + reset
+        else:
+            continue
+        blocked_until = max(blocked_until or 0.0, until)
+
+    for name in ("x-app-usage", "x-business-use-case-usage", "x-ad-account-usage"):
+        usage = _meta_usage(_header(headers, name))
+        if not usage or _usage_percent(usage) < 100:
+            continue
+        regain_minutes = _float(str(usage.get("estimated_time_to_regain_access", "")) or None)
+        cooldown = regain_minutes * 60 if regain_minutes else USAGE_COOLDOWN
+        blocked_until = max(blocked_until or 0.0, now + cooldown)
+
+    return blocked_until
+
+
+class RateLimiter:
+    """
+    Shared token-bucket rate limiter.
+
+    Each ``(platform, operation, account)`` has a bucket seeded from
+    :data:`RATE_LIMITS`. Taking a token when the bucket is empty reserves
+    the next one, so concurrent callers queue instead of bursting. Response
+    headers can additionally pause a whole platform account until the
+    platform's reset time.
+    """
+
+    def __init__(
+        self,
+        store: Optional[KeyValueStore] = None,
+        limits: Optional[Dict[str, Dict[str, RateLimit]]] = None,
+        clock: Callable[[], float] = time.time,
+        max_wait: Optional[float] = MAX_WAIT,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            store (KeyValueStore, optional): Bucket storage; an in-memory store by default
+            limits (dict, optional): Per-platform limits; :data:`RATE_LIMITS` by default
+            clock (callable): Epoch time source
+            max_wait (float, optional): Longest wait :meth:`acquire` accepts; None waits without limit
+        """
+        self.store = store if store is not None else KeyValueStore(MEMORY)
+        self.limits = RATE_LIMITS if limits is None else limits
+        self.clock = clock
+        self.max_wait = max_wait
+
+    def limit_for(self, platform: str, operation: str) -> Optional[RateLimit]:
+        """
+        Return the bucket configuration for an operation.
+
+        Args:
+            platform (str): Platform name (``x``, ``facebook``, ...)
+            operation (str): Operation name
+
+        Returns:
+            RateLimit or None: None if the platform has no known limits
+        """
+        platform_limits = self.limits.get(platform) or {}
+        return platform_limits.get(operation) or platform_limits.get("default")
+
+    def has_limit(self, platform: str, operation: str) -> bool:
+        """
+        Return whether a platform configures a bucket for exactly this operation.
+
+        Args:
+            platform (str): Platform name
+            operation (str): Operation name
+
+        Returns:
+            bool: False when the operation would only fall back to ``default``
+        """
+        return operation in (self.limits.get(platform) or {})
+
+    def reserve(
+        self, platform: str, operation: str, account: str = "default", max_wait: Optional[float] = None
+    ) -> float:
+        """
+        Take a token and return how long the caller must wait before using it.
+
+        Args:
+            platform (str): Platform name
+            operation (str): Operation name
+            account (str): Account identifier
+            max_wait (float, optional): Leave the token in the bucket if the wait would be longer
+
+        Returns:
+            float: Seconds to wait (0 when a token was available)
+        """
+        now = self.clock()
+        blocked = self.store.get(NAMESPACE, f"{platform}:*:{account}") or {}
+        wait = max(0.0, blocked.get("until", 0.0) - now)
+
+        limit = self.limit_for(platform, operation)
+        if limit is None or (max_wait is not None and wait > max_wait):
+            return wait
+
+        def take(state):
+            nonlocal wait
+            tokens = float(limit.capacity)
+            if state:
+                elapsed = max(0.0, now - state["at"])
+                tokens = min(float(limit.capacity), state["tokens"] + elapsed * limit.rate)
+            wait = max(wait, (1 - tokens) / limit.rate)
+            if max_wait is not None and wait > max_wait:
+                return {"tokens": tokens, "at": now}
+            return {"tokens": tokens - 1, "at": now}
+
+        bucket = limit.bucket or operation
+        self.store.update(NAMESPACE, f"{platform}:{bucket}:{account}", take, ttl=limit.period * 2)
+        return wait
+
+    async def acquire(self, platform: str, operation: str, account: str = "default") -> float:
+        """
+        Wait until the operation may run.
+
+        Args:
+            platform (str): Platform name
+            operation (str): Operation name
+            account (str): Account identifier
+
+        Returns:
+            float: Seconds waited
+
+        Raises:
+            Exception: If the quota frees up later than ``max_wait`` from now; no token is taken
+        """
+        wait = await asyncio.to_thread(self.reserve, platform, operation, account, self.max_wait)
+        if self.max_wait is not None and wait > self.max_wait:
+            raise Exception(f'{platform} "{operation}" quota exhausted, retry after {wait:.0f} s.')
+        if wait > LOG_WAIT:
+            logger.info(f'{platform} "{operation}" rate limit reached, waiting {wait:.0f} s.')
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def observe(self, platform: str, headers: Mapping[str, str], account: str = "default") -> Optional[float]:
+        """
+        Record rate-limit feedback from a platform response.
+
+        Args:
+            platform (str): Platform name
+            headers (mapping): Response headers
+            account (str): Account identifier
+
+        Returns:
+            float or None: Epoch time the account is paused until, if the headers asked for a pause
+        """
+        now = self.clock()
+        until = parse_rate_limit_headers(headers, now)
+        if until is None or until <= now:
+            return None
+
+        def extend(state):
+            return {"until": max(until, (state or {}).get("until", 0.0))}
+
+        self.store.update(NAMESPACE, f"{platform}:*:{account}", extend, ttl=until - now)
+        return until
+
+    def attach(self, session, platform: str, account: str = "default"):
+        """
+        Feed every response of a ``requests`` session into :meth:`observe`.
+
+        Attaching the same platform account twice is a no-op.
+
+        Args:
+            session (requests.Session): Session used by a platform client
+            platform (str): Platform name
+            account (str): Account identifier
+        """
+        hooks = session.hooks.setdefault("response", [])
+        marker = (id(self), platform, account)
+        if any(getattr(hook, "_agoras_rate_limit", None) == marker for hook in hooks):
+            return
+
+        def hook(response, *args, **kwargs):
+            self.observe(platform, response.headers, account)
+
+        hook._agoras_rate_limit = marker  # type: ignore[attr-defined]
+        hooks.append(hook)
+
+
+def configured_max_wait() -> float:
+    """
+    Return the longest rate-limit wait to sleep through: ``AGORAS_RATE_LIMIT_MAX_WAIT`` or :data:`MAX_WAIT`.
+
+    Returns:
+        float: Seconds
+
+    Raises:
+        Exception: If the variable is not a non-negative number
+    """
+    value = os.environ.get("AGORAS_RATE_LIMIT_MAX_WAIT")
+    if not value:
+        return MAX_WAIT
+    seconds = _float(value)
+    if seconds is None or seconds < 0:
+        raise Exception(f'AGORAS_RATE_LIMIT_MAX_WAIT must be a non-negative number of seconds, got "{value}".')
+    return seconds
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Return the process-wide rate limiter selected by ``AGORAS_RATE_LIMIT``.
+
+    ``shared`` (default) keeps buckets in the agoras state database so every
+    process on the machine shares one budget, ``memory`` keeps them per
+    process and ``off`` disables quota tracking. Waits longer than
+    :func:`configured_max_wait` fail instead of sleeping.
+
+    Returns:
+        RateLimiter or None: None when rate limiting is disabled
+    """
+    mode = os.environ.get("AGORAS_RATE_LIMIT", "shared").lower()
+    if mode == "off":
+        return None
+
+    with _default_lock:
+        key = mode if mode == "memory" else f"shared:{os.environ.get('AGORAS_STORAGE_DIR', '')}"
+        if key not in _default_limiters:
+            store = None
+            if mode != "memory":
+                try:
+                    store = default_store()
+                except (OSError, sqlite3.Error):
+                    # Read-only home or locked filesystem: fall back to per-process buckets.
+                    store = None
+            _default_limiters[key] = RateLimiter(store)
+        _default_limiters[key].max_wait = configured_max_wait()
+        return _default_limiters[key]
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.core.retry module.
+
+One retry policy for platform clients: exponential backoff with full
+jitter, ``Retry-After`` support and idempotency awareness. Calls that are
+not idempotent (creating a post) are only retried when the platform
+rejected them without processing (HTTP 429), so a retry can never publish
+twice.
+"""
+
+import asyncio
+import functools
+import http.client
+import inspect
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, FrozenSet, Optional, Tuple
+
+import requests
+
+from .http import IDEMPOTENT_METHODS
+from .ratelimit import parse_rate_limit_headers
+
+RETRY_AFTER_STATUS = 429
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how long to retry a failed platform call."""
+
+    attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    # Give up instead of waiting when a platform asks for a longer pause.
+    max_retry_after: float = 120.0
+    statuses: FrozenSet[int] = frozenset({RETRY_AFTER_STATUS, 500, 502, 503, 504})
+    exceptions: Tuple[type, ...] = (
+        requests.ConnectionError,
+        requests.Timeout,
+        ConnectionError,
+        TimeoutError,
+        http.client.HTTPException,
+    )
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Return the delay before retry number ``attempt`` (1-based).
+
+        Args:
+            attempt (int): Retry number
+            retry_after (float, optional): Server-requested delay in seconds
+
+        Returns:
+            float: Seconds to wait
+        """
+        if retry_after is not None:
+            return max(0.0, retry_after)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def should_retry(self, status: Optional[int] = None, error: Optional[BaseException] = None, idempotent=False):
+        """
+        Decide whether a failed call may be retried.
+
+        Args:
+            status (int, optional): HTTP status of the failed call
+            error (Exception, optional): Exception raised by the call
+            idempotent (bool): Whether repeating the call is safe
+
+        Returns:
+            bool: True if the call should be retried
+        """
+        if status is not None:
+            return status == RETRY_AFTER_STATUS or (idempotent and status in self.statuses)
+        if error is not None:
+            return idempotent and isinstance(error, self.exceptions)
+        return False
+
+
+DEFAULT_POLICY = RetryPolicy()
+
+
+def _parse_retry_after(value) -> Optional[float]:
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return parsedate_to_datetime(str(value)).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+
+
+def _headers(source) -> Any:
+    return getattr(source, "headers", None) or (source if isinstance(source, dict) else {})
+
+
+def status_of(error: BaseException) -> Optional[int]:
+    """
+    Return the HTTP status carried by an SDK or ``requests`` exception.
+
+    Args:
+        error (Exception): Raised exception
+
+    Returns:
+        int or None: HTTP status code if the exception has one
+    """
+    for source in (getattr(error, "response", None), getattr(error, "resp", None), error):
+        for attribute in ("status_code", "status"):
+            value = getattr(source, attribute, None)
+            if isinstance(value, int):
+                return value
+            if isinstance(value, str) and value.isdigit():
+                return int(value)
+    return None
+
+
+def retry_after_of(source) -> Optional[float]:
+    """
+    Return the ``Retry-After`` delay from a response or exception.
+
+    Args:
+        source: ``requests.Response``, ``httplib2.Response`` or an exception carrying one
+
+    Returns:
+        float or None: Seconds to wait, if the platform said so (``Retry-After``
+        or an exhausted ``x-rate-limit-*`` window)
+    """
+    for candidate in (source, getattr(source, "response", None), getattr(source, "resp", None)):
+        headers = _headers(candidate) if candidate is not None else {}
+        for key in ("Retry-After", "retry-after"):
+            if key in headers:
+                return _parse_retry_after(headers[key])
+        if headers:
+            # X and Discord announce the reset time instead of Retry-After.
+            now = time.time()
+            blocked_until = parse_rate_limit_headers(headers, now)
+            if blocked_until is not None:
+                return blocked_until - now
+    return None
+
+
+def _next_delay(policy: RetryPolicy, attempt: int, retry_after: Optional[float]) -> Optional[float]:
+    if attempt >= policy.attempts:
+        return None
+    if retry_after is not None and retry_after > policy.max_retry_after:
+        return None
+    return policy.backoff(attempt, retry_after)
+
+
+def _delay_for_error(policy: RetryPolicy, attempt: int, error: BaseException, idempotent: bool) -> Optional[float]:
+    status = status_of(error)
+    if not policy.should_retry(status=status, error=None if status is not None else error, idempotent=idempotent):
+        return None
+    return _next_delay(policy, attempt, retry_after_of(error))
+
+
+async def retry_async(
+    func: Callable[..., Any],
+    *args,
+    idempotent: bool = False,
+    policy: Optional[RetryPolicy] = None,
+    **kwargs,
+) -> Any:
+    """
+    Await ``func(*args, **kwargs)``, retrying transient failures with async sleeps.
+
+    ``func`` may be a coroutine function or ``run_blocking`` wrapping a
+    blocking SDK call.
+
+    Args:
+        func (callable): Coroutine function to call
+        *args: Positional arguments for ``func``
+        idempotent (bool): Whether repeating the call is safe
+        policy (RetryPolicy, optional): Retry policy; :data:`DEFAULT_POLICY` by default
+        **kwargs: Keyword arguments for ``func``
+
+    Returns:
+        The result of ``func``
+
+    Raises:
+        Exception: The last error once retries are exhausted or not allowed
+    """
+    policy = policy or DEFAULT_POLICY
+    attempt = 1
+    while True:
+        try:
+            return await func(*args, **kwargs)
+        except Exception as error:
+            delay = _delay_for_error(policy, attempt, error, idempotent)
+            if delay is None:
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def retry_sync(
+    func: Callable[..., Any],
+    *args,
+    idempotent: bool = False,
+    policy: Optional[RetryPolicy] = None,
+    **kwargs,
+) -> Any:
+    """
+    Call blocking ``func(*args, **kwargs)`` with retries.
+
+    Only for code already running in a worker thread; event-loop code
+    should use :func:`retry_async`.
+
+    Args:
+        func (callable): Function to call
+        *args: Positional arguments for ``func``
+        idempotent (bool): Whether repeating the call is safe
+        policy (RetryPolicy, optional): Retry policy; :data:`DEFAULT_POLICY` by default
+        **kwargs: Keyword arguments for ``func``
+
+    Returns:
+        The result of ``func``
+
+    Raises:
+        Exception: The last error once retries are exhausted or not allowed
+    """
+    policy = policy or DEFAULT_POLICY
+    attempt = 1
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except Exception as error:
+            delay = _delay_for_error(policy, attempt, error, idempotent)
+            if delay is None:
+                raise
+        time.sleep(delay)
+        attempt += 1
+
+
+def request_with_retry(
+    session: requests.Session,
+    method: str,
+    url: str,
+    idempotent: Optional[bool] = None,
+    policy: Optional[RetryPolicy] = None,
+    **kwargs,
+) -> requests.Response:
+    """
+    Send an HTTP request on ``session``, retrying retryable statuses and errors.
+
+    The final response is returned whatever its status, so callers keep
+    their existing error handling.
+
+    Args:
+        session (requests.Session): Session to send on
+        method (str): HTTP method
+        url (str): Request URL
+        idempotent (bool, optional): Whether repeating the request is safe.
+            Defaults to True for GET, HEAD, OPTIONS, PUT and DELETE.
+        policy (RetryPolicy, optional): Retry policy; :data:`DEFAULT_POLICY` by default
+        **kwargs: Passed to the session method
+
+    Returns:
+        requests.Response: Last response received
+
+    Raises:
+        requests.RequestException: The last transport error once retries are exhausted
+    """
+    policy = policy or DEFAULT_POLICY
+    if idempotent is None:
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+    send = getattr(session, method.lower())
+    attempt = 1
+    while True:
+        try:
+            response = send(url, **kwargs)
+        except Exception as error:
+            delay = _delay_for_error(policy, attempt, error, idempotent)
+            if delay is None:
+                raise
+        else:
+            status = response.status_code
+            if not isinstance(status, int) or not policy.should_retry(status=status, idempotent=idempotent):
+                return response
+            delay = _next_delay(policy, attempt, retry_after_of(response))
+            if delay is None:
+                return response
+        time.sleep(delay)
+        attempt += 1
+
+
+def retryable(idempotent: bool = False, policy: Optional[RetryPolicy] = None):
+    """
+    Declare a client call safe to retry.
+
+    Works on coroutine functions (async sleeps) and blocking functions
+    (for methods that run in worker threads).
+
+    Args:
+        idempotent (bool): Whether repeating the call is safe
+        policy (RetryPolicy, optional): Retry policy; :data:`DEFAULT_POLICY` by default
+
+    Returns:
+        callable: Decorator
+    """
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await retry_async(func, *args, idempotent=idempotent, policy=policy, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return retry_sync(func, *args, idempotent=idempotent, policy=policy, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.core.scheduler module.
+
+Persistent job queue and scheduler. Jobs are legacy-shaped dictionaries
+(the same ones ``ClientPool.run`` accepts) stored in a local SQLite table
+with the time they are due. The scheduler sleeps until the earliest due
+job, runs due jobs on a bounded set of workers and records the outcome.
+
+Delivery is at least once: a claimed job holds a lease, and a job whose
+worker died is claimed again once its lease expires. Enqueueing is
+idempotent: every job has a key, and a key that is already queued is
+ignored, so sync stages can enqueue the same sheet or feed repeatedly.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from agoras.common.logger import logger
+from agoras.common.store import MEMORY, storage_dir
+
+from .auth import AuthenticationError
+from .retry import RetryPolicy, retry_after_of, status_of
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+DEFAULT_CONCURRENCY = 4
+# Seconds a claimed job belongs to its worker. Workers renew the lease
+# while the job runs, so it only expires when the process is gone.
+DEFAULT_LEASE = 300.0
+# Longest sleep between checks, so jobs enqueued by other processes are
+# picked up without a wake-up signal.
+DEFAULT_POLL_INTERVAL = 30.0
+
+# Posting is not idempotent, so a failed job is only retried when the
+# platform rejected it with HTTP 429 (nothing was published).
+SCHEDULER_RETRY = RetryPolicy(attempts=5, base_delay=5.0, max_delay=900.0, max_retry_after=3600.0)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id TEXT PRIMARY KEY,
+        run_at REAL NOT NULL,
+        job TEXT NOT NULL,
+        state TEXT NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        lease_until REAL,
+        result TEXT,
+        error TEXT,
+        created_at REAL NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS jobs_due ON jobs (state, run_at)",
+)
+
+
+def job_key(job: Dict[str, Any], run_at: float) -> str:
+    """
+    Return the default key of a job: a digest of its content and due time.
+
+    Args:
+        job (dict): Legacy-shaped job
+        run_at (float): Unix timestamp the job is due
+
+    Returns:
+        str: Hex digest identifying the job
+    """
+    encoded = json.dumps({"job": job, "run_at": round(run_at, 3)}, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class QueuedJob:
+    """One row of the job table."""
+
+    id: str
+    run_at: float
+    job: Dict[str, Any]
+    state: str
+    attempts: int
+    result: Any = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the job as a JSON-serializable dictionary.
+
+        Returns:
+            dict: Job fields with ``run_at`` as a Unix timestamp
+        """
+        return {
+            "id": self.id,
+            "run_at": self.run_at,
+            "state": self.state,
+            "attempts": self.attempts,
+            "job": self.job,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobQueue:
+    """
+    SQLite table of scheduled jobs.
+
+    The ``(state, run_at)`` index keeps pending jobs ordered by due time,
+    so the next due job is found without scanning the table. Several
+    processes can share one database: claims run in immediate transactions.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, timeout: float = 10.0):
+        """
+        Open (and create if needed) the queue.
+
+        Args:
+            path (str or Path, optional): Database file, or ``":memory:"``.
+                Defaults to ``jobs.db`` in the Agoras storage directory.
+            timeout (float): Seconds to wait for another process's lock
+        """
+        if path is None:
+            path = storage_dir() / "jobs.db"
+        self.path = str(path)
+        if self.path != MEMORY:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        if self.path != MEMORY:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            os.chmod(self.path, 0o600)
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+
+    def enqueue(self, job: Dict[str, Any], run_at: float, key: Optional[str] = None) -> bool:
+        """
+        Add a job unless a job with the same key was already queued.
+
+        Args:
+            job (dict): Legacy-shaped job (``network``, ``action``, ``status_text``, ...)
+            run_at (float): Unix timestamp the job is due
+            key (str, optional): Deduplication key; defaults to :func:`job_key`
+
+        Returns:
+            bool: True if the job was added, False if its key already existed
+
+        Raises:
+            Exception: If the job has no network
+        """
+        if not job.get("network"):
+            raise Exception("network is required.")
+        job = {"action": "post", **job}
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO jobs (id, run_at, job, state, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key or job_key(job, run_at), run_at, json.dumps(job, default=str), PENDING, now, now),
+            )
+        return cursor.rowcount == 1
+
+    def claim(self, limit: int, lease: float = DEFAULT_LEASE, due_by: Optional[float] = None) -> List[QueuedJob]:
+        """
+        Mark up to ``limit`` due jobs as running and return them.
+
+        Pending jobs are due at ``run_at``; running jobs whose lease expired
+        (their worker died) are due again.
+
+        Args:
+            limit (int): Maximum jobs to claim
+            lease (float): Seconds the claim is valid
+            due_by (float, optional): Only claim jobs due by this Unix time (default: now)
+
+        Returns:
+            list: Claimed jobs, earliest first
+        """
+        if limit <= 0:
+            return []
+        now = time.time()
+        due = now if due_by is None else min(due_by, now)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT id, run_at, job, state, attempts FROM jobs "
+                    "WHERE (state = ? AND run_at <= ?) OR (state = ? AND lease_until <= ?) "
+                    "ORDER BY run_at LIMIT ?",
+                    (PENDING, due, RUNNING, now, limit),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE jobs SET state = ?, attempts = attempts + 1, lease_until = ?, updated_at = ? WHERE id = ?",
+                    [(RUNNING, now + lease, now, row[0]) for row in rows],
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return [QueuedJob(row[0], row[1], json.loads(row[2]), RUNNING, row[4] + 1) for row in rows]
+
+    def renew(self, ids, lease: float = DEFAULT_LEASE):
+        """
+        Extend the lease of jobs that are still running.
+
+        Args:
+            ids (iterable): Job IDs
+            lease (float): Seconds from now the claims stay valid
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND state = ?",
+                [(now + lease, job_id, RUNNING) for job_id in ids],
+            )
+
+    def complete(self, job_id: str, result: Any = None):
+        """
+        Mark a job as done.
+
+        Args:
+            job_id (str): Job ID
+            result: JSON-serializable action result (usually a post ID)
+        """
+        self._finish(job_id, DONE, result=json.dumps(result, default=str))
+
+    def fail(self, job_id: str, error: str, retry_at: Optional[float] = None):
+        """
+        Record a failed attempt.
+
+        Args:
+            job_id (str): Job ID
+            error (str): Error message
+            retry_at (float, optional): Unix time to try again; the job fails for good when omitted
+        """
+        if retry_at is None:
+            self._finish(job_id, FAILED, error=error)
+            return
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET state = ?, run_at = ?, lease_until = NULL, error = ?, updated_at = ? WHERE id = ?",
+                (PENDING, retry_at, error, time.time(), job_id),
+            )
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job that has not started.
+
+        Args:
+            job_id (str): Job ID
+
+        Returns:
+            bool: True if a pending job was cancelled
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET state = ?, updated_at = ? WHERE id = ? AND state = ?",
+                (CANCELLED, time.time(), job_id, PENDING),
+            )
+        return cursor.rowcount == 1
+
+    def next_due(self) -> Optional[float]:
+        """
+        Return when the next job becomes due.
+
+        Returns:
+            float or None: Earliest ``run_at`` of pending jobs or lease expiry
+            of running jobs, None when the queue is idle
+        """
+        with self._lock:
+            pending = self._conn.execute("SELECT MIN(run_at) FROM jobs WHERE state = ?", (PENDING,)).fetchone()[0]
+            leased = self._conn.execute("SELECT MIN(lease_until) FROM jobs WHERE state = ?", (RUNNING,)).fetchone()[0]
+        times = [value for value in (pending, leased) if value is not None]
+        return min(times) if times else None
+
+    def jobs(self, state: Optional[str] = None) -> List[QueuedJob]:
+        """
+        List jobs ordered by due time.
+
+        Args:
+            state (str, optional): Only list jobs in this state
+
+        Returns:
+            list: Matching jobs
+        """
+        query = "SELECT id, run_at, job, state, attempts, result, error FROM jobs"
+        params: tuple = ()
+        if state is not None:
+            query += " WHERE state = ?"
+            params = (state,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY run_at", params).fetchall()
+        return [
+            QueuedJob(*row[:2], json.loads(row[2]), *row[3:5], json.loads(row[5]) if row[5] else None, row[6])
+            for row in rows
+        ]
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _finish(self, job_id: str, state: str, result: Optional[str] = None, error: Optional[str] = None):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET state = ?, lease_until = NULL, result = ?, error = ?, updated_at = ? WHERE id = ?",
+                (state, result, error, time.time(), job_id),
+            )
+
+
+class Scheduler:
+    """
+    Run queued jobs when they are due on a bounded set of workers.
+
+    The scheduler sleeps until the earliest due job (or at most
+    ``poll_interval``), claims as many due jobs as it has free workers and
+    wakes again as soon as a worker finishes.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        run: Callable[[Dict[str, Any]], Awaitable[Any]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        lease: float = DEFAULT_LEASE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        policy: Optional[RetryPolicy] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            queue (JobQueue): Queue to run
+            run (callable): Coroutine function running one job, e.g. ``ClientPool.run``
+            concurrency (int): Maximum jobs running at once
+            lease (float): Seconds a claim stays valid without renewal
+            poll_interval (float): Longest sleep between checks of the queue
+            policy (RetryPolicy, optional): Retry policy for throttled jobs; :data:`SCHEDULER_RETRY` by default
+        """
+        self.queue = queue
+        self.run_job = run
+        self.concurrency = max(concurrency, 1)
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self.policy = policy or SCHEDULER_RETRY
+        self._running: Dict[str, asyncio.Task] = {}
+        self._wake: Optional[asyncio.Event] = None
+
+    def wake(self):
+        """Re-check the queue now, e.g. after enqueueing from the same process."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None):
+        """
+        Run due jobs until ``stop`` is set, then wait for running jobs.
+
+        Args:
+            stop (asyncio.Event, optional): Set to stop the scheduler
+        """
+        self._wake = asyncio.Event()
+        stop = stop or asyncio.Event()
+        try:
+            while not stop.is_set():
+                self._start_due()
+                self._wake.clear()
+                await self._sleep(stop)
+        finally:
+            await self._drain()
+
+    async def run_pending(self) -> Dict[str, int]:
+        """
+        Run every job that is due now and return when they have finished.
+
+        Returns:
+            dict: Number of jobs per final state (``done``, ``failed``, ``pending`` for rescheduled ones)
+        """
+        # Jobs rescheduled during this run are due later and left for the next run.
+        started = time.time()
+        counts: Dict[str, int] = {}
+        while True:
+            self._start_due(started)
+            if not self._running:
+                return counts
+            done, _ = await asyncio.wait(
+                set(self._running.values()), timeout=self.lease / 2, return_when=asyncio.FIRST_COMPLETED
+            )
+            self.queue.renew(list(self._running), self.lease)
+            for task in done:
+                state = task.result()
+                counts[state] = counts.get(state, 0) + 1
+
+    def _start_due(self, due_by: Optional[float] = None):
+        free = self.concurrency - len(self._running)
+        for queued in self.queue.claim(free, self.lease, due_by=due_by):
+            task = asyncio.ensure_future(self._execute(queued))
+            self._running[queued.id] = task
+            task.add_done_callback(lambda _task, job_id=queued.id: self._finished(job_id))
+
+    def _finished(self, job_id: str):
+        self._running.pop(job_id, None)
+        self.wake()
+
+    async def _execute(self, queued: QueuedJob) -> str:
+        try:
+            # The job ID makes a re-run after a lost lease report the first publish instead of repeating it.
+            result = await self.run_job({"idempotency_key": queued.id, **queued.job})
+        except Exception as error:
+            retry_at = self._retry_at(queued, error)
+            logger.error(f"Scheduled job {queued.id[:12]} failed: {error}")
+            self.queue.fail(queued.id, str(error), retry_at=retry_at)
+            return PENDING if retry_at is not None else FAILED
+        self.queue.complete(queued.id, result)
+        return DONE
+
+    def _retry_at(self, queued: QueuedJob, error: Exception) -> Optional[float]:
+        if isinstance(error, AuthenticationError) or queued.attempts >= self.policy.attempts:
+            return None
+        if not self.policy.should_retry(status=status_of(error)):
+            return None
+        retry_after = retry_after_of(error)
+        if retry_after is not None and retry_after > self.policy.max_retry_after:
+            return None
+        return time.time() + self.policy.backoff(queued.attempts, retry_after)
+
+    async def _sleep(self, stop: asyncio.Event):
+        now = time.time()
+        next_due = self.queue.next_due()
+        delay = self.poll_interval if next_due is None else max(0.0, next_due - now)
+        if self._running:
+            self.queue.renew(list(self._running), self.lease)
+            delay = min(delay, self.lease / 2)
+        delay = min(delay, self.poll_interval)
+        if delay <= 0 and len(self._running) >= self.concurrency:
+            # Due jobs are waiting for a free worker; a finishing job wakes us.
+            delay = self.poll_interval
+
+        waiters = [asyncio.ensure_future(self._wake.wait()), asyncio.ensure_future(stop.wait())]
+        try:
+            await asyncio.wait(waiters, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def _drain(self):
+        if self._running:
+            await asyncio.gather(*self._running.values(), return_exceptions=True)
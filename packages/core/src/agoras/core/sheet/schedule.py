@@ -137,3 +137,45 @@ class ScheduleSheet(Sheet):
         await self.write_all(updated_rows, clear_first=True)
 
         return posts_to_publish
+
+    async def scheduled_posts(self):
+        """
+        Read every unpublished post with the time it is due, without changing the sheet.
+
+        Used by the job queue's sync stage, which enqueues each post once and
+        publishes it at its exact time.
+
+        Returns:
+            list: ``(due_at, post_data)`` pairs, where ``due_at`` is a naive
+            local ``datetime`` at the scheduled date and hour
+        """
+        all_rows = await self.read_all(has_headers=False)
+        keys = (
+            "status_text",
+            "status_link",
+            "status_image_url_1",
+            "status_image_url_2",
+            "status_image_url_3",
+            "status_image_url_4",
+        )
+        posts = []
+
+        for row_data in all_rows:
+            if len(row_data.data) < 9:
+                continue
+
+            *content, date, hour, state = row_data.data[:9]
+            if state == "published":
+                continue
+
+            try:
+                # Dates are documented as DD-MM-YYYY.
+                due_at = parser.parse(date, dayfirst=True).replace(
+                    hour=int(hour or 0), minute=0, second=0, microsecond=0
+                )
+            except (TypeError, ValueError, OverflowError):
+                continue
+
+            posts.append((due_at, dict(zip(keys, content))))
+
+        return posts
@@ -17,12 +17,13 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.core.sheet.sheet module."""
 
-import asyncio
 from typing import Optional
 
 import gspread
 from google.oauth2.service_account import Credentials
 
+from agoras.common.executors import API, run_blocking
+
 from .row import SheetRow
 
 
@@ -81,7 +82,7 @@ class Sheet:
 
             return client, spreadsheet
 
-        self._client, self._spreadsheet = await asyncio.to_thread(_sync_auth)
+        self._client, self._spreadsheet = await run_blocking(API, _sync_auth)
         self._authenticated = True
 
         return self
@@ -114,7 +115,7 @@ class Sheet:
                 # Get first worksheet if no name specified
                 return self._spreadsheet.get_worksheet(0)
 
-        self._worksheet = await asyncio.to_thread(_sync_get_worksheet)
+        self._worksheet = await run_blocking(API, _sync_get_worksheet)
         return self
 
     async def read_all(self, has_headers=True):
@@ -137,7 +138,7 @@ class Sheet:
             assert self._worksheet is not None  # Help type checker
             return self._worksheet.get_all_values()
 
-        raw_data = await asyncio.to_thread(_sync_read)
+        raw_data = await run_blocking(API, _sync_read)
 
         if not raw_data:
             return []
@@ -167,7 +168,7 @@ class Sheet:
             assert self._worksheet is not None  # Help type checker
             return self._worksheet.get(range_name)
 
-        return await asyncio.to_thread(_sync_read)
+        return await run_blocking(API, _sync_read)
 
     async def write_all(self, data, clear_first=True, table_range="A1"):
         """
@@ -204,7 +205,7 @@ class Sheet:
             for row_data in rows_data:
                 self._worksheet.append_row(row_data, table_range=table_range)
 
-        await asyncio.to_thread(_sync_write)
+        await run_blocking(API, _sync_write)
 
     async def append_row(self, row_data, table_range="A1"):
         """
@@ -231,7 +232,7 @@ class Sheet:
 
             self._worksheet.append_row(data, table_range=table_range)
 
-        await asyncio.to_thread(_sync_append)
+        await run_blocking(API, _sync_append)
 
     async def update_cell(self, row, col, value):
         """
@@ -252,7 +253,7 @@ class Sheet:
             assert self._worksheet is not None  # Help type checker
             self._worksheet.update_cell(row, col, value)
 
-        await asyncio.to_thread(_sync_update)
+        await run_blocking(API, _sync_update)
 
     async def update_range(self, range_name, values):
         """
@@ -272,7 +273,7 @@ class Sheet:
             assert self._worksheet is not None  # Help type checker
             self._worksheet.update(range_name, values)
 
-        await asyncio.to_thread(_sync_update)
+        await run_blocking(API, _sync_update)
 
     async def clear(self):
         """Clear all data from the worksheet."""
@@ -286,7 +287,7 @@ class Sheet:
             assert self._worksheet is not None  # Help type checker
             self._worksheet.clear()
 
-        await asyncio.to_thread(_sync_clear)
+        await run_blocking(API, _sync_clear)
 
     async def find_rows(self, condition):
         """
@@ -337,7 +338,7 @@ class Sheet:
             assert self._worksheet is not None  # Help type checker
             return len(self._worksheet.get_all_values())
 
-        return await asyncio.to_thread(_sync_count)
+        return await run_blocking(API, _sync_count)
 
     async def get_column_count(self):
         """
@@ -357,7 +358,7 @@ class Sheet:
             all_values = self._worksheet.get_all_values()
             return max(len(row) for row in all_values) if all_values else 0
 
-        return await asyncio.to_thread(_sync_count)
+        return await run_blocking(API, _sync_count)
 
     def get_sheet_info(self):
         """
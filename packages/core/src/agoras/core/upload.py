@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.core.upload module.
+
+Resumable chunked uploads for large media. Chunks are read by byte range
+(from disk when the source is a file), each chunk is retried on its own,
+and the last acknowledged offset is checkpointed in the shared
+:class:`agoras.common.store.KeyValueStore`, so a crashed or retried job
+continues where the previous attempt stopped instead of starting over.
+"""
+
+import hashlib
+import os
+import sqlite3
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from agoras.common.metrics import span
+from agoras.common.store import KeyValueStore, default_store
+
+from .retry import RetryPolicy, retry_sync
+
+# 8 MiB: a multiple of the 256 KiB granularity YouTube requires.
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+# Parts sent at once by platforms that accept them in any order.
+UPLOAD_CONCURRENCY = 4
+# Per-chunk read timeout; whole-file timeouts fail large uploads on slow links.
+CHUNK_TIMEOUT = 120.0
+# Platform upload sessions outlive this; stale checkpoints are simply dropped.
+CHECKPOINT_TTL = 86400.0
+
+NAMESPACE = "uploads"
+
+# Chunk uploads repeat the same bytes at the same offset, so every failure
+# with a retryable status or transport error is retried, with a longer backoff.
+CHUNK_RETRY_POLICY = RetryPolicy(attempts=5, base_delay=1.0, max_delay=60.0)
+
+
+class UploadSource:
+    """Upload payload read by byte range, from memory or from a file on disk."""
+
+    def __init__(self, source: Union[bytes, bytearray, str, "os.PathLike[str]"]):
+        """
+        Wrap upload content.
+
+        Args:
+            source (bytes or str or PathLike): Content already in memory, or a file path
+        """
+        if isinstance(source, (bytes, bytearray)):
+            self.path: Optional[str] = None
+            self._data: Optional[memoryview] = memoryview(source)
+            self.size = len(source)
+        else:
+            self.path = os.fspath(source)
+            self._data = None
+            self.size = os.path.getsize(self.path)
+        self._digest: Optional[str] = None
+
+    def read(self, offset: int, length: int) -> bytes:
+        """
+        Return ``length`` bytes starting at ``offset``.
+
+        Safe to call from several threads at once.
+
+        Args:
+            offset (int): First byte
+            length (int): Number of bytes
+
+        Returns:
+            bytes: Chunk content (shorter at the end of the source)
+        """
+        if self._data is not None:
+            return bytes(self._data[offset : offset + length])
+        with open(self.path, "rb") as handle:  # type: ignore[arg-type]
+            handle.seek(offset)
+            return handle.read(length)
+
+    def digest(self) -> str:
+        """
+        Return the SHA-256 of the content, computed once.
+
+        Returns:
+            str: Hex digest identifying the content across processes
+        """
+        if self._digest is None:
+            sha = hashlib.sha256()
+            for offset in range(0, self.size, DEFAULT_CHUNK_SIZE):
+                sha.update(self.read(offset, DEFAULT_CHUNK_SIZE))
+            self._digest = sha.hexdigest()
+        return self._digest
+
+
+def checkpoint_store() -> Optional[KeyValueStore]:
+    """
+    Return the store for upload checkpoints.
+
+    Set ``AGORAS_UPLOAD_RESUME=off`` to keep checkpoints in memory only.
+
+    Returns:
+        KeyValueStore or None: None when checkpoints are not persisted
+    """
+    if os.environ.get("AGORAS_UPLOAD_RESUME", "on").lower() == "off":
+        return None
+    try:
+        return default_store()
+    except (OSError, sqlite3.Error):
+        return None
+
+
+class UploadCheckpoint:
+    """Progress of one upload, persisted so a later attempt can resume it."""
+
+    def __init__(self, key: str, store: Optional[KeyValueStore] = None, ttl: float = CHECKPOINT_TTL):
+        """
+        Initialize the checkpoint.
+
+        Args:
+            key (str): Identifies the upload (platform, destination and content)
+            store (KeyValueStore, optional): Where to persist; :func:`checkpoint_store` by default.
+                Without a store the checkpoint only lives as long as this object.
+            ttl (float): Seconds a checkpoint stays resumable
+        """
+        self.key = key
+        self.store = store if store is not None else checkpoint_store()
+        self.ttl = ttl
+        self._state: Dict[str, Any] = {}
+
+    @classmethod
+    def for_upload(
+        cls, platform: str, source: UploadSource, *scope: str, store: Optional[KeyValueStore] = None
+    ) -> "UploadCheckpoint":
+        """
+        Build the checkpoint for uploading ``source`` to a destination.
+
+        Args:
+            platform (str): Platform name
+            source (UploadSource): Content being uploaded
+            *scope (str): Destination details (account, page, title, ...)
+            store (KeyValueStore, optional): Where to persist
+
+        Returns:
+            UploadCheckpoint: Checkpoint keyed by platform, destination and content
+        """
+        destination = hashlib.sha256("\0".join(str(part) for part in scope).encode()).hexdigest()[:16]
+        return cls(f"{platform}:{destination}:{source.digest()}:{source.size}", store)
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Return the saved progress.
+
+        Returns:
+            dict: Saved fields, empty when there is nothing to resume
+        """
+        if self.store is not None:
+            self._state = self.store.get(NAMESPACE, self.key) or {}
+        return dict(self._state)
+
+    def save(self, **fields: Any) -> Dict[str, Any]:
+        """
+        Merge ``fields`` into the saved progress.
+
+        Args:
+            **fields: JSON-serializable progress fields
+
+        Returns:
+            dict: Progress after the update
+        """
+
+        def merge(state):
+            return {**(state or {}), **fields}
+
+        if self.store is not None:
+            self._state = self.store.update(NAMESPACE, self.key, merge, ttl=self.ttl)
+        else:
+            self._state = merge(self._state)
+        return dict(self._state)
+
+    def clear(self):
+        """Forget the upload once it completed (or can no longer be resumed)."""
+        self._state = {}
+        if self.store is not None:
+            self.store.delete(NAMESPACE, self.key)
+
+
+def chunk_ranges(size: int, chunk_size: int = DEFAULT_CHUNK_SIZE, start: int = 0) -> Iterator[Tuple[int, int]]:
+    """
+    Yield the ``(offset, length)`` of each chunk from ``start`` to ``size``.
+
+    Args:
+        size (int): Total bytes
+        chunk_size (int): Bytes per chunk
+        start (int): First offset
+
+    Returns:
+        iterator: ``(offset, length)`` tuples
+    """
+    offset = max(0, start)
+    while offset < size:
+        length = min(chunk_size, size - offset)
+        yield offset, length
+        offset += length
+
+
+def upload_chunks(
+    source: UploadSource,
+    send_chunk: Callable[[int, bytes], Any],
+    checkpoint: Optional[UploadCheckpoint] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    start: Optional[int] = None,
+    policy: Optional[RetryPolicy] = None,
+) -> Any:
+    """
+    Send ``source`` in fixed-size chunks, resuming from the last acknowledged offset.
+
+    ``send_chunk(offset, data)`` uploads one chunk and raises on failure;
+    failed chunks are retried on their own. Blocking: run it in a worker
+    thread from async code.
+
+    Args:
+        source (UploadSource): Content to upload
+        send_chunk (callable): Uploads ``data`` at ``offset`` and returns the platform response
+        checkpoint (UploadCheckpoint, optional): Progress store; its ``offset`` is updated after every chunk
+        chunk_size (int): Bytes per chunk
+        start (int, optional): Offset to start from, e.g. as reported by the platform.
+            Defaults to the checkpointed offset, or 0.
+        policy (RetryPolicy, optional): Per-chunk retry policy; :data:`CHUNK_RETRY_POLICY` by default
+
+    Returns:
+        The value returned by ``send_chunk`` for the last chunk (None if nothing was left to send)
+    """
+    if start is None:
+        start = checkpoint.load().get("offset", 0) if checkpoint else 0
+
+    result = None
+    with span("upload"):
+        for offset, length in chunk_ranges(source.size, chunk_size, start):
+            data = source.read(offset, length)
+            result = retry_sync(send_chunk, offset, data, idempotent=True, policy=policy or CHUNK_RETRY_POLICY)
+            if checkpoint:
+                checkpoint.save(offset=offset + length)
+    return result
@@ -20,6 +20,7 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import requests
 
 from agoras.core.api_base import BaseAPI
 
@@ -144,6 +145,63 @@ async def test_rate_limit_check_separate_operations():
     assert 'write' in api._rate_limit_cache
 
 
+@pytest.mark.asyncio
+async def test_rate_limit_check_uses_platform_limiter():
+    """Test rate_limit_check takes a token from the limiter for platform APIs."""
+    api = ConcreteAPI(user_id='1', refresh_token='rotating')
+    api.platform = 'demo'
+    api.client = MagicMock(session=requests.Session())
+    api.rate_limiter = MagicMock(acquire=AsyncMock(return_value=0))
+
+    await api._rate_limit_check(operation_type='post', min_interval=0)
+
+    account = api._rate_limit_account()
+    api.rate_limiter.acquire.assert_awaited_once_with('demo', 'post', account)
+    api.rate_limiter.attach.assert_called_once_with(api.client.session, 'demo', account)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_check_skips_limiter_without_platform():
+    """Test rate_limit_check keeps interval-only behaviour for APIs without a platform."""
+    api = ConcreteAPI()
+    api.rate_limiter = MagicMock(acquire=AsyncMock())
+
+    await api._rate_limit_check(operation_type='post', min_interval=0)
+
+    api.rate_limiter.acquire.assert_not_awaited()
+
+
+def test_rate_limit_account_ignores_rotating_refresh_token():
+    """Test the quota account id is stable across refresh token rotation."""
+    first = ConcreteAPI(user_id='1', refresh_token='a')
+    second = ConcreteAPI(user_id='1', refresh_token='b')
+
+    assert first._rate_limit_account() == second._rate_limit_account()
+    assert first._rate_limit_account() != ConcreteAPI(user_id='2')._rate_limit_account()
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_check_applies_destination_limit():
+    """Test calls to a chat take a token from the account and from that chat's bucket."""
+    from agoras.core.ratelimit import RateLimit, RateLimiter
+
+    class ChatAPI(ConcreteAPI):
+        platform = 'demo'
+        destination_credentials = ('chat_id',)
+
+    api = ChatAPI(bot_token='t', chat_id='default-chat')
+    api.rate_limiter = RateLimiter(limits={'demo': {'default': RateLimit(30, 1), 'destination': RateLimit(1, 60)}})
+
+    await api._rate_limit_check('send', min_interval=0, destination='chat-1')
+    await api._rate_limit_check('send', min_interval=0, destination='chat-2')
+
+    account = api._rate_limit_account()
+    assert account == ChatAPI(bot_token='t', chat_id='other-chat')._rate_limit_account()
+    assert api.rate_limiter.reserve('demo', 'destination', f'{account}:chat-1') > 0
+    assert api.rate_limiter.reserve('demo', 'destination', f'{account}:chat-3') == 0
+    assert 'send:chat-1' in api._rate_limit_cache
+
+
 # Error Handling Tests
 
 def test_handle_api_error_formats_message():
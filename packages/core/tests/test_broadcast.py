@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+
+from agoras.core.broadcast import broadcast, split_destinations
+
+
+def test_split_destinations():
+    """Test destinations are split, stripped and de-duplicated in order."""
+    assert split_destinations(' a, b,,a ,c') == ['a', 'b', 'c']
+    assert split_destinations(['x', 'x', 'y']) == ['x', 'y']
+    assert split_destinations(None) == []
+
+
+@pytest.mark.asyncio
+async def test_broadcast_collects_results_per_destination():
+    """Test every destination gets an id or an error, in input order."""
+
+    async def send(destination):
+        await asyncio.sleep(0)
+        if destination == 'b':
+            raise Exception('chat not found')
+        return f'id-{destination}'
+
+    results = await broadcast(['a', 'b', 'c'], send, concurrency=2)
+
+    assert list(results) == ['a', 'b', 'c']
+    assert results == {'a': {'id': 'id-a'}, 'b': {'error': 'chat not found'}, 'c': {'id': 'id-c'}}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_uploads_to_one_destination_first():
+    """Test upload_first posts alone until one destination succeeds, then fans out."""
+    calls = []
+    in_flight = 0
+
+    async def send(destination):
+        nonlocal in_flight
+        in_flight += 1
+        calls.append((destination, in_flight))
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if destination == 'a':
+            raise Exception('forbidden')
+        return destination
+
+    results = await broadcast(['a', 'b', 'c', 'd'], send, concurrency=4, upload_first=True)
+
+    assert calls[:2] == [('a', 1), ('b', 1)]
+    assert max(depth for _, depth in calls[2:]) == 2
+    assert results['a'] == {'error': 'forbidden'}
+    assert all(results[name] == {'id': name} for name in 'bcd')
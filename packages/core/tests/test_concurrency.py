@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agoras.core.concurrency import gather_bounded, map_bounded
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_preserves_order_and_limit():
+    active = {'now': 0, 'peak': 0}
+
+    async def work(item):
+        active['now'] += 1
+        active['peak'] = max(active['peak'], active['now'])
+        await asyncio.sleep(0.01 * (6 - item))
+        active['now'] -= 1
+        return item * 10
+
+    results = await gather_bounded(work, [1, 2, 3, 4, 5], limit=2)
+
+    assert results == [10, 20, 30, 40, 50]
+    assert active['peak'] == 2
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_return_exceptions():
+    async def work(item):
+        if item == 2:
+            raise ValueError('bad')
+        return item
+
+    results = await gather_bounded(work, [1, 2, 3], return_exceptions=True)
+
+    assert results[0] == 1 and results[2] == 3
+    assert isinstance(results[1], ValueError)
+
+    with pytest.raises(ValueError):
+        await gather_bounded(work, [1, 2, 3])
+
+
+def test_map_bounded_runs_in_threads_and_preserves_order():
+    threads = set()
+
+    def work(item):
+        threads.add(threading.current_thread().name)
+        time.sleep(0.01 * (5 - item))
+        return item * 2
+
+    assert map_bounded(work, [1, 2, 3, 4]) == [2, 4, 6, 8]
+    assert len(threads) > 1
+    assert all(name == threading.current_thread().name or name.startswith('agoras-upload') for name in threads)
+
+
+def test_map_bounded_single_item_runs_inline():
+    assert map_bounded(lambda item: threading.get_ident(), ['a']) == [threading.get_ident()]
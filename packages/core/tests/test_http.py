@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from agoras.core.http import IDEMPOTENT_METHODS, create_session
+
+
+def test_create_session_mounts_pooled_adapter_with_retries():
+    session = create_session(pool_size=7, retries=2, backoff_factor=0.1)
+
+    adapter = session.get_adapter('https://graph.example.com/v1')
+    assert session.get_adapter('http://graph.example.com/v1') is adapter
+    assert adapter._pool_connections == 7
+    assert adapter._pool_maxsize == 7
+    assert adapter.max_retries.total == 2
+    assert adapter.max_retries.connect == 2
+    assert adapter.max_retries.backoff_factor == 0.1
+
+
+def test_create_session_leaves_status_retries_to_retry_engine():
+    retry = create_session().get_adapter('https://example.com').max_retries
+
+    assert 'POST' not in IDEMPOTENT_METHODS
+    assert retry.read == 0
+    assert retry.is_retry('POST', 503) is False
+    assert retry.is_retry('PUT', 503) is False
+
+
+def test_create_session_default_headers():
+    session = create_session(headers={'X-Test': '1'})
+
+    assert session.headers['User-Agent'].startswith('Agoras/')
+    assert session.headers['X-Test'] == '1'
+
@@ -16,11 +16,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import json
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from agoras.common.metrics import Metrics
 from agoras.core.interfaces import SocialNetwork
 
 
@@ -322,6 +324,22 @@ async def test_execute_action_initializes_client():
     assert network.client == 'test_client'
 
 
+@pytest.mark.asyncio
+async def test_execute_action_times_auth_and_action_by_platform(tmp_path):
+    """Test execute_action records auth and action spans labelled with the platform."""
+    log = tmp_path / 'metrics.jsonl'
+    network = ConcreteSocialNetwork(status_text='Test', status_link='')
+
+    with patch('agoras.common.metrics.metrics', Metrics(log=str(log))):
+        await network.execute_action('post')
+
+    records = [json.loads(line) for line in log.read_text().splitlines()]
+    assert [record['phase'] for record in records] == ['auth', 'action']
+    assert {record['platform'] for record in records} == {'concretesocial'}
+    assert records[1]['action'] == 'post'
+    assert records[1]['outcome'] == 'ok'
+
+
 @pytest.mark.asyncio
 async def test_execute_action_post():
     """Test execute_action routes 'post' action correctly."""
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from agoras.common.store import MEMORY, KeyValueStore
+from agoras.core.interfaces import SocialNetwork
+from agoras.core.journal import (
+    CONTAINER,
+    MEDIA,
+    PUBLISHED,
+    PublishJournal,
+    active_journal,
+    idempotency_key,
+    journal_step,
+)
+
+
+class JournaledNetwork(SocialNetwork):
+    """Uploads media, then publishes; fails once on demand."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.uploads = 0
+        self.publishes = 0
+        self.fail_publish = False
+
+    async def _initialize_client(self):
+        pass
+
+    async def disconnect(self):
+        pass
+
+    async def _upload(self):
+        self.uploads += 1
+        return ["media-1"]
+
+    async def _publish(self, media):
+        if self.fail_publish:
+            raise Exception("connection reset")
+        self.publishes += 1
+        return f"post-{self.publishes}"
+
+    async def post(self, status_text, status_link, status_image_url_1=None, status_image_url_2=None,
+                   status_image_url_3=None, status_image_url_4=None):
+        media = await journal_step(MEDIA, self._upload)
+        post_id = await journal_step(PUBLISHED, self._publish, media)
+        self._output_status(post_id)
+        return post_id
+
+    async def like(self, post_id):
+        return post_id
+
+    async def delete(self, post_id):
+        return post_id
+
+    async def share(self, post_id):
+        return post_id
+
+
+@pytest.fixture
+def store():
+    store = KeyValueStore(MEMORY)
+    with patch("agoras.core.interfaces.journal_store", return_value=store):
+        yield store
+    store.close()
+
+
+def test_idempotency_key_depends_on_network_account_and_content():
+    key = idempotency_key("x", "account", {"status_text": "hi"})
+
+    assert key == idempotency_key("x", "account", {"status_text": "hi"})
+    assert key != idempotency_key("threads", "account", {"status_text": "hi"})
+    assert key != idempotency_key("x", "other", {"status_text": "hi"})
+    assert key != idempotency_key("x", "account", {"status_text": "hello"})
+
+
+@pytest.mark.asyncio
+async def test_step_records_results_and_skips_completed_stages():
+    journal = PublishJournal("key", KeyValueStore(MEMORY))
+    upload = AsyncMock(return_value="container-1")
+
+    assert await journal.step(CONTAINER, upload, "a.jpg") == "container-1"
+    assert await journal.step(CONTAINER, upload, "a.jpg") == "container-1"
+
+    upload.assert_awaited_once_with("a.jpg")
+    assert journal.stages() == {CONTAINER: "container-1"}
+
+
+@pytest.mark.asyncio
+async def test_journal_step_without_active_journal_just_runs():
+    func = AsyncMock(return_value="id")
+
+    assert active_journal() is None
+    assert await journal_step(MEDIA, func, 1) == "id"
+    assert await journal_step(MEDIA, func, 1) == "id"
+    assert func.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_publish_once_reports_completed_publish_without_repeating_it(store, capsys):
+    network = JournaledNetwork()
+
+    first = await network.publish_once("post", lambda: network.post("hi", ""), key="job-1")
+    second = await network.publish_once("post", lambda: network.post("edited", ""), key="job-1")
+    other = await network.publish_once("post", lambda: network.post("hi", ""), key="job-2")
+
+    assert (first, second, other) == ("post-1", "post-1", "post-2")
+    assert (network.uploads, network.publishes) == (2, 2)
+    assert capsys.readouterr().out.split() == ['{"id":"post-1"}'] * 2 + ['{"id":"post-2"}']
+
+
+@pytest.mark.asyncio
+async def test_publish_once_resumes_after_a_failed_stage(store):
+    network = JournaledNetwork()
+    network.fail_publish = True
+
+    with pytest.raises(Exception, match="connection reset"):
+        await network.publish_once("post", lambda: network.post("hi", ""), key="job-1")
+
+    network.fail_publish = False
+    assert await network.publish_once("post", lambda: network.post("hi", ""), key="job-1") == "post-1"
+    assert (network.uploads, network.publishes) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_publish_once_starts_over_when_a_resumed_attempt_fails(store):
+    network = JournaledNetwork()
+    network.fail_publish = True
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            await network.publish_once("post", lambda: network.post("hi", ""), key="job-1")
+
+    network.fail_publish = False
+    await network.publish_once("post", lambda: network.post("hi", ""), key="job-1")
+    assert network.uploads == 2
+
+
+@pytest.mark.asyncio
+async def test_publish_once_without_a_key_publishes_every_time(store):
+    network = JournaledNetwork()
+
+    await network.publish_once("post", lambda: network.post("hi", ""))
+    await network.publish_once("post", lambda: network.post("hi", ""))
+
+    assert (network.uploads, network.publishes) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_publish_once_is_bypassed_when_journal_is_off():
+    network = JournaledNetwork()
+
+    await network.publish_once("post", lambda: network.post("hi", ""), key="job-1")
+    await network.publish_once("post", lambda: network.post("hi", ""), key="job-1")
+
+    assert network.publishes == 2
+
+
+@pytest.mark.asyncio
+async def test_publish_once_keys_on_the_destination(store):
+    pages = [JournaledNetwork(), JournaledNetwork()]
+    for network, page in zip(pages, ("page-1", "page-2")):
+        network._publish_destination = lambda page=page: {"object_id": page}
+        await network.publish_once("post", lambda network=network: network.post("hi", ""), key="job-1")
+
+    assert [network.publishes for network in pages] == [1, 1]
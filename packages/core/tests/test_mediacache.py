@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import io
+
+from agoras.common.store import MEMORY, KeyValueStore
+from agoras.core.mediacache import MediaReferenceCache, account_key, content_digest, media_cache_store
+
+
+def test_content_digest_matches_across_sources(tmp_path):
+    path = tmp_path / 'image.jpg'
+    path.write_bytes(b'image-bytes')
+
+    digest = content_digest(b'image-bytes')
+
+    assert content_digest(str(path)) == digest
+    assert content_digest(path) == digest
+    assert content_digest(io.BytesIO(b'image-bytes')) == digest
+    assert content_digest('https://example.com/image.jpg') is None
+    assert content_digest('AgACAgQAAxkBAAI') is None
+
+
+def test_references_are_shared_per_platform_account():
+    store = KeyValueStore(MEMORY)
+    digest = content_digest(b'video')
+    cache = MediaReferenceCache('telegram', account_key('bot-a'), store=store)
+
+    cache.put(digest, 'file-id-1')
+
+    assert MediaReferenceCache('telegram', account_key('bot-a'), store=store).get(digest) == 'file-id-1'
+    assert MediaReferenceCache('telegram', account_key('bot-b'), store=store).get(digest) is None
+    assert MediaReferenceCache('discord', account_key('bot-a'), store=store).get(digest) is None
+
+    cache.forget(digest)
+    assert cache.get(digest) is None
+
+
+def test_put_ignores_missing_references_and_expired_ttls():
+    cache = MediaReferenceCache('discord', 'account', store=KeyValueStore(MEMORY))
+    digest = content_digest(b'video')
+
+    cache.put(digest, None)
+    cache.put(None, 'https://cdn.example/video.mp4')
+    cache.put(digest, 'https://cdn.example/video.mp4', ttl=-1)
+
+    assert cache.get(digest) is None
+
+
+def test_media_cache_store_can_be_disabled(monkeypatch):
+    monkeypatch.setenv('AGORAS_MEDIA_CACHE', 'off')
+
+    assert media_cache_store() is None
+    assert account_key('token') != 'token'
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from itertools import islice
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from agoras.core.polling import PollSchedule, poll_until
+
+
+def test_poll_schedule_intervals_back_off_to_cap():
+    schedule = PollSchedule(initial=1.0, factor=2.0, max_interval=5.0)
+
+    assert list(islice(schedule.intervals(), 5)) == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+@pytest.mark.asyncio
+@patch('agoras.core.polling.asyncio.sleep', new_callable=AsyncMock)
+async def test_poll_until_returns_first_truthy_result(mock_sleep):
+    check = AsyncMock(side_effect=[None, False, {'status': 'done'}])
+
+    result = await poll_until(check, PollSchedule(initial=0.5, max_interval=10.0))
+
+    assert result == {'status': 'done'}
+    assert check.await_count == 3
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+
+@pytest.mark.asyncio
+@patch('agoras.core.polling.asyncio.sleep', new_callable=AsyncMock)
+async def test_poll_until_initial_delay(mock_sleep):
+    check = AsyncMock(return_value=True)
+
+    await poll_until(check, PollSchedule(timeout=10.0), initial_delay=3.0)
+
+    mock_sleep.assert_awaited_once_with(3.0)
+    check.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch('agoras.core.polling.time')
+@patch('agoras.core.polling.asyncio.sleep', new_callable=AsyncMock)
+async def test_poll_until_never_sleeps_past_deadline(mock_sleep, mock_time):
+    mock_time.monotonic.side_effect = [0.0, 2.0, 9.0, 10.5]
+    check = AsyncMock(return_value=False)
+
+    with pytest.raises(Exception, match='still processing'):
+        await poll_until(check, PollSchedule(initial=4.0, timeout=10.0), timeout_message='still processing')
+
+    assert check.await_count == 3
+    # The second wait is trimmed to the second left before the deadline.
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [4.0, 1.0]
+
+
+@pytest.mark.asyncio
+@patch('agoras.core.polling.asyncio.sleep', new_callable=AsyncMock)
+async def test_poll_until_propagates_check_errors(mock_sleep):
+    check = AsyncMock(side_effect=Exception('processing failed'))
+
+    with pytest.raises(Exception, match='processing failed'):
+        await poll_until(check)
+
+    mock_sleep.assert_not_called()
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+
+from agoras.core.auth import AuthenticationError
+from agoras.core.interfaces import SocialNetwork
+from agoras.core.pool import ClientPool, pool_key, split_job
+
+
+class FakeNetwork(SocialNetwork):
+    """Records initialization and action calls."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.initialized = 0
+        self.disconnected = 0
+        self.calls = []
+
+    async def _initialize_client(self):
+        self.initialized += 1
+
+    async def disconnect(self):
+        self.disconnected += 1
+
+    async def post(self, status_text, status_link, status_image_url_1=None, status_image_url_2=None,
+                   status_image_url_3=None, status_image_url_4=None):
+        self.calls.append(("post", status_text, status_link, status_image_url_1))
+        self._output_status("post-1")
+        return "post-1"
+
+    async def like(self, post_id):
+        if post_id == "expired":
+            raise AuthenticationError("Token expired.")
+        self.calls.append(("like", post_id))
+        return post_id
+
+    async def delete(self, post_id):
+        return post_id
+
+    async def share(self, post_id):
+        return post_id
+
+
+@pytest.fixture
+def created():
+    return []
+
+
+@pytest.fixture
+def pool(created):
+    def factory(network, options):
+        instance = FakeNetwork(**options)
+        created.append((network, instance))
+        return instance
+
+    return ClientPool(factory, max_idle=None)
+
+
+def test_split_job_separates_job_keys_from_options():
+    job, options = split_job({
+        "network": "x", "action": "post", "status_text": "hi", "x_consumer_key": "k", "unused": None,
+    })
+
+    assert job == {"network": "x", "action": "post", "status_text": "hi"}
+    assert options == {"x_consumer_key": "k"}
+
+
+def test_pool_key_ignores_option_order():
+    assert pool_key("x", {"a": 1, "b": 2}) == pool_key("x", {"b": 2, "a": 1})
+    assert pool_key("x", {"a": 1}) != pool_key("x", {"a": 2})
+
+
+@pytest.mark.asyncio
+async def test_run_reuses_warm_instance(pool, created, capsys):
+    first = await pool.run({"network": "x", "action": "post", "status_text": "one", "token": "t"})
+    second = await pool.run({"network": "x", "action": "post", "status_text": "two", "token": "t"})
+
+    assert first == second == "post-1"
+    assert len(created) == 1
+    instance = created[0][1]
+    assert instance.initialized == 1
+    assert [call[1] for call in instance.calls] == ["one", "two"]
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.asyncio
+async def test_run_separates_accounts(pool, created):
+    await pool.run({"network": "x", "action": "post", "token": "a"})
+    await pool.run({"network": "x", "action": "post", "token": "b"})
+    await pool.run({"network": "twitter", "action": "post", "token": "a"})
+
+    assert len(created) == 2
+    assert len(pool) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_rejects_unsupported_action(pool):
+    with pytest.raises(Exception, match="not supported"):
+        await pool.run({"network": "x", "action": "schedule"})
+
+
+@pytest.mark.asyncio
+async def test_run_requires_post_id(pool):
+    with pytest.raises(Exception, match="Post ID is required"):
+        await pool.run({"network": "x", "action": "like"})
+
+
+@pytest.mark.asyncio
+async def test_authentication_error_evicts_instance(pool, created):
+    with pytest.raises(AuthenticationError):
+        await pool.run({"network": "x", "action": "like", "post_id": "expired"})
+
+    assert len(pool) == 0
+    assert created[0][1].disconnected == 1
+
+    await pool.run({"network": "x", "action": "like", "post_id": "1"})
+    assert len(created) == 2
+
+
+@pytest.mark.asyncio
+async def test_authentication_error_disconnects_after_running_jobs(pool, created):
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_share(post_id):
+        started.set()
+        await release.wait()
+        return post_id
+
+    await pool.run({"network": "x", "action": "like", "post_id": "1"})
+    instance = created[0][1]
+    instance.share = slow_share
+    running = asyncio.ensure_future(pool.run({"network": "x", "action": "share", "post_id": "2"}))
+    await started.wait()
+
+    with pytest.raises(AuthenticationError):
+        await pool.run({"network": "x", "action": "like", "post_id": "expired"})
+
+    assert len(pool) == 0
+    assert instance.disconnected == 0
+
+    await pool.run({"network": "x", "action": "like", "post_id": "3"})
+    assert len(created) == 2
+
+    release.set()
+    assert await running == "2"
+    assert instance.disconnected == 1
+    assert created[1][1].disconnected == 0
+
+
+@pytest.mark.asyncio
+async def test_prune_disconnects_idle_instances(created):
+    pool = ClientPool(lambda network, options: created.append(FakeNetwork()) or created[-1], max_idle=0)
+
+    await pool.run({"network": "x", "action": "like", "post_id": "1"})
+    await pool.prune()
+
+    assert len(pool) == 0
+    assert created[0].disconnected == 1
+
+
+@pytest.mark.asyncio
+async def test_close_disconnects_all(pool, created):
+    await pool.run({"network": "x", "action": "like", "post_id": "1"})
+    await pool.run({"network": "facebook", "action": "like", "post_id": "1"})
+
+    await pool.close()
+
+    assert len(pool) == 0
+    assert all(instance.disconnected == 1 for _, instance in created)
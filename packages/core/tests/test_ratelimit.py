@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from agoras.common.store import MEMORY, KeyValueStore
+from agoras.core.ratelimit import (
+    MAX_WAIT,
+    RATE_LIMITS,
+    RateLimit,
+    RateLimiter,
+    configured_max_wait,
+    get_rate_limiter,
+    parse_rate_limit_headers,
+)
+
+
+class Clock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def limiter(clock):
+    return RateLimiter(KeyValueStore(MEMORY), limits={'demo': {'post': RateLimit(2, 10)}}, clock=clock)
+
+
+def test_reserve_spends_burst_then_queues(limiter, clock):
+    assert limiter.reserve('demo', 'post', 'acct') == 0
+    assert limiter.reserve('demo', 'post', 'acct') == 0
+    assert limiter.reserve('demo', 'post', 'acct') == pytest.approx(5.0)
+    # A second caller queues behind the first reservation.
+    assert limiter.reserve('demo', 'post', 'acct') == pytest.approx(10.0)
+
+    clock.now += 20
+    assert limiter.reserve('demo', 'post', 'acct') == 0
+
+
+def test_reserve_separates_accounts_and_unknown_operations(limiter):
+    limiter.reserve('demo', 'post', 'a')
+    limiter.reserve('demo', 'post', 'a')
+
+    assert limiter.reserve('demo', 'post', 'b') == 0
+    assert limiter.reserve('demo', 'like', 'a') == 0
+    assert limiter.reserve('unknown', 'post', 'a') == 0
+
+
+def test_limit_for_falls_back_to_platform_default():
+    limiter = RateLimiter()
+
+    assert limiter.limit_for('tiktok', 'upload_video') == RATE_LIMITS['tiktok']['upload_video']
+    assert limiter.limit_for('facebook', 'like') == RATE_LIMITS['facebook']['default']
+    assert limiter.limit_for('nowhere', 'post') is None
+
+
+def test_buckets_are_shared_through_the_store(tmp_path, clock):
+    limits = {'demo': {'default': RateLimit(1, 60)}}
+    first = RateLimiter(KeyValueStore(tmp_path / 'state.db'), limits=limits, clock=clock)
+    second = RateLimiter(KeyValueStore(tmp_path / 'state.db'), limits=limits, clock=clock)
+
+    assert first.reserve('demo', 'post', 'acct') == 0
+    assert second.reserve('demo', 'post', 'acct') == pytest.approx(60.0)
+
+
+def test_parse_headers_x_remaining_zero(clock):
+    headers = {'x-rate-limit-remaining': '0', 'x-rate-limit-reset': str(int(clock.now) + 120)}
+
+    assert parse_rate_limit_headers(headers, clock.now) == clock.now + 120
+    assert parse_rate_limit_headers({'x-rate-limit-remaining': '3', 'x-rate-limit-reset': '1'}, clock.now) is None
+
+
+def test_parse_headers_discord_reset_after_and_retry_after(clock):
+    assert parse_rate_limit_headers({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset-After': '2.5'}, clock.now) == (
+        clock.now + 2.5
+    )
+    assert parse_rate_limit_headers({'Retry-After': '30'}, clock.now) == clock.now + 30
+
+
+def test_parse_headers_meta_usage(clock):
+    assert parse_rate_limit_headers({'x-app-usage': json.dumps({'call_count': 40})}, clock.now) is None
+    assert parse_rate_limit_headers({'x-app-usage': json.dumps({'call_count': 100})}, clock.now) == clock.now + 300
+
+    business = {'123': [{'call_count': 100, 'total_time': 5, 'estimated_time_to_regain_access': 2}]}
+    assert parse_rate_limit_headers({'x-business-use-case-usage': json.dumps(business)}, clock.now) == clock.now + 120
+
+
+def test_observe_pauses_account(limiter, clock):
+    assert limiter.observe('demo', {'retry-after': '15'}, 'acct') == clock.now + 15
+
+    assert limiter.reserve('demo', 'post', 'acct') == pytest.approx(15.0)
+    assert limiter.reserve('demo', 'post', 'other') == 0
+    assert limiter.observe('demo', {'content-type': 'application/json'}, 'acct') is None
+
+
+def test_attach_feeds_session_responses_once(limiter, clock):
+    session = requests.Session()
+    limiter.attach(session, 'demo', 'acct')
+    limiter.attach(session, 'demo', 'acct')
+
+    assert len(session.hooks['response']) == 1
+
+    response = MagicMock(headers={'Retry-After': '5'})
+    session.hooks['response'][0](response)
+    assert limiter.reserve('demo', 'post', 'acct') == pytest.approx(5.0)
+
+
+@pytest.mark.asyncio
+async def test_acquire_sleeps_for_reserved_wait(limiter):
+    limiter.reserve('demo', 'post', 'acct')
+    limiter.reserve('demo', 'post', 'acct')
+
+    with patch('agoras.core.ratelimit.asyncio.sleep') as mock_sleep:
+        waited = await limiter.acquire('demo', 'post', 'acct')
+
+    assert waited == pytest.approx(5.0, abs=0.1)
+    mock_sleep.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_acquire_fails_past_max_wait_without_taking_a_token(clock):
+    limiter = RateLimiter(KeyValueStore(MEMORY), limits={'demo': {'upload': RateLimit(1, 3600)}}, clock=clock,
+                          max_wait=60)
+    limiter.reserve('demo', 'upload', 'acct')
+
+    with patch('agoras.core.ratelimit.asyncio.sleep') as mock_sleep:
+        with pytest.raises(Exception, match=r'demo "upload" quota exhausted, retry after 3600 s\.'):
+            await limiter.acquire('demo', 'upload', 'acct')
+
+    mock_sleep.assert_not_awaited()
+    clock.now += 3600
+    assert limiter.reserve('demo', 'upload', 'acct') == 0
+
+
+@pytest.mark.asyncio
+async def test_acquire_fails_when_account_is_paused_past_max_wait(limiter, clock):
+    limiter.max_wait = 60
+    limiter.observe('demo', {'retry-after': '600'}, 'acct')
+
+    with pytest.raises(Exception, match='quota exhausted, retry after 600 s'):
+        await limiter.acquire('demo', 'post', 'acct')
+
+
+@pytest.mark.asyncio
+async def test_acquire_logs_long_waits(clock):
+    limiter = RateLimiter(KeyValueStore(MEMORY), limits={'demo': {'post': RateLimit(1, 30)}}, clock=clock)
+    limiter.reserve('demo', 'post', 'acct')
+
+    with patch('agoras.core.ratelimit.asyncio.sleep'), patch('agoras.core.ratelimit.logger') as mock_logger:
+        assert await limiter.acquire('demo', 'post', 'acct') == pytest.approx(30.0)
+
+    mock_logger.info.assert_called_once_with('demo "post" rate limit reached, waiting 30 s.')
+
+
+def test_configured_max_wait(monkeypatch):
+    monkeypatch.delenv('AGORAS_RATE_LIMIT_MAX_WAIT', raising=False)
+    assert configured_max_wait() == MAX_WAIT
+
+    monkeypatch.setenv('AGORAS_RATE_LIMIT_MAX_WAIT', '3600')
+    assert configured_max_wait() == 3600.0
+
+    monkeypatch.setenv('AGORAS_RATE_LIMIT_MAX_WAIT', 'forever')
+    with pytest.raises(Exception, match='AGORAS_RATE_LIMIT_MAX_WAIT must be a non-negative number'):
+        configured_max_wait()
+
+
+def test_get_rate_limiter_modes(tmp_path, monkeypatch):
+    monkeypatch.setenv('AGORAS_RATE_LIMIT', 'off')
+    assert get_rate_limiter() is None
+
+    monkeypatch.setenv('AGORAS_RATE_LIMIT', 'memory')
+    assert get_rate_limiter() is get_rate_limiter()
+    assert get_rate_limiter().store.path == MEMORY
+
+    monkeypatch.setenv('AGORAS_RATE_LIMIT', 'shared')
+    monkeypatch.setenv('AGORAS_STORAGE_DIR', str(tmp_path))
+    assert get_rate_limiter().store.path == str(tmp_path.resolve() / 'state.db')
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import requests
+
+from agoras.core.retry import (
+    RetryPolicy,
+    request_with_retry,
+    retry_after_of,
+    retry_async,
+    retry_sync,
+    retryable,
+    status_of,
+)
+
+FAST = RetryPolicy(attempts=3, base_delay=0, max_delay=0)
+
+
+def http_error(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.HTTPError(response=response)
+
+
+def response(status, headers=None):
+    result = requests.Response()
+    result.status_code = status
+    result.headers.update(headers or {})
+    return result
+
+
+def test_policy_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=1, max_delay=5)
+
+    for attempt in range(1, 8):
+        assert 0 <= policy.backoff(attempt) <= min(5, 2**attempt)
+    assert policy.backoff(3, retry_after=12) == 12
+
+
+def test_policy_only_retries_rejected_requests_when_not_idempotent():
+    policy = RetryPolicy()
+
+    assert policy.should_retry(status=429) is True
+    assert policy.should_retry(status=503) is False
+    assert policy.should_retry(status=503, idempotent=True) is True
+    assert policy.should_retry(status=400, idempotent=True) is False
+    assert policy.should_retry(error=requests.ConnectionError()) is False
+    assert policy.should_retry(error=requests.ConnectionError(), idempotent=True) is True
+    assert policy.should_retry(error=ValueError(), idempotent=True) is False
+
+
+def test_status_and_retry_after_from_sdk_errors():
+    assert status_of(http_error(503)) == 503
+    assert status_of(MagicMock(spec=['resp'], resp=MagicMock(status=500))) == 500
+    assert status_of(ValueError('nope')) is None
+
+    assert retry_after_of(http_error(429, {'Retry-After': '7'})) == 7
+    assert retry_after_of(MagicMock(spec=['resp'], resp={'retry-after': '3'})) == 3
+    assert retry_after_of(response(503)) is None
+
+
+@pytest.mark.asyncio
+async def test_retry_async_retries_idempotent_calls_with_async_sleep():
+    func = AsyncMock(side_effect=[http_error(503), http_error(502), 'ok'])
+
+    with patch('agoras.core.retry.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        result = await retry_async(func, 'arg', idempotent=True, policy=FAST)
+
+    assert result == 'ok'
+    assert func.await_count == 3
+    assert mock_sleep.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_async_never_repeats_non_idempotent_server_errors():
+    func = AsyncMock(side_effect=http_error(500))
+
+    with pytest.raises(requests.HTTPError):
+        await retry_async(func, policy=FAST)
+
+    assert func.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_async_honours_retry_after_for_rejected_posts():
+    func = AsyncMock(side_effect=[http_error(429, {'Retry-After': '2'}), 'posted'])
+
+    with patch('agoras.core.retry.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        assert await retry_async(func, policy=FAST) == 'posted'
+
+    mock_sleep.assert_awaited_once_with(2.0)
+
+
+@pytest.mark.asyncio
+async def test_retry_async_gives_up_on_long_retry_after_and_exhaustion():
+    too_long = AsyncMock(side_effect=http_error(429, {'Retry-After': '3600'}))
+    with pytest.raises(requests.HTTPError):
+        await retry_async(too_long, policy=FAST)
+    assert too_long.await_count == 1
+
+    always = AsyncMock(side_effect=requests.ConnectionError())
+    with patch('agoras.core.retry.asyncio.sleep', new_callable=AsyncMock):
+        with pytest.raises(requests.ConnectionError):
+            await retry_async(always, idempotent=True, policy=FAST)
+    assert always.await_count == 3
+
+
+def test_request_with_retry_returns_final_response():
+    session = MagicMock()
+    session.get.side_effect = [response(503), response(200)]
+    session.post.return_value = response(503)
+
+    with patch('agoras.core.retry.time.sleep') as mock_sleep:
+        assert request_with_retry(session, 'GET', 'https://x', policy=FAST, timeout=5).status_code == 200
+        assert request_with_retry(session, 'POST', 'https://x', policy=FAST).status_code == 503
+
+    assert session.get.call_count == 2
+    session.get.assert_called_with('https://x', timeout=5)
+    assert session.post.call_count == 1
+    assert mock_sleep.call_count == 1
+
+
+def test_request_with_retry_declared_idempotent_post():
+    session = MagicMock()
+    session.post.side_effect = [requests.ConnectionError(), response(200)]
+
+    with patch('agoras.core.retry.time.sleep'):
+        assert request_with_retry(session, 'POST', 'https://x', idempotent=True, policy=FAST).status_code == 200
+
+
+def test_request_with_retry_uses_rate_limit_reset_for_429():
+    session = MagicMock()
+    session.post.side_effect = [response(429, {'x-ratelimit-remaining': '0', 'x-ratelimit-reset-after': '1.5'}),
+                                response(201)]
+
+    with patch('agoras.core.retry.time.sleep') as mock_sleep:
+        assert request_with_retry(session, 'POST', 'https://x', policy=FAST).status_code == 201
+
+    assert mock_sleep.call_args[0][0] == pytest.approx(1.5, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_retryable_decorates_sync_and_async_functions():
+    calls = {'sync': 0, 'async': 0}
+
+    @retryable(idempotent=True, policy=FAST)
+    def fetch():
+        calls['sync'] += 1
+        if calls['sync'] < 2:
+            raise TimeoutError()
+        return 'sync'
+
+    @retryable(idempotent=True, policy=FAST)
+    async def afetch():
+        calls['async'] += 1
+        if calls['async'] < 2:
+            raise TimeoutError()
+        return 'async'
+
+    with patch('agoras.core.retry.time.sleep'), patch('agoras.core.retry.asyncio.sleep', new_callable=AsyncMock):
+        assert fetch() == 'sync'
+        assert await afetch() == 'async'
+
+    assert calls == {'sync': 2, 'async': 2}
+    assert fetch.__name__ == 'fetch'
+
+
+def test_retry_sync_propagates_non_retryable_errors():
+    func = MagicMock(side_effect=ValueError('bad input'))
+
+    with pytest.raises(ValueError):
+        retry_sync(func, idempotent=True, policy=FAST)
+
+    func.assert_called_once()
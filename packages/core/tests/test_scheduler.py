@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import time
+
+import pytest
+
+from agoras.core.auth import AuthenticationError
+from agoras.core.retry import RetryPolicy
+from agoras.core.scheduler import DONE, FAILED, PENDING, RUNNING, JobQueue, Scheduler, job_key
+
+
+class Throttled(Exception):
+    status_code = 429
+
+
+@pytest.fixture
+def queue():
+    queue = JobQueue(":memory:")
+    yield queue
+    queue.close()
+
+
+def test_enqueue_ignores_jobs_already_queued(queue):
+    job = {"network": "x", "status_text": "hi"}
+
+    assert queue.enqueue(job, 100.0) is True
+    assert queue.enqueue(dict(job), 100.0) is False
+    assert queue.enqueue(job, 200.0) is True
+    assert queue.enqueue({"network": "x", "status_text": "other"}, 300.0, key="feed:1") is True
+    assert queue.enqueue({"network": "x", "status_text": "edited"}, 300.0, key="feed:1") is False
+
+    jobs = queue.jobs()
+    assert [job.run_at for job in jobs] == [100.0, 200.0, 300.0]
+    assert jobs[0].id == job_key({"action": "post", **job}, 100.0)
+    assert jobs[0].job == {"action": "post", "network": "x", "status_text": "hi"}
+
+
+def test_enqueue_requires_network(queue):
+    with pytest.raises(Exception, match="network is required"):
+        queue.enqueue({"status_text": "hi"}, 0.0)
+
+
+def test_claim_takes_due_jobs_in_order_and_reclaims_expired_leases(queue):
+    now = time.time()
+    queue.enqueue({"network": "x", "status_text": "later"}, now + 3600)
+    queue.enqueue({"network": "x", "status_text": "second"}, now - 10)
+    queue.enqueue({"network": "x", "status_text": "first"}, now - 20)
+
+    claimed = queue.claim(5, lease=0.0)
+    assert [job.job["status_text"] for job in claimed] == ["first", "second"]
+    assert {job.state for job in queue.jobs(RUNNING)} == {RUNNING}
+
+    # The worker died: its expired lease makes the job due again.
+    reclaimed = queue.claim(1, lease=60.0)
+    assert reclaimed[0].job["status_text"] == "first"
+    assert reclaimed[0].attempts == 2
+    assert [job.job["status_text"] for job in queue.claim(5)] == ["second"]
+    assert queue.claim(5) == []
+
+
+def test_next_due_and_cancel(queue):
+    assert queue.next_due() is None
+    queue.enqueue({"network": "x", "status_text": "a"}, 500.0, key="a")
+    queue.enqueue({"network": "x", "status_text": "b"}, 100.0, key="b")
+
+    assert queue.next_due() == 100.0
+    assert queue.cancel("b") is True
+    assert queue.cancel("b") is False
+    assert queue.next_due() == 500.0
+
+
+@pytest.mark.asyncio
+async def test_run_pending_runs_due_jobs_and_records_results(queue):
+    now = time.time()
+    queue.enqueue({"network": "x", "status_text": "ok"}, now - 1, key="ok")
+    queue.enqueue({"network": "x", "status_text": "broken"}, now - 1, key="broken")
+    queue.enqueue({"network": "x", "status_text": "future"}, now + 3600, key="future")
+    calls = []
+
+    async def run(job):
+        calls.append(job["status_text"])
+        if job["status_text"] == "broken":
+            raise Exception("Invalid media.")
+        return "post-1"
+
+    counts = await Scheduler(queue, run, concurrency=1).run_pending()
+
+    assert counts == {DONE: 1, FAILED: 1}
+    assert sorted(calls) == ["broken", "ok"]
+    jobs = {job.id: job for job in queue.jobs()}
+    assert (jobs["ok"].state, jobs["ok"].result) == (DONE, "post-1")
+    assert (jobs["broken"].state, jobs["broken"].error) == (FAILED, "Invalid media.")
+    assert jobs["future"].state == PENDING
+
+
+@pytest.mark.asyncio
+async def test_only_throttled_jobs_are_retried(queue):
+    queue.enqueue({"network": "x", "status_text": "throttled"}, 0.0, key="throttled")
+    queue.enqueue({"network": "x", "status_text": "expired"}, 0.0, key="expired")
+
+    async def run(job):
+        if job["status_text"] == "throttled":
+            raise Throttled("Too many requests.")
+        raise AuthenticationError("Token expired.")
+
+    policy = RetryPolicy(attempts=3, base_delay=60.0, max_delay=60.0)
+    counts = await Scheduler(queue, run, policy=policy).run_pending()
+
+    assert counts == {PENDING: 1, FAILED: 1}
+    jobs = {job.id: job for job in queue.jobs()}
+    assert jobs["throttled"].state == PENDING
+    assert jobs["throttled"].run_at > 0.0
+    assert jobs["throttled"].error == "Too many requests."
+    assert jobs["expired"].state == FAILED
+
+
+@pytest.mark.asyncio
+async def test_run_forever_wakes_for_the_next_due_job(queue):
+    ran = []
+    stop = asyncio.Event()
+
+    async def run(job):
+        ran.append((job["status_text"], time.time()))
+        stop.set()
+        return "id"
+
+    due = time.time() + 0.2
+    queue.enqueue({"network": "x", "status_text": "soon"}, due)
+    scheduler = Scheduler(queue, run, poll_interval=30.0)
+
+    await asyncio.wait_for(scheduler.run_forever(stop), timeout=5)
+
+    assert ran[0][0] == "soon"
+    assert due <= ran[0][1] < due + 1.0
+    assert queue.jobs()[0].state == DONE
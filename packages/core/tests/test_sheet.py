@@ -822,3 +822,26 @@ async def test_sheetmanager_write_skips_unknown_sheets():
 
     # Should only write to known sheet
     mock_sheet.write_all.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_schedulesheet_scheduled_posts_reads_without_writing():
+    """Test scheduled_posts returns unpublished rows with their due time and leaves the sheet alone."""
+    rows = [
+        SheetRow(['Due', 'http://link.com', 'img1.jpg', '', '', '', '05-02-2024', '09', '']),
+        SheetRow(['Done', '', '', '', '', '', '05-02-2024', '10', 'published']),
+        SheetRow(['Bad date', '', '', '', '', '', 'someday', '10', '']),
+        SheetRow(['Short row']),
+    ]
+    sheet = ScheduleSheet('sheet-id', 'email@example.com', 'key')
+
+    with patch.object(sheet, 'read_all', new_callable=AsyncMock, return_value=rows):
+        with patch.object(sheet, 'write_all', new_callable=AsyncMock) as mock_write:
+            posts = await sheet.scheduled_posts()
+
+    mock_write.assert_not_called()
+    assert len(posts) == 1
+    due_at, post = posts[0]
+    assert due_at == datetime.datetime(2024, 2, 5, 9, 0)
+    assert post['status_text'] == 'Due'
+    assert post['status_image_url_1'] == 'img1.jpg'
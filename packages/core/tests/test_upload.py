@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from agoras.common.store import MEMORY, KeyValueStore
+from agoras.core.upload import UploadCheckpoint, UploadSource, checkpoint_store, chunk_ranges, upload_chunks
+
+
+def test_upload_source_reads_byte_ranges_from_memory_and_disk(tmp_path):
+    content = bytes(range(256)) * 4
+    path = tmp_path / 'video.bin'
+    path.write_bytes(content)
+
+    in_memory = UploadSource(content)
+    on_disk = UploadSource(str(path))
+
+    assert in_memory.size == on_disk.size == 1024
+    assert in_memory.read(1000, 100) == on_disk.read(1000, 100) == content[1000:]
+    assert on_disk.path == str(path)
+    assert in_memory.digest() == on_disk.digest()
+
+
+def test_chunk_ranges():
+    assert list(chunk_ranges(10, 4)) == [(0, 4), (4, 4), (8, 2)]
+    assert list(chunk_ranges(10, 4, start=6)) == [(6, 4)]
+    assert list(chunk_ranges(10, 4, start=10)) == []
+
+
+def test_checkpoint_persists_across_instances():
+    store = KeyValueStore(MEMORY)
+    source = UploadSource(b'video-bytes')
+
+    first = UploadCheckpoint.for_upload('facebook', source, 'app', 'page', store=store)
+    first.save(session='upload-1', offset=0)
+    first.save(offset=4)
+
+    second = UploadCheckpoint.for_upload('facebook', source, 'app', 'page', store=store)
+    assert second.load() == {'session': 'upload-1', 'offset': 4}
+
+    other_page = UploadCheckpoint.for_upload('facebook', source, 'app', 'other-page', store=store)
+    assert other_page.load() == {}
+
+    second.clear()
+    assert first.load() == {}
+
+
+def test_checkpoint_without_store_is_process_local(monkeypatch):
+    monkeypatch.setenv('AGORAS_UPLOAD_RESUME', 'off')
+    assert checkpoint_store() is None
+
+    checkpoint = UploadCheckpoint('youtube:key')
+    checkpoint.save(resumable_uri='https://upload')
+
+    assert checkpoint.load() == {'resumable_uri': 'https://upload'}
+    assert UploadCheckpoint('youtube:key').load() == {}
+
+
+def test_upload_chunks_resumes_from_checkpointed_offset():
+    store = KeyValueStore(MEMORY)
+    source = UploadSource(b'0123456789')
+    checkpoint = UploadCheckpoint('test:key', store)
+    checkpoint.save(offset=4)
+    sent = []
+
+    def send_chunk(offset, data):
+        sent.append((offset, data))
+        return f'ack-{offset}'
+
+    result = upload_chunks(source, send_chunk, checkpoint, chunk_size=4)
+
+    assert sent == [(4, b'4567'), (8, b'89')]
+    assert result == 'ack-8'
+    assert checkpoint.load()['offset'] == 10
+
+
+@patch('agoras.core.retry.time.sleep')
+def test_upload_chunks_retries_only_the_failed_chunk(mock_sleep):
+    source = UploadSource(b'0123456789')
+    checkpoint = UploadCheckpoint('test:key', KeyValueStore(MEMORY))
+    unavailable = requests.HTTPError('503', response=MagicMock(status_code=503, headers={}))
+    send_chunk = MagicMock(side_effect=[None, unavailable, None, 'done'])
+
+    assert upload_chunks(source, send_chunk, checkpoint, chunk_size=4) == 'done'
+
+    assert [call.args[0] for call in send_chunk.call_args_list] == [0, 4, 4, 8]
+    mock_sleep.assert_called_once()
+
+
+def test_upload_chunks_keeps_progress_when_a_chunk_fails():
+    source = UploadSource(b'0123456789')
+    checkpoint = UploadCheckpoint('test:key', KeyValueStore(MEMORY))
+    send_chunk = MagicMock(side_effect=[None, requests.HTTPError('400', response=MagicMock(status_code=400))])
+
+    with pytest.raises(requests.HTTPError):
+        upload_chunks(source, send_chunk, checkpoint, chunk_size=4)
+
+    assert checkpoint.load() == {'offset': 4}
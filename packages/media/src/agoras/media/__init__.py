@@ -24,34 +24,47 @@ Contains:
 - Image: Handles image media files
 - Video: Handles video media files with platform-specific limits
 - MediaFactory: Factory for creating and managing media instances
+- DownloadCache: Shares one download per URL across media instances
+- MediaInfo: Probed size and duration, read off the event loop
 - constraints: Shared per-platform MIME/size/duration limits
 """
 
-from .base import Media
-from .constraints import (
-    IMAGE,
-    TRANSFER,
-    VIDEO,
-    MediaConstraints,
-    constraints_summary,
-    format_bytes,
-    image_limits,
-    platforms_with_post_or_video,
-    resolve_platform,
-    transfer_mode,
-    video_limits,
+from agoras.common.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Media": ".base",
+        "DownloadCache": ".cache",
+        "IMAGE": ".constraints",
+        "TRANSFER": ".constraints",
+        "VIDEO": ".constraints",
+        "MediaConstraints": ".constraints",
+        "constraints_summary": ".constraints",
+        "format_bytes": ".constraints",
+        "image_limits": ".constraints",
+        "platforms_with_post_or_video": ".constraints",
+        "resolve_platform": ".constraints",
+        "transfer_mode": ".constraints",
+        "video_limits": ".constraints",
+        "MediaValidationError": ".errors",
+        "format_limit_error": ".errors",
+        "MediaFactory": ".factory",
+        "Image": ".image",
+        "MediaInfo": ".probe",
+        "preflight_url": ".preflight",
+        "preflight_url_for_platform": ".preflight",
+        "Video": ".video",
+    },
 )
-from .errors import MediaValidationError, format_limit_error
-from .factory import MediaFactory
-from .image import Image
-from .preflight import preflight_url, preflight_url_for_platform
-from .video import Video
 
 __all__ = [
     "Media",
     "Image",
     "Video",
     "MediaFactory",
+    "DownloadCache",
+    "MediaInfo",
     "MediaConstraints",
     "MediaValidationError",
     "IMAGE",
@@ -17,16 +17,21 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.media.base module."""
 
-import asyncio
 import io
 import os
 import tempfile
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
 from urllib.request import Request, urlopen
 
 import filetype
 
 from agoras.common import __version__
+from agoras.common.executors import UPLOAD, run_blocking
+from agoras.common.metrics import span
+
+from .cache import active_download_cache
+from .probe import MediaInfo, probe_pool
 
 
 class Media(ABC):
@@ -37,6 +42,11 @@ class Media(ABC):
     media files from URLs.
     """
 
+    # Module-level function returning the MediaInfo of a local file, run by the
+    # probe pool during download() so later getters need not block the event
+    # loop; None when there is nothing to probe.
+    _prober: Optional[Callable[[str], MediaInfo]] = None
+
     def __init__(self, url):
         """
         Initialize media instance.
@@ -48,6 +58,7 @@ class Media(ABC):
         self.temp_file = None
         self.content = None
         self.file_type = None
+        self.info: Optional[MediaInfo] = None
         self._downloaded = False
         self._file_handle = None
 
@@ -74,19 +85,35 @@ class Media(ABC):
         if self._downloaded:
             return self.temp_file, self.content, self.file_type
 
-        def _sync_download():
+        def _fetch():
+            request = Request(url=self.url, headers={"User-Agent": f"Agoras/{__version__}"})
+            return urlopen(request).read()
+
+        def _write(content):
             _, tmpfile = tempfile.mkstemp(prefix=self._get_file_prefix(), suffix=".bin")
 
             with open(tmpfile, "wb") as f:
-                request = Request(url=self.url, headers={"User-Agent": f"Agoras/{__version__}"})
-                content = urlopen(request).read()
                 f.write(content)
 
-            return tmpfile, content
+            return tmpfile
 
-        self.temp_file, self.content = await asyncio.to_thread(_sync_download)
-        self.file_type = self._validate_file_type()
-        self._validate_content()
+        def _sync_download():
+            content = _fetch()
+            return _write(content), content
+
+        media = type(self).__name__.lower()
+        cache = active_download_cache()
+        with span("download", media=media):
+            if cache is not None:
+                self.content = await cache.fetch(self.url, lambda: run_blocking(UPLOAD, _fetch))
+                self.temp_file = await run_blocking(UPLOAD, _write, self.content)
+            else:
+                self.temp_file, self.content = await run_blocking(UPLOAD, _sync_download)
+        with span("validate", media=media):
+            self.file_type = self._validate_file_type()
+            if self._prober is not None:
+                self.info = await probe_pool.run(self._prober, self.temp_file)
+            self._validate_content()
         self._downloaded = True
 
         return self.temp_file, self.content, self.file_type
@@ -225,6 +252,7 @@ class Media(ABC):
 
         self.content = None
         self.file_type = None
+        self.info = None
         self._downloaded = False
 
     def __enter__(self):
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""agoras.media.cache module."""
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, Optional
+
+_active_cache: ContextVar[Optional["DownloadCache"]] = ContextVar("agoras_media_download_cache", default=None)
+
+
+def active_download_cache() -> Optional["DownloadCache"]:
+    """
+    Return the download cache active in the current context, if any.
+
+    Returns:
+        DownloadCache or None
+    """
+    return _active_cache.get()
+
+
+class DownloadCache:
+    """
+    Share media downloads between ``Media`` instances in one event loop.
+
+    While a cache is active, every ``Media.download()`` for the same URL
+    reuses a single in-flight or completed fetch. Each instance still writes
+    its own temporary file and runs its own platform validation.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._tasks: Dict[str, asyncio.Future] = {}
+
+    def __contains__(self, url):
+        """Return True if a fetch for ``url`` completed successfully."""
+        task = self._tasks.get(url)
+        return task is not None and task.done() and not task.cancelled() and task.exception() is None
+
+    async def fetch(self, url: str, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        Return the content for ``url``, loading it once.
+
+        Args:
+            url (str): Media URL
+            loader (callable): Coroutine factory that downloads the content
+
+        Returns:
+            bytes: Downloaded content
+
+        Raises:
+            Exception: Whatever the loader raised; failed fetches are not cached
+        """
+        task = self._tasks.get(url)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._tasks[url] = task
+        try:
+            # Shield so one caller timing out does not cancel the shared fetch.
+            return await asyncio.shield(task)
+        except Exception:
+            if task.done() and self._tasks.get(url) is task:
+                del self._tasks[url]
+            raise
+
+    @contextmanager
+    def activate(self):
+        """Make this cache active for ``Media.download()`` calls in the current context."""
+        token = _active_cache.set(self)
+        try:
+            yield self
+        finally:
+            _active_cache.reset(token)
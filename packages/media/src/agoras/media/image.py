@@ -24,6 +24,25 @@ from PIL import Image as PILImage
 from .base import Media
 from .constraints import MediaConstraints, image_limits, resolve_platform
 from .errors import MediaValidationError
+from .probe import MediaInfo
+
+
+def probe_image(path: str) -> MediaInfo:
+    """
+    Read the size of an image file, on a probe thread or worker process.
+
+    Args:
+        path (str): Local image file
+
+    Returns:
+        MediaInfo: Width and height, empty if Pillow cannot read the file
+    """
+    try:
+        with PILImage.open(path) as img:
+            width, height = img.size
+    except Exception:
+        return MediaInfo()
+    return MediaInfo(width=width, height=height)
 
 
 class Image(Media):
@@ -33,6 +52,8 @@ class Image(Media):
     Handles downloading, validation, and processing of image files.
     """
 
+    _prober = staticmethod(probe_image)
+
     def __init__(self, url, platform: str = "generic", constraints: Optional[MediaConstraints] = None):
         """Initialize an image media handler for the given URL and platform."""
         super().__init__(url)
@@ -54,6 +75,8 @@ class Image(Media):
         """
         if not self._downloaded or not self.content:
             return None
+        if self.info is not None:
+            return self.info.dimensions
         try:
             with PILImage.open(self.get_file_like_object()) as img:
                 return img.size
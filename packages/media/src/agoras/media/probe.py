@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.media.probe module.
+
+Media probing (Pillow, OpenCV) off the event loop. Probes run on the
+``cpu`` thread pool by default: they read headers and metadata in C code
+that releases the GIL, and take milliseconds. Batch runs that validate
+many large assets can set ``AGORAS_MEDIA_PROCESSES`` to probe in warm
+worker processes across every core instead. Either way, probes return a
+compact :class:`MediaInfo` rather than the decoded media.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+from agoras.common.executors import CPU, run_blocking
+from agoras.common.logger import logger
+
+
+@dataclass(frozen=True)
+class MediaInfo:
+    """What validation needs to know about a media file."""
+
+    width: Optional[int] = None
+    height: Optional[int] = None
+    duration: Optional[float] = None
+
+    @property
+    def dimensions(self) -> Optional[Tuple[int, int]]:
+        """
+        Return the frame size.
+
+        Returns:
+            tuple: (width, height), or None if the probe could not read it
+        """
+        if self.width and self.height:
+            return self.width, self.height
+        return None
+
+
+def configured_processes() -> int:
+    """
+    Return the number of probe processes from ``AGORAS_MEDIA_PROCESSES``.
+
+    ``0``, the default, probes on the ``cpu`` thread pool instead.
+
+    Returns:
+        int: Worker processes
+
+    Raises:
+        Exception: If the variable is not a non-negative integer
+    """
+    value = os.environ.get("AGORAS_MEDIA_PROCESSES")
+    if not value:
+        return 0
+    if not value.isdigit():
+        raise Exception(f'AGORAS_MEDIA_PROCESSES must be a non-negative integer, got "{value}".')
+    return int(value)
+
+
+def _warm_up():
+    # Import the codecs once per worker rather than once per probe, and keep
+    # OpenCV to one thread so parallel probes do not oversubscribe the cores.
+    import cv2
+    from PIL import Image  # noqa: F401
+
+    cv2.setNumThreads(1)
+
+
+class ProbePool:
+    """Optional process pool for probes, falling back to the ``cpu`` thread pool."""
+
+    def __init__(self):
+        """Initialize the pool; worker processes start on the first probe."""
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._processes: Optional[int] = None
+
+    def _executor(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if self._pool is None and self._processes is None:
+                self._processes = configured_processes()
+                if self._processes:
+                    try:
+                        self._pool = ProcessPoolExecutor(
+                            max_workers=self._processes, mp_context=_context(), initializer=_warm_up
+                        )
+                    except (OSError, NotImplementedError):
+                        # No process support here (e.g. no semaphores in a sandbox).
+                        self._processes = 0
+            return self._pool
+
+    async def run(self, probe: Callable[[str], MediaInfo], path: str) -> MediaInfo:
+        """
+        Run ``probe(path)`` in a worker process, or on the ``cpu`` thread pool.
+
+        Args:
+            probe (callable): Module-level function, so it can be pickled
+            path (str): Local media file
+
+        Returns:
+            MediaInfo: The probe result
+        """
+        pool = self._executor()
+        if pool is not None:
+            try:
+                return await asyncio.wrap_future(pool.submit(probe, path))
+            except BrokenProcessPool:
+                # A worker died: out of memory, a codec crash, or a script that
+                # starts agoras without an ``if __name__ == "__main__":`` guard.
+                logger.warning("Media probe processes stopped; probing in threads instead.")
+                self.shutdown(processes=0)
+        return await run_blocking(CPU, probe, path)
+
+    def shutdown(self, wait: bool = False, processes: Optional[int] = None):
+        """
+        Stop the worker processes.
+
+        Args:
+            wait (bool): Wait for running probes to finish
+            processes (int, optional): Processes for later probes; by default
+                ``AGORAS_MEDIA_PROCESSES`` is read again on the next probe
+        """
+        with self._lock:
+            pool, self._pool, self._processes = self._pool, None, processes
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+def _context():
+    # Forking a process that runs thread pools can copy held locks; start
+    # workers from a clean server process instead.
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+probe_pool = ProbePool()
@@ -24,6 +24,35 @@ import cv2
 from .base import Media
 from .constraints import MediaConstraints, resolve_platform, video_limits
 from .errors import MediaValidationError
+from .probe import MediaInfo
+
+
+def probe_video(path: str) -> MediaInfo:
+    """
+    Read the duration and frame size of a video file, on a probe thread or worker process.
+
+    Args:
+        path (str): Local video file
+
+    Returns:
+        MediaInfo: What OpenCV could read, empty if it cannot open the file
+    """
+    try:
+        cap = cv2.VideoCapture(path)
+        try:
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        finally:
+            cap.release()
+    except Exception:
+        return MediaInfo()
+    return MediaInfo(
+        width=width if width > 0 else None,
+        height=height if height > 0 else None,
+        duration=float(frame_count / fps) if fps > 0 else None,
+    )
 
 
 class Video(Media):
@@ -34,6 +63,8 @@ class Video(Media):
     Includes size limit validation for platform-specific requirements.
     """
 
+    _prober = staticmethod(probe_video)
+
     def __init__(self, url, max_size=None, platform="generic", constraints: Optional[MediaConstraints] = None):
         """Initialize a video media handler for the given URL and platform."""
         super().__init__(url)
@@ -112,6 +143,8 @@ class Video(Media):
         """
         if not self._downloaded or not self.temp_file:
             raise Exception("Video must be downloaded before getting duration")
+        if self.info is not None:
+            return self.info.duration
 
         try:
             cap = cv2.VideoCapture(self.temp_file)
@@ -129,6 +162,8 @@ class Video(Media):
         """Return (width, height) of the first video frame."""
         if not self._downloaded or not self.temp_file:
             return None
+        if self.info is not None:
+            return self.info.dimensions
         try:
             cap = cv2.VideoCapture(self.temp_file)
             width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
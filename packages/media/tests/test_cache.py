@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image as PILImage
+
+from agoras.media.cache import DownloadCache, active_download_cache
+from agoras.media.factory import MediaFactory
+
+
+def _png_bytes():
+    buffer = io.BytesIO()
+    PILImage.new("RGB", (4, 4), "red").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_activate_sets_and_resets_context():
+    cache = DownloadCache()
+    assert active_download_cache() is None
+    with cache.activate():
+        assert active_download_cache() is cache
+    assert active_download_cache() is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_shares_one_load():
+    cache = DownloadCache()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return b"data"
+
+    results = await asyncio.gather(*(cache.fetch("https://example.com/a.png", loader) for _ in range(3)))
+
+    assert results == [b"data"] * 3
+    assert len(calls) == 1
+    assert "https://example.com/a.png" in cache
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached():
+    cache = DownloadCache()
+
+    async def failing():
+        raise OSError("offline")
+
+    async def working():
+        return b"ok"
+
+    with pytest.raises(OSError):
+        await cache.fetch("https://example.com/a.png", failing)
+
+    assert "https://example.com/a.png" not in cache
+    assert await cache.fetch("https://example.com/a.png", working) == b"ok"
+
+
+@pytest.mark.asyncio
+@patch("agoras.media.base.urlopen")
+async def test_downloads_share_content_across_platforms(mock_urlopen):
+    response = MagicMock()
+    response.read.return_value = _png_bytes()
+    mock_urlopen.return_value = response
+    url = "https://example.com/a.png"
+
+    with DownloadCache().activate():
+        x_images, facebook_images = await asyncio.gather(
+            MediaFactory.download_images([url], platform="x"),
+            MediaFactory.download_images([url], platform="facebook"),
+        )
+
+    try:
+        assert mock_urlopen.call_count == 1
+        assert x_images[0]._downloaded and facebook_images[0]._downloaded
+        assert x_images[0].temp_file != facebook_images[0].temp_file
+    finally:
+        for image in x_images + facebook_images:
+            image.cleanup()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy
+import pytest
+from PIL import Image as PILImage
+
+from agoras.media.factory import MediaFactory
+from agoras.media.image import probe_image
+from agoras.media.probe import MediaInfo, ProbePool, configured_processes
+from agoras.media.video import probe_video
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    path = tmp_path / 'image.png'
+    PILImage.new('RGB', (320, 200)).save(path)
+    return str(path)
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    path = tmp_path / 'video.mp4'
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'mp4v'), 10, (64, 48))
+    for _ in range(10):
+        writer.write(numpy.zeros((48, 64, 3), dtype=numpy.uint8))
+    writer.release()
+    return str(path)
+
+
+def test_probes_return_compact_info(image_file, video_file, tmp_path):
+    assert probe_image(image_file) == MediaInfo(width=320, height=200)
+    assert probe_video(video_file) == MediaInfo(width=64, height=48, duration=1.0)
+    assert probe_image(str(tmp_path / 'missing.png')) == MediaInfo()
+    assert MediaInfo(width=64).dimensions is None
+
+
+@pytest.mark.asyncio
+async def test_probe_pool_runs_probes_in_worker_processes(image_file, video_file, monkeypatch):
+    monkeypatch.setenv('AGORAS_MEDIA_PROCESSES', '2')
+    pool = ProbePool()
+    try:
+        image, video = await pool.run(probe_image, image_file), await pool.run(probe_video, video_file)
+        assert pool._pool is not None
+    finally:
+        pool.shutdown(wait=True)
+
+    assert image.dimensions == (320, 200)
+    assert video.duration == 1.0
+
+
+@pytest.mark.asyncio
+@patch('agoras.media.base.urlopen')
+async def test_download_probes_without_new_limit_checks(mock_urlopen, tmp_path):
+    """A large photo is probed during download but not rejected for its size in pixels."""
+    path = tmp_path / 'photo.jpg'
+    PILImage.new('RGB', (2000, 1500)).save(path)
+    mock_urlopen.return_value = MagicMock(read=MagicMock(return_value=path.read_bytes()))
+    image = MediaFactory.create_image('https://example.com/photo.jpg', 'instagram')
+
+    try:
+        await image.download()
+
+        assert image.info == MediaInfo(width=2000, height=1500)
+        assert image.get_dimensions() == (2000, 1500)
+    finally:
+        image.cleanup()
+
+
+def test_configured_processes(monkeypatch):
+    monkeypatch.delenv('AGORAS_MEDIA_PROCESSES', raising=False)
+    assert configured_processes() == 0
+    monkeypatch.setenv('AGORAS_MEDIA_PROCESSES', '3')
+    assert configured_processes() == 3
+    monkeypatch.setenv('AGORAS_MEDIA_PROCESSES', 'all')
+    with pytest.raises(Exception, match='AGORAS_MEDIA_PROCESSES must be a non-negative integer'):
+        configured_processes()
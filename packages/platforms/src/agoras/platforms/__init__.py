@@ -24,16 +24,23 @@ This package provides concrete implementations of the SocialNetwork interface
 for 10 social media platforms.
 """
 
-from .discord import Discord
-from .facebook import Facebook
-from .instagram import Instagram
-from .linkedin import LinkedIn
-from .telegram import Telegram
-from .threads import Threads
-from .tiktok import TikTok
-from .whatsapp import WhatsApp
-from .x import X
-from .youtube import YouTube
+from agoras.common.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Discord": ".discord",
+        "Facebook": ".facebook",
+        "Instagram": ".instagram",
+        "LinkedIn": ".linkedin",
+        "Telegram": ".telegram",
+        "Threads": ".threads",
+        "TikTok": ".tiktok",
+        "WhatsApp": ".whatsapp",
+        "X": ".x",
+        "YouTube": ".youtube",
+    },
+)
 
 __all__ = [
     "Discord",
@@ -31,6 +31,9 @@ class DiscordAPI(BaseAPI):
     message operations, and file uploads.
     """
 
+    platform = "discord"
+    destination_credentials = ("server_name", "channel_name")
+
     def __init__(self, bot_token, server_name, channel_name):
         """
         Initialize Discord API instance.
@@ -107,7 +110,7 @@ class DiscordAPI(BaseAPI):
         self.client = None
         self._authenticated = False
 
-    async def post(self, content=None, embeds=None, file=None):
+    async def post(self, content=None, embeds=None, file=None, channel=None):
         """
         Post a message to the configured Discord channel.
 
@@ -115,6 +118,7 @@ class DiscordAPI(BaseAPI):
             content (str, optional): Text content of the message
             embeds (list, optional): List of Discord embeds
             file (discord.File, optional): File to attach
+            channel (str, optional): Post to this channel of the server instead
 
         Returns:
             str: Message ID
@@ -122,14 +126,38 @@ class DiscordAPI(BaseAPI):
         Raises:
             Exception: If message posting fails
         """
+        client = await self._channel_client(channel)
+        await self._rate_limit_check("post", 1.0, destination=channel or self.channel_name)
+        return await client.send_message(content=content, embeds=embeds, file=file)
+
+    async def _channel_client(self, channel=None):
+        """
+        Return the client posting to ``channel``, authenticating if needed.
+
+        Args:
+            channel (str, optional): Channel name; the configured channel when omitted
+
+        Returns:
+            Client bound to the channel
+
+        Raises:
+            Exception: If the client is unavailable or cannot reach other channels
+        """
         if not self._authenticated:
             await self.authenticate()
 
         if not self.client:
             raise Exception("Discord client not available")
 
-        await self._rate_limit_check("post", 1.0)
-        return await self.client.send_message(content=content, embeds=embeds, file=file)
+        if not channel or channel == self.channel_name:
+            return self.client
+
+        for_channel = getattr(self.client, "for_channel", None)
+        if for_channel is None:
+            raise Exception("Posting to several Discord channels requires DISCORD_MODE=rest.")
+        client = for_channel(channel)
+        await client.authenticate()
+        return client
 
     async def like(self, message_id, emoji="❤️"):
         """
@@ -176,7 +204,7 @@ class DiscordAPI(BaseAPI):
         await self._rate_limit_check("delete", 0.5)
         return await self.client.delete_message(message_id)
 
-    async def upload_file(self, file_content, filename, content=None, embeds=None):
+    async def upload_file(self, file_content, filename, content=None, embeds=None, channel=None):
         """
         Upload a file to Discord.
 
@@ -185,6 +213,7 @@ class DiscordAPI(BaseAPI):
             filename (str): Name of the file
             content (str, optional): Message content to accompany file
             embeds (list, optional): Embeds to include with file
+            channel (str, optional): Upload to this channel of the server instead
 
         Returns:
             str: Message ID
@@ -192,14 +221,9 @@ class DiscordAPI(BaseAPI):
         Raises:
             Exception: If file upload fails
         """
-        if not self._authenticated:
-            await self.authenticate()
-
-        if not self.client:
-            raise Exception("Discord client not available")
-
-        await self._rate_limit_check("upload_file", 1.0)
-        return await self.client.upload_file(file_content, filename, content, embeds)
+        client = await self._channel_client(channel)
+        await self._rate_limit_check("upload_file", 1.0, destination=channel or self.channel_name)
+        return await client.upload_file(file_content, filename, content, embeds)
 
     async def share(self, message_id):
         """
@@ -20,13 +20,14 @@
 import asyncio
 import os
 import sys
-from typing import Optional
+from typing import Optional, Union
 
 import discord
 
 from agoras.core.auth import BaseAuthManager
 
 from .client import DiscordAPIClient
+from .rest import DiscordRESTClient, discord_mode
 
 
 class DiscordAuthManager(BaseAuthManager):
@@ -76,6 +77,9 @@ class DiscordAuthManager(BaseAuthManager):
         if not self._validate_credentials():
             return self._missing_credentials_failed()
 
+        if discord_mode() == "rest":
+            return await self._authenticate_rest()
+
         # For Discord, we need to validate the bot token by connecting
         try:
             success = await self._validate_bot_token()
@@ -100,6 +104,26 @@ class DiscordAuthManager(BaseAuthManager):
         except Exception as e:
             return self._authentication_failed(e)
 
+    async def _authenticate_rest(self) -> bool:
+        """
+        Authenticate without a gateway connection.
+
+        Resolving the server and channel (cached after the first run), or
+        one ``GET /users/@me`` when they are cached, validates the token, so
+        a post needs no gateway login.
+
+        Returns:
+            bool: True if authentication successful, False otherwise
+        """
+        try:
+            self.client = self._create_client(self._require_bot_token())
+            await self.client.authenticate()
+            self.access_token = self.bot_token
+            self.user_info = await self._get_user_info()
+            return True
+        except Exception as e:
+            return self._authentication_failed(e)
+
     def _has_stored_or_env_credentials(self) -> bool:
         if self.bot_token:
             return True
@@ -233,9 +257,10 @@ class DiscordAuthManager(BaseAuthManager):
                 return channel
         raise Exception(f'Channel "{self.channel_name}" not found in guild "{self.server_name}"')
 
-    def _create_client(self, access_token: str) -> DiscordAPIClient:
-        """Create Discord API client instance."""
-        return DiscordAPIClient(
+    def _create_client(self, access_token: str) -> Union[DiscordAPIClient, DiscordRESTClient]:
+        """Create the Discord client for the mode selected by ``DISCORD_MODE``."""
+        client_class = DiscordRESTClient if discord_mode() == "rest" else DiscordAPIClient
+        return client_class(
             bot_token=access_token,
             server_name=self._require_server_name(),
             channel_name=self._require_channel_name(),
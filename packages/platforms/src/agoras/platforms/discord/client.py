@@ -18,10 +18,71 @@
 """agoras.platforms.discord.client module."""
 
 import asyncio
+import time
 from typing import Any, List, Optional
+from urllib.parse import parse_qs, urlparse
 
 import discord
 
+from agoras.common.executors import CPU, run_blocking
+from agoras.core.mediacache import MediaReferenceCache, account_key, content_digest
+
+# Stop reusing a signed attachment URL this long before Discord expires it.
+ATTACHMENT_EXPIRY_MARGIN = 3600.0
+
+
+def attachment_ttl(url: str) -> Optional[float]:
+    """
+    Return how long a Discord attachment URL stays usable.
+
+    Args:
+        url (str): CDN attachment URL
+
+    Returns:
+        float or None: Seconds until the signed URL expires (minus a safety margin),
+        or None for URLs without an ``ex`` expiry
+    """
+    expires = parse_qs(urlparse(url).query).get("ex")
+    if not expires:
+        return None
+    try:
+        return int(expires[0], 16) - time.time() - ATTACHMENT_EXPIRY_MARGIN
+    except ValueError:
+        return None
+
+
+def build_embed(
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+    url: Optional[str] = None,
+    image_url: Optional[str] = None,
+) -> discord.Embed:
+    """
+    Create a Discord embed object.
+
+    Args:
+        title (str, optional): Embed title
+        description (str, optional): Embed description
+        url (str, optional): Embed URL
+        image_url (str, optional): Image URL for embed
+
+    Returns:
+        discord.Embed: Discord embed object
+    """
+    # Create embed without type parameter to avoid linter issues
+    embed = discord.Embed()
+
+    if title:
+        embed.title = title
+    if description:
+        embed.description = description
+    if url:
+        embed.url = url
+    if image_url:
+        embed.set_image(url=image_url)
+
+    return embed
+
 
 class DiscordAPIClient:
     """
@@ -46,6 +107,7 @@ class DiscordAPIClient:
         self.client: Optional[discord.Client] = None
         self._authenticated = False
         self._fetched_channels = {}  # Store fetched channels by guild name
+        self.media_cache = MediaReferenceCache("discord", account_key(bot_token or ""))
 
     async def authenticate(self) -> bool:
         """
@@ -352,6 +414,9 @@ class DiscordAPIClient:
         """
         Upload a file to Discord.
 
+        Content sent before is posted as a link to its earlier attachment
+        instead of being uploaded again.
+
         Args:
             file_content: File-like object or bytes
             filename (str): Name of the file
@@ -370,23 +435,36 @@ class DiscordAPIClient:
         if not self.client:
             raise Exception("Discord client not available")
 
+        digest = await run_blocking(CPU, content_digest, file_content)
         try:
             channel = self._get_channel()
 
             kwargs = {}
-            kwargs["file"] = discord.File(file_content, filename=filename)
-
-            if content is not None:
-                kwargs["content"] = content
+            attachment_url = self.media_cache.get(digest)
+            if attachment_url:
+                # Discord embeds links to its own attachments, so the file is not sent again.
+                kwargs["content"] = f"{content}\n{attachment_url}" if content else attachment_url
+            else:
+                kwargs["file"] = discord.File(file_content, filename=filename)
+                if content is not None:
+                    kwargs["content"] = content
             if embeds is not None:
                 kwargs["embeds"] = embeds
 
             message = await channel.send(**kwargs)
+            if not attachment_url:
+                self._remember_attachment(digest, message)
             return str(message.id)
         except Exception as e:
             error_msg = f"Discord file upload failed: {str(e)}"
             raise Exception(error_msg) from e
 
+    def _remember_attachment(self, digest: Optional[str], message):
+        attachments = getattr(message, "attachments", None) or []
+        url = getattr(attachments[0], "url", None) if attachments else None
+        if isinstance(url, str):
+            self.media_cache.put(digest, url, ttl=attachment_ttl(url))
+
     def create_embed(
         self,
         title: Optional[str] = None,
@@ -408,16 +486,4 @@ class DiscordAPIClient:
         Returns:
             discord.Embed: Discord embed object
         """
-        # Create embed without type parameter to avoid linter issues
-        embed = discord.Embed()
-
-        if title:
-            embed.title = title
-        if description:
-            embed.description = description
-        if url:
-            embed.url = url
-        if image_url:
-            embed.set_image(url=image_url)
-
-        return embed
+        return build_embed(title=title, description=description, url=url, image_url=image_url)
@@ -0,0 +1,422 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.md for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.platforms.discord.rest module.
+
+Gateway-free Discord client. Posting only needs the REST API, so instead of
+logging in a ``discord.Client`` and waiting for the gateway to become ready,
+the server and channel names are resolved to IDs once, cached in the shared
+state store, and each action is a single request on a pooled session.
+"""
+
+import copy
+import json
+import os
+import sqlite3
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+import discord
+import requests
+
+from agoras.common.executors import API, CPU, UPLOAD, run_blocking
+from agoras.common.store import MEMORY, KeyValueStore, default_store
+from agoras.core.http import create_session
+from agoras.core.mediacache import MediaReferenceCache, account_key, content_digest
+from agoras.core.retry import request_with_retry
+
+from .client import attachment_ttl, build_embed
+
+DISCORD_API_URL = "https://discord.com/api/v10"
+NAMESPACE = "discord"
+# Renamed or recreated channels are re-resolved on 404, so IDs can be kept long.
+CHANNEL_CACHE_TTL = 7 * 86400.0
+# GUILD_TEXT and GUILD_ANNOUNCEMENT
+TEXT_CHANNEL_TYPES = frozenset({0, 5})
+REQUEST_TIMEOUT = 30
+# JSON error code Discord returns for a deleted (or inaccessible) channel ID.
+UNKNOWN_CHANNEL = 10003
+
+
+def discord_mode() -> str:
+    """
+    Return how Discord is reached, from ``DISCORD_MODE``.
+
+    Returns:
+        str: ``rest`` (default) posts over the REST API; ``gateway`` logs in a full ``discord.Client``
+    """
+    return "gateway" if os.environ.get("DISCORD_MODE", "rest").lower() == "gateway" else "rest"
+
+
+def channel_cache_store() -> KeyValueStore:
+    """
+    Return the store for resolved server and channel IDs.
+
+    Set ``AGORAS_DISCORD_CACHE=off`` to resolve names again in every process.
+
+    Returns:
+        KeyValueStore: The shared state store, or an in-memory store
+    """
+    if os.environ.get("AGORAS_DISCORD_CACHE", "on").lower() != "off":
+        try:
+            return default_store()
+        except (OSError, sqlite3.Error):
+            pass
+    return KeyValueStore(MEMORY)
+
+
+def _error_code(response) -> Optional[int]:
+    try:
+        return response.json().get("code")
+    except (AttributeError, ValueError):
+        return None
+
+
+class DiscordRESTClient:
+    """
+    Discord client that posts through the REST API without a gateway connection.
+
+    Offers the same operations as :class:`~agoras.platforms.discord.client.DiscordAPIClient`.
+    """
+
+    def __init__(self, bot_token: str, server_name: str, channel_name: str, store: Optional[KeyValueStore] = None):
+        """
+        Initialize Discord REST client.
+
+        Args:
+            bot_token (str): Discord bot token
+            server_name (str): Discord server name
+            channel_name (str): Discord channel name
+            store (KeyValueStore, optional): Where resolved IDs are cached; :func:`channel_cache_store` by default
+        """
+        self.bot_token = bot_token
+        self.server_name = server_name
+        self.channel_name = channel_name
+        self.store = store if store is not None else channel_cache_store()
+        self.session = create_session(headers={"Authorization": f"Bot {bot_token}"})
+        self.media_cache = MediaReferenceCache("discord", account_key(bot_token or ""))
+        self.guild_id: Optional[str] = None
+        self.channel_id: Optional[str] = None
+        self._channels: Dict[str, "DiscordRESTClient"] = {}
+        self._authenticated = False
+        # Set by any successful request; clients for other channels inherit it.
+        self._token_checked = False
+
+    @property
+    def _cache_key(self) -> str:
+        return f"{account_key(self.bot_token or '')}:{self.server_name}:{self.channel_name}"
+
+    async def authenticate(self) -> bool:
+        """
+        Resolve the configured channel, from the cache when possible, and check the token.
+
+        Resolving names proves the token works; when the IDs come from the
+        cache, one ``GET /users/@me`` does instead, so a revoked token fails
+        here rather than on the first post.
+
+        Returns:
+            bool: True if authentication successful
+
+        Raises:
+            Exception: If the token is rejected or the server or channel does not exist
+        """
+        if self._authenticated:
+            return True
+
+        if not self.bot_token:
+            raise Exception("Discord bot token is required")
+
+        try:
+            await run_blocking(API, self._resolve_channel_and_check_token)
+            self._authenticated = True
+            return True
+        except Exception as e:
+            raise Exception(f"Discord authentication failed: {str(e)}") from e
+
+    def disconnect(self):
+        """
+        Close pooled HTTP connections.
+        """
+        self.session.close()
+        self._authenticated = False
+        self._token_checked = False
+
+    def for_channel(self, channel_name: str) -> "DiscordRESTClient":
+        """
+        Return a client for another channel of the same server.
+
+        It shares this client's session, caches and resolved server, and is
+        closed with it.
+
+        Args:
+            channel_name (str): Discord channel name
+
+        Returns:
+            DiscordRESTClient: Client for ``channel_name``; call :meth:`authenticate` before use
+        """
+        if channel_name == self.channel_name:
+            return self
+        client = self._channels.get(channel_name)
+        if client is None:
+            client = copy.copy(self)
+            client.channel_name = channel_name
+            client.channel_id = None
+            client._channels = {}
+            client._authenticated = False
+            self._channels[channel_name] = client
+        return client
+
+    def _request(self, method: str, path: str, **kwargs) -> Any:
+        response = request_with_retry(
+            self.session, method, f"{DISCORD_API_URL}{path}", timeout=REQUEST_TIMEOUT, **kwargs
+        )
+        if response.status_code >= 400:
+            try:
+                message = response.json().get("message", response.text)
+            except ValueError:
+                message = response.text
+            raise requests.HTTPError(f"{response.status_code} {message}", response=response)
+        self._token_checked = True
+        return response.json() if response.content else None
+
+    def _resolve_channel_and_check_token(self):
+        self._resolve_channel()
+        if not self._token_checked:
+            self._request("GET", "/users/@me")
+
+    def _resolve_channel(self, refresh: bool = False):
+        """Set ``guild_id`` and ``channel_id`` from the cache or by listing servers and channels."""
+        cached = None if refresh else self.store.get(NAMESPACE, self._cache_key)
+        if cached:
+            self.guild_id, self.channel_id = cached["guild_id"], cached["channel_id"]
+            return
+
+        if refresh or not self.guild_id:
+            self.guild_id = self._find_guild_id()
+        channels = self._request("GET", f"/guilds/{self.guild_id}/channels")
+        for channel in channels:
+            if channel.get("type") in TEXT_CHANNEL_TYPES and channel.get("name") == self.channel_name:
+                self.channel_id = str(channel["id"])
+                break
+        else:
+            raise Exception(f"Text channel {self.channel_name} not found.")
+
+        self.store.set(
+            NAMESPACE,
+            self._cache_key,
+            {"guild_id": self.guild_id, "channel_id": self.channel_id},
+            ttl=CHANNEL_CACHE_TTL,
+        )
+
+    def _find_guild_id(self) -> str:
+        after = None
+        while True:
+            params: Dict[str, Any] = {"limit": 200}
+            if after:
+                params["after"] = after
+            guilds = self._request("GET", "/users/@me/guilds", params=params)
+            for guild in guilds:
+                if guild.get("name") == self.server_name:
+                    return str(guild["id"])
+            if len(guilds) < 200:
+                raise Exception(f"Guild {self.server_name} not found.")
+            after = guilds[-1]["id"]
+
+    def _channel_request(self, method: str, path: str = "", **kwargs) -> Any:
+        """Send a request for the configured channel, re-resolving it once if Discord no longer knows the ID."""
+        if not self.channel_id:
+            self._resolve_channel()
+        try:
+            return self._request(method, f"/channels/{self.channel_id}{path}", **kwargs)
+        except requests.HTTPError as e:
+            if _error_code(e.response) != UNKNOWN_CHANNEL:
+                raise
+            # The channel was recreated or the cached ID is stale.
+            self._resolve_channel(refresh=True)
+            return self._request(method, f"/channels/{self.channel_id}{path}", **kwargs)
+
+    def _post_message(self, payload: Dict[str, Any], file_content: Any = None, filename: Optional[str] = None):
+        if file_content is None:
+            return self._channel_request("POST", "/messages", json=payload)
+        # Bytes, so a retried or re-routed request sends the whole file again.
+        if hasattr(file_content, "getvalue"):
+            file_content = file_content.getvalue()
+        elif hasattr(file_content, "read"):
+            file_content = file_content.read()
+        return self._channel_request(
+            "POST",
+            "/messages",
+            data={"payload_json": json.dumps(payload)},
+            files={"files[0]": (filename, file_content)},
+        )
+
+    def _require_authenticated(self):
+        if not self._authenticated:
+            raise Exception("Discord client not authenticated")
+
+    @staticmethod
+    def _payload(content: Optional[str], embeds: Optional[List[discord.Embed]]) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {}
+        if content is not None:
+            payload["content"] = content
+        if embeds is not None:
+            payload["embeds"] = [embed.to_dict() for embed in embeds]
+        return payload
+
+    async def send_message(
+        self,
+        content: Optional[str] = None,
+        embeds: Optional[List[discord.Embed]] = None,
+        file: Optional[discord.File] = None,
+    ) -> str:
+        """
+        Send a message to the configured Discord channel.
+
+        Args:
+            content (str, optional): Text content of the message
+            embeds (list, optional): List of Discord embeds
+            file (discord.File, optional): File to attach
+
+        Returns:
+            str: Message ID
+
+        Raises:
+            Exception: If message sending fails
+        """
+        self._require_authenticated()
+
+        try:
+            payload = self._payload(content, embeds)
+            if file is not None:
+                message = await run_blocking(UPLOAD, self._post_message, payload, file.fp, file.filename)
+            else:
+                message = await run_blocking(API, self._post_message, payload)
+            return str(message["id"])
+        except Exception as e:
+            raise Exception(f"Discord send message failed: {str(e)}") from e
+
+    async def add_reaction(self, message_id: str, emoji: str = "❤️") -> str:
+        """
+        Add a reaction to a Discord message.
+
+        Args:
+            message_id (str): ID of the message to react to
+            emoji (str): Emoji to react with
+
+        Returns:
+            str: Message ID
+
+        Raises:
+            Exception: If reaction fails
+        """
+        self._require_authenticated()
+
+        try:
+            path = f"/messages/{int(message_id)}/reactions/{quote(emoji)}/@me"
+            await run_blocking(API, self._channel_request, "PUT", path)
+            return message_id
+        except Exception as e:
+            raise Exception(f"Discord add reaction failed: {str(e)}") from e
+
+    async def delete_message(self, message_id: str) -> str:
+        """
+        Delete a Discord message.
+
+        Args:
+            message_id (str): ID of the message to delete
+
+        Returns:
+            str: Message ID
+
+        Raises:
+            Exception: If deletion fails
+        """
+        self._require_authenticated()
+
+        try:
+            await run_blocking(API, self._channel_request, "DELETE", f"/messages/{int(message_id)}")
+            return message_id
+        except Exception as e:
+            raise Exception(f"Discord delete message failed: {str(e)}") from e
+
+    async def upload_file(
+        self,
+        file_content: Any,
+        filename: str,
+        content: Optional[str] = None,
+        embeds: Optional[List[discord.Embed]] = None,
+    ) -> str:
+        """
+        Upload a file to Discord.
+
+        Content sent before is posted as a link to its earlier attachment
+        instead of being uploaded again.
+
+        Args:
+            file_content: File-like object or bytes
+            filename (str): Name of the file
+            content (str, optional): Message content to accompany file
+            embeds (list, optional): Embeds to include with file
+
+        Returns:
+            str: Message ID
+
+        Raises:
+            Exception: If file upload fails
+        """
+        self._require_authenticated()
+
+        digest = await run_blocking(CPU, content_digest, file_content)
+        try:
+            attachment_url = self.media_cache.get(digest)
+            if attachment_url:
+                text = f"{content}\n{attachment_url}" if content else attachment_url
+                message = await run_blocking(API, self._post_message, self._payload(text, embeds))
+            else:
+                payload = self._payload(content, embeds)
+                message = await run_blocking(UPLOAD, self._post_message, payload, file_content, filename)
+                attachments = message.get("attachments") or []
+                url = attachments[0].get("url") if attachments else None
+                if url:
+                    self.media_cache.put(digest, url, ttl=attachment_ttl(url))
+            return str(message["id"])
+        except Exception as e:
+            raise Exception(f"Discord file upload failed: {str(e)}") from e
+
+    def create_embed(
+        self,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        url: Optional[str] = None,
+        embed_type: str = "rich",
+        image_url: Optional[str] = None,
+    ) -> discord.Embed:
+        """
+        Create a Discord embed object.
+
+        Args:
+            title (str, optional): Embed title
+            description (str, optional): Embed description
+            url (str, optional): Embed URL
+            embed_type (str): Embed type (default: 'rich')
+            image_url (str, optional): Image URL for embed
+
+        Returns:
+            discord.Embed: Discord embed object
+        """
+        return build_embed(title=title, description=description, url=url, image_url=image_url)
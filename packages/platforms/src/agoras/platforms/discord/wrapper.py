@@ -18,8 +18,12 @@
 """agoras.platforms.discord.wrapper module."""
 
 import asyncio
+import json
+from typing import Any, Dict, Iterable, List, Optional
 
+from agoras.common.executors import API, run_blocking
 from agoras.common.utils import parse_metatags
+from agoras.core.broadcast import DEFAULT_CONCURRENCY, broadcast, split_destinations
 from agoras.core.interfaces import SocialNetwork
 
 from .api import DiscordAPI
@@ -42,6 +46,7 @@ class Discord(SocialNetwork):
                 - discord_bot_token: Discord bot token
                 - discord_server_name: Discord server name
                 - discord_channel_name: Discord channel name
+                - discord_channel_names: Comma-separated channel names for the broadcast action
         """
         # Map platform-specific keys to generic keys for core interface compatibility
         if "discord_post_id" in kwargs:
@@ -55,6 +60,7 @@ class Discord(SocialNetwork):
         self.discord_bot_token = None
         self.discord_server_name = None
         self.discord_channel_name = None
+        self.discord_channel_names: List[str] = []
         self.api = None
 
     async def _initialize_client(self):
@@ -67,6 +73,12 @@ class Discord(SocialNetwork):
         self.discord_bot_token = self._get_config_value("discord_bot_token", "DISCORD_BOT_TOKEN")
         self.discord_server_name = self._get_config_value("discord_server_name", "DISCORD_SERVER_NAME")
         self.discord_channel_name = self._get_config_value("discord_channel_name", "DISCORD_CHANNEL_NAME")
+        self.discord_channel_names = split_destinations(
+            self._get_config_value("discord_channel_names", "DISCORD_CHANNEL_NAMES")
+        )
+        # A broadcast can run without a default channel; the first listed one is used to connect.
+        if not self.discord_channel_name and self.discord_channel_names:
+            self.discord_channel_name = self.discord_channel_names[0]
 
         # If credentials not provided, try loading from storage
         if not all([self.discord_bot_token, self.discord_server_name, self.discord_channel_name]):
@@ -151,10 +163,6 @@ class Discord(SocialNetwork):
         if not self.api:
             raise Exception("Discord API not initialized")
 
-        embeds = []
-        status_link_title = ""
-        status_link_description = ""
-        status_link_image = ""
         source_media = list(
             filter(None, [status_image_url_1, status_image_url_2, status_image_url_3, status_image_url_4])
         )
@@ -162,19 +170,37 @@ class Discord(SocialNetwork):
         if not source_media and not status_text and not status_link:
             raise Exception("No status text, link, or images provided.")
 
+        embeds = await self._build_embeds(status_link, source_media)
+
+        # Post message using Discord API
+        message_id = await self.api.post(content=status_text or None, embeds=embeds if embeds else None)
+
+        self._output_status(message_id)
+        return message_id
+
+    async def _build_embeds(self, status_link, source_media):
+        """
+        Build the link preview and image embeds of a post.
+
+        Args:
+            status_link (str): URL to preview, if any
+            source_media (list): Image URLs, validated with the Media system
+
+        Returns:
+            list: Discord embeds
+        """
+        embeds = []
+
         # Parse link metadata
         if status_link:
-            scraped_data = parse_metatags(status_link)
-            status_link_title = scraped_data.get("title", "")
-            status_link_description = scraped_data.get("description", "")
-            status_link_image = scraped_data.get("image", "")
+            scraped_data = await run_blocking(API, parse_metatags, status_link)
 
             # Create link embed
             link_embed = self.api.create_embed(
-                title=status_link_title,
-                description=status_link_description,
+                title=scraped_data.get("title", ""),
+                description=scraped_data.get("description", ""),
                 url=status_link,
-                image_url=status_link_image,
+                image_url=scraped_data.get("image", ""),
             )
             embeds.append(link_embed)
 
@@ -189,11 +215,92 @@ class Discord(SocialNetwork):
                     # Clean up temporary files
                     image.cleanup()
 
-        # Post message using Discord API
-        message_id = await self.api.post(content=status_text or None, embeds=embeds if embeds else None)
+        return embeds
 
-        self._output_status(message_id)
-        return message_id
+    async def broadcast(
+        self,
+        channel_names: Iterable[str],
+        status_text: Optional[str] = None,
+        status_link: Optional[str] = None,
+        image_urls: Optional[List[str]] = None,
+        video_url: Optional[str] = None,
+        video_title: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Post the same message or video to several channels of the server.
+
+        Embeds are built and a video is downloaded once. The video is uploaded
+        to the first channel only; the others get a link to that attachment.
+        Channels are posted to concurrently within the global and per-channel
+        rate limits.
+
+        Args:
+            channel_names (iterable): Channel names in the configured server
+            status_text (str, optional): Message text
+            status_link (str, optional): URL to preview
+            image_urls (list, optional): Up to four image URLs shown as embeds
+            video_url (str, optional): Video to upload instead of posting embeds
+            video_title (str, optional): Title of the video embed
+            concurrency (int): Maximum channels posted to at once
+
+        Returns:
+            dict: ``{channel: {"id": message_id}}`` or ``{channel: {"error": message}}``
+        """
+        api = self.api
+        if not api:
+            raise Exception("Discord API not initialized")
+
+        channel_names = split_destinations(channel_names)
+        if not channel_names:
+            raise Exception("At least one Discord channel name is required for broadcast.")
+
+        if video_url:
+            video = await self.download_video(video_url)
+            try:
+                if not video.content or not video.file_type:
+                    raise Exception("Failed to download or validate video")
+                embeds = []
+                if video_title or status_text:
+                    embeds.append(api.create_embed(title=video_title or "Video", description=status_text))
+                filename = f"video.{video.file_type.extension}"
+                content = video.content
+
+                async def send(channel):
+                    return await api.upload_file(content, filename, embeds=embeds or None, channel=channel)
+
+                return await broadcast(channel_names, send, concurrency, upload_first=True)
+            finally:
+                video.cleanup()
+
+        source_media = list(filter(None, image_urls or []))
+        if not source_media and not status_text and not status_link:
+            raise Exception("No status text, link, images, or video provided.")
+        embeds = await self._build_embeds(status_link, source_media)
+
+        async def send(channel):
+            return await api.post(content=status_text or None, embeds=embeds or None, channel=channel)
+
+        return await broadcast(channel_names, send, concurrency)
+
+    async def _handle_broadcast_action(self):
+        """Handle broadcast action, printing the result for every channel."""
+        concurrency = self._get_config_value("discord_broadcast_concurrency", "DISCORD_BROADCAST_CONCURRENCY")
+        results = await self.broadcast(
+            self.discord_channel_names,
+            status_text=self._get_config_value("status_text", "STATUS_TEXT"),
+            status_link=self._get_config_value("status_link", "STATUS_LINK"),
+            image_urls=[self._get_config_value(f"status_image_url_{i}", f"STATUS_IMAGE_URL_{i}") for i in range(1, 5)],
+            video_url=self._get_config_value("video_url", "VIDEO_URL"),
+            video_title=self._get_config_value("video_title", "VIDEO_TITLE"),
+            concurrency=int(concurrency or DEFAULT_CONCURRENCY),
+        )
+        if self.emit_status:
+            print(json.dumps(results, separators=(",", ":")))
+
+        failed = [channel for channel, result in results.items() if "error" in result]
+        if failed:
+            raise Exception(f"Discord broadcast failed for {len(failed)} of {len(results)} channels.")
 
     async def like(self, discord_post_id):
         """
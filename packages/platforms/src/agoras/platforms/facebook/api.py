@@ -33,6 +33,8 @@ class FacebookAPI(BaseAPI):
     and all Facebook API operations including posts, likes, shares, and videos.
     """
 
+    platform = "facebook"
+
     def __init__(self, user_id, client_id, client_secret, refresh_token=None, app_id=None):
         """
         Initialize Facebook API instance.
@@ -17,14 +17,17 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.platforms.facebook.client module."""
 
-import asyncio
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import requests
 from pyfacebook import GraphAPI
 
 from agoras.common import __version__
+from agoras.common.executors import API, UPLOAD, run_blocking
+from agoras.core.http import create_session
+from agoras.core.retry import request_with_retry
+from agoras.core.upload import CHUNK_TIMEOUT, UploadCheckpoint, UploadSource, upload_chunks
 
 
 def _is_video_file_processing_error(error: requests.HTTPError) -> bool:
@@ -59,6 +62,7 @@ class FacebookAPIClient:
         """
         self.access_token = access_token
         self.graph_api: Optional[GraphAPI] = None
+        self.session = create_session()
         self._authenticated = False
 
     async def authenticate(self) -> bool:
@@ -79,6 +83,7 @@ class FacebookAPIClient:
 
         try:
             self.graph_api = GraphAPI(access_token=self.access_token, version="21.0")
+            self.graph_api.session = self.session
             self._authenticated = True
             return True
         except Exception as e:
@@ -88,6 +93,7 @@ class FacebookAPIClient:
         """
         Disconnect and clean up client resources.
         """
+        self.session.close()
         self.graph_api = None
         self._authenticated = False
 
@@ -203,12 +209,10 @@ class FacebookAPIClient:
 
         try:
             # Use direct HTTP request to /me/accounts endpoint
-            import requests
-
             url = "https://graph.facebook.com/v21.0/me/accounts"
             params = {"access_token": user_access_token, "fields": "id,access_token"}
 
-            response = requests.get(url, params=params, timeout=30)
+            response = request_with_retry(self.session, "GET", url, params=params, timeout=30)
             response.raise_for_status()
 
             accounts_data = response.json()
@@ -261,7 +265,7 @@ class FacebookAPIClient:
             response = self.post_object(object_id=object_id, connection="feed", data=data)
             return response["id"].split("_")[1]
 
-        return await asyncio.to_thread(_sync_create_post)
+        return await run_blocking(API, _sync_create_post)
 
     async def upload_media(self, object_id: str, media_url: str, published: bool = False) -> Dict[str, Any]:
         """
@@ -284,7 +288,7 @@ class FacebookAPIClient:
                 object_id=object_id, connection="photos", data={"url": media_url, "published": published}
             )
 
-        return await asyncio.to_thread(_sync_upload_media)
+        return await run_blocking(UPLOAD, _sync_upload_media)
 
     async def like_post(self, object_id: str, post_id: str) -> str:
         """
@@ -305,7 +309,7 @@ class FacebookAPIClient:
             self.post_object(object_id=f"{object_id}_{post_id}", connection="likes")
             return post_id
 
-        return await asyncio.to_thread(_sync_like)
+        return await run_blocking(API, _sync_like)
 
     async def delete_post(self, object_id: str, post_id: str) -> str:
         """
@@ -332,7 +336,7 @@ class FacebookAPIClient:
                 self.delete_object(object_id=post_id)
             return post_id
 
-        return await asyncio.to_thread(_sync_delete)
+        return await run_blocking(API, _sync_delete)
 
     async def share_post(self, profile_id: str, object_id: str, post_id: str) -> str:
         """
@@ -356,7 +360,7 @@ class FacebookAPIClient:
             response = self.post_object(object_id=profile_id, connection="feed", data=data)
             return response["id"].split("_")[1]
 
-        return await asyncio.to_thread(_sync_share)
+        return await run_blocking(API, _sync_share)
 
     async def upload_reel_or_story(self, object_id: str, video_type: str, status_text: str, video_url: str) -> str:
         """
@@ -385,7 +389,9 @@ class FacebookAPIClient:
 
             # Upload video
             if upload_url:
-                requests.post(
+                request_with_retry(
+                    self.session,
+                    "POST",
                     upload_url,
                     headers={
                         "file_url": video_url,
@@ -409,13 +415,13 @@ class FacebookAPIClient:
 
             return str(video_id) if video_id else ""
 
-        return await asyncio.to_thread(_sync_upload_reel_or_story)
+        return await run_blocking(UPLOAD, _sync_upload_reel_or_story)
 
     async def upload_regular_video(
         self,
         object_id: str,
         app_id: str,
-        video_content: bytes,
+        video_content: Union[bytes, str],
         video_file_type: str,
         video_file_size: int,
         video_filename: str,
@@ -429,7 +435,7 @@ class FacebookAPIClient:
         Args:
             object_id (str): Facebook object ID
             app_id (str): Facebook app ID
-            video_content (bytes): Video file content
+            video_content (bytes or str): Video file content, or the path of the video file
             video_file_type (str): Video MIME type
             video_file_size (int): Video file size in bytes
             video_filename (str): Video filename
@@ -446,46 +452,16 @@ class FacebookAPIClient:
         """
 
         def _sync_upload_regular_video():
-            # Create upload session
-            upload_response = requests.post(
-                f"https://graph.facebook.com/v21.0/{app_id}/uploads",
-                headers={
-                    "Authorization": f"OAuth {self.access_token}",
-                    "User-Agent": f"Agoras/{__version__}",
-                },
-                data={
-                    "file_type": video_file_type,
-                    "file_length": str(video_file_size),
-                    "file_name": video_filename,
-                },
-                timeout=30,
+            source = UploadSource(video_content)
+            checkpoint = UploadCheckpoint.for_upload("facebook", source, app_id, object_id)
+            file_handle = checkpoint.load().get("handle") or self._upload_video_file(
+                app_id, source, checkpoint, video_file_type, video_filename
             )
-            upload_response.raise_for_status()
-            upload_session_id = upload_response.json().get("id")
-
-            if not upload_session_id:
-                raise Exception("Failed to create upload session")
-
-            # Upload video file
-            upload_data_response = requests.post(
-                f"https://graph.facebook.com/v21.0/{upload_session_id}",
-                headers={
-                    "Content-Type": video_file_type,
-                    "file_offset": "0",
-                    "Authorization": f"OAuth {self.access_token}",
-                    "User-Agent": f"Agoras/{__version__}",
-                },
-                data=video_content,
-                timeout=30,
-            )
-            upload_data_response.raise_for_status()
-            file_handle = upload_data_response.json().get("h")
-
-            if not file_handle:
-                raise Exception("Failed to upload video data")
 
             # Create video post
-            video_response = requests.post(
+            video_response = request_with_retry(
+                self.session,
+                "POST",
                 f"https://graph-video.facebook.com/v21.0/{object_id}/videos",
                 headers={
                     "Authorization": f"OAuth {self.access_token}",
@@ -506,11 +482,113 @@ class FacebookAPIClient:
                     and source_video_url.startswith(("http://", "https://"))
                     and _is_video_file_processing_error(error)
                 ):
+                    checkpoint.clear()
                     return self.upload_regular_video_from_url(object_id, source_video_url, status_text, video_title)
                 raise
+            checkpoint.clear()
             return str(video_response.json()["id"])
 
-        return await asyncio.to_thread(_sync_upload_regular_video)
+        return await run_blocking(UPLOAD, _sync_upload_regular_video)
+
+    def _upload_video_file(
+        self,
+        app_id: str,
+        source: UploadSource,
+        checkpoint: UploadCheckpoint,
+        video_file_type: str,
+        video_filename: str,
+    ) -> str:
+        """
+        Send a video through the Resumable Upload API and return its file handle.
+
+        Continues the checkpointed upload session from the offset Facebook
+        reports, or starts a new session.
+
+        Args:
+            app_id (str): Facebook app ID
+            source (UploadSource): Video content
+            checkpoint (UploadCheckpoint): Upload progress
+            video_file_type (str): Video MIME type
+            video_filename (str): Video filename
+
+        Returns:
+            str: Uploaded file handle
+
+        Raises:
+            Exception: If the upload fails
+        """
+        auth_headers = {
+            "Authorization": f"OAuth {self.access_token}",
+            "User-Agent": f"Agoras/{__version__}",
+        }
+        upload_session_id = checkpoint.load().get("session")
+        offset = self._upload_session_offset(upload_session_id, auth_headers) if upload_session_id else None
+
+        if offset is None:
+            # Create upload session
+            upload_response = request_with_retry(
+                self.session,
+                "POST",
+                f"https://graph.facebook.com/v21.0/{app_id}/uploads",
+                headers=auth_headers,
+                data={
+                    "file_type": video_file_type,
+                    "file_length": str(source.size),
+                    "file_name": video_filename,
+                },
+                timeout=30,
+            )
+            upload_response.raise_for_status()
+            upload_session_id = upload_response.json().get("id")
+
+            if not upload_session_id:
+                raise Exception("Failed to create upload session")
+
+            checkpoint.save(session=upload_session_id, offset=0)
+            offset = 0
+
+        def _send_chunk(chunk_offset, data):
+            # Each chunk is written at a fixed offset, so resending it is safe.
+            response = self.session.post(
+                f"https://graph.facebook.com/v21.0/{upload_session_id}",
+                headers={**auth_headers, "Content-Type": video_file_type, "file_offset": str(chunk_offset)},
+                data=data,
+                timeout=CHUNK_TIMEOUT,
+            )
+            response.raise_for_status()
+            return response.json().get("h")
+
+        file_handle = upload_chunks(source, _send_chunk, checkpoint, start=offset)
+
+        if not file_handle:
+            raise Exception("Failed to upload video data")
+
+        checkpoint.save(handle=file_handle)
+        return file_handle
+
+    def _upload_session_offset(self, upload_session_id: str, headers: Dict[str, str]) -> Optional[int]:
+        """
+        Return how many bytes Facebook already holds for an upload session.
+
+        Args:
+            upload_session_id (str): Upload session ID
+            headers (dict): Authorization headers
+
+        Returns:
+            int or None: Acknowledged offset, or None if the session can no longer be resumed
+        """
+        try:
+            response = request_with_retry(
+                self.session,
+                "GET",
+                f"https://graph.facebook.com/v21.0/{upload_session_id}",
+                headers=headers,
+                timeout=30,
+            )
+            response.raise_for_status()
+            return int(response.json()["file_offset"])
+        except (requests.RequestException, KeyError, TypeError, ValueError):
+            return None
 
     def upload_regular_video_from_url(
         self,
@@ -531,7 +609,9 @@ class FacebookAPIClient:
         Returns:
             str: Post ID
         """
-        response = requests.post(
+        response = request_with_retry(
+            self.session,
+            "POST",
             f"https://graph.facebook.com/v21.0/{object_id}/videos",
             headers={
                 "Authorization": f"OAuth {self.access_token}",
@@ -20,7 +20,9 @@
 import asyncio
 import sys
 
+from agoras.core.concurrency import gather_bounded
 from agoras.core.interfaces import SocialNetwork
+from agoras.core.journal import MEDIA, journal_step
 
 from .api import FacebookAPI
 
@@ -235,6 +237,15 @@ class Facebook(SocialNetwork):
         if self.api:
             await self.api.disconnect()
 
+    def _publish_destination(self):
+        """
+        Return where posts go, so the publish journal tells targets apart.
+
+        Returns:
+            dict: The page or profile ID
+        """
+        return {"object_id": self.facebook_object_id}
+
     async def post(
         self,
         status_text,
@@ -294,17 +305,20 @@ class Facebook(SocialNetwork):
             # For Facebook Profiles: Upload media first, then attach
             # Download and validate images using the Media system
             if source_media:
-                images = await self.download_images(source_media)
-                for image in images:
+
+                async def upload_media(image):
                     try:
-                        # Upload media to Facebook
-                        media_response = await self.api.upload_media(self.facebook_object_id, image.url, published=True)
-                        if media_response and "id" in media_response:
-                            attached_media.append({"media_fbid": media_response["id"]})
+                        return await self.api.upload_media(self.facebook_object_id, image.url, published=True)
                     finally:
                         # Clean up temporary files
                         image.cleanup()
 
+                images = await self.download_images(source_media)
+                # Upload media to Facebook concurrently, keeping the original order
+                for media_response in await gather_bounded(upload_media, images):
+                    if media_response and "id" in media_response:
+                        attached_media.append({"media_fbid": media_response["id"]})
+
             # Create the post
             post_id = await self.api.post(
                 self.facebook_object_id,
@@ -473,37 +487,36 @@ class Facebook(SocialNetwork):
         # Get video type from config
         video_type = self._get_config_value("facebook_video_type", "FACEBOOK_VIDEO_TYPE") or ""
 
-        # Download and validate video using the Media system
-        video = await self.download_video(video_url)
-
-        if not video.content or not video.file_type:
-            video.cleanup()
-            raise Exception("Failed to download or validate video")
-
-        from agoras.media.constraints import video_limits
-        from agoras.media.errors import MediaValidationError
-
-        allowed = video_limits("facebook").mime_types
-        if video.file_type.mime not in allowed:
-            video.cleanup()
-            raise MediaValidationError(
-                "facebook",
-                "video",
-                "mime_types",
-                video.file_type.mime,
-                sorted(allowed),
-            )
-
-        try:
-            # Handle different video types
-            if video_type in ["reel", "story"]:
-                post_id = await self._upload_reel_or_story(video_type, status_text, video_url)
-            else:
-                post_id = await self._upload_regular_video(video, status_text, video_title, video_url)
-
-        finally:
-            # Clean up using Media system
-            video.cleanup()
+        async def upload_video():
+            # Download and validate video using the Media system
+            video = await self.download_video(video_url)
+            try:
+                if not video.content or not video.file_type:
+                    raise Exception("Failed to download or validate video")
+
+                from agoras.media.constraints import video_limits
+                from agoras.media.errors import MediaValidationError
+
+                allowed = video_limits("facebook").mime_types
+                if video.file_type.mime not in allowed:
+                    raise MediaValidationError(
+                        "facebook",
+                        "video",
+                        "mime_types",
+                        video.file_type.mime,
+                        sorted(allowed),
+                    )
+
+                # Handle different video types
+                if video_type in ["reel", "story"]:
+                    return await self._upload_reel_or_story(video_type, status_text, video_url)
+                return await self._upload_regular_video(video, status_text, video_title, video_url)
+            finally:
+                # Clean up using Media system
+                video.cleanup()
+
+        # The upload publishes the video; a retry after a crash reports it instead of downloading again
+        post_id = await journal_step(MEDIA, upload_video)
 
         self._output_status(post_id)
         return post_id
@@ -33,6 +33,8 @@ class InstagramAPI(BaseAPI):
     and all Instagram API operations including posts, videos, and media uploads.
     """
 
+    platform = "instagram"
+
     def __init__(self, user_id, client_id, client_secret, refresh_token=None):
         """
         Initialize Instagram API instance.
@@ -17,12 +17,13 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.platforms.instagram.client module."""
 
-import asyncio
-import time
 from typing import Any, Dict, List, Optional
 
 from pyfacebook import GraphAPI
 
+from agoras.common.executors import API, POLL, run_blocking
+from agoras.core.polling import PollSchedule, poll_until
+
 
 class InstagramAPIClient:
     """
@@ -129,33 +130,34 @@ class InstagramAPIClient:
         """
         Wait until an Instagram media container is ready to publish.
 
+        Checks start after one second and back off to ``poll_interval``; the
+        wait itself does not hold a worker thread.
+
         Args:
             container_id (str): Media container ID from create_media/create_carousel
             max_wait_time (int): Maximum wait time in seconds
-            poll_interval (float): Seconds between status checks
+            poll_interval (float): Longest interval between status checks
 
         Raises:
             Exception: If container fails, expires, or times out
         """
 
-        def _sync_wait():
-            start = time.time()
-            while True:
-                if time.time() - start > max_wait_time:
-                    raise Exception(f"Instagram media container {container_id} not ready after {max_wait_time} seconds")
-
-                response = self.get_object(object_id=container_id, fields="status_code,status")
-                status_code = response.get("status_code")
-
-                if status_code in ("FINISHED", "PUBLISHED"):
-                    return
-                if status_code in ("ERROR", "EXPIRED"):
-                    detail = response.get("status", status_code)
-                    raise Exception(f"Instagram media container {container_id} failed: {detail}")
-
-                time.sleep(poll_interval)
-
-        await asyncio.to_thread(_sync_wait)
+        async def _check_ready():
+            response = await run_blocking(POLL, self.get_object, object_id=container_id, fields="status_code,status")
+            status_code = response.get("status_code")
+
+            if status_code in ("FINISHED", "PUBLISHED"):
+                return True
+            if status_code in ("ERROR", "EXPIRED"):
+                detail = response.get("status", status_code)
+                raise Exception(f"Instagram media container {container_id} failed: {detail}")
+            return False
+
+        await poll_until(
+            _check_ready,
+            PollSchedule(initial=min(1.0, poll_interval), max_interval=poll_interval, timeout=max_wait_time),
+            timeout_message=f"Instagram media container {container_id} not ready after {max_wait_time} seconds",
+        )
 
     async def create_media(
         self,
@@ -204,7 +206,7 @@ class InstagramAPIClient:
             response = self.post_object(object_id=object_id, connection="media", data=data)
             return response["id"]
 
-        media_id = await asyncio.to_thread(_sync_create_media)
+        media_id = await run_blocking(API, _sync_create_media)
         await self.wait_for_media_container(media_id)
         return media_id
 
@@ -236,7 +238,7 @@ class InstagramAPIClient:
             response = self.post_object(object_id=object_id, connection="media", data=data)
             return response["id"]
 
-        carousel_id = await asyncio.to_thread(_sync_create_carousel)
+        carousel_id = await run_blocking(API, _sync_create_carousel)
         await self.wait_for_media_container(carousel_id)
         return carousel_id
 
@@ -264,7 +266,7 @@ class InstagramAPIClient:
             response = self.post_object(object_id=object_id, connection="media_publish", data=data)
             return response["id"]
 
-        return await asyncio.to_thread(_sync_publish_media)
+        return await run_blocking(API, _sync_publish_media)
 
     async def create_post(
         self,
@@ -354,7 +356,7 @@ class InstagramAPIClient:
 
             return self.get_object(object_id=f"{object_id}/media", fields=f"{query_fields}&limit={limit}")
 
-        return await asyncio.to_thread(_sync_get_user_media)
+        return await run_blocking(API, _sync_get_user_media)
 
     async def get_media_insights(self, media_id: str, metrics: List[str]) -> Dict[str, Any]:
         """
@@ -374,4 +376,4 @@ class InstagramAPIClient:
         def _sync_get_media_insights():
             return self.get_object(object_id=f"{media_id}/insights", fields=f"metric={','.join(metrics)}")
 
-        return await asyncio.to_thread(_sync_get_media_insights)
+        return await run_blocking(API, _sync_get_media_insights)
@@ -19,7 +19,9 @@
 
 import asyncio
 
+from agoras.core.concurrency import gather_bounded
 from agoras.core.interfaces import SocialNetwork
+from agoras.core.journal import CONTAINER, MEDIA, PUBLISHED, journal_step
 
 from .api import InstagramAPI
 
@@ -160,6 +162,15 @@ class Instagram(SocialNetwork):
         if self.api:
             await self.api.disconnect()
 
+    def _publish_destination(self):
+        """
+        Return where posts go, so the publish journal tells targets apart.
+
+        Returns:
+            dict: The Instagram account ID
+        """
+        return {"object_id": self.instagram_object_id}
+
     async def post(
         self,
         status_text,
@@ -189,7 +200,6 @@ class Instagram(SocialNetwork):
         if not self.instagram_object_id:
             raise Exception("Instagram object ID is required.")
 
-        attached_media = []
         source_media = list(
             filter(None, [status_image_url_1, status_image_url_2, status_image_url_3, status_image_url_4])
         )
@@ -198,43 +208,39 @@ class Instagram(SocialNetwork):
             raise Exception("Instagram requires at least one status image.")
 
         is_carousel_item = len(source_media) > 1
+        caption = f"{status_text} {status_link}"
+
+        async def create_media(image):
+            try:
+                return await self.api.create_media(
+                    self.instagram_object_id,
+                    image_url=image.url,
+                    caption=None if is_carousel_item else caption,
+                    is_carousel_item=is_carousel_item,
+                )
+            finally:
+                # Clean up temporary files
+                image.cleanup()
 
-        # Download and validate images using the Media system
-        if source_media:
+        async def create_containers():
+            # Download and validate images, then create media containers concurrently in order
             images = await self.download_images(source_media)
-            for image in images:
-                try:
-                    # Create media for each image
-                    media_id = await self.api.create_media(
-                        self.instagram_object_id, image_url=image.url, is_carousel_item=is_carousel_item
-                    )
-                    attached_media.append(media_id)
-                finally:
-                    # Clean up temporary files
-                    image.cleanup()
+            return await gather_bounded(create_media, images)
 
-        # Create carousel or single post
+        # Each stage is journaled, so a retry after a crash resumes from the last completed one
+        attached_media = await journal_step(MEDIA, create_containers)
+        if not attached_media:
+            raise Exception("No media created")
+
+        # A single image is published from its own container, which already carries the caption
         if is_carousel_item:
-            caption = f"{status_text} {status_link}"
-            creation_id = await self.api.create_carousel(self.instagram_object_id, attached_media, caption)
+            creation_id = await journal_step(
+                CONTAINER, self.api.create_carousel, self.instagram_object_id, attached_media, caption
+            )
         else:
-            # For single image, the caption needs to be set in create_media
-            # We need to recreate the media with caption for single posts
-            if attached_media:
-                # Remove the media without caption
-                media_id = attached_media[0]
-                # Create new media with caption for single posts
-                creation_id = await self.api.create_media(
-                    self.instagram_object_id,
-                    image_url=images[0].url,
-                    caption=f"{status_text} {status_link}",
-                    is_carousel_item=False,
-                )
-            else:
-                raise Exception("No media created")
+            creation_id = attached_media[0]
 
-        # Publish the media
-        post_id = await self.api.publish_media(self.instagram_object_id, creation_id)
+        post_id = await journal_step(PUBLISHED, self.api.publish_media, self.instagram_object_id, creation_id)
 
         self._output_status(post_id)
         return post_id
@@ -297,45 +303,40 @@ class Instagram(SocialNetwork):
 
         video_type = self.instagram_video_type or ""
 
-        # Download and validate video using the Media system
-        video = await self.download_video(video_url)
-
-        if not video.content or not video.file_type:
-            video.cleanup()
-            raise Exception("Failed to download or validate video")
-
-        from agoras.media.constraints import video_limits
-        from agoras.media.errors import MediaValidationError
-
-        allowed = video_limits("instagram").mime_types
-        if video.file_type.mime not in allowed:
-            video.cleanup()
-            raise MediaValidationError(
-                "instagram",
-                "video",
-                "mime_types",
-                video.file_type.mime,
-                sorted(allowed),
-            )
-
-        try:
-            media_type = _instagram_video_media_type(video_type)
-
-            # Create media for video
-            creation_id = await self.api.create_media(
-                self.instagram_object_id,
-                video_url=video_url,
-                caption=status_text,
-                is_carousel_item=False,
-                media_type=media_type,
-            )
+        async def create_container():
+            # Download and validate video using the Media system
+            video = await self.download_video(video_url)
+            try:
+                if not video.content or not video.file_type:
+                    raise Exception("Failed to download or validate video")
+
+                from agoras.media.constraints import video_limits
+                from agoras.media.errors import MediaValidationError
+
+                allowed = video_limits("instagram").mime_types
+                if video.file_type.mime not in allowed:
+                    raise MediaValidationError(
+                        "instagram",
+                        "video",
+                        "mime_types",
+                        video.file_type.mime,
+                        sorted(allowed),
+                    )
 
-            # Publish the video
-            post_id = await self.api.publish_media(self.instagram_object_id, creation_id)
+                return await self.api.create_media(
+                    self.instagram_object_id,
+                    video_url=video_url,
+                    caption=status_text,
+                    is_carousel_item=False,
+                    media_type=_instagram_video_media_type(video_type),
+                )
+            finally:
+                # Clean up using Media system
+                video.cleanup()
 
-        finally:
-            # Clean up using Media system
-            video.cleanup()
+        # A retry after a crash reuses the container instead of downloading and transcoding again
+        creation_id = await journal_step(CONTAINER, create_container)
+        post_id = await journal_step(PUBLISHED, self.api.publish_media, self.instagram_object_id, creation_id)
 
         self._output_status(post_id)
         return post_id
@@ -17,7 +17,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.platforms.linkedin.api module."""
 
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from agoras.core.api_base import BaseAPI
 from agoras.core.auth import raise_authentication_error_from_manager
@@ -33,6 +33,8 @@ class LinkedInAPI(BaseAPI):
     and all LinkedIn API operations including posts, likes, shares, and media uploads.
     """
 
+    platform = "linkedin"
+
     def __init__(self, user_id, client_id, client_secret, refresh_token=None, access_token=None):
         """
         Initialize LinkedIn API instance.
@@ -134,12 +136,12 @@ class LinkedInAPI(BaseAPI):
         self.client = None
         self._authenticated = False
 
-    async def upload_video(self, video_content: bytes) -> str:
+    async def upload_video(self, video_content: Union[bytes, str]) -> str:
         """
         Upload a video to LinkedIn.
 
         Args:
-            video_content (bytes): Raw video content
+            video_content (bytes or str): Raw video content, or the path of the video file
 
         Returns:
             str: Video URN for the uploaded video
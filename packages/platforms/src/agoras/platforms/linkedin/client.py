@@ -17,10 +17,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.platforms.linkedin.client module."""
 
-import asyncio
-import time
+import threading
 import urllib.parse
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import requests
 from linkedin_api.clients.restli.client import RestliClient
@@ -28,6 +27,19 @@ from linkedin_api.clients.restli.utils import api as apiutils
 from linkedin_api.clients.restli.utils.query_tunneling import maybe_apply_query_tunneling_requests_with_body
 from linkedin_api.common.constants import RESTLI_METHODS
 
+from agoras.common.executors import API, POLL, UPLOAD, run_blocking
+from agoras.core.concurrency import map_bounded
+from agoras.core.http import create_session
+from agoras.core.polling import PollSchedule, poll_until
+from agoras.core.retry import request_with_retry, retry_sync, status_of
+from agoras.core.upload import (
+    CHUNK_RETRY_POLICY,
+    CHUNK_TIMEOUT,
+    UPLOAD_CONCURRENCY,
+    UploadCheckpoint,
+    UploadSource,
+)
+
 
 class LinkedInAPIClient:
     """
@@ -47,6 +59,7 @@ class LinkedInAPIClient:
         self.access_token = access_token
         self.restli_client: Optional[RestliClient] = None
         self.api_version = "202503"
+        self.session = create_session()
         self._authenticated = False
 
     async def authenticate(self) -> bool:
@@ -67,6 +80,7 @@ class LinkedInAPIClient:
 
         try:
             self.restli_client = RestliClient()
+            self.restli_client.session = self.session
             self._authenticated = True
             return True
         except Exception as e:
@@ -76,6 +90,7 @@ class LinkedInAPIClient:
         """
         Disconnect and clean up client resources.
         """
+        self.session.close()
         self.restli_client = None
         self._authenticated = False
 
@@ -152,8 +167,13 @@ class LinkedInAPIClient:
                 raise Exception("Failed to get upload URL or media ID from LinkedIn")
 
             # Upload the image content
-            upload_response = requests.put(
-                upload_url, headers={"Authorization": f"Bearer {self.access_token}"}, data=image_content, timeout=30
+            upload_response = request_with_retry(
+                self.session,
+                "PUT",
+                upload_url,
+                headers={"Authorization": f"Bearer {self.access_token}"},
+                data=image_content,
+                timeout=30,
             )
 
             if upload_response.status_code != 201:
@@ -161,7 +181,7 @@ class LinkedInAPIClient:
 
             return media_id
 
-        return await asyncio.to_thread(_sync_upload)
+        return await run_blocking(UPLOAD, _sync_upload)
 
     @staticmethod
     def _etag_from_response(response: requests.Response) -> str:
@@ -172,15 +192,16 @@ class LinkedInAPIClient:
             raise Exception("Missing ETag from video upload response")
         return etag
 
-    async def upload_video(self, video_content: bytes, owner_urn: str) -> str:
+    async def upload_video(self, video_content: Union[bytes, str], owner_urn: str) -> str:
         """
         Upload a video to LinkedIn via the Videos API.
 
-        Initializes upload, sends byte chunks, finalizes, and waits until
-        the video status is AVAILABLE.
+        Initializes upload, sends the byte-range parts concurrently,
+        finalizes, and waits until the video status is AVAILABLE. Progress is checkpointed per part, so
+        retrying a failed upload of the same video only sends the missing parts.
 
         Args:
-            video_content (bytes): Raw video content
+            video_content (bytes or str): Raw video content, or the path of the video file
             owner_urn (str): LinkedIn owner URN (e.g., "urn:li:person:12345")
 
         Returns:
@@ -196,92 +217,150 @@ class LinkedInAPIClient:
             if not self.access_token:
                 raise Exception("No access token available")
 
-            init_request = self.restli_client.action(
-                resource_path="/videos",
-                action_name="initializeUpload",
-                action_params={
-                    "initializeUploadRequest": {
-                        "owner": owner_urn,
-                        "fileSizeBytes": len(video_content),
-                        "uploadCaptions": False,
-                        "uploadThumbnail": False,
-                    }
-                },
-                version_string=self.api_version,
-                access_token=self.access_token,
+            source = UploadSource(video_content)
+            checkpoint = UploadCheckpoint.for_upload("linkedin", source, owner_urn)
+            upload = checkpoint.load()
+
+            if upload.get("video"):
+                try:
+                    return self._complete_video_upload(source, upload, checkpoint)
+                except requests.HTTPError as error:
+                    if not 400 <= (status_of(error) or 0) < 500:
+                        raise
+                    # The saved upload URLs expired; start over with a new upload.
+                    checkpoint.clear()
+
+            upload = checkpoint.save(**self._initialize_video_upload(source.size, owner_urn))
+            return self._complete_video_upload(source, upload, checkpoint)
+
+        video_urn = await run_blocking(UPLOAD, _sync_upload)
+        await self._wait_for_video_available(video_urn)
+        return video_urn
+
+    def _initialize_video_upload(self, file_size: int, owner_urn: str) -> Dict[str, Any]:
+        """Register a video upload and return its URN, token and part instructions."""
+        init_request = self.restli_client.action(  # type: ignore[union-attr]
+            resource_path="/videos",
+            action_name="initializeUpload",
+            action_params={
+                "initializeUploadRequest": {
+                    "owner": owner_urn,
+                    "fileSizeBytes": file_size,
+                    "uploadCaptions": False,
+                    "uploadThumbnail": False,
+                }
+            },
+            version_string=self.api_version,
+            access_token=self.access_token,
+        )
+
+        init_value = init_request.response.json().get("value", {})
+        video_urn = init_value.get("video", "")
+        instructions = init_value.get("uploadInstructions", [])
+
+        if not video_urn or not instructions:
+            raise Exception("Failed to initialize video upload with LinkedIn")
+
+        return {
+            "video": video_urn,
+            "uploadToken": init_value.get("uploadToken", ""),
+            "instructions": instructions,
+            "parts": {},
+        }
+
+    def _complete_video_upload(self, source: UploadSource, upload: Dict[str, Any], checkpoint: UploadCheckpoint) -> str:
+        """Upload the parts not yet acknowledged concurrently, then finalize the video."""
+        instructions = upload["instructions"]
+        parts = dict(upload.get("parts") or {})
+        pending = [(index, instruction) for index, instruction in enumerate(instructions) if str(index) not in parts]
+        if any(not instruction.get("uploadUrl") for _, instruction in pending):
+            raise Exception("Missing upload URL in LinkedIn video instructions")
+
+        lock = threading.Lock()
+
+        def _upload_part(item):
+            index, instruction = item
+            first_byte = instruction.get("firstByte", 0)
+            last_byte = instruction.get("lastByte", source.size - 1)
+
+            # Each worker reads only its own byte range, so at most
+            # UPLOAD_CONCURRENCY parts are held in memory at once.
+            chunk = source.read(first_byte, last_byte - first_byte + 1)
+            etag = retry_sync(
+                self._upload_video_part, instruction["uploadUrl"], chunk, idempotent=True, policy=CHUNK_RETRY_POLICY
             )
+            with lock:
+                parts[str(index)] = etag
+                checkpoint.save(parts=dict(parts))
+
+        # LinkedIn accepts parts in any order; ETags are finalized in instruction order below.
+        map_bounded(_upload_part, pending, limit=UPLOAD_CONCURRENCY)
+
+        finalize_response = self._post_restli_action(
+            resource_path="/videos",
+            action_name="finalizeUpload",
+            action_params={
+                "finalizeUploadRequest": {
+                    "video": upload["video"],
+                    "uploadToken": upload["uploadToken"],
+                    "uploadedPartIds": [parts[str(index)] for index in range(len(instructions))],
+                }
+            },
+        )
 
-            init_value = init_request.response.json().get("value", {})
-            video_urn = init_value.get("video", "")
-            upload_token = init_value.get("uploadToken", "")
-            instructions = init_value.get("uploadInstructions", [])
-
-            if not video_urn or not instructions:
-                raise Exception("Failed to initialize video upload with LinkedIn")
-
-            uploaded_part_ids = []
-            for instruction in instructions:
-                first_byte = instruction.get("firstByte", 0)
-                last_byte = instruction.get("lastByte", len(video_content) - 1)
-                upload_url = instruction.get("uploadUrl", "")
-                if not upload_url:
-                    raise Exception("Missing upload URL in LinkedIn video instructions")
-
-                chunk = video_content[first_byte : last_byte + 1]
-                upload_response = requests.put(
-                    upload_url,
-                    headers={"Content-Type": "application/octet-stream"},
-                    data=chunk,
-                    timeout=30,
-                )
-
-                if upload_response.status_code not in (200, 201):
-                    raise Exception(f"Failed to upload video part: {upload_response.status_code}")
-
-                uploaded_part_ids.append(self._etag_from_response(upload_response))
-
-            finalize_response = self._post_restli_action(
-                resource_path="/videos",
-                action_name="finalizeUpload",
-                action_params={
-                    "finalizeUploadRequest": {
-                        "video": video_urn,
-                        "uploadToken": upload_token,
-                        "uploadedPartIds": uploaded_part_ids,
-                    }
-                },
+        if finalize_response.status_code not in (200, 201, 204):
+            detail = finalize_response.text.strip() or finalize_response.reason
+            if 400 <= finalize_response.status_code < 500:
+                # LinkedIn rejected the recorded parts; the next attempt must start a new upload.
+                checkpoint.clear()
+            raise requests.HTTPError(
+                f"Failed to finalize video upload: {finalize_response.status_code} ({detail})",
+                response=finalize_response,
             )
 
-            if finalize_response.status_code not in (200, 201, 204):
-                detail = finalize_response.text.strip() or finalize_response.reason
-                raise Exception(f"Failed to finalize video upload: {finalize_response.status_code} ({detail})")
+        checkpoint.clear()
+        return upload["video"]
 
-            self._wait_for_video_available(video_urn)
-            return video_urn
+    def _upload_video_part(self, upload_url: str, chunk: bytes) -> str:
+        """PUT one video part and return its ETag."""
+        upload_response = self.session.put(
+            upload_url,
+            headers={"Content-Type": "application/octet-stream"},
+            data=chunk,
+            timeout=CHUNK_TIMEOUT,
+        )
+
+        if upload_response.status_code not in (200, 201):
+            raise requests.HTTPError(
+                f"Failed to upload video part: {upload_response.status_code}", response=upload_response
+            )
 
-        return await asyncio.to_thread(_sync_upload)
+        return self._etag_from_response(upload_response)
 
-    def _wait_for_video_available(self, video_urn: str, timeout_s: int = 120) -> None:
+    async def _wait_for_video_available(self, video_urn: str, timeout_s: int = 120) -> None:
         """Poll LinkedIn until the uploaded video is AVAILABLE."""
         if not self.restli_client:
             raise Exception("LinkedIn RestliClient not initialized")
 
         encoded_urn = urllib.parse.quote(video_urn, safe="")
-        deadline = time.monotonic() + timeout_s
 
-        while time.monotonic() < deadline:
+        def _sync_status():
             request = self.restli_client.get(
                 resource_path=f"/videos/{encoded_urn}", version_string=self.api_version, access_token=self.access_token
             )
-            status = request.response.json().get("status", "")
-            if status == "AVAILABLE":
-                return
+            return request.response.json().get("status", "")
+
+        async def _check_available():
+            status = await run_blocking(POLL, _sync_status)
             if status == "PROCESSING_FAILED":
                 raise Exception("LinkedIn video processing failed")
+            return status == "AVAILABLE"
 
-            time.sleep(2)
-
-        raise Exception("Timed out waiting for LinkedIn video to become available")
+        await poll_until(
+            _check_available,
+            PollSchedule(initial=1.0, max_interval=10.0, timeout=timeout_s),
+            timeout_message="Timed out waiting for LinkedIn video to become available",
+        )
 
     @staticmethod
     def _build_post_content(
@@ -391,7 +470,7 @@ class LinkedInAPIClient:
             else:
                 raise Exception("Invalid response from LinkedIn API")
 
-        return await asyncio.to_thread(_sync_create_post)
+        return await run_blocking(API, _sync_create_post)
 
     async def like_post(self, post_id: str, actor_urn: str) -> str:
         """
@@ -452,7 +531,7 @@ class LinkedInAPIClient:
                     raise Exception(f"Unable to like post {post_id} - Status: {request.status_code}")
             return post_id
 
-        return await asyncio.to_thread(_sync_like)
+        return await run_blocking(API, _sync_like)
 
     async def share_post(self, post_id: str, author_urn: str, commentary: str = "") -> str:
         """
@@ -502,7 +581,7 @@ class LinkedInAPIClient:
             else:
                 raise Exception("Invalid response from LinkedIn API")
 
-        return await asyncio.to_thread(_sync_share)
+        return await run_blocking(API, _sync_share)
 
     async def delete_post(self, post_id: str) -> str:
         """
@@ -535,7 +614,7 @@ class LinkedInAPIClient:
                 raise Exception(f"Unable to delete post {post_id}")
             return post_id
 
-        return await asyncio.to_thread(_sync_delete)
+        return await run_blocking(API, _sync_delete)
 
     async def get_user_info(self) -> Dict[str, Any]:
         """
@@ -563,4 +642,4 @@ class LinkedInAPIClient:
 
             return result
 
-        return await asyncio.to_thread(_sync_get_user_info)
+        return await run_blocking(API, _sync_get_user_info)
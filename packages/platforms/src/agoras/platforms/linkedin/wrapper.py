@@ -20,8 +20,10 @@
 import asyncio
 import sys
 
+from agoras.common.executors import API, run_blocking
 from agoras.common.utils import parse_metatags
 from agoras.core.interfaces import SocialNetwork
+from agoras.core.journal import MEDIA, PUBLISHED, journal_step
 
 from .api import LinkedInAPI
 
@@ -146,6 +148,15 @@ class LinkedIn(SocialNetwork):
         if self.api:
             await self.api.disconnect()
 
+    def _publish_destination(self):
+        """
+        Return where posts go, so the publish journal tells targets apart.
+
+        Returns:
+            dict: The member or organization ID
+        """
+        return {"object_id": self.linkedin_object_id}
+
     async def post(
         self,
         status_text,
@@ -185,7 +196,7 @@ class LinkedIn(SocialNetwork):
 
         # Parse link metadata if link is provided
         if status_link:
-            scraped_data = parse_metatags(status_link)
+            scraped_data = await run_blocking(API, parse_metatags, status_link)
             status_link_title = scraped_data.get("title", "")
             status_link_description = scraped_data.get("description", "")
             status_link_image = scraped_data.get("image", "")
@@ -305,37 +316,37 @@ class LinkedIn(SocialNetwork):
         if not video_url:
             raise Exception("LinkedIn video URL is required.")
 
-        video = await self.download_video(video_url)
-
-        if not video.content or not video.file_type:
-            video.cleanup()
-            raise Exception("Failed to download or validate video")
-
-        from agoras.media.constraints import video_limits
-        from agoras.media.errors import MediaValidationError
-
-        allowed = video_limits("linkedin").mime_types
-        if video.file_type.mime not in allowed:
-            video.cleanup()
-            raise MediaValidationError(
-                "linkedin",
-                "video",
-                "mime_types",
-                video.file_type.mime,
-                sorted(allowed),
-            )
-
-        try:
-            video_urn = await self.api.upload_video(video.content)
-            post_id = await self.api.post(
-                text=status_text,
-                video_id=video_urn,
-                video_title=video_title or None,
-            )
-            self._output_status(post_id)
-            return post_id
-        finally:
-            video.cleanup()
+        async def upload_video():
+            video = await self.download_video(video_url)
+            try:
+                if not video.content or not video.file_type:
+                    raise Exception("Failed to download or validate video")
+
+                from agoras.media.constraints import video_limits
+                from agoras.media.errors import MediaValidationError
+
+                allowed = video_limits("linkedin").mime_types
+                if video.file_type.mime not in allowed:
+                    raise MediaValidationError(
+                        "linkedin",
+                        "video",
+                        "mime_types",
+                        video.file_type.mime,
+                        sorted(allowed),
+                    )
+
+                # Parts are read from the downloaded file by byte range when it exists.
+                return await self.api.upload_video(video.temp_file or video.content)
+            finally:
+                video.cleanup()
+
+        # A retry after a crash posts the uploaded video instead of downloading and uploading it again
+        video_urn = await journal_step(MEDIA, upload_video)
+        post_id = await journal_step(
+            PUBLISHED, self.api.post, text=status_text, video_id=video_urn, video_title=video_title or None
+        )
+        self._output_status(post_id)
+        return post_id
 
     # The base class already provides last_from_feed, random_from_feed, and schedule methods.
     # We only need to override the action handlers for LinkedIn-specific parameter names.
@@ -17,12 +17,13 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.platforms.telegram.api module."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from agoras.core.api_base import BaseAPI
 from agoras.core.auth import raise_authentication_error_from_manager
 
 from .auth import TelegramAuthManager
+from .client import telegram_max_upload
 
 
 class TelegramAPI(BaseAPI):
@@ -33,6 +34,9 @@ class TelegramAPI(BaseAPI):
     media posting, and all Telegram Bot API operations.
     """
 
+    platform = "telegram"
+    destination_credentials = ("chat_id",)
+
     def __init__(self, bot_token: str, chat_id: Optional[str] = None):
         """
         Initialize Telegram API instance.
@@ -140,7 +144,7 @@ class TelegramAPI(BaseAPI):
         if not self.client:
             raise Exception("Telegram client not available")
 
-        await self._rate_limit_check("send_message", 1.0)
+        await self._rate_limit_check("send_message", 1.0, destination=chat_id)
 
         try:
             response = await self.client.send_message(chat_id=chat_id, text=text, parse_mode=parse_mode)
@@ -156,6 +160,7 @@ class TelegramAPI(BaseAPI):
         photo_content: Optional[bytes] = None,
         caption: Optional[str] = None,
         parse_mode: Optional[str] = None,
+        digest: Optional[str] = None,
     ) -> str:
         """
         Send photo with Media system integration.
@@ -166,6 +171,7 @@ class TelegramAPI(BaseAPI):
             photo_content (bytes, optional): Direct bytes content (bypasses Media system)
             caption (str, optional): Photo caption
             parse_mode (str, optional): Parse mode for caption
+            digest (str, optional): Content digest of ``photo_content``, if already known
 
         Returns:
             str: Message ID
@@ -179,7 +185,7 @@ class TelegramAPI(BaseAPI):
         if not self.client:
             raise Exception("Telegram client not available")
 
-        await self._rate_limit_check("send_photo", 1.0)
+        await self._rate_limit_check("send_photo", 1.0, destination=chat_id)
 
         # If URL provided, download using Media system
         if photo_url:
@@ -207,7 +213,7 @@ class TelegramAPI(BaseAPI):
 
         try:
             response = await self.client.send_photo(
-                chat_id=chat_id, photo=photo_content, caption=caption, parse_mode=parse_mode
+                chat_id=chat_id, photo=photo_content, caption=caption, parse_mode=parse_mode, digest=digest
             )
             return str(response["message_id"])
         except Exception as e:
@@ -218,9 +224,10 @@ class TelegramAPI(BaseAPI):
         self,
         chat_id: str,
         video_url: Optional[str] = None,
-        video_content: Optional[bytes] = None,
+        video_content: Optional[Union[bytes, str]] = None,
         caption: Optional[str] = None,
         parse_mode: Optional[str] = None,
+        digest: Optional[str] = None,
     ) -> str:
         """
         Send video with Media system integration.
@@ -228,9 +235,10 @@ class TelegramAPI(BaseAPI):
         Args:
             chat_id (str): Target chat ID (user, group, or channel)
             video_url (str, optional): URL to download video from (uses Media system)
-            video_content (bytes, optional): Direct bytes content (bypasses Media system)
+            video_content (bytes or str, optional): Video bytes or local file path (bypasses Media system)
             caption (str, optional): Video caption
             parse_mode (str, optional): Parse mode for caption
+            digest (str, optional): Content digest of ``video_content``, if already known
 
         Returns:
             str: Message ID
@@ -244,28 +252,33 @@ class TelegramAPI(BaseAPI):
         if not self.client:
             raise Exception("Telegram client not available")
 
-        await self._rate_limit_check("send_video", 1.0)
+        await self._rate_limit_check("send_video", 1.0, destination=chat_id)
 
         # If URL provided, download using Media system
         if video_url:
             from agoras.media import MediaFactory
 
-            video = MediaFactory.create_video(video_url, platform="telegram")
+            video = MediaFactory.create_video(video_url, platform="telegram", max_size=telegram_max_upload())
             try:
                 await video.download()
-                if video.content and video.file_type:
-                    video_content = video.content
-                else:
+                if not video.content or not video.file_type:
                     raise Exception(f"Failed to validate video: {video.url}")
+                # Send from the downloaded file while it still exists.
+                return await self._send_video(chat_id, video.temp_file or video.content, caption, parse_mode)
             finally:
                 video.cleanup()
 
         if not video_content:
             raise Exception("No video content available")
 
+        return await self._send_video(chat_id, video_content, caption, parse_mode, digest)
+
+    async def _send_video(
+        self, chat_id: str, video, caption: Optional[str], parse_mode: Optional[str], digest: Optional[str] = None
+    ) -> str:
         try:
             response = await self.client.send_video(
-                chat_id=chat_id, video=video_content, caption=caption, parse_mode=parse_mode
+                chat_id=chat_id, video=video, caption=caption, parse_mode=parse_mode, digest=digest
             )
             return str(response["message_id"])
         except Exception as e:
@@ -292,7 +305,7 @@ class TelegramAPI(BaseAPI):
         if not self.client:
             raise Exception("Telegram client not available")
 
-        await self._rate_limit_check("delete_message", 0.5)
+        await self._rate_limit_check("delete_message", 0.5, destination=chat_id)
 
         try:
             await self.client.delete_message(chat_id=chat_id, message_id=int(message_id))
@@ -385,6 +398,7 @@ class TelegramAPI(BaseAPI):
         Args:
             chat_id (str): Target chat ID (user, group, or channel)
             media (List[Dict]): List of media items, each with 'type' and 'media' keys
+                and an optional 'digest' of the content
 
         Returns:
             List[str]: List of message IDs for each media item
@@ -398,7 +412,7 @@ class TelegramAPI(BaseAPI):
         if not self.client:
             raise Exception("Telegram client not available")
 
-        await self._rate_limit_check("send_media_group", 1.0)
+        await self._rate_limit_check("send_media_group", 1.0, destination=chat_id)
 
         try:
             response = await self.client.send_media_group(chat_id=chat_id, media=media)
@@ -26,7 +26,7 @@ from telegram.error import TelegramError
 
 from agoras.core.auth import BaseAuthManager
 
-from .client import TelegramAPIClient
+from .client import TelegramAPIClient, telegram_bot_options
 
 
 def normalize_chat_id(chat_id: Optional[str]) -> Optional[str]:
@@ -165,7 +165,7 @@ class TelegramAuthManager(BaseAuthManager):
             raise Exception("Telegram chat ID is required.")
 
         try:
-            bot = Bot(token=self._require_bot_token())
+            bot = Bot(token=self._require_bot_token(), **telegram_bot_options())
             await bot.get_chat(self.chat_id)
         except TelegramError as e:
             error_text = str(e)
@@ -188,7 +188,7 @@ class TelegramAuthManager(BaseAuthManager):
             bool: True if token is valid, False otherwise
         """
         try:
-            bot = Bot(token=self._require_bot_token())
+            bot = Bot(token=self._require_bot_token(), **telegram_bot_options())
             # get_me() is an async coroutine, so we need to await it
             bot_info = await bot.get_me()
             # Store bot info for later use
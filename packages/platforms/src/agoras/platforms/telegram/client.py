@@ -17,14 +17,20 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.platforms.telegram.client module."""
 
+import functools
 import os
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
 
 from telegram import Bot
 from telegram.constants import ParseMode
-from telegram.error import TelegramError, TimedOut
+from telegram.error import BadRequest, TelegramError, TimedOut
 from telegram.request import HTTPXRequest
 
+from agoras.common.executors import CPU, run_blocking
+from agoras.core.mediacache import MediaReferenceCache, account_key, content_digest
+
 # PTB defaults (5s read, 20s media write) are too low for multi-MB uploads.
 TELEGRAM_CONNECT_TIMEOUT = 30.0
 TELEGRAM_READ_TIMEOUT = 60.0
@@ -32,19 +38,146 @@ TELEGRAM_WRITE_TIMEOUT = 60.0
 TELEGRAM_POOL_TIMEOUT = 30.0
 TELEGRAM_MEDIA_WRITE_TIMEOUT = 300.0
 
+# Slowest uplink a video upload is expected to sustain; larger files get
+# proportionally longer write timeouts instead of one fixed limit.
+TELEGRAM_MIN_UPLOAD_RATE = 256 * 1024
+
+# Upload cap of a self-hosted Bot API server started with --local
+# (the cloud Bot API accepts 50 MB).
+TELEGRAM_LOCAL_MAX_UPLOAD = 2000 * 1024 * 1024
+
+# Fragments of the BadRequest messages for an unknown, expired or mismatched
+# file_id; other errors (caption too long, ...) would fail on upload too.
+FILE_ID_ERRORS = ("file identifier", "file_id", "file reference", "type of file mismatch")
+
+
+def telegram_api_url() -> Optional[str]:
+    """
+    Return the self-hosted Bot API server configured in ``TELEGRAM_API_URL``.
+
+    Returns:
+        str or None: Server root such as ``http://localhost:8081``, or None for the cloud Bot API
+    """
+    url = os.environ.get("TELEGRAM_API_URL", "").strip().rstrip("/")
+    return url or None
+
+
+def telegram_max_upload() -> Optional[int]:
+    """
+    Return the upload cap to enforce instead of the cloud Bot API limits.
+
+    Returns:
+        int or None: :data:`TELEGRAM_LOCAL_MAX_UPLOAD` with a local server, None otherwise
+    """
+    return TELEGRAM_LOCAL_MAX_UPLOAD if telegram_api_url() else None
+
+
+def media_write_timeout(size: Optional[int]) -> float:
+    """
+    Return a write timeout long enough to upload ``size`` bytes.
+
+    Args:
+        size (int, optional): Upload size in bytes
+
+    Returns:
+        float: ``TELEGRAM_MEDIA_WRITE_TIMEOUT`` (or its env override), raised for
+        files that need longer at :data:`TELEGRAM_MIN_UPLOAD_RATE`
+    """
+    minimum = float(os.environ.get("TELEGRAM_MEDIA_WRITE_TIMEOUT", TELEGRAM_MEDIA_WRITE_TIMEOUT))
+    if not size:
+        return minimum
+    return max(minimum, TELEGRAM_CONNECT_TIMEOUT + size / TELEGRAM_MIN_UPLOAD_RATE)
+
 
 def build_telegram_request() -> HTTPXRequest:
     """Build an HTTPX request client with timeouts suited to media uploads."""
-    media_write_timeout = float(os.environ.get("TELEGRAM_MEDIA_WRITE_TIMEOUT", TELEGRAM_MEDIA_WRITE_TIMEOUT))
     return HTTPXRequest(
         connect_timeout=TELEGRAM_CONNECT_TIMEOUT,
         read_timeout=TELEGRAM_READ_TIMEOUT,
         write_timeout=TELEGRAM_WRITE_TIMEOUT,
         pool_timeout=TELEGRAM_POOL_TIMEOUT,
-        media_write_timeout=media_write_timeout,
+        media_write_timeout=media_write_timeout(None),
     )
 
 
+def telegram_bot_options() -> Dict[str, Any]:
+    """
+    Return ``Bot`` keyword arguments for the server in ``TELEGRAM_API_URL``.
+
+    A self-hosted server runs in local mode: files on this machine are sent
+    as ``file://`` paths the server reads itself, so no bytes are uploaded.
+
+    Returns:
+        dict: ``base_url``, ``base_file_url`` and ``local_mode``, or nothing for the cloud Bot API
+    """
+    base_url = telegram_api_url()
+    if not base_url:
+        return {}
+    return {"base_url": f"{base_url}/bot", "base_file_url": f"{base_url}/file/bot", "local_mode": True}
+
+
+def _file_path(media) -> Optional[Path]:
+    if isinstance(media, str) and media.startswith("file://"):
+        return Path(unquote(urlparse(media).path))
+    if isinstance(media, (str, Path)):
+        try:
+            path = Path(media)
+            return path if path.is_file() else None
+        except (OSError, ValueError):
+            return None
+    return None
+
+
+def _media_input(media, local_mode: bool) -> Tuple[Any, Optional[int]]:
+    """Return what to pass to PTB for ``media`` and its size in bytes, if known."""
+    if isinstance(media, (bytes, bytearray)):
+        return media, len(media)
+    path = _file_path(media)
+    if path is None:
+        # file_id or URL: Telegram fetches it, nothing is uploaded.
+        return media, None
+    size = path.stat().st_size if path.is_file() else None
+    # A local server reads the file itself from the file:// URI; the cloud
+    # API gets the file contents in the request body.
+    return (path.absolute().as_uri() if local_mode else path), size
+
+
+def _sent_file_id(message, field: str) -> Optional[str]:
+    media = getattr(message, field, None)
+    if isinstance(media, (list, tuple)):
+        # Photo sizes, largest last
+        media = media[-1] if media else None
+    return getattr(media, "file_id", None)
+
+
+def _is_file_id_error(error: BadRequest) -> bool:
+    """Return whether Telegram rejected a cached ``file_id`` rather than the rest of the request."""
+    message = str(error).lower()
+    return any(fragment in message for fragment in FILE_ID_ERRORS)
+
+
+def _input_media(media: List[Dict[str, Any]], file_ids: List[Optional[str]]) -> List[Any]:
+    """Convert media dicts to InputMedia objects, using cached file_ids where known."""
+    from telegram import InputMediaPhoto, InputMediaVideo
+
+    input_media = []
+    for item, file_id in zip(media, file_ids):
+        media_type = item.get("type", "photo")
+        media_content = file_id or item.get("media")
+        caption = item.get("caption")
+
+        if media_content is None:
+            raise Exception("Media content is required for media group items")
+
+        if media_type == "photo":
+            input_media.append(InputMediaPhoto(media=media_content, caption=caption))
+        elif media_type == "video":
+            input_media.append(InputMediaVideo(media=media_content, caption=caption))
+        else:
+            raise Exception(f"Unsupported media type: {media_type}")
+    return input_media
+
+
 class TelegramAPIClient:
     """
     Telegram API client for making requests to Telegram Bot API.
@@ -60,8 +193,34 @@ class TelegramAPIClient:
             bot_token (str): Telegram bot token from @BotFather
         """
         self.bot_token = bot_token
-        self.bot = Bot(token=bot_token, request=build_telegram_request())
+        self.bot = Bot(token=bot_token, request=build_telegram_request(), **telegram_bot_options())
         self.default_parse_mode = ParseMode.HTML
+        # file_ids are only valid for the bot that received the file.
+        self.media_cache = MediaReferenceCache("telegram", account_key(bot_token or ""))
+
+    async def _send_cached(self, send: Callable[..., Awaitable[Any]], field: str, digest: Optional[str]):
+        """
+        Send previously uploaded content by its cached ``file_id``.
+
+        Args:
+            send (callable): Bot method with every argument but the media bound
+            field (str): Name of the media argument (``photo``, ``video``)
+            digest (str, optional): Content digest of the media
+
+        Returns:
+            Message or None: None when nothing is cached or Telegram rejected the file_id
+        """
+        file_id = self.media_cache.get(digest)
+        if not file_id:
+            return None
+        try:
+            return await send(**{field: file_id})
+        except BadRequest as e:
+            if not _is_file_id_error(e):
+                raise
+            # Unknown or expired file_id: upload the content again.
+            self.media_cache.forget(digest)
+            return None
 
     async def get_me(self) -> Dict[str, Any]:
         """
@@ -124,7 +283,12 @@ class TelegramAPIClient:
             raise Exception(f"Unexpected error sending message: {e}") from e
 
     async def send_photo(
-        self, chat_id: str, photo, caption: Optional[str] = None, parse_mode: Optional[str] = None
+        self,
+        chat_id: str,
+        photo,
+        caption: Optional[str] = None,
+        parse_mode: Optional[str] = None,
+        digest: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Send photo with optional caption.
@@ -134,6 +298,7 @@ class TelegramAPIClient:
             photo: Photo to send (file-like object, bytes, file path, or URL)
             caption (str, optional): Photo caption (up to 1024 characters)
             parse_mode (str, optional): Parse mode for caption (HTML, Markdown, MarkdownV2)
+            digest (str, optional): Content digest of the photo, if already known
 
         Returns:
             dict: Message data including message_id
@@ -145,9 +310,15 @@ class TelegramAPIClient:
             raise Exception("No bot token available")
 
         try:
-            message = await self.bot.send_photo(
-                chat_id=chat_id, photo=photo, caption=caption, parse_mode=parse_mode or self.default_parse_mode
+            send = functools.partial(
+                self.bot.send_photo, chat_id=chat_id, caption=caption, parse_mode=parse_mode or self.default_parse_mode
             )
+            if digest is None:
+                digest = await run_blocking(CPU, content_digest, _file_path(photo) or photo)
+            message = await self._send_cached(send, "photo", digest)
+            if message is None:
+                message = await send(photo=photo)
+                self.media_cache.put(digest, _sent_file_id(message, "photo"))
             return message.to_dict()
         except TelegramError as e:
             error_text = str(e)
@@ -170,18 +341,20 @@ class TelegramAPIClient:
         duration: Optional[int] = None,
         width: Optional[int] = None,
         height: Optional[int] = None,
+        digest: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Send video with optional caption.
 
         Args:
             chat_id (str): Target chat ID (user, group, or channel)
-            video: Video to send (file-like object, bytes, file path, or URL)
+            video: Video to send (bytes, file path, ``file://`` URI, file_id or URL)
             caption (str, optional): Video caption (up to 1024 characters)
             parse_mode (str, optional): Parse mode for caption (HTML, Markdown, MarkdownV2)
             duration (int, optional): Video duration in seconds
             width (int, optional): Video width
             height (int, optional): Video height
+            digest (str, optional): Content digest of the video, if already known
 
         Returns:
             dict: Message data including message_id
@@ -193,15 +366,21 @@ class TelegramAPIClient:
             raise Exception("No bot token available")
 
         try:
-            message = await self.bot.send_video(
+            send = functools.partial(
+                self.bot.send_video,
                 chat_id=chat_id,
-                video=video,
                 caption=caption,
                 parse_mode=parse_mode or self.default_parse_mode,
                 duration=duration,
                 width=width,
                 height=height,
             )
+            if digest is None:
+                digest = await run_blocking(CPU, content_digest, _file_path(video) or video)
+            message = await self._send_cached(send, "video", digest)
+            if message is None:
+                message = await self._upload_video(send, video)
+                self.media_cache.put(digest, _sent_file_id(message, "video"))
             return message.to_dict()
         except TimedOut as e:
             raise Exception(
@@ -221,6 +400,17 @@ class TelegramAPIClient:
         except Exception as e:
             raise Exception(f"Unexpected error sending video: {e}") from e
 
+    async def _upload_video(self, send: Callable[..., Awaitable[Any]], video):
+        local_mode = getattr(self.bot, "local_mode", False) is True
+        video, size = _media_input(video, local_mode)
+        timeouts = {}
+        if size:
+            timeouts["write_timeout"] = media_write_timeout(size)
+            if local_mode:
+                # The local server answers only after relaying the file to Telegram.
+                timeouts["read_timeout"] = timeouts["write_timeout"]
+        return await send(video=video, **timeouts)
+
     async def delete_message(self, chat_id: str, message_id: int) -> bool:
         """
         Delete a message.
@@ -252,6 +442,7 @@ class TelegramAPIClient:
         Args:
             chat_id (str): Target chat ID (user, group, or channel)
             media (List[Dict]): List of media items, each with 'type' and 'media' keys
+                and an optional 'digest' of the content, if already known
                 Example: [
                     {'type': 'photo', 'media': photo_bytes, 'caption': 'First image'},
                     {'type': 'photo', 'media': photo_bytes2}
@@ -266,28 +457,16 @@ class TelegramAPIClient:
         if not self.bot_token:
             raise Exception("No bot token available")
 
-        from telegram import InputMediaPhoto, InputMediaVideo
-
         try:
-            # Convert media dicts to InputMedia objects
-            input_media = []
-            for item in media:
-                media_type = item.get("type", "photo")
-                media_content = item.get("media")
-                caption = item.get("caption")
-
-                if media_content is None:
-                    raise Exception("Media content is required for media group items")
-
-                if media_type == "photo":
-                    input_media.append(InputMediaPhoto(media=media_content, caption=caption))
-                elif media_type == "video":
-                    input_media.append(InputMediaVideo(media=media_content, caption=caption))
-                else:
-                    raise Exception(f"Unsupported media type: {media_type}")
-
-            # Send media group (all items must be same type: all photos or all videos)
-            messages = await self.bot.send_media_group(chat_id=chat_id, media=input_media)
+            digests = [
+                item["digest"] if item.get("digest") else await run_blocking(CPU, content_digest, item.get("media"))
+                for item in media
+            ]
+            messages, file_ids = await self._send_media_group_cached(chat_id, media, digests)
+
+            for item, digest, file_id, message in zip(media, digests, file_ids, messages):
+                if not file_id:
+                    self.media_cache.put(digest, _sent_file_id(message, item.get("type", "photo")))
 
             # Return list of message dicts
             return [msg.to_dict() for msg in messages]
@@ -295,3 +474,30 @@ class TelegramAPIClient:
             raise Exception(f"Failed to send media group: {e}") from e
         except Exception as e:
             raise Exception(f"Unexpected error sending media group: {e}") from e
+
+    async def _send_media_group_cached(
+        self, chat_id: str, media: List[Dict[str, Any]], digests: List[Optional[str]]
+    ) -> Tuple[List[Any], List[Optional[str]]]:
+        """
+        Send an album using cached file_ids where known.
+
+        Args:
+            chat_id (str): Target chat ID
+            media (List[Dict]): Media items as given to :meth:`send_media_group`
+            digests (List[str]): Content digest of each item
+
+        Returns:
+            tuple: Sent messages and the ``file_id`` used for each item (None if uploaded)
+        """
+        file_ids = [self.media_cache.get(digest) for digest in digests]
+        try:
+            return await self.bot.send_media_group(chat_id=chat_id, media=_input_media(media, file_ids)), file_ids
+        except BadRequest as e:
+            if not any(file_ids) or not _is_file_id_error(e):
+                raise
+        # A cached file_id is no longer valid: upload every item again.
+        for digest, file_id in zip(digests, file_ids):
+            if file_id:
+                self.media_cache.forget(digest)
+        file_ids = [None] * len(media)
+        return await self.bot.send_media_group(chat_id=chat_id, media=_input_media(media, file_ids)), file_ids
@@ -18,12 +18,17 @@
 """agoras.platforms.telegram.wrapper module."""
 
 import asyncio
-from typing import List
+import json
+from typing import Any, Dict, Iterable, List, Optional
 
+from agoras.common.executors import CPU, run_blocking
+from agoras.core.broadcast import DEFAULT_CONCURRENCY, broadcast, split_destinations
 from agoras.core.interfaces import SocialNetwork
+from agoras.core.mediacache import content_digest
 
 from .api import TelegramAPI
 from .auth import normalize_chat_id
+from .client import telegram_max_upload
 
 
 class Telegram(SocialNetwork):
@@ -42,6 +47,7 @@ class Telegram(SocialNetwork):
             **kwargs: Configuration parameters including:
                 - telegram_bot_token: Telegram bot token from @BotFather
                 - telegram_chat_id: Target chat ID (user, group, or channel)
+                - telegram_chat_ids: Comma-separated chat IDs for the broadcast action
                 - telegram_parse_mode: Message parse mode (HTML, Markdown, MarkdownV2)
                 - telegram_message_id: Message ID for delete action
                 - telegram_reply_to_message_id: Message ID to reply to
@@ -50,6 +56,7 @@ class Telegram(SocialNetwork):
         # Platform-specific configuration attributes
         self.telegram_bot_token = None
         self.telegram_chat_id = None
+        self.telegram_chat_ids: List[str] = []
         self.telegram_parse_mode = None
         # Action-specific attributes
         self.telegram_message_id = None
@@ -72,6 +79,10 @@ class Telegram(SocialNetwork):
         # Get configuration values
         self.telegram_bot_token = self._get_config_value("telegram_bot_token", "TELEGRAM_BOT_TOKEN")
         self.telegram_chat_id = normalize_chat_id(self._get_config_value("telegram_chat_id", "TELEGRAM_CHAT_ID"))
+        self.telegram_chat_ids = [
+            normalize_chat_id(chat_id)
+            for chat_id in split_destinations(self._get_config_value("telegram_chat_ids", "TELEGRAM_CHAT_IDS"))
+        ]
         self.telegram_parse_mode = self._get_config_value("telegram_parse_mode", "TELEGRAM_PARSE_MODE") or "HTML"
         self.telegram_reply_to_message_id = self._get_config_value(
             "telegram_reply_to_message_id", "TELEGRAM_REPLY_TO_MESSAGE_ID"
@@ -91,14 +102,12 @@ class Telegram(SocialNetwork):
                 if not self.telegram_chat_id:
                     self.telegram_chat_id = auth_manager.chat_id
 
-        # Validate all credentials are now available
-        if not all([self.telegram_bot_token, self.telegram_chat_id]):
+        # Validate all credentials are now available (a broadcast names its own chats)
+        if not self.telegram_bot_token or not (self.telegram_chat_id or self.telegram_chat_ids):
             raise Exception("Not authenticated. Please run 'agoras telegram authorize' first.")
 
         bot_token = self.telegram_bot_token
         chat_id = self.telegram_chat_id
-        if not bot_token or not chat_id:
-            raise Exception("Not authenticated. Please run 'agoras telegram authorize' first.")
 
         # Initialize Telegram API
         self.api = TelegramAPI(bot_token, chat_id)
@@ -223,6 +232,22 @@ class Telegram(SocialNetwork):
             for image in images:
                 image.cleanup()
 
+    async def download_video(self, video_url):
+        """
+        Download a video, allowing up to 2 GB when a local Bot API server is configured.
+
+        Args:
+            video_url (str): Video URL
+
+        Returns:
+            Video: Downloaded Video instance
+        """
+        from agoras.media import MediaFactory
+
+        video = MediaFactory.create_video(video_url, "telegram", max_size=telegram_max_upload())
+        await video.download()
+        return video
+
     async def video(self, status_text, video_url, video_title):
         """
         Post a video to Telegram.
@@ -251,10 +276,10 @@ class Telegram(SocialNetwork):
             if not video.content or not video.file_type:
                 raise Exception("Failed to download or validate video")
 
-            # Send downloaded bytes (avoid re-downloading in the API layer)
+            # Send the downloaded file (avoid re-downloading in the API layer)
             message_id = await self.api.send_video(
                 chat_id=self._require_chat_id(),
-                video_content=video.content,
+                video_content=video.temp_file or video.content,
                 caption=caption,
                 parse_mode=self.telegram_parse_mode,
             )
@@ -265,6 +290,171 @@ class Telegram(SocialNetwork):
             # Clean up downloaded video
             video.cleanup()
 
+    async def broadcast(
+        self,
+        chat_ids: Iterable[str],
+        status_text: Optional[str] = None,
+        status_link: Optional[str] = None,
+        image_urls: Optional[List[str]] = None,
+        video_url: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Post the same message, images or video to several chats.
+
+        Media is downloaded once and uploaded to the first chat only; the
+        other chats receive it by the ``file_id`` Telegram returned, and are
+        posted to concurrently within the bot-wide and per-chat rate limits.
+
+        Args:
+            chat_ids (iterable): Target chat IDs or channel usernames
+            status_text (str, optional): Message text or caption
+            status_link (str, optional): URL appended to the text
+            image_urls (list, optional): Up to four image URLs; several are sent as an album
+            video_url (str, optional): Video to send instead of images
+            concurrency (int): Maximum chats posted to at once
+
+        Returns:
+            dict: ``{chat_id: {"id": message_id}}`` or ``{chat_id: {"error": message}}``
+        """
+        api = self.api
+        if not api:
+            raise Exception("Telegram API not initialized")
+
+        chat_ids = [normalize_chat_id(chat_id) for chat_id in split_destinations(chat_ids)]
+        if not chat_ids:
+            raise Exception("At least one Telegram chat ID is required for broadcast.")
+
+        message_text = f"{status_text or ''}\n{status_link}".strip() if status_link else status_text or ""
+        image_urls = list(filter(None, image_urls or []))
+        media: List[Any] = []
+
+        try:
+            if video_url:
+                send = await self._broadcast_video_sender(video_url, message_text, media)
+            elif image_urls:
+                send = await self._broadcast_images_sender(image_urls, message_text, media)
+            elif message_text:
+                send = self._broadcast_text_sender(message_text)
+            else:
+                raise Exception("No status text, link, images, or video provided.")
+
+            return await broadcast(chat_ids, send, concurrency, upload_first=bool(media))
+        finally:
+            for item in media:
+                item.cleanup()
+
+    async def _broadcast_video_sender(self, video_url: str, caption: str, media: List[Any]):
+        """
+        Download a video once and return a coroutine function sending it to a chat.
+
+        Args:
+            video_url (str): Video URL
+            caption (str): Video caption
+            media (list): Downloaded media to clean up; the video is appended
+
+        Returns:
+            callable: ``send(chat_id)`` returning the message ID
+        """
+        api = self.api
+        parse_mode = self.telegram_parse_mode
+        video = await self.download_video(video_url)
+        media.append(video)
+        if not video.content or not video.file_type:
+            raise Exception("Failed to download or validate video")
+        video_content = video.temp_file or video.content
+        # Hash the video once here rather than once per chat in the client.
+        digest = await run_blocking(CPU, content_digest, video_content)
+
+        async def send(chat_id):
+            return await api.send_video(
+                chat_id=chat_id, video_content=video_content, caption=caption, parse_mode=parse_mode, digest=digest
+            )
+
+        return send
+
+    async def _broadcast_images_sender(self, image_urls: List[str], caption: str, media: List[Any]):
+        """
+        Download images once and return a coroutine function sending them to a chat.
+
+        Several images are sent as an album captioned on the first image.
+
+        Args:
+            image_urls (list): Image URLs
+            caption (str): Photo or album caption
+            media (list): Downloaded media to clean up; the images are appended
+
+        Returns:
+            callable: ``send(chat_id)`` returning the (first) message ID
+        """
+        api = self.api
+        parse_mode = self.telegram_parse_mode
+        images = await self.download_images(image_urls)
+        media.extend(images)
+        for image in images:
+            if not image.content or not image.file_type:
+                raise Exception(f"Failed to validate image: {image.url}")
+        items = [
+            {
+                "type": "photo",
+                "media": image.content,
+                "caption": caption if i == 0 else None,
+                "digest": await run_blocking(CPU, content_digest, image.content),
+            }
+            for i, image in enumerate(images)
+        ]
+
+        async def send(chat_id):
+            if len(items) == 1:
+                item = items[0]
+                return await api.send_photo(
+                    chat_id=chat_id,
+                    photo_content=item["media"],
+                    caption=caption,
+                    parse_mode=parse_mode,
+                    digest=item["digest"],
+                )
+            message_ids = await api.send_media_group(chat_id=chat_id, media=items)
+            return message_ids[0] if message_ids else ""
+
+        return send
+
+    def _broadcast_text_sender(self, message_text: str):
+        """
+        Return a coroutine function sending a text message to a chat.
+
+        Args:
+            message_text (str): Message text
+
+        Returns:
+            callable: ``send(chat_id)`` returning the message ID
+        """
+        api = self.api
+        parse_mode = self.telegram_parse_mode
+
+        async def send(chat_id):
+            return await api.send_message(chat_id=chat_id, text=message_text, parse_mode=parse_mode)
+
+        return send
+
+    async def _handle_broadcast_action(self):
+        """Handle broadcast action, printing the result for every chat."""
+        concurrency = self._get_config_value("telegram_broadcast_concurrency", "TELEGRAM_BROADCAST_CONCURRENCY")
+        results = await self.broadcast(
+            self.telegram_chat_ids,
+            status_text=self._get_config_value("status_text", "STATUS_TEXT"),
+            status_link=self._get_config_value("status_link", "STATUS_LINK"),
+            image_urls=[self._get_config_value(f"status_image_url_{i}", f"STATUS_IMAGE_URL_{i}") for i in range(1, 5)],
+            video_url=self._get_config_value("video_url", "VIDEO_URL"),
+            concurrency=int(concurrency or DEFAULT_CONCURRENCY),
+        )
+        if self.emit_status:
+            print(json.dumps(results, separators=(",", ":")))
+
+        failed = [chat_id for chat_id, result in results.items() if "error" in result]
+        if failed:
+            raise Exception(f"Telegram broadcast failed for {len(failed)} of {len(results)} chats.")
+
     async def _handle_delete_action(self):
         """Handle delete action with Telegram-specific parameter extraction."""
         message_id = self._get_config_value("telegram_message_id", "TELEGRAM_MESSAGE_ID")
@@ -17,9 +17,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.platforms.threads.api module."""
 
-import asyncio
 from typing import Any, Dict, List, Optional, Tuple
 
+from agoras.common.executors import API, run_blocking
 from agoras.core.api_base import BaseAPI
 from agoras.core.auth import raise_authentication_error_from_manager
 from agoras.media import MediaFactory
@@ -36,6 +36,8 @@ class ThreadsAPI(BaseAPI):
     reposts, and all Threads API operations.
     """
 
+    platform = "threads"
+
     def __init__(self, app_id: str, app_secret: str, refresh_token: Optional[str] = None):
         """
         Initialize Threads API instance.
@@ -90,6 +92,9 @@ class ThreadsAPI(BaseAPI):
         """
         Disconnect from Threads API and clean up resources.
         """
+        if self.client:
+            self.client.disconnect()
+
         # Clear BaseAPI client
         self.client = None
         self._authenticated = False
@@ -210,7 +215,7 @@ class ThreadsAPI(BaseAPI):
             return self.client.get_profile()
 
         try:
-            profile_info = await asyncio.to_thread(_sync_get_profile)
+            profile_info = await run_blocking(API, _sync_get_profile)
             return profile_info
         except Exception as e:
             self._handle_api_error(e, "Threads get profile")
@@ -260,19 +265,16 @@ class ThreadsAPI(BaseAPI):
         if files:
             validated_files, validated_captions, images = await self._validate_and_download_images(files, file_captions)
 
-        def _sync_create_post():
+        try:
             if not self.client:
                 raise Exception("Threads client not available")
-            return self.client.create_post(
+            response = await self.client.create_post(
                 post_text=post_text,
                 files=validated_files if validated_files else None,
                 file_captions=validated_captions if validated_captions else None,
                 who_can_reply=who_can_reply,
             )
 
-        try:
-            response = await asyncio.to_thread(_sync_create_post)
-
             # Extract post ID from response
             post_id = response.get("id") or response.get("post_id") or str(response)
             return post_id
@@ -335,14 +337,11 @@ class ThreadsAPI(BaseAPI):
                     sorted(allowed),
                 )
 
-            def _sync_create_video_post():
-                if not self.client:
-                    raise Exception("Threads client not available")
-                return self.client.create_video_post(
-                    post_text=post_text, video_url=video_url, who_can_reply=who_can_reply
-                )
-
-            response = await asyncio.to_thread(_sync_create_video_post)
+            if not self.client:
+                raise Exception("Threads client not available")
+            response = await self.client.create_video_post(
+                post_text=post_text, video_url=video_url, who_can_reply=who_can_reply
+            )
             post_id = response.get("id") or response.get("post_id") or str(response)
             return post_id
         except MediaValidationError:
@@ -386,7 +385,7 @@ class ThreadsAPI(BaseAPI):
             return self.client.repost_post(post_id=post_id)
 
         try:
-            response = await asyncio.to_thread(_sync_repost)
+            response = await run_blocking(API, _sync_repost)
 
             # Extract repost ID from response
             repost_id = response.get("id") or response.get("repost_id") or str(response)
@@ -456,7 +455,7 @@ class ThreadsAPI(BaseAPI):
             return self.client.delete_post(post_id=post_id)
 
         try:
-            response = await asyncio.to_thread(_sync_delete)
+            response = await run_blocking(API, _sync_delete)
             return response.get("id", post_id)
         except Exception as e:
             self._handle_api_error(e, "Threads post deletion")
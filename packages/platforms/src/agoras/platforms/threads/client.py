@@ -17,11 +17,17 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.platforms.threads.client module."""
 
-import time
 from typing import Any, Dict, List, Optional
 
 import requests
 
+from agoras.common.executors import API, POLL, run_blocking
+from agoras.core.concurrency import map_bounded
+from agoras.core.http import create_session
+from agoras.core.journal import CONTAINER, MEDIA, journal_step
+from agoras.core.polling import PollSchedule, poll_until
+from agoras.core.retry import request_with_retry
+
 
 class ThreadsAPIClient:
     """
@@ -31,6 +37,11 @@ class ThreadsAPIClient:
     and user profile operations using Meta's Threads Graph API.
     """
 
+    # Image and text containers are usually ready within a second or two.
+    POST_POLL_SCHEDULE = PollSchedule(initial=0.5, max_interval=5.0, timeout=60.0)
+    # Video containers can take minutes to transcode.
+    VIDEO_POLL_SCHEDULE = PollSchedule(initial=2.0, max_interval=15.0, timeout=600.0)
+
     def __init__(self, access_token: str, user_id: str):
         """
         Initialize Threads API client.
@@ -42,6 +53,13 @@ class ThreadsAPIClient:
         self.access_token = access_token
         self.user_id = user_id
         self.base_url = "https://graph.threads.net/v1.0"
+        self.session = create_session()
+
+    def disconnect(self):
+        """
+        Close pooled HTTP connections.
+        """
+        self.session.close()
 
     def get_profile(self) -> Dict[str, Any]:
         """
@@ -67,7 +85,7 @@ class ThreadsAPIClient:
         except Exception as e:
             raise Exception(f"Failed to get profile: {str(e)}")
 
-    def create_post(
+    async def create_post(
         self,
         post_text: str,
         files: Optional[List[str]] = None,
@@ -114,39 +132,32 @@ class ThreadsAPIClient:
             else:
                 # Carousel post (2-4 images)
                 # First create individual carousel item containers
-                item_ids = []
-                for image_url in files:
+                def create_item(image_url):
                     item_data = {
                         "access_token": self.access_token,
                         "media_type": "IMAGE",
                         "image_url": image_url,
                         "is_carousel_item": True,
                     }
-                    resp = requests.post(f"{self.base_url}/me/threads", data=item_data, timeout=30)
-                    self._check_response(resp)
-                    item_ids.append(resp.json()["id"])
+                    return self._create_container(item_data)
+
+                # Item containers are independent, so create them concurrently in order
+                item_ids = await journal_step(MEDIA, run_blocking, API, map_bounded, create_item, files, pool=API)
 
                 # Now create the carousel container
                 container_data["media_type"] = "CAROUSEL"
                 container_data["children"] = ",".join(item_ids)
 
-            # Create the container
-            resp = requests.post(f"{self.base_url}/me/threads", data=container_data, timeout=30)
-            self._check_response(resp)
-            creation_id = resp.json()["id"]
-
-            # Wait a bit for container to be ready (Meta recommends this)
-            time.sleep(2)
+            async def create_container():
+                creation_id = await run_blocking(API, self._create_container, container_data)
+                # Media containers must finish processing before they can be published
+                if files:
+                    await self.wait_for_container(creation_id, self.POST_POLL_SCHEDULE)
+                return creation_id
 
-            # Publish the container
-            publish_data = {"access_token": self.access_token, "creation_id": creation_id}
-
-            publish_resp = requests.post(
-                f"{self.base_url}/{self.user_id}/threads_publish", data=publish_data, timeout=30
-            )
-            self._check_response(publish_resp)
-
-            return {"id": publish_resp.json()["id"]}
+            # A retry after a crash publishes the recorded container instead of creating another
+            creation_id = await journal_step(CONTAINER, create_container)
+            return await run_blocking(API, self._publish_container, creation_id)
 
         except Exception as e:
             raise Exception(f"Failed to create post: {str(e)}")
@@ -162,7 +173,62 @@ class ThreadsAPIClient:
                 pass
             raise Exception(f"HTTP {response.status_code}: {response.text}")
 
-    def create_video_post(self, post_text: str, video_url: str, who_can_reply: str = "everyone") -> Dict[str, Any]:
+    def _create_container(self, container_data: Dict[str, Any]) -> str:
+        """Create a media container and return its creation ID."""
+        resp = request_with_retry(self.session, "POST", f"{self.base_url}/me/threads", data=container_data, timeout=30)
+        self._check_response(resp)
+        return resp.json()["id"]
+
+    def _publish_container(self, creation_id: str) -> Dict[str, Any]:
+        """Publish a ready media container."""
+        publish_data = {"access_token": self.access_token, "creation_id": creation_id}
+
+        publish_resp = request_with_retry(
+            self.session, "POST", f"{self.base_url}/{self.user_id}/threads_publish", data=publish_data, timeout=30
+        )
+        self._check_response(publish_resp)
+
+        return {"id": publish_resp.json()["id"]}
+
+    async def wait_for_container(self, creation_id: str, schedule: Optional[PollSchedule] = None) -> None:
+        """
+        Wait until a media container has finished processing.
+
+        Args:
+            creation_id (str): Container ID returned when it was created
+            schedule (PollSchedule, optional): Polling intervals and deadline
+
+        Raises:
+            Exception: If processing fails, expires or times out
+        """
+
+        def _sync_status():
+            status_resp = request_with_retry(
+                self.session,
+                "GET",
+                f"{self.base_url}/{creation_id}",
+                params={"fields": "status", "access_token": self.access_token},
+                timeout=30,
+            )
+            self._check_response(status_resp)
+            return status_resp.json().get("status", "")
+
+        async def _check_finished():
+            status = await run_blocking(POLL, _sync_status)
+            if status in ("ERROR", "EXPIRED"):
+                raise Exception("Threads video processing failed" if status == "ERROR" else "Threads container expired")
+            return status in ("FINISHED", "PUBLISHED")
+
+        schedule = schedule or self.VIDEO_POLL_SCHEDULE
+        await poll_until(
+            _check_finished,
+            schedule,
+            timeout_message=f"Threads container {creation_id} not ready after {schedule.timeout:g} seconds",
+        )
+
+    async def create_video_post(
+        self, post_text: str, video_url: str, who_can_reply: str = "everyone"
+    ) -> Dict[str, Any]:
         """
         Create a video post on Threads using Meta's Graph API.
 
@@ -195,32 +261,15 @@ class ThreadsAPIClient:
                 "video_url": video_url,
             }
 
-            resp = requests.post(f"{self.base_url}/me/threads", data=container_data, timeout=30)
-            self._check_response(resp)
-            creation_id = resp.json()["id"]
-
-            # Video processing is asynchronous; poll until ready
-            status = "IN_PROGRESS"
-            while status not in ("FINISHED", "PUBLISHED"):
-                time.sleep(5)
-                status_resp = requests.get(
-                    f"{self.base_url}/{creation_id}",
-                    params={"fields": "status", "access_token": self.access_token},
-                    timeout=30,
-                )
-                self._check_response(status_resp)
-                status = status_resp.json().get("status", "")
-                if status == "ERROR":
-                    raise Exception("Threads video processing failed")
-
-            publish_data = {"access_token": self.access_token, "creation_id": creation_id}
-
-            publish_resp = requests.post(
-                f"{self.base_url}/{self.user_id}/threads_publish", data=publish_data, timeout=30
-            )
-            self._check_response(publish_resp)
+            async def create_container():
+                creation_id = await run_blocking(API, self._create_container, container_data)
+                # Video processing is asynchronous; poll until ready
+                await self.wait_for_container(creation_id, self.VIDEO_POLL_SCHEDULE)
+                return creation_id
 
-            return {"id": publish_resp.json()["id"]}
+            # A retry after a crash reuses the transcoded container
+            creation_id = await journal_step(CONTAINER, create_container)
+            return await run_blocking(API, self._publish_container, creation_id)
 
         except Exception as e:
             raise Exception(f"Failed to create video post: {str(e)}")
@@ -247,7 +296,9 @@ class ThreadsAPIClient:
         try:
             data = {"access_token": self.access_token}
 
-            response = requests.post(f"{self.base_url}/{post_id}/repost", data=data, timeout=30)
+            response = request_with_retry(
+                self.session, "POST", f"{self.base_url}/{post_id}/repost", data=data, timeout=30
+            )
             self._check_response(response)
 
             return {"id": response.json()["id"]}
@@ -274,8 +325,12 @@ class ThreadsAPIClient:
             raise Exception("Post ID is required")
 
         try:
-            response = requests.delete(
-                f"{self.base_url}/{post_id}", params={"access_token": self.access_token}, timeout=30
+            response = request_with_retry(
+                self.session,
+                "DELETE",
+                f"{self.base_url}/{post_id}",
+                params={"access_token": self.access_token},
+                timeout=30,
             )
             if response.status_code not in (200, 204):
                 self._check_response(response)
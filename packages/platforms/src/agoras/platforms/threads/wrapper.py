@@ -300,41 +300,6 @@ class Threads(SocialNetwork):
             return True
         return False
 
-    async def execute_action(self, action):
-        """
-        Execute the specified action asynchronously.
-
-        Args:
-            action (str): Action to execute
-
-        Raises:
-            Exception: If action is not supported or required arguments missing
-        """
-        if action == "":
-            raise Exception("Action is a required argument.")
-
-        # Initialize client before executing other actions
-        await self._initialize_client()
-
-        if action == "post":
-            await self._handle_post_action()
-        elif action == "like":
-            await self._handle_like_action()
-        elif action == "share":
-            await self._handle_share_action()
-        elif action == "delete":
-            await self._handle_delete_action()
-        elif action == "video":
-            await self._handle_video_action()
-        elif action == "last-from-feed":
-            await self._handle_last_from_feed_action()
-        elif action == "random-from-feed":
-            await self._handle_random_from_feed_action()
-        elif action == "schedule":
-            await self._handle_schedule_action()
-        else:
-            raise Exception(f'"{action}" action not supported.')
-
 
 async def main_async(kwargs):
     """
@@ -17,13 +17,13 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.platforms.tiktok.api module."""
 
-import asyncio
 import sys
-import time
 from typing import Any, Dict, List
 
+from agoras.common.executors import API, POLL, UPLOAD, run_blocking
 from agoras.core.api_base import BaseAPI
 from agoras.core.auth import raise_authentication_error_from_manager
+from agoras.core.polling import PollSchedule, poll_until
 
 from .auth import TikTokAuthManager
 
@@ -36,6 +36,8 @@ class TikTokAPI(BaseAPI):
     and all TikTok API operations.
     """
 
+    platform = "tiktok"
+
     # TikTok API URLs - moved to client
     # DIRECT_POST_URL = "https://open.tiktokapis.com/v2/post/publish/video/init/"
     # GET_VIDEO_STATUS_URL = "https://open.tiktokapis.com/v2/post/publish/status/fetch/"
@@ -94,6 +96,9 @@ class TikTokAPI(BaseAPI):
         """
         Disconnect from TikTok API and clean up resources.
         """
+        if self.client:
+            self.client.disconnect()
+
         # Clear auth manager tokens and user info
         if self.auth_manager:
             self.auth_manager.access_token = None
@@ -121,7 +126,7 @@ class TikTokAPI(BaseAPI):
             return self.creator_info
 
         try:
-            creator_info = await asyncio.to_thread(_sync_get_creator_info)
+            creator_info = await run_blocking(API, _sync_get_creator_info)
             if not creator_info:
                 raise Exception("Failed to get creator info")
             return creator_info
@@ -184,7 +189,7 @@ class TikTokAPI(BaseAPI):
             )
 
         try:
-            response = await asyncio.to_thread(_sync_upload)
+            response = await run_blocking(UPLOAD, _sync_upload)
 
             publish_id = response.get("data", {}).get("publish_id")
 
@@ -251,7 +256,7 @@ class TikTokAPI(BaseAPI):
             )
 
         try:
-            response = await asyncio.to_thread(_sync_upload)
+            response = await run_blocking(UPLOAD, _sync_upload)
             # TikTok API returns: {"data": {"publish_id": "..."}, "error": {"code": "ok", ...}}
             # Extract the data object which contains publish_id
             return response.get("data", {})
@@ -263,6 +268,9 @@ class TikTokAPI(BaseAPI):
         """
         Wait for TikTok post to be published.
 
+        Polls quickly at first, since photo posts usually finish within
+        seconds, then backs off up to ten seconds between checks.
+
         Args:
             publish_id (str): Publish ID to check status for
             max_wait_time (int): Maximum time to wait in seconds
@@ -270,39 +278,45 @@ class TikTokAPI(BaseAPI):
         Raises:
             Exception: If publish fails or times out
         """
-        start_time = time.time()
-
-        while True:
-            # Check if we've exceeded max wait time
-            if time.time() - start_time > max_wait_time:
-                raise Exception(f"Publish timeout after {max_wait_time} seconds")
 
-            await asyncio.sleep(10)
-            print("Waiting for post status ...", file=sys.stderr)
-
-            def _sync_check_status():
-                if not self.client:
-                    raise Exception("TikTok client not available")
-                return self.client.get_publish_status(publish_id)
+        def _sync_check_status():
+            if not self.client:
+                raise Exception("TikTok client not available")
+            return self.client.get_publish_status(publish_id)
 
+        async def _check_published():
             try:
-                status = await asyncio.to_thread(_sync_check_status)
-                publish_status = status.get("data", {}).get("status")
-                publish_id_list = status.get("data", {}).get("publicaly_available_post_id", [])
-
-                if len(publish_id_list) > 0 or publish_status == "PUBLISH_COMPLETE":
-                    try:
-                        print("Post published!", file=sys.stderr)
-                    except BrokenPipeError:
-                        pass
-                    break
-
+                print("Waiting for post status ...", file=sys.stderr)
             except BrokenPipeError:
-                break
+                pass
+
+            try:
+                status = await run_blocking(POLL, _sync_check_status)
             except Exception as e:
                 self._handle_api_error(e, "TikTok status check")
                 raise
 
+            data = status.get("data", {})
+            publish_status = data.get("status")
+            if publish_status == "FAILED":
+                raise Exception(f"TikTok publish failed: {data.get('fail_reason', 'unknown reason')}")
+
+            if len(data.get("publicaly_available_post_id", [])) > 0 or publish_status == "PUBLISH_COMPLETE":
+                try:
+                    print("Post published!", file=sys.stderr)
+                except BrokenPipeError:
+                    pass
+                return True
+            return False
+
+        schedule = PollSchedule(initial=2.0, max_interval=10.0, timeout=max_wait_time)
+        await poll_until(
+            _check_published,
+            schedule,
+            timeout_message=f"Publish timeout after {max_wait_time} seconds",
+            initial_delay=schedule.initial,
+        )
+
     async def post(self, *args, **kwargs) -> str:
         """
         Regular posts are not supported on TikTok (use upload_photo instead).
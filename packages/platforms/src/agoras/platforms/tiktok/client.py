@@ -20,9 +20,9 @@
 import json
 from typing import Any, Dict, List, Optional
 
-import requests
-
 from agoras.common import __version__
+from agoras.core.http import create_session
+from agoras.core.retry import request_with_retry
 
 
 class TikTokAPIClient:
@@ -47,6 +47,13 @@ class TikTokAPIClient:
             access_token (str, optional): TikTok access token for authenticated requests
         """
         self.access_token = access_token
+        self.session = create_session()
+
+    def disconnect(self):
+        """
+        Close pooled HTTP connections.
+        """
+        self.session.close()
 
     def get_user_info(self) -> Dict[str, Any]:
         """
@@ -61,8 +68,11 @@ class TikTokAPIClient:
         if not self.access_token:
             raise Exception("No access token available")
 
-        response = requests.post(
+        response = request_with_retry(
+            self.session,
+            "POST",
             self.CREATOR_INFO_URL,
+            idempotent=True,  # read-only query
             headers={
                 "Authorization": f"Bearer {self.access_token}",
                 "Content-Type": "application/json; charset=UTF-8",
@@ -136,7 +146,9 @@ class TikTokAPIClient:
             },
         }
 
-        response = requests.post(
+        response = request_with_retry(
+            self.session,
+            "POST",
             self.VIDEO_POST_URL,
             headers={
                 "Authorization": f"Bearer {self.access_token}",
@@ -213,7 +225,9 @@ class TikTokAPIClient:
             },
         }
 
-        response = requests.post(
+        response = request_with_retry(
+            self.session,
+            "POST",
             self.CONTENT_POST_URL,  # Use content endpoint for photos
             headers={
                 "Authorization": f"Bearer {self.access_token}",
@@ -254,8 +268,11 @@ class TikTokAPIClient:
         if not self.access_token:
             raise Exception("No access token available")
 
-        response = requests.post(
+        response = request_with_retry(
+            self.session,
+            "POST",
             self.GET_VIDEO_STATUS_URL,
+            idempotent=True,  # read-only query
             headers={
                 "Authorization": f"Bearer {self.access_token}",
                 "Content-Type": "application/json; charset=UTF-8",
@@ -22,6 +22,7 @@ import json
 import sys
 
 from agoras.core.interfaces import SocialNetwork
+from agoras.core.journal import MEDIA, journal_step
 
 from .api import TikTokAPI
 
@@ -36,6 +37,8 @@ class TikTok(SocialNetwork):
 
     def _output_status(self, post_id):
         """Emit publish_id JSON on stdout for CLI piping."""
+        if not self.emit_status:
+            return
         status = {"publish_id": post_id}
         print(json.dumps(status, separators=(",", ":")))
 
@@ -299,61 +302,65 @@ class TikTok(SocialNetwork):
         if self.tiktok_auto_add_music:
             raise Exception("Auto-add music is not supported for video posts.")
 
-        # Download and validate video using Media system
-        video = await self.download_video(video_url)
+        async def upload_video():
+            # Download and validate video using Media system
+            video = await self.download_video(video_url)
 
-        try:
-            if not video.content or not video.file_type:
-                raise Exception("Failed to download or validate video")
-
-            from agoras.media.constraints import video_limits
-            from agoras.media.errors import MediaValidationError
-
-            allowed = video_limits("tiktok").mime_types
-            if video.file_type.mime not in allowed:
-                raise MediaValidationError(
-                    "tiktok",
-                    "video",
-                    "mime_types",
-                    video.file_type.mime,
-                    sorted(allowed),
-                )
-
-            # Check video duration against creator limits
-            if hasattr(self.api, "creator_info") and self.api.creator_info:
-                max_duration = self.api.creator_info.get("max_video_post_duration_sec", 0)
-                video_duration = video.get_duration()
-                if video_duration and video_duration > max_duration:
-                    raise Exception(f"Video duration {video_duration}s exceeds max duration of {max_duration}s")
+            try:
+                if not video.content or not video.file_type:
+                    raise Exception("Failed to download or validate video")
 
-            # Validate brand content settings
-            if self.brand_content and self.tiktok_privacy_status == "ONLY_ME":
-                raise Exception("You cannot use brand content with ONLY_ME privacy status")
+                from agoras.media.constraints import video_limits
+                from agoras.media.errors import MediaValidationError
 
-            # Print brand content notices
-            self._print_brand_content_notices()
+                allowed = video_limits("tiktok").mime_types
+                if video.file_type.mime not in allowed:
+                    raise MediaValidationError(
+                        "tiktok",
+                        "video",
+                        "mime_types",
+                        video.file_type.mime,
+                        sorted(allowed),
+                    )
 
-            print(f"Uploading video to @{self.tiktok_username}...", file=sys.stderr)
+                # Check video duration against creator limits
+                if hasattr(self.api, "creator_info") and self.api.creator_info:
+                    max_duration = self.api.creator_info.get("max_video_post_duration_sec", 0)
+                    video_duration = video.get_duration()
+                    if video_duration and video_duration > max_duration:
+                        raise Exception(f"Video duration {video_duration}s exceeds max duration of {max_duration}s")
+
+                # Validate brand content settings
+                if self.brand_content and self.tiktok_privacy_status == "ONLY_ME":
+                    raise Exception("You cannot use brand content with ONLY_ME privacy status")
+
+                # Print brand content notices
+                self._print_brand_content_notices()
+
+                print(f"Uploading video to @{self.tiktok_username}...", file=sys.stderr)
+
+                # Upload the video
+                response = await self.api.upload_video(
+                    video_url,
+                    title,
+                    str(self.tiktok_privacy_status),
+                    bool(self.tiktok_allow_comments),
+                    bool(self.tiktok_allow_duet),
+                    bool(self.tiktok_allow_stitch),
+                    bool(self.brand_organic),
+                    bool(self.brand_content),
+                )
 
-            # Upload the video
-            response = await self.api.upload_video(
-                video_url,
-                title,
-                str(self.tiktok_privacy_status),
-                bool(self.tiktok_allow_comments),
-                bool(self.tiktok_allow_duet),
-                bool(self.tiktok_allow_stitch),
-                bool(self.brand_organic),
-                bool(self.brand_content),
-            )
+                return response.get("publish_id")
 
-            post_id = response.get("publish_id")
-            self._output_status(post_id)
-            return post_id
+            finally:
+                # Clean up downloaded video
+                video.cleanup()
 
-        finally:
-            # Clean up downloaded video
-            video.cleanup()
+        # A retry after a crash reports the recorded upload instead of downloading and uploading again
+        post_id = await journal_step(MEDIA, upload_video)
+        self._output_status(post_id)
+        return post_id
 
     async def like(self, post_id):
         """
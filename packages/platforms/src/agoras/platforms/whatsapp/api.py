@@ -17,9 +17,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.platforms.whatsapp.api module."""
 
-import asyncio
 from typing import Any, Dict, List, Optional
 
+from agoras.common.executors import API, run_blocking
 from agoras.core.api_base import BaseAPI
 from agoras.core.auth import raise_authentication_error_from_manager
 from agoras.media.factory import MediaFactory
@@ -36,6 +36,8 @@ class WhatsAppAPI(BaseAPI):
     and business profile management.
     """
 
+    platform = "whatsapp"
+
     def __init__(self, access_token: str, phone_number_id: str, business_account_id: Optional[str] = None):
         """
         Initialize WhatsApp API instance.
@@ -49,6 +51,9 @@ class WhatsAppAPI(BaseAPI):
             access_token=access_token, phone_number_id=phone_number_id, business_account_id=business_account_id
         )
 
+        # Minimum seconds between sends of the same kind; broadcasts pace with the rate limiter instead.
+        self.send_interval = 1.0
+
         # Initialize the authentication manager
         self.auth_manager = WhatsAppAuthManager(
             access_token=access_token, phone_number_id=phone_number_id, business_account_id=business_account_id
@@ -188,7 +193,7 @@ class WhatsAppAPI(BaseAPI):
             raise Exception("WhatsApp API not authenticated")
 
         client = self.client
-        await self._rate_limit_check("send_message", 1.0)
+        await self._rate_limit_check("send_message", self.send_interval)
 
         try:
 
@@ -196,7 +201,7 @@ class WhatsAppAPI(BaseAPI):
                 response = client.send_message(to, text, buttons=buttons)
                 return response["message_id"]
 
-            return await asyncio.to_thread(_sync_send)
+            return await run_blocking(API, _sync_send)
         except Exception as e:
             self._handle_api_error(e, "WhatsApp send_message")
             raise
@@ -222,7 +227,7 @@ class WhatsAppAPI(BaseAPI):
             raise Exception("WhatsApp API not authenticated")
 
         client = self.client
-        await self._rate_limit_check("send_image", 1.0)
+        await self._rate_limit_check("send_image", self.send_interval)
 
         try:
 
@@ -230,7 +235,7 @@ class WhatsAppAPI(BaseAPI):
                 response = client.send_image(to, image_url, caption=caption)
                 return response["message_id"]
 
-            return await asyncio.to_thread(_sync_send)
+            return await run_blocking(API, _sync_send)
         except Exception as e:
             self._handle_api_error(e, "WhatsApp send_image")
             raise
@@ -256,7 +261,7 @@ class WhatsAppAPI(BaseAPI):
             raise Exception("WhatsApp API not authenticated")
 
         client = self.client
-        await self._rate_limit_check("send_video", 1.0)
+        await self._rate_limit_check("send_video", self.send_interval)
 
         try:
 
@@ -264,7 +269,7 @@ class WhatsAppAPI(BaseAPI):
                 response = client.send_video(to, video_url, caption=caption)
                 return response["message_id"]
 
-            return await asyncio.to_thread(_sync_send)
+            return await run_blocking(API, _sync_send)
         except Exception as e:
             self._handle_api_error(e, "WhatsApp send_video")
             raise
@@ -297,7 +302,7 @@ class WhatsAppAPI(BaseAPI):
                 else:
                     raise Exception(f"Failed to get business profile: {response}")
 
-            return await asyncio.to_thread(_sync_get_profile)
+            return await run_blocking(API, _sync_get_profile)
         except Exception as e:
             self._handle_api_error(e, "WhatsApp get_business_profile")
             raise
@@ -365,7 +370,7 @@ class WhatsAppAPI(BaseAPI):
         if not template_name:
             raise Exception("Template name is required.")
 
-        await self._rate_limit_check("send_template", 1.0)
+        await self._rate_limit_check("send_template", self.send_interval)
 
         try:
 
@@ -373,7 +378,7 @@ class WhatsAppAPI(BaseAPI):
                 response = client.send_template(to, template_name, language_code=language_code, components=components)
                 return response["message_id"]
 
-            return await asyncio.to_thread(_sync_send)
+            return await run_blocking(API, _sync_send)
         except Exception as e:
             self._handle_api_error(e, "WhatsApp send_template")
             raise
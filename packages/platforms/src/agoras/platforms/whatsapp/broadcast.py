@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.md for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+agoras.platforms.whatsapp.broadcast module.
+
+Sends one message to many recipients on a single WhatsApp client: a fixed
+number of workers pull recipients from the input as they go, message sends
+are paced by the Cloud API throughput of the business phone number, and one
+JSON result per recipient is streamed to the output.
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from agoras.core.ratelimit import RATE_LIMITS, RateLimit, RateLimiter, get_rate_limiter
+from agoras.core.retry import RetryPolicy
+
+from .client import is_rate_limited
+
+DEFAULT_CONCURRENCY = 20
+
+# Cloud API throughput of a business phone number: 80 messages per second by
+# default, 1000 once Meta upgrades the number.
+DEFAULT_MESSAGES_PER_SECOND = 80.0
+
+# Throttled sends were never delivered, so they are retried with longer waits
+# than transport errors get from agoras.core.retry.
+BROADCAST_RETRY = RetryPolicy(attempts=5, base_delay=1.0, max_delay=60.0)
+
+
+def read_recipients(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield recipient phone numbers from text lines, skipping duplicates.
+
+    Each line holds one number, or several separated by commas. Blank lines
+    and lines starting with ``#`` are ignored.
+
+    Args:
+        lines (iterable): Lines of a recipients file or stream
+
+    Returns:
+        iterator: Recipient phone numbers in input order
+    """
+    seen = set()
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        for recipient in line.split(","):
+            recipient = recipient.strip()
+            if recipient and recipient not in seen:
+                seen.add(recipient)
+                yield recipient
+
+
+def broadcast_rate_limiter(messages_per_second: float = DEFAULT_MESSAGES_PER_SECOND) -> RateLimiter:
+    """
+    Build a rate limiter allowing ``messages_per_second`` WhatsApp sends.
+
+    Buckets live in the shared state database when ``AGORAS_RATE_LIMIT``
+    keeps them there, so concurrent broadcasts from the same number share
+    its throughput.
+
+    Args:
+        messages_per_second (float): Throughput tier of the business phone number
+
+    Returns:
+        RateLimiter: Limiter to assign to ``WhatsAppAPI.rate_limiter``
+
+    Raises:
+        Exception: If ``messages_per_second`` is not positive
+    """
+    if messages_per_second <= 0:
+        raise Exception("Messages per second must be greater than zero.")
+    shared = get_rate_limiter()
+    limits = dict(RATE_LIMITS)
+    limits["whatsapp"] = {"default": RateLimit(max(1, int(messages_per_second)), 1.0)}
+    return RateLimiter(shared.store if shared else None, limits)
+
+
+async def deliver(
+    send: Callable[[str], Awaitable[List[str]]],
+    recipient: str,
+    policy: RetryPolicy = BROADCAST_RETRY,
+) -> Dict[str, Any]:
+    """
+    Send to one recipient, retrying sends rejected by a throughput limit.
+
+    Other failures are not retried here: the message may already have been
+    delivered, and transport retries already happened in the client.
+
+    Args:
+        send (callable): Coroutine function sending the message to a recipient and returning its message IDs
+        recipient (str): Recipient phone number
+        policy (RetryPolicy): Attempts and backoff for throttled sends
+
+    Returns:
+        dict: ``recipient``, ``attempts`` and either ``ids`` or ``error``
+    """
+    attempt = 1
+    while True:
+        try:
+            ids = await send(recipient)
+            return {"recipient": recipient, "ids": ids, "attempts": attempt}
+        except Exception as error:
+            if attempt >= policy.attempts or not is_rate_limited(error):
+                return {"recipient": recipient, "error": str(error), "attempts": attempt}
+        await asyncio.sleep(policy.backoff(attempt))
+        attempt += 1
+
+
+async def run_broadcast(
+    recipients: Iterable[str],
+    send: Callable[[str], Awaitable[List[str]]],
+    output,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    policy: Optional[RetryPolicy] = None,
+) -> Tuple[int, int]:
+    """
+    Send to every recipient with at most ``concurrency`` sends in flight.
+
+    Recipients are consumed lazily, so large lists are never held in memory,
+    and each result is written as soon as it is known.
+
+    Args:
+        recipients (iterable): Recipient phone numbers
+        send (callable): Coroutine function sending the message to a recipient and returning its message IDs
+        output: Text stream receiving one JSON result per recipient
+        concurrency (int): Maximum recipients in flight
+        policy (RetryPolicy, optional): Retry policy for throttled sends; :data:`BROADCAST_RETRY` by default
+
+    Returns:
+        tuple: ``(sent, failed)`` recipient counts
+    """
+    policy = policy or BROADCAST_RETRY
+    pending = iter(recipients)
+    counts = {"sent": 0, "failed": 0}
+
+    async def worker():
+        for recipient in pending:
+            result = await deliver(send, recipient, policy)
+            counts["failed" if "error" in result else "sent"] += 1
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return counts["sent"], counts["failed"]
@@ -19,8 +19,48 @@
 
 from typing import Any, Dict, List, Optional
 
+import requests
 from pyfacebook import GraphAPI
 
+from agoras.core.http import create_session
+from agoras.core.retry import request_with_retry
+
+# Meta error codes for messages rejected by a throughput limit before being
+# sent: application (4), business account (80007), Cloud API throughput
+# (130429) and per-recipient pair rate (131056).
+THROTTLING_ERROR_CODES = frozenset({4, 80007, 130429, 131056})
+
+
+class WhatsAppRateLimitError(Exception):
+    """A message was rejected by a WhatsApp throughput limit and not sent."""
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """
+    Return whether an error, or any error it wraps, is a :class:`WhatsAppRateLimitError`.
+
+    Args:
+        error (Exception): Raised exception
+
+    Returns:
+        bool: True if retrying the same message cannot deliver it twice
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        if isinstance(current, WhatsAppRateLimitError):
+            return True
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def _error_code(error_data: Any) -> Optional[int]:
+    if isinstance(error_data, dict) and isinstance(error_data.get("error"), dict):
+        code = error_data["error"].get("code")
+        return code if isinstance(code, int) else None
+    return None
+
 
 class WhatsAppAPIClient:
     """
@@ -43,6 +83,7 @@ class WhatsAppAPIClient:
         self.phone_number_id = phone_number_id
         self.graph_api: Optional[GraphAPI] = None
         self.api_version = "v23.0"
+        self.session = create_session()
         self._authenticated = False
 
     async def authenticate(self) -> bool:
@@ -63,6 +104,7 @@ class WhatsAppAPIClient:
 
         try:
             self.graph_api = GraphAPI(access_token=self.access_token, version=self.api_version)
+            self.graph_api.session = self.session
             self._authenticated = True
             return True
         except Exception as e:
@@ -72,6 +114,7 @@ class WhatsAppAPIClient:
         """
         Disconnect and clean up client resources.
         """
+        self.session.close()
         self.graph_api = None
         self._authenticated = False
 
@@ -118,8 +161,6 @@ class WhatsAppAPIClient:
         if not self.access_token:
             raise Exception("WhatsApp access token not available")
 
-        import requests
-
         url = f"https://graph.facebook.com/{self.api_version}/{object_id}"
         if connection:
             url += f"/{connection}"
@@ -127,16 +168,22 @@ class WhatsAppAPIClient:
         headers = {"Authorization": f"Bearer {self.access_token}", "Content-Type": "application/json"}
 
         try:
-            response = requests.post(url, json=data or {}, headers=headers, timeout=30)
+            response = request_with_retry(self.session, "POST", url, json=data or {}, headers=headers, timeout=30)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
             # Include response body in error for debugging
             try:
                 error_data = response.json()
-                raise Exception(f"WhatsApp post_object failed: {response.status_code} {response.reason} - {error_data}")
-            except BaseException:
-                raise Exception(f"WhatsApp post_object failed: {str(e)}")
+            except ValueError:
+                error_data = None
+            if error_data is None:
+                message = f"WhatsApp post_object failed: {str(e)}"
+            else:
+                message = f"WhatsApp post_object failed: {response.status_code} {response.reason} - {error_data}"
+            if response.status_code == 429 or _error_code(error_data) in THROTTLING_ERROR_CODES:
+                raise WhatsAppRateLimitError(message) from e
+            raise Exception(message) from e
         except requests.exceptions.RequestException as e:
             raise Exception(f"WhatsApp post_object failed: {str(e)}")
 
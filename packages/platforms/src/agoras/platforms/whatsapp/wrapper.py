@@ -19,12 +19,20 @@
 
 import asyncio
 import os
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 from agoras.core.interfaces import SocialNetwork
 
 from .api import WhatsAppAPI
+from .broadcast import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MESSAGES_PER_SECOND,
+    broadcast_rate_limiter,
+    read_recipients,
+    run_broadcast,
+)
 
 
 class WhatsApp(SocialNetwork):
@@ -128,6 +136,15 @@ class WhatsApp(SocialNetwork):
         if self.api:
             await self.api.disconnect()
 
+    def _publish_destination(self):
+        """
+        Return where posts go, so the publish journal tells targets apart.
+
+        Returns:
+            dict: The recipient phone number
+        """
+        return {"recipient": self.whatsapp_recipient}
+
     async def post(
         self,
         status_text,
@@ -162,39 +179,128 @@ class WhatsApp(SocialNetwork):
             filter(None, [status_image_url_1, status_image_url_2, status_image_url_3, status_image_url_4])
         )
 
-        if image_urls:
-            # WhatsApp supports multiple media in sequence
-            message_ids = []
-            images = await self.download_images(image_urls)
-
-            try:
-                for i, image in enumerate(images):
-                    if image.content and image.file_type:
-                        # First image gets the full caption, others get minimal caption
-                        caption = message_text if i == 0 else f"Image {i + 1}"
-
-                        message_id = await self.api.send_image(
-                            to=self._require_recipient(), image_url=image.url, caption=caption
-                        )
-                        message_ids.append(message_id)
-                    else:
-                        raise Exception(f"Failed to validate image: {image.url}")
-            finally:
-                for image in images:
-                    image.cleanup()
-
-            # Return first message ID for consistency
-            primary_message_id = message_ids[0] if message_ids else None
-        else:
-            # Text-only message
-            if not message_text:
-                raise Exception("No status text, link, or images provided.")
+        if not image_urls and not message_text:
+            raise Exception("No status text, link, or images provided.")
 
-            primary_message_id = await self.api.send_message(to=self._require_recipient(), text=message_text)
+        image_urls = await self._validated_image_urls(image_urls)
+        message_ids = await self._send_content(self._require_recipient(), message_text, image_urls)
 
+        # Return first message ID for consistency
+        primary_message_id = message_ids[0] if message_ids else None
         self._output_status(primary_message_id)
         return primary_message_id
 
+    async def _validated_image_urls(self, image_urls: List[str]) -> List[str]:
+        """
+        Download and validate images, returning their URLs.
+
+        WhatsApp fetches media from the URL itself, so the downloads are only
+        used for validation and are cleaned up right away.
+
+        Args:
+            image_urls (list): Image URLs
+
+        Returns:
+            list: Validated image URLs, in order
+
+        Raises:
+            Exception: If an image cannot be downloaded or validated
+        """
+        if not image_urls:
+            return []
+
+        images = await self.download_images(image_urls)
+        try:
+            for image in images:
+                if not image.content or not image.file_type:
+                    raise Exception(f"Failed to validate image: {image.url}")
+            return [image.url for image in images]
+        finally:
+            for image in images:
+                image.cleanup()
+
+    async def _send_content(self, to: str, message_text: str, image_urls: List[str]) -> List[str]:
+        """
+        Send a text message, or the images with the text as first caption, to one recipient.
+
+        Args:
+            to (str): Recipient phone number
+            message_text (str): Message text or first image caption
+            image_urls (list): Validated image URLs
+
+        Returns:
+            list: Message IDs, one per message sent
+        """
+        if not image_urls:
+            return [await self.api.send_message(to=to, text=message_text)]
+
+        # WhatsApp supports multiple media in sequence
+        message_ids = []
+        for i, image_url in enumerate(image_urls):
+            # First image gets the full caption, others get minimal caption
+            caption = message_text if i == 0 else f"Image {i + 1}"
+            message_ids.append(await self.api.send_image(to=to, image_url=image_url, caption=caption))
+        return message_ids
+
+    async def broadcast(
+        self,
+        recipients: Iterable[str],
+        output,
+        status_text: Optional[str] = None,
+        status_link: Optional[str] = None,
+        image_urls: Optional[List[str]] = None,
+        template_name: Optional[str] = None,
+        language_code: str = "en",
+        concurrency: int = DEFAULT_CONCURRENCY,
+        messages_per_second: float = DEFAULT_MESSAGES_PER_SECOND,
+    ) -> Tuple[int, int]:
+        """
+        Send the same message or template to many recipients on this client.
+
+        Images are validated once for the whole broadcast. Sends run
+        concurrently, paced to ``messages_per_second``, and each recipient's
+        message IDs or error are written to ``output`` as a JSON line.
+
+        Args:
+            recipients (iterable): Recipient phone numbers
+            output: Text stream receiving one JSON result per recipient
+            status_text (str, optional): Message text
+            status_link (str, optional): URL appended to the text
+            image_urls (list, optional): Up to four image URLs
+            template_name (str, optional): Send this pre-approved template instead of text and images
+            language_code (str): Template language code
+            concurrency (int): Maximum recipients in flight
+            messages_per_second (float): Throughput tier of the business phone number
+
+        Returns:
+            tuple: ``(sent, failed)`` recipient counts
+        """
+        if not self.api:
+            raise Exception("WhatsApp API not initialized")
+
+        if template_name:
+
+            async def send(to):
+                return [await self.api.send_template(to=to, template_name=template_name, language_code=language_code)]
+
+        else:
+            message_text = f"{status_text or ''}\n{status_link}".strip() if status_link else status_text
+            image_urls = list(filter(None, image_urls or []))
+            if not image_urls and not message_text:
+                raise Exception("No status text, link, images, or template provided.")
+            validated_urls = await self._validated_image_urls(image_urls)
+
+            async def send(to):
+                return await self._send_content(to, message_text, validated_urls)
+
+        rate_limiter, send_interval = self.api.rate_limiter, self.api.send_interval
+        self.api.rate_limiter = broadcast_rate_limiter(messages_per_second)
+        self.api.send_interval = 0
+        try:
+            return await run_broadcast(recipients, send, output, concurrency)
+        finally:
+            self.api.rate_limiter, self.api.send_interval = rate_limiter, send_interval
+
     async def like(self, message_id=None):
         """
         Like a WhatsApp message (not supported).
@@ -360,6 +466,41 @@ class WhatsApp(SocialNetwork):
 
         await self.send_template(template_name, language_code=language_code, components=components)
 
+    async def _handle_broadcast_action(self):
+        """Handle broadcast action, reading recipients from a file (or - for stdin)."""
+        recipients_path = self._get_config_value("whatsapp_recipients", "WHATSAPP_RECIPIENTS")
+        if not recipients_path:
+            raise Exception("A recipients file is required for broadcast action.")
+        output_path = self._get_config_value("whatsapp_broadcast_output", "WHATSAPP_BROADCAST_OUTPUT")
+        concurrency = self._get_config_value("whatsapp_broadcast_concurrency", "WHATSAPP_BROADCAST_CONCURRENCY")
+        messages_per_second = self._get_config_value("whatsapp_messages_per_second", "WHATSAPP_MESSAGES_PER_SECOND")
+
+        image_urls = [self._get_config_value(f"status_image_url_{i}", f"STATUS_IMAGE_URL_{i}") for i in range(1, 5)]
+
+        source = sys.stdin if recipients_path == "-" else open(recipients_path, encoding="utf-8")
+        output = open(output_path, "w", encoding="utf-8") if output_path else sys.stdout
+        try:
+            sent, failed = await self.broadcast(
+                read_recipients(source),
+                output,
+                status_text=self._get_config_value("status_text", "STATUS_TEXT"),
+                status_link=self._get_config_value("status_link", "STATUS_LINK"),
+                image_urls=image_urls,
+                template_name=self._get_config_value("whatsapp_template_name", "WHATSAPP_TEMPLATE_NAME"),
+                language_code=self._get_config_value("whatsapp_template_language", "WHATSAPP_TEMPLATE_LANGUAGE")
+                or "en",
+                concurrency=int(concurrency or DEFAULT_CONCURRENCY),
+                messages_per_second=float(messages_per_second or DEFAULT_MESSAGES_PER_SECOND),
+            )
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if output is not sys.stdout:
+                output.close()
+
+        if failed:
+            raise Exception(f"WhatsApp broadcast failed for {failed} of {sent + failed} recipients.")
+
     async def authorize_credentials(self):
         """
         Authorize and store WhatsApp credentials for future use.
@@ -405,29 +546,13 @@ class WhatsApp(SocialNetwork):
                 raise Exception("WhatsApp authorization failed.")
             return
 
-        # Initialize client before executing other actions
-        await self._initialize_client()
-
-        if action == "post":
-            await self._handle_post_action()
-        elif action == "like":
-            await self._handle_like_action()
-        elif action == "share":
-            await self._handle_share_action()
-        elif action == "delete":
-            await self._handle_delete_action()
-        elif action == "video":
-            await self._handle_video_action()
-        elif action == "template":
+        await super().execute_action(action)
+
+    async def _dispatch_action(self, action):
+        if action == "template":
             await self._handle_template_action()
-        elif action == "last-from-feed":
-            await self._handle_last_from_feed_action()
-        elif action == "random-from-feed":
-            await self._handle_random_from_feed_action()
-        elif action == "schedule":
-            await self._handle_schedule_action()
         else:
-            raise Exception(f'"{action}" action not supported.')
+            await super()._dispatch_action(action)
 
 
 async def main_async(kwargs):
@@ -17,7 +17,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.platforms.x.api module."""
 
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from agoras.core.api_base import BaseAPI
 from agoras.core.auth import raise_authentication_error_from_manager
@@ -33,6 +33,8 @@ class XAPI(BaseAPI):
     including tweets, likes, retweets, and media uploads using both v1.1 and v2 APIs.
     """
 
+    platform = "x"
+
     def __init__(self, consumer_key, consumer_secret, oauth_token, oauth_secret):
         """
         Initialize X API instance.
@@ -53,6 +55,20 @@ class XAPI(BaseAPI):
             oauth_secret=oauth_secret,
         )
 
+    def _http_sessions(self) -> List:
+        """
+        Return the tweepy v1.1 and v2 sessions so X rate-limit headers reach the limiter.
+
+        Returns:
+            list: ``requests`` sessions owned by the tweepy clients
+        """
+        sessions = []
+        for tweepy_client in (getattr(self.client, "client_v1", None), getattr(self.client, "client_v2", None)):
+            session = getattr(tweepy_client, "session", None)
+            if session is not None and hasattr(session, "hooks"):
+                sessions.append(session)
+        return sessions
+
     @property
     def consumer_key(self):
         """Get the Twitter consumer key from the auth manager."""
@@ -121,12 +137,12 @@ class XAPI(BaseAPI):
         self.client = None
         self._authenticated = False
 
-    async def upload_media(self, media_content: bytes, media_type: str) -> str:
+    async def upload_media(self, media_content: Union[bytes, str], media_type: str) -> str:
         """
         Upload media to X.
 
         Args:
-            media_content (bytes): Raw media content
+            media_content (bytes or str): Raw media content, or the path of the media file
             media_type (str): Media MIME type
 
         Returns:
@@ -17,17 +17,30 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """agoras.platforms.x.client module."""
 
-import asyncio
+import io
 import mimetypes
-import os
-import tempfile
-from typing import List, Optional, Tuple
+from typing import BinaryIO, List, Optional, Tuple, Union
 
 from tweepy import API, Client, OAuth1UserHandler
 
+from agoras.common.executors import (
+    API as API_EXECUTOR,
+    POLL,
+    UPLOAD,
+    run_blocking,
+)
+from agoras.core.concurrency import map_bounded
+from agoras.core.polling import PollSchedule, poll_until
+from agoras.core.retry import retry_async, retry_sync
+from agoras.core.upload import CHUNK_RETRY_POLICY, UPLOAD_CONCURRENCY, UploadSource, chunk_ranges
+
+# X accepts APPEND segments of up to 5 MB.
+APPEND_CHUNK_SIZE = 4 * 1024 * 1024
+MEDIA_PROCESSING_SCHEDULE = PollSchedule(initial=1.0, max_interval=10.0, timeout=600.0)
+
 
 def _upload_path_for_media_type(media_type: str) -> Tuple[str, Optional[str]]:
-    """Return temp-file suffix and X media_category for a MIME type."""
+    """Return file suffix and X media_category for a MIME type."""
     if media_type.startswith("video/"):
         suffix = mimetypes.guess_extension(media_type) or ".mp4"
         return suffix, "tweet_video"
@@ -37,6 +50,13 @@ def _upload_path_for_media_type(media_type: str) -> Tuple[str, Optional[str]]:
     return ".bin", None
 
 
+def _open_media(media_content: Union[bytes, str]) -> BinaryIO:
+    """Return a readable file object over in-memory content or a media file."""
+    if isinstance(media_content, (bytes, bytearray)):
+        return io.BytesIO(media_content)
+    return open(media_content, "rb")
+
+
 class XAPIClient:
     """
     X API client that centralizes both v1.1 and v2 API operations.
@@ -163,14 +183,19 @@ class XAPIClient:
                 "verified": getattr(user, "verified", False),
             }
 
-        return await asyncio.to_thread(_sync_get_info)
+        return await run_blocking(API_EXECUTOR, _sync_get_info)
 
-    async def upload_media(self, media_content: bytes, media_type: str) -> str:
+    async def upload_media(self, media_content: Union[bytes, str], media_type: str) -> str:
         """
         Upload media using v1.1 API.
 
+        Images are sent in one request. Videos use the chunked
+        INIT/APPEND/FINALIZE flow with APPEND segments sent concurrently, and
+        wait for X to finish processing them. Content is read straight from
+        memory or from the given file, without a temporary copy.
+
         Args:
-            media_content (bytes): Raw media content
+            media_content (bytes or str): Raw media content, or the path of the media file
             media_type (str): Media MIME type
 
         Returns:
@@ -182,28 +207,74 @@ class XAPIClient:
         if not self.client_v1:
             raise Exception("X v1 client not initialized")
 
-        def _sync_upload():
-            suffix, media_category = _upload_path_for_media_type(media_type)
-            _, temp_file = tempfile.mkstemp(suffix=suffix)
-            try:
-                with open(temp_file, "wb") as f:
-                    f.write(media_content)
+        suffix, media_category = _upload_path_for_media_type(media_type)
 
-                upload_kwargs = {}
-                if media_category:
-                    upload_kwargs["media_category"] = media_category
+        if not media_type.startswith("video/"):
 
-                # Tweepy infers file_type from temp path suffix; do not pass file_type
-                # (duplicate kwarg breaks chunked_upload for video).
-                media = self.client_v1.media_upload(temp_file, **upload_kwargs)  # type: ignore
+            def _sync_simple_upload():
+                with _open_media(media_content) as media_file:
+                    # Tweepy only uses the filename for the multipart part name.
+                    media = self.client_v1.simple_upload(  # type: ignore[union-attr]
+                        f"media{suffix}", file=media_file, media_category=media_category
+                    )
                 return media.media_id
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
 
-        media_id = await asyncio.to_thread(_sync_upload)
-        return str(media_id)
+            return str(await run_blocking(UPLOAD, _sync_simple_upload))
+
+        media = await run_blocking(
+            UPLOAD, self._chunked_upload, UploadSource(media_content), media_type, media_category
+        )
+        await self._wait_for_media_processing(media)
+        return str(media.media_id)
+
+    def _chunked_upload(self, source: UploadSource, media_type: str, media_category: Optional[str]):
+        """Run INIT, concurrent APPEND and FINALIZE for one media file."""
+        client = self.client_v1
+        if not client:
+            raise Exception("X v1 client not initialized")
+
+        media_id = client.chunked_upload_init(source.size, media_type, media_category=media_category).media_id
+        # At most 1000 segments per upload.
+        chunk_size = max(APPEND_CHUNK_SIZE, -(-source.size // 999))
+
+        def _append(segment):
+            segment_index, (offset, length) = segment
+            retry_sync(
+                client.chunked_upload_append,
+                media_id,
+                ("media", source.read(offset, length)),
+                segment_index,
+                idempotent=True,
+                policy=CHUNK_RETRY_POLICY,
+            )
+
+        # Segments carry their index, so X accepts them in any order.
+        map_bounded(_append, list(enumerate(chunk_ranges(source.size, chunk_size))), limit=UPLOAD_CONCURRENCY)
+        return client.chunked_upload_finalize(media_id)
+
+    async def _wait_for_media_processing(self, media) -> None:
+        """Poll X until an uploaded video finished processing."""
+        processing_info = getattr(media, "processing_info", None) or {}
+
+        def _finished(info):
+            if info.get("state") == "failed":
+                error = info.get("error") or {}
+                raise Exception(f"X media processing failed: {error.get('message') or error.get('name') or 'unknown'}")
+            return info.get("state") not in ("pending", "in_progress")
+
+        if _finished(processing_info):
+            return
+
+        async def _check_processed():
+            status = await run_blocking(POLL, self.client_v1.get_media_upload_status, media.media_id)  # type: ignore
+            return _finished(getattr(status, "processing_info", None) or {})
+
+        await poll_until(
+            _check_processed,
+            MEDIA_PROCESSING_SCHEDULE,
+            timeout_message=f"X media {media.media_id} was not processed in time",
+            initial_delay=processing_info.get("check_after_secs", 0),
+        )
 
     async def create_tweet(self, text: str, media_ids: Optional[List[str]] = None) -> str:
         """
@@ -223,24 +294,23 @@ class XAPIClient:
             raise Exception("X v2 client not initialized")
 
         def _sync_create_tweet():
-            try:
-                # Use the correct method signature for Tweepy v2
-                if media_ids:
-                    response = self.client_v2.create_tweet(text=text, media_ids=media_ids)  # type: ignore
-                else:
-                    response = self.client_v2.create_tweet(text=text)  # type: ignore
-
-                # Handle Tweepy response object safely
-                response_data = getattr(response, "data", None)
-                if response_data and isinstance(response_data, dict) and "id" in response_data:
-                    return str(response_data["id"])
-                else:
-                    raise Exception("Invalid response from X API")
-            except Exception as api_error:
-                raise Exception(f"X API error: {str(api_error)}")
-
-        tweet_id = await asyncio.to_thread(_sync_create_tweet)
-        return tweet_id
+            # Use the correct method signature for Tweepy v2
+            if media_ids:
+                return self.client_v2.create_tweet(text=text, media_ids=media_ids)  # type: ignore
+            return self.client_v2.create_tweet(text=text)  # type: ignore
+
+        try:
+            # Not idempotent: only retried when X rejects it with 429.
+            response = await retry_async(run_blocking, API_EXECUTOR, _sync_create_tweet)
+
+            # Handle Tweepy response object safely
+            response_data = getattr(response, "data", None)
+            if response_data and isinstance(response_data, dict) and "id" in response_data:
+                return str(response_data["id"])
+            else:
+                raise Exception("Invalid response from X API")
+        except Exception as api_error:
+            raise Exception(f"X API error: {str(api_error)}")
 
     async def like_tweet(self, tweet_id: str) -> str:
         """
@@ -262,7 +332,7 @@ class XAPIClient:
             self.client_v2.like(tweet_id)  # type: ignore
             return tweet_id
 
-        result = await asyncio.to_thread(_sync_like)
+        result = await retry_async(run_blocking, API_EXECUTOR, _sync_like, idempotent=True)
         return result
 
     async def retweet(self, tweet_id: str) -> str:
@@ -285,7 +355,7 @@ class XAPIClient:
             self.client_v2.retweet(tweet_id)  # type: ignore
             return tweet_id
 
-        result = await asyncio.to_thread(_sync_retweet)
+        result = await retry_async(run_blocking, API_EXECUTOR, _sync_retweet, idempotent=True)
         return result
 
     async def delete_tweet(self, tweet_id: str) -> str:
@@ -308,5 +378,5 @@ class XAPIClient:
             self.client_v2.delete_tweet(tweet_id)  # type: ignore
             return tweet_id
 
-        result = await asyncio.to_thread(_sync_delete)
+        result = await retry_async(run_blocking, API_EXECUTOR, _sync_delete, idempotent=True)
         return result
@@ -20,6 +20,7 @@
 import asyncio
 import sys
 
+from agoras.core.concurrency import gather_bounded
 from agoras.core.interfaces import SocialNetwork
 
 from .api import XAPI
@@ -145,6 +146,45 @@ class X(SocialNetwork):
         if self.api:
             await self.api.disconnect()
 
+    async def _upload_media_url(self, media_url):
+        """
+        Download one image or video and upload it to X.
+
+        Args:
+            media_url (str): Image or video URL
+
+        Returns:
+            str: Media ID, or None if the download or upload failed
+        """
+        try:
+            # Try to download as image first, then video
+            try:
+                image = await self.download_images([media_url])
+                if image and len(image) > 0:
+                    media_obj = image[0]
+                else:
+                    raise Exception("Failed to download as image")
+            except Exception:
+                # Try as video
+                video = await self.download_video(media_url)
+                media_obj = video
+
+            media_id = None
+            try:
+                # Upload media to X
+                if media_obj.content and media_obj.file_type:
+                    media_id = await self.api.upload_media(
+                        media_obj.temp_file or media_obj.content, media_obj.file_type.mime
+                    )
+            finally:
+                # Clean up temporary files
+                media_obj.cleanup()
+            return media_id
+
+        except Exception as e:
+            print(f"Failed to upload media {media_url}: {str(e)}", file=sys.stderr)
+            return None
+
     async def post(
         self,
         status_text,
@@ -171,7 +211,6 @@ class X(SocialNetwork):
         if not self.api:
             raise Exception("X API not initialized")
 
-        media_ids = []
         source_media = list(
             filter(None, [status_image_url_1, status_image_url_2, status_image_url_3, status_image_url_4])
         )
@@ -179,34 +218,9 @@ class X(SocialNetwork):
         if not source_media and not status_text and not status_link:
             raise Exception("No status text, link, or images provided.")
 
-        # Download and upload media using the Media system
-        if source_media:
-            # Handle both images and videos
-            for media_url in source_media:
-                try:
-                    # Try to download as image first, then video
-                    try:
-                        image = await self.download_images([media_url])
-                        if image and len(image) > 0:
-                            media_obj = image[0]
-                        else:
-                            raise Exception("Failed to download as image")
-                    except Exception:
-                        # Try as video
-                        video = await self.download_video(media_url)
-                        media_obj = video
-
-                    # Upload media to X
-                    if media_obj.content and media_obj.file_type:
-                        media_id = await self.api.upload_media(media_obj.content, media_obj.file_type.mime)
-                        if media_id:
-                            media_ids.append(media_id)
-
-                    # Clean up temporary files
-                    media_obj.cleanup()
-
-                except Exception as e:
-                    print(f"Failed to upload media {media_url}: {str(e)}", file=sys.stderr)
+        # Download and upload media concurrently, keeping the original order
+        uploaded = await gather_bounded(self._upload_media_url, source_media)
+        media_ids = [media_id for media_id in uploaded if media_id]
 
         # Compose tweet text
         tweet_text = f"{status_text} {status_link}".strip()
@@ -323,8 +337,8 @@ class X(SocialNetwork):
             )
 
         try:
-            # Upload video to X
-            media_id = await self.api.upload_media(video.content, video.file_type.mime)
+            # Upload video to X, reading segments from the downloaded file
+            media_id = await self.api.upload_media(video.temp_file or video.content, video.file_type.mime)
 
             # Compose tweet text with title and description
             tweet_text_parts = []
@@ -33,6 +33,8 @@ class YouTubeAPI(BaseAPI):
     and all YouTube API operations.
     """
 
+    platform = "youtube"
+
     def __init__(self, client_id, client_secret, refresh_token=None):
         """
         Initialize YouTube API instance.
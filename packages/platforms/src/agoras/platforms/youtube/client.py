@@ -19,13 +19,15 @@
 
 import asyncio
 import http.client as httplib
-import random
-import time
 from typing import Any, Dict, Optional
 
 import httplib2
 from apiclient import discovery, errors, http
 
+from agoras.common.executors import API, CPU, UPLOAD, run_blocking
+from agoras.core.retry import RetryPolicy, retry_async
+from agoras.core.upload import DEFAULT_CHUNK_SIZE, UploadCheckpoint, UploadSource
+
 
 class YouTubeAPIClient:
     """
@@ -49,6 +51,12 @@ class YouTubeAPIClient:
         httplib.BadStatusLine,
     )
     RETRIABLE_STATUS_CODES = [500, 502, 503, 504]
+    # Chunks must be multiples of 256 KiB; smaller chunks lose less on a dropped connection.
+    UPLOAD_CHUNK_SIZE = DEFAULT_CHUNK_SIZE
+    # Resumable upload chunks can be resent, so use a long backoff.
+    UPLOAD_RETRY_POLICY = RetryPolicy(attempts=MAX_RETRIES + 1, base_delay=1.0, max_delay=64.0)
+    # Rating, deleting and reading are idempotent API calls.
+    API_RETRY_POLICY = RetryPolicy(exceptions=RETRIABLE_EXCEPTIONS)
 
     def __init__(self, access_token: str):
         """
@@ -60,6 +68,7 @@ class YouTubeAPIClient:
         self.access_token = access_token
         self.youtube_client = None
         self._authenticated = False
+        self._channel_id: Optional[str] = None
 
         # Set up retry configuration
         httplib2.RETRIES = 1
@@ -108,7 +117,7 @@ class YouTubeAPIClient:
                 # Build YouTube API client with authorized HTTP
                 return discovery.build("youtube", "v3", http=authorized_http)
 
-            self.youtube_client = await asyncio.to_thread(_sync_create)
+            self.youtube_client = await run_blocking(API, _sync_create)
             self._authenticated = True
             return True
         except Exception as e:
@@ -120,6 +129,7 @@ class YouTubeAPIClient:
         """
         self.youtube_client = None
         self._authenticated = False
+        self._channel_id = None
 
     def _simplify_upload_method(self, request, retry: int, error: str) -> tuple:
         """Helper method to reduce complexity of upload_video."""
@@ -142,15 +152,13 @@ class YouTubeAPIClient:
 
         return None, None, retry
 
-    def _handle_upload_retry(self, retry: int, error: str) -> int:
-        """Helper method to handle upload retries."""
+    async def _handle_upload_retry(self, retry: int, error: str) -> int:
+        """Helper method to wait before the next upload retry without blocking the event loop."""
         retry += 1
         if retry > self.MAX_RETRIES:
             raise Exception("No longer attempting to retry.")
 
-        max_sleep = 2**retry
-        sleep_seconds = random.random() * max_sleep
-        time.sleep(sleep_seconds)
+        await asyncio.sleep(self.UPLOAD_RETRY_POLICY.backoff(retry))
         return retry
 
     async def upload_video(
@@ -180,13 +188,10 @@ class YouTubeAPIClient:
             Exception: If upload fails
         """
 
-        def _sync_upload():
+        def _create_request():
             if not self.youtube_client:
                 raise Exception("YouTube client not initialized")
 
-            retry = 0
-            response = None
-            error = ""  # Initialize as empty string instead of None
             tags = None
 
             if keywords:
@@ -198,25 +203,103 @@ class YouTubeAPIClient:
             }
 
             # Call the API's videos.insert method to create and upload the video
-            request = self.youtube_client.videos().insert(
+            return self.youtube_client.videos().insert(
                 part=",".join(body.keys()),
                 body=body,
-                media_body=http.MediaFileUpload(video_file_path, chunksize=-1, resumable=True),
+                media_body=http.MediaFileUpload(video_file_path, chunksize=self.UPLOAD_CHUNK_SIZE, resumable=True),
             )
 
-            while response is None:
-                response, new_error, retry = self._simplify_upload_method(request, retry, error)
+        def _open_checkpoint(channel_id):
+            source = UploadSource(video_file_path)
+            return UploadCheckpoint.for_upload("youtube", source, channel_id, title, category_id, privacy_status)
+
+        request = await run_blocking(API, _create_request)
+        checkpoint = await run_blocking(CPU, _open_checkpoint, await self._get_channel_id())
+        resumable_uri = checkpoint.load().get("resumable_uri")
+
+        try:
+            response = None
+            if resumable_uri:
+                response = await run_blocking(UPLOAD, self._resume_upload, request, resumable_uri)
+            if response is None:
+                response = await self._upload_chunks(request, checkpoint)
+        except errors.HttpError as e:
+            if not resumable_uri or not 400 <= e.resp.status < 500:
+                raise
+            # The upload session expired or was rejected: start a fresh upload.
+            checkpoint.clear()
+            request = await run_blocking(API, _create_request)
+            response = await self._upload_chunks(request, checkpoint)
+
+        checkpoint.clear()
+        return response
+
+    async def _get_channel_id(self) -> str:
+        """Return the authenticated channel's ID, looked up once per client."""
+
+        def _sync_channel_id():
+            if not self.youtube_client:
+                raise Exception("YouTube client not initialized")
 
-                if response is not None:
-                    break
+            response = self.youtube_client.channels().list(part="id", mine=True).execute()
+            if not response.get("items"):
+                raise Exception("No YouTube channel found for authenticated user")
+            return response["items"][0]["id"]
 
-                if new_error is not None:
-                    retry = self._handle_upload_retry(retry, new_error)
-                    error = ""  # Reset error for next iteration
+        if self._channel_id is None:
+            self._channel_id = await retry_async(
+                run_blocking, API, _sync_channel_id, idempotent=True, policy=self.API_RETRY_POLICY
+            )
+        return self._channel_id
 
-            return response
+    def _resume_upload(self, request, resumable_uri: str) -> Optional[Dict[str, Any]]:
+        """
+        Point ``request`` at a saved upload session.
 
-        return await asyncio.to_thread(_sync_upload)
+        Asks YouTube how many bytes the session holds (an empty ``PUT`` with
+        ``Content-Range: bytes */<size>``) and sets the request's public
+        ``resumable_uri`` and ``resumable_progress`` so ``next_chunk`` sends
+        the rest.
+
+        Returns:
+            dict or None: The video if the session had already finished
+
+        Raises:
+            errors.HttpError: If YouTube no longer accepts the session
+        """
+        headers = {"Content-Range": f"bytes */{request.resumable.size()}", "Content-Length": "0"}
+        resp, content = request.http.request(resumable_uri, method="PUT", body="", headers=headers)
+        if resp.status in (200, 201):
+            return request.postproc(resp, content)
+        if resp.status != 308:
+            raise errors.HttpError(resp, content, uri=resumable_uri)
+
+        request.resumable_uri = resumable_uri
+        # Range is "bytes=0-<last byte received>"; absent when nothing was kept.
+        received = resp.get("range")
+        request.resumable_progress = int(received.split("-")[1]) + 1 if received else 0
+        return None
+
+    async def _upload_chunks(self, request, checkpoint: UploadCheckpoint) -> Dict[str, Any]:
+        """Send upload chunks until YouTube returns the video, saving the session URI for resuming."""
+        retry = 0
+        response = None
+
+        while response is None:
+            try:
+                response, new_error, retry = await run_blocking(
+                    UPLOAD, self._simplify_upload_method, request, retry, ""
+                )
+            finally:
+                # Saved even when the chunk failed, so a later attempt can resume the session.
+                resumable_uri = getattr(request, "resumable_uri", None)
+                if isinstance(resumable_uri, str) and checkpoint.load().get("resumable_uri") != resumable_uri:
+                    await run_blocking(API, checkpoint.save, resumable_uri=resumable_uri)
+
+            if response is None and new_error is not None:
+                retry = await self._handle_upload_retry(retry, new_error)
+
+        return response
 
     async def like_video(self, video_id: str) -> None:
         """
@@ -236,7 +319,7 @@ class YouTubeAPIClient:
             request = self.youtube_client.videos().rate(id=video_id, rating="like")
             request.execute()
 
-        return await asyncio.to_thread(_sync_like)
+        return await retry_async(run_blocking, API, _sync_like, idempotent=True, policy=self.API_RETRY_POLICY)
 
     async def delete_video(self, video_id: str) -> None:
         """
@@ -256,7 +339,7 @@ class YouTubeAPIClient:
             request = self.youtube_client.videos().delete(id=video_id)
             request.execute()
 
-        return await asyncio.to_thread(_sync_delete)
+        return await retry_async(run_blocking, API, _sync_delete, idempotent=True, policy=self.API_RETRY_POLICY)
 
     async def get_channel_info(self) -> Dict[str, Any]:
         """
@@ -290,7 +373,9 @@ class YouTubeAPIClient:
                 "view_count": channel["statistics"].get("viewCount", 0),
             }
 
-        return await asyncio.to_thread(_sync_get_channel_info)
+        return await retry_async(
+            run_blocking, API, _sync_get_channel_info, idempotent=True, policy=self.API_RETRY_POLICY
+        )
 
     async def get_video_info(self, video_id: str) -> Dict[str, Any]:
         """
@@ -329,7 +414,7 @@ class YouTubeAPIClient:
                 "comment_count": video["statistics"].get("commentCount", 0),
             }
 
-        return await asyncio.to_thread(_sync_get_video_info)
+        return await retry_async(run_blocking, API, _sync_get_video_info, idempotent=True, policy=self.API_RETRY_POLICY)
 
     async def search_videos(self, query: str, max_results: int = 25) -> Dict[str, Any]:
         """
@@ -353,4 +438,4 @@ class YouTubeAPIClient:
             request = self.youtube_client.search().list(part="snippet", type="video", q=query, maxResults=max_results)
             return request.execute()
 
-        return await asyncio.to_thread(_sync_search)
+        return await retry_async(run_blocking, API, _sync_search, idempotent=True, policy=self.API_RETRY_POLICY)
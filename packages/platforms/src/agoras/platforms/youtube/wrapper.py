@@ -20,6 +20,7 @@
 import asyncio
 
 from agoras.core.interfaces import SocialNetwork
+from agoras.core.journal import MEDIA, journal_step
 
 from .api import YouTubeAPI
 
@@ -216,50 +217,50 @@ class YouTube(SocialNetwork):
         if not video_title or not video_url:
             raise Exception("Video title and URL are required.")
 
-        # Download and validate video using the Media system
-        video = await self.download_video(video_url)
-
-        if not video.content or not video.file_type:
-            video.cleanup()
-            raise Exception("Failed to download or validate video")
-
-        from agoras.media.constraints import video_limits
-        from agoras.media.errors import MediaValidationError
-
-        allowed = video_limits("youtube").mime_types
-        if video.file_type.mime not in allowed:
-            video.cleanup()
-            raise MediaValidationError(
-                "youtube",
-                "video",
-                "mime_types",
-                video.file_type.mime,
-                sorted(allowed),
-            )
-
-        # Ensure temp file exists
-        if not video.temp_file:
-            video.cleanup()
-            raise Exception("No temporary file created for video")
-
-        try:
-            # Upload video using YouTube API
-            response = await self.api.upload_video(
-                video_file_path=video.temp_file,
-                title=video_title,
-                description=status_text,
-                category_id=self.youtube_category_id or "",
-                privacy_status=self.youtube_privacy_status or "private",
-                keywords=self.youtube_keywords,
-            )
-
-            video_id = response.get("id")
-            if not video_id:
-                raise Exception("Failed to get video ID from upload response")
-
-        finally:
-            # Clean up using Media system
-            video.cleanup()
+        async def upload_video():
+            # Download and validate video using the Media system
+            video = await self.download_video(video_url)
+            try:
+                if not video.content or not video.file_type:
+                    raise Exception("Failed to download or validate video")
+
+                from agoras.media.constraints import video_limits
+                from agoras.media.errors import MediaValidationError
+
+                allowed = video_limits("youtube").mime_types
+                if video.file_type.mime not in allowed:
+                    raise MediaValidationError(
+                        "youtube",
+                        "video",
+                        "mime_types",
+                        video.file_type.mime,
+                        sorted(allowed),
+                    )
+
+                # Ensure temp file exists
+                if not video.temp_file:
+                    raise Exception("No temporary file created for video")
+
+                # Upload video using YouTube API
+                response = await self.api.upload_video(
+                    video_file_path=video.temp_file,
+                    title=video_title,
+                    description=status_text,
+                    category_id=self.youtube_category_id or "",
+                    privacy_status=self.youtube_privacy_status or "private",
+                    keywords=self.youtube_keywords,
+                )
+
+                video_id = response.get("id")
+                if not video_id:
+                    raise Exception("Failed to get video ID from upload response")
+                return video_id
+            finally:
+                # Clean up using Media system
+                video.cleanup()
+
+        # The upload publishes the video; a retry after a crash reports it instead of downloading again
+        video_id = await journal_step(MEDIA, upload_video)
 
         self._output_status(video_id)
         return video_id
@@ -537,3 +537,44 @@ async def test_discord_main_async_execute_action(mock_discord_class):
     assert result is None
     mock_discord.execute_action.assert_called_once_with('video')
     mock_discord.disconnect.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.discord.wrapper.DiscordAPI')
+async def test_discord_broadcast_uploads_video_once(mock_api_class):
+    """Test a broadcast uploads to the first channel before posting to the others."""
+    mock_api = MagicMock()
+    mock_api.authenticate = AsyncMock()
+    order = []
+
+    async def upload_file(content, filename, embeds=None, channel=None):
+        order.append(channel)
+        if channel == 'missing':
+            raise Exception('Text channel missing not found.')
+        return f'id-{channel}'
+
+    mock_api.upload_file = AsyncMock(side_effect=upload_file)
+    mock_api_class.return_value = mock_api
+
+    discord = Discord(
+        discord_bot_token='token',
+        discord_server_name='Server',
+        discord_channel_names='general, missing, news',
+    )
+    await discord._initialize_client()
+
+    video = MagicMock(content=b'video-bytes')
+    video.file_type.extension = 'mp4'
+    with patch.object(discord, 'download_video', AsyncMock(return_value=video)) as mock_download:
+        results = await discord.broadcast(discord.discord_channel_names, video_url='https://example.com/v.mp4')
+
+    assert discord.discord_channel_name == 'general'
+    mock_download.assert_awaited_once()
+    video.cleanup.assert_called_once()
+    assert order[0] == 'general'
+    assert results == {
+        'general': {'id': 'id-general'},
+        'missing': {'error': 'Text channel missing not found.'},
+        'news': {'id': 'id-news'},
+    }
+    assert mock_api.upload_file.call_args_list[0][0] == (b'video-bytes', 'video.mp4')
@@ -16,11 +16,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from agoras.platforms.discord.client import DiscordAPIClient
+from agoras.platforms.discord.client import ATTACHMENT_EXPIRY_MARGIN, DiscordAPIClient, attachment_ttl
 
 # Initialization Tests
 
@@ -562,3 +563,41 @@ def test_discord_client_create_embed_minimal():
         assert result is mock_embed
         # Verify embed was created (no title/description set when not provided)
         mock_embed_class.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.discord.client.discord.File')
+async def test_discord_client_upload_file_reuses_attachment_url(mock_file_class):
+    """Test content uploaded once is posted as a link to its attachment afterwards."""
+    attachment_url = 'https://cdn.discordapp.com/attachments/1/2/video.mp4'
+    client = DiscordAPIClient('bot_token', 'server_name', 'channel_name')
+    mock_client = MagicMock()
+    mock_guild = MagicMock()
+    mock_guild.name = 'server_name'
+    mock_channel = AsyncMock()
+    mock_channel.name = 'channel_name'
+    mock_message = MagicMock()
+    mock_message.id = 123456789
+    mock_message.attachments = [MagicMock(url=attachment_url)]
+    mock_channel.send = AsyncMock(return_value=mock_message)
+    mock_guild.text_channels = [mock_channel]
+    mock_client.guilds = [mock_guild]
+    client.client = mock_client
+    client._authenticated = True
+
+    await client.upload_file(b'video-bytes', 'video.mp4')
+    await client.upload_file(b'video-bytes', 'video.mp4', content='Again')
+
+    mock_file_class.assert_called_once_with(b'video-bytes', filename='video.mp4')
+    assert mock_channel.send.call_args_list[1][1] == {'content': f'Again\n{attachment_url}'}
+
+
+def test_discord_attachment_ttl_follows_signed_expiry():
+    """Test signed attachment URLs are only reused until shortly before they expire."""
+    expires = int(time.time()) + 86400
+    url = f'https://cdn.discordapp.com/attachments/1/2/video.mp4?ex={expires:x}&is=0&hm=abc'
+
+    ttl = attachment_ttl(url)
+
+    assert 86400 - ATTACHMENT_EXPIRY_MARGIN - 5 < ttl <= 86400 - ATTACHMENT_EXPIRY_MARGIN
+    assert attachment_ttl('https://cdn.discordapp.com/attachments/1/2/video.mp4') is None
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agoras.common.store import MEMORY, KeyValueStore
+from agoras.platforms.discord.auth import DiscordAuthManager
+from agoras.platforms.discord.client import DiscordAPIClient
+from agoras.platforms.discord.rest import DISCORD_API_URL, DiscordRESTClient, discord_mode
+
+
+def _response(status=200, payload=None):
+    response = MagicMock()
+    response.status_code = status
+    response.json.return_value = payload
+    response.content = b'{}' if payload is not None else b''
+    response.text = json.dumps(payload)
+    response.headers = {}
+    return response
+
+
+GUILDS = _response(payload=[{'id': '10', 'name': 'Other'}, {'id': '11', 'name': 'Server'}])
+CHANNELS = _response(payload=[
+    {'id': '20', 'name': 'general', 'type': 2},
+    {'id': '21', 'name': 'general', 'type': 0},
+])
+
+
+def _client(store=None):
+    client = DiscordRESTClient('bot_token', 'Server', 'general', store=store or KeyValueStore(MEMORY))
+    client.session = MagicMock()
+    return client
+
+
+def test_discord_mode_defaults_to_rest(monkeypatch):
+    """Test REST is the default and the gateway client stays available."""
+    assert discord_mode() == 'rest'
+    monkeypatch.setenv('DISCORD_MODE', 'gateway')
+    assert discord_mode() == 'gateway'
+
+
+@pytest.mark.asyncio
+async def test_discord_rest_resolves_channel_once():
+    """Test names are resolved with two requests and then served from the store."""
+    store = KeyValueStore(MEMORY)
+    first = _client(store)
+    first.session.get.side_effect = [GUILDS, CHANNELS]
+
+    await first.authenticate()
+
+    assert (first.guild_id, first.channel_id) == ('11', '21')
+    assert first.session.get.call_args_list[0][0][0] == f'{DISCORD_API_URL}/users/@me/guilds'
+
+    second = _client(store)
+    second.session.get.return_value = _response(payload={'id': '1', 'username': 'bot'})
+    await second.authenticate()
+
+    assert second.channel_id == '21'
+    # Only the token is checked; the IDs come from the store.
+    second.session.get.assert_called_once()
+    assert second.session.get.call_args[0][0] == f'{DISCORD_API_URL}/users/@me'
+
+
+@pytest.mark.asyncio
+async def test_discord_rest_cached_channel_still_rejects_revoked_token():
+    """Test a cache hit does not report a revoked token as authenticated."""
+    store = KeyValueStore(MEMORY)
+    first = _client(store)
+    first.session.get.side_effect = [GUILDS, CHANNELS]
+    await first.authenticate()
+
+    second = _client(store)
+    second.session.get.return_value = _response(status=401, payload={'message': '401: Unauthorized'})
+
+    with pytest.raises(Exception, match='Discord authentication failed: 401'):
+        await second.authenticate()
+
+
+@pytest.mark.asyncio
+async def test_discord_rest_authenticate_channel_not_found():
+    """Test a missing channel fails authentication with the gateway client's message."""
+    client = _client()
+    client.session.get.side_effect = [GUILDS, _response(payload=[])]
+
+    with pytest.raises(Exception, match='Text channel general not found'):
+        await client.authenticate()
+
+
+@pytest.mark.asyncio
+async def test_discord_rest_send_message_is_one_request():
+    """Test a post with embeds is a single REST call once the channel is known."""
+    client = _client()
+    client.channel_id = '21'
+    client._authenticated = True
+    client.session.post.return_value = _response(payload={'id': '99'})
+    embed = client.create_embed(title='Title', url='https://example.com')
+
+    result = await client.send_message(content='Hello', embeds=[embed])
+
+    assert result == '99'
+    args, kwargs = client.session.post.call_args
+    assert args[0] == f'{DISCORD_API_URL}/channels/21/messages'
+    assert kwargs['json'] == {'content': 'Hello', 'embeds': [embed.to_dict()]}
+
+
+@pytest.mark.asyncio
+async def test_discord_rest_upload_file_reuses_attachment():
+    """Test files are sent as multipart once and linked afterwards."""
+    attachment_url = 'https://cdn.discordapp.com/attachments/21/5/video.mp4'
+    client = _client()
+    client.channel_id = '21'
+    client._authenticated = True
+    client.session.post.side_effect = [
+        _response(payload={'id': '1', 'attachments': [{'url': attachment_url}]}),
+        _response(payload={'id': '2'}),
+    ]
+
+    await client.upload_file(b'video-bytes', 'video.mp4', content='First')
+    await client.upload_file(b'video-bytes', 'video.mp4')
+
+    upload, link = client.session.post.call_args_list
+    assert upload[1]['files'] == {'files[0]': ('video.mp4', b'video-bytes')}
+    assert json.loads(upload[1]['data']['payload_json']) == {'content': 'First'}
+    assert link[1]['json'] == {'content': attachment_url}
+
+
+@pytest.mark.asyncio
+async def test_discord_rest_re_resolves_unknown_channel():
+    """Test a stale cached channel ID is resolved again and the request repeated."""
+    store = KeyValueStore(MEMORY)
+    client = _client(store)
+    client.channel_id = '7'
+    client._authenticated = True
+    client.session.get.side_effect = [GUILDS, CHANNELS]
+    client.session.delete.side_effect = [
+        _response(404, {'message': 'Unknown Channel', 'code': 10003}),
+        _response(204),
+    ]
+
+    assert await client.delete_message('55') == '55'
+
+    assert client.session.delete.call_args_list[1][0][0] == f'{DISCORD_API_URL}/channels/21/messages/55'
+    assert store.get('discord', client._cache_key)['channel_id'] == '21'
+
+
+@pytest.mark.asyncio
+async def test_discord_rest_unknown_message_is_not_re_resolved():
+    """Test other 404s are reported without resolving the channel again."""
+    client = _client()
+    client.channel_id = '21'
+    client._authenticated = True
+    client.session.delete.return_value = _response(404, {'message': 'Unknown Message', 'code': 10008})
+
+    with pytest.raises(Exception, match='delete message failed: 404 Unknown Message'):
+        await client.delete_message('55')
+
+    client.session.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch.object(DiscordRESTClient, 'authenticate', new_callable=AsyncMock)
+async def test_discord_auth_manager_rest_mode_skips_gateway(mock_authenticate):
+    """Test REST mode authenticates without logging in to the gateway."""
+    manager = DiscordAuthManager(bot_token='bot_token', server_name='Server', channel_name='general')
+
+    with patch.object(DiscordAuthManager, '_validate_bot_token', new_callable=AsyncMock) as mock_validate:
+        assert await manager.authenticate() is True
+
+    mock_validate.assert_not_called()
+    mock_authenticate.assert_awaited_once()
+    assert isinstance(manager.client, DiscordRESTClient)
+
+
+def test_discord_auth_manager_gateway_mode(monkeypatch):
+    """Test DISCORD_MODE=gateway keeps the discord.Client based client."""
+    monkeypatch.setenv('DISCORD_MODE', 'gateway')
+    manager = DiscordAuthManager(bot_token='bot_token', server_name='Server', channel_name='general')
+
+    assert isinstance(manager._create_client('bot_token'), DiscordAPIClient)
+
+
+@pytest.mark.asyncio
+async def test_discord_rest_for_channel_shares_session_and_media():
+    """Test other channels reuse the session, resolved server and uploaded attachments."""
+    attachment_url = 'https://cdn.discordapp.com/attachments/21/5/video.mp4'
+    client = _client()
+    client.session.get.side_effect = [
+        GUILDS,
+        CHANNELS,
+        _response(payload=[{'id': '22', 'name': 'news', 'type': 5}]),
+    ]
+    client.session.post.side_effect = [
+        _response(payload={'id': '1', 'attachments': [{'url': attachment_url}]}),
+        _response(payload={'id': '2'}),
+    ]
+    await client.authenticate()
+
+    news = client.for_channel('news')
+    await news.authenticate()
+
+    assert client.for_channel('news') is news
+    assert client.for_channel('general') is client
+    assert news.session is client.session
+    assert (news.guild_id, news.channel_id) == ('11', '22')
+    assert client.session.get.call_args_list[2][0][0] == f'{DISCORD_API_URL}/guilds/11/channels'
+
+    await client.upload_file(b'video-bytes', 'video.mp4')
+    await news.upload_file(b'video-bytes', 'video.mp4')
+
+    link = client.session.post.call_args_list[1]
+    assert link[0][0] == f'{DISCORD_API_URL}/channels/22/messages'
+    assert link[1]['json'] == {'content': attachment_url}
@@ -20,6 +20,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from agoras.common.store import MEMORY, KeyValueStore
+from agoras.core.upload import UploadCheckpoint, UploadSource
 from agoras.platforms.facebook.client import FacebookAPIClient
 
 
@@ -281,7 +283,7 @@ async def test_facebook_client_is_page_exception(mock_graph_api_class):
 
 
 @pytest.mark.asyncio
-@patch("agoras.platforms.facebook.client.requests.get")
+@patch("requests.Session.get")
 @patch("agoras.platforms.facebook.client.GraphAPI")
 async def test_facebook_client_get_page_token_success(mock_graph_api_class, mock_requests_get):
     """Test FacebookAPIClient get_page_access_token success."""
@@ -318,7 +320,7 @@ async def test_facebook_client_get_page_token_not_found(mock_graph_api_class):
     mock_response.json.return_value = {"data": []}  # No pages
     mock_response.raise_for_status.return_value = None
 
-    with patch("agoras.platforms.facebook.client.requests.get", return_value=mock_response):
+    with patch("requests.Session.get", return_value=mock_response):
         client = FacebookAPIClient("access_token")
         client.graph_api = mock_graph_api
         client._authenticated = True
@@ -464,7 +466,7 @@ async def test_facebook_client_share_post(mock_graph_api_class):
 
 
 @pytest.mark.asyncio
-@patch("agoras.platforms.facebook.client.requests.post")
+@patch("requests.Session.post")
 @patch("agoras.platforms.facebook.client.GraphAPI")
 async def test_facebook_client_upload_reel_or_story(mock_graph_api_class, mock_requests_post):
     """Test FacebookAPIClient upload_reel_or_story success."""
@@ -507,7 +509,7 @@ async def test_facebook_client_upload_reel_or_story(mock_graph_api_class, mock_r
 
 
 @pytest.mark.asyncio
-@patch("agoras.platforms.facebook.client.requests.post")
+@patch("requests.Session.post")
 async def test_facebook_client_upload_regular_video_falls_back_to_file_url(mock_requests_post):
     """Test regular video upload falls back to file_url for Facebook 6000/1363019."""
     import requests
@@ -557,3 +559,44 @@ async def test_facebook_client_upload_regular_video_falls_back_to_file_url(mock_
     assert fallback_call[1]["data"]["file_url"] == "https://example.com/video.mp4"
     assert fallback_call[1]["data"]["title"] == "Video Title"
     assert fallback_call[1]["data"]["description"] == "Video description"
+
+
+@pytest.mark.asyncio
+@patch("requests.Session.get")
+@patch("requests.Session.post")
+async def test_facebook_client_upload_regular_video_resumes_upload_session(mock_requests_post, mock_requests_get):
+    """Test a retried regular video upload continues from the offset Facebook already has."""
+    video_content = b"0123456789"
+    store = KeyValueStore(MEMORY)
+    UploadCheckpoint.for_upload("facebook", UploadSource(video_content), "app456", "page123", store=store).save(
+        session="upload:session123", offset=0
+    )
+
+    mock_requests_get.return_value = MagicMock(status_code=200, json=MagicMock(return_value={"file_offset": 6}))
+    data_response = MagicMock(status_code=200, json=MagicMock(return_value={"h": "file-handle-abc"}))
+    publish_response = MagicMock(status_code=200, json=MagicMock(return_value={"id": "video-999"}))
+    mock_requests_post.side_effect = [data_response, publish_response]
+
+    client = FacebookAPIClient("page-token")
+    client._authenticated = True
+
+    with patch("agoras.core.upload.checkpoint_store", return_value=store):
+        result = await client.upload_regular_video(
+            object_id="page123",
+            app_id="app456",
+            video_content=video_content,
+            video_file_type="video/mp4",
+            video_file_size=10,
+            video_filename="video.mp4",
+            status_text="Video description",
+            video_title="Video Title",
+        )
+
+    assert result == "video-999"
+    assert mock_requests_get.call_args[0][0] == "https://graph.facebook.com/v21.0/upload:session123"
+
+    data_call = mock_requests_post.call_args_list[0]
+    assert data_call[0][0] == "https://graph.facebook.com/v21.0/upload:session123"
+    assert data_call[1]["headers"]["file_offset"] == "6"
+    assert data_call[1]["data"] == b"6789"
+    assert mock_requests_post.call_args_list[1][1]["data"]["fbuploader_video_file_chunk"] == "file-handle-abc"
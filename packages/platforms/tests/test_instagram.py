@@ -641,3 +641,35 @@ async def test_instagram_main_async_execute_action(mock_instagram_class):
 def test_instagram_api_class_exists():
     """Test InstagramAPI class exists."""
     assert InstagramAPI is not None
+
+
+@pytest.mark.asyncio
+@patch("agoras.platforms.instagram.wrapper.InstagramAPI")
+@patch("agoras.platforms.instagram.auth.InstagramAuthManager")
+async def test_instagram_video_resumes_from_journaled_container(mock_auth_manager_class, mock_api_class):
+    """Test a retried video publishes the recorded container without downloading again."""
+    from agoras.common.store import MEMORY, KeyValueStore
+    from agoras.core.journal import CONTAINER, PublishJournal
+
+    configure_instagram_auth_mock(mock_auth_manager_class)
+    mock_api = MagicMock()
+    mock_api.authenticate = AsyncMock()
+    mock_api.create_media = AsyncMock()
+    mock_api.publish_media = AsyncMock(return_value="post123")
+    mock_api_class.return_value = mock_api
+
+    instagram = Instagram(**INSTAGRAM_KWARGS)
+    await instagram._initialize_client()
+
+    journal = PublishJournal("video-key", KeyValueStore(MEMORY))
+    journal.record(CONTAINER, "container123")
+
+    with patch.object(instagram, "download_video", new_callable=AsyncMock) as mock_download:
+        with patch.object(instagram, "_output_status"), journal.activate():
+            result = await instagram.video("Video text", "http://video.mp4", "Video Title")
+
+    assert result == "post123"
+    mock_download.assert_not_awaited()
+    mock_api.create_media.assert_not_awaited()
+    mock_api.publish_media.assert_awaited_once_with(INSTAGRAM_KWARGS["instagram_object_id"], "container123")
+    assert journal.get("published") == "post123"
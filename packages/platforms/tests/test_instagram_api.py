@@ -20,6 +20,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from agoras.common.store import MEMORY, KeyValueStore
+from agoras.core.ratelimit import NAMESPACE, RateLimiter
 from agoras.platforms.instagram.api import InstagramAPI
 
 
@@ -89,6 +91,17 @@ async def test_instagram_api_publish_media(instagram_api):
     instagram_api.client.publish_media.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_instagram_api_publish_media_spends_publishing_quota(instagram_api):
+    """publish_media draws from the 100 posts per day publishing bucket."""
+    instagram_api.rate_limiter = RateLimiter(KeyValueStore(MEMORY))
+
+    await instagram_api.publish_media('user_id', 'container-123')
+
+    bucket = f'instagram:publish:{instagram_api._rate_limit_account()}'
+    assert instagram_api.rate_limiter.store.get(NAMESPACE, bucket)['tokens'] == pytest.approx(99, abs=0.01)
+
+
 # Post Tests
 
 @pytest.mark.asyncio
@@ -20,6 +20,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from agoras.common.store import MEMORY, KeyValueStore
+from agoras.core.journal import MEDIA, PUBLISHED, PublishJournal
 from agoras.platforms.linkedin import LinkedIn
 from agoras.platforms.linkedin.api import LinkedInAPI
 
@@ -270,6 +272,7 @@ async def test_linkedin_video(mock_auth_manager_class, mock_api_class):
 
     mock_video = MagicMock()
     mock_video.content = b"video-bytes"
+    mock_video.temp_file = "/tmp/agoras-video.bin"
     mock_file_type = MagicMock()
     mock_file_type.mime = "video/mp4"
     mock_video.file_type = mock_file_type
@@ -282,7 +285,7 @@ async def test_linkedin_video(mock_auth_manager_class, mock_api_class):
         result = await linkedin.video("Caption", "http://video.mp4", "Title")
 
     assert result == "post-789"
-    mock_api.upload_video.assert_called_once_with(b"video-bytes")
+    mock_api.upload_video.assert_called_once_with("/tmp/agoras-video.bin")
     mock_api.post.assert_called_once_with(
         text="Caption",
         video_id="urn:li:video:123",
@@ -291,6 +294,37 @@ async def test_linkedin_video(mock_auth_manager_class, mock_api_class):
     mock_video.cleanup.assert_called_once()
 
 
+@pytest.mark.asyncio
+@patch("agoras.platforms.linkedin.wrapper.LinkedInAPI")
+@patch("agoras.platforms.linkedin.auth.LinkedInAuthManager")
+async def test_linkedin_video_resumes_journaled_upload(mock_auth_manager_class, mock_api_class):
+    """Test a journaled retry posts the uploaded video without downloading or uploading it again."""
+    configure_linkedin_auth_mock(mock_auth_manager_class)
+    mock_api = MagicMock()
+    mock_api.authenticate = AsyncMock()
+    mock_api.upload_video = AsyncMock()
+    mock_api.post = AsyncMock(return_value="post-789")
+    mock_api_class.return_value = mock_api
+
+    linkedin = LinkedIn(**LINKEDIN_KWARGS)
+    await linkedin._initialize_client()
+    journal = PublishJournal("key", KeyValueStore(MEMORY))
+    journal.record(MEDIA, "urn:li:video:123")
+
+    with (
+        patch.object(linkedin, "download_video", new_callable=AsyncMock) as mock_download,
+        patch.object(linkedin, "_output_status"),
+        journal.activate(),
+    ):
+        result = await linkedin.video("Caption", "http://video.mp4", "Title")
+
+    assert result == "post-789"
+    mock_download.assert_not_called()
+    mock_api.upload_video.assert_not_called()
+    mock_api.post.assert_called_once_with(text="Caption", video_id="urn:li:video:123", video_title="Title")
+    assert journal.get(PUBLISHED) == "post-789"
+
+
 @pytest.mark.asyncio
 @patch("agoras.platforms.linkedin.wrapper.LinkedInAPI")
 @patch("agoras.platforms.linkedin.auth.LinkedInAuthManager")
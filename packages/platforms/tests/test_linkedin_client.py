@@ -16,10 +16,15 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import threading
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import requests
 
+from agoras.common.store import MEMORY, KeyValueStore
+from agoras.core.upload import UploadCheckpoint, UploadSource
 from agoras.platforms.linkedin.client import LinkedInAPIClient
 
 # Initialization Tests
@@ -103,9 +108,9 @@ def test_linkedin_client_disconnect():
 # Upload Image Tests
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.requests.put')
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_upload_image(mock_to_thread, mock_requests_put):
+@patch('requests.Session.put')
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_upload_image(mock_run_blocking, mock_requests_put):
     """Test LinkedInAPIClient upload_image method."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -126,10 +131,10 @@ async def test_linkedin_client_upload_image(mock_to_thread, mock_requests_put):
     mock_upload_response.status_code = 201
     mock_requests_put.return_value = mock_upload_response
 
-    # Mock asyncio.to_thread to execute the sync function
-    def execute_sync(func):
+    # Mock run_blocking to execute the sync function
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     result = await client.upload_image(b'image_content', 'urn:li:person:123')
 
@@ -139,23 +144,23 @@ async def test_linkedin_client_upload_image(mock_to_thread, mock_requests_put):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_upload_image_not_initialized(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_upload_image_not_initialized(mock_run_blocking):
     """Test LinkedInAPIClient upload_image raises error when not initialized."""
     client = LinkedInAPIClient('access_token')
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     with pytest.raises(Exception, match='RestliClient not initialized'):
         await client.upload_image(b'content', 'urn:li:person:123')
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.requests.put')
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_upload_image_upload_failure(mock_to_thread, mock_requests_put):
+@patch('requests.Session.put')
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_upload_image_upload_failure(mock_run_blocking, mock_requests_put):
     """Test LinkedInAPIClient upload_image handles upload failure."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -176,9 +181,9 @@ async def test_linkedin_client_upload_image_upload_failure(mock_to_thread, mock_
     mock_upload_response.status_code = 400  # Upload failed
     mock_requests_put.return_value = mock_upload_response
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     with pytest.raises(Exception, match='Failed to upload image'):
         await client.upload_image(b'content', 'urn:li:person:123')
@@ -187,9 +192,9 @@ async def test_linkedin_client_upload_image_upload_failure(mock_to_thread, mock_
 # Upload Video Tests
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.requests.put')
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_upload_video(mock_to_thread, mock_requests_put):
+@patch('requests.Session.put')
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_upload_video(mock_run_blocking, mock_requests_put):
     """Test LinkedInAPIClient upload_video method."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -221,9 +226,9 @@ async def test_linkedin_client_upload_video(mock_to_thread, mock_requests_put):
     mock_upload_response.headers = {'etag': 'part-etag-1'}
     mock_requests_put.return_value = mock_upload_response
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     with patch.object(client, '_post_restli_action', return_value=finalize_response):
         result = await client.upload_video(b'video-bytes!', 'urn:li:person:123')
@@ -234,8 +239,8 @@ async def test_linkedin_client_upload_video(mock_to_thread, mock_requests_put):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_upload_video_finalize_empty_body(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_upload_video_finalize_empty_body(mock_run_blocking):
     """finalizeUpload may return 200 with an empty body (not JSON)."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -265,14 +270,14 @@ async def test_linkedin_client_upload_video_finalize_empty_body(mock_to_thread):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_upload_video_not_initialized(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_upload_video_not_initialized(mock_run_blocking):
     """Test LinkedInAPIClient upload_video raises error when not initialized."""
     client = LinkedInAPIClient('access_token')
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     with pytest.raises(Exception, match='RestliClient not initialized'):
         await client.upload_video(b'content', 'urn:li:person:123')
@@ -281,8 +286,8 @@ async def test_linkedin_client_upload_video_not_initialized(mock_to_thread):
 # Create Post Tests
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_create_post_text_only(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_create_post_text_only(mock_run_blocking):
     """Test LinkedInAPIClient create_post with text only."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -292,9 +297,9 @@ async def test_linkedin_client_create_post_text_only(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     result = await client.create_post('urn:li:person:123', 'Test post')
 
@@ -306,8 +311,8 @@ async def test_linkedin_client_create_post_text_only(mock_to_thread):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_create_post_with_link(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_create_post_with_link(mock_run_blocking):
     """Test LinkedInAPIClient create_post with link."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -317,9 +322,9 @@ async def test_linkedin_client_create_post_with_link(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     result = await client.create_post(
         'urn:li:person:123',
@@ -338,8 +343,8 @@ async def test_linkedin_client_create_post_with_link(mock_to_thread):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_create_post_with_video(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_create_post_with_video(mock_run_blocking):
     """Test LinkedInAPIClient create_post with video."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -349,9 +354,9 @@ async def test_linkedin_client_create_post_with_video(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     result = await client.create_post(
         'urn:li:person:123',
@@ -367,8 +372,8 @@ async def test_linkedin_client_create_post_with_video(mock_to_thread):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_create_post_with_single_image(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_create_post_with_single_image(mock_run_blocking):
     """Test LinkedInAPIClient create_post with single image."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -378,9 +383,9 @@ async def test_linkedin_client_create_post_with_single_image(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     result = await client.create_post('urn:li:person:123', 'Test post', image_ids=['image-123'])
 
@@ -390,8 +395,8 @@ async def test_linkedin_client_create_post_with_single_image(mock_to_thread):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_create_post_with_multiple_images(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_create_post_with_multiple_images(mock_run_blocking):
     """Test LinkedInAPIClient create_post with multiple images."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -401,9 +406,9 @@ async def test_linkedin_client_create_post_with_multiple_images(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     result = await client.create_post('urn:li:person:123', 'Test post', image_ids=['img1', 'img2', 'img3'])
 
@@ -414,22 +419,22 @@ async def test_linkedin_client_create_post_with_multiple_images(mock_to_thread):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_create_post_not_initialized(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_create_post_not_initialized(mock_run_blocking):
     """Test LinkedInAPIClient create_post raises error when not initialized."""
     client = LinkedInAPIClient('access_token')
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     with pytest.raises(Exception, match='RestliClient not initialized'):
         await client.create_post('urn:li:person:123', 'Test')
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_create_post_invalid_response(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_create_post_invalid_response(mock_run_blocking):
     """Test LinkedInAPIClient create_post handles invalid response."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -439,9 +444,9 @@ async def test_linkedin_client_create_post_invalid_response(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     with pytest.raises(Exception, match='Invalid response from LinkedIn API'):
         await client.create_post('urn:li:person:123', 'Test')
@@ -450,8 +455,8 @@ async def test_linkedin_client_create_post_invalid_response(mock_to_thread):
 # Like Post Tests
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_like_post(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_like_post(mock_run_blocking):
     """Test LinkedInAPIClient like_post method."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -461,9 +466,9 @@ async def test_linkedin_client_like_post(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     result = await client.like_post('post-123', 'urn:li:person:123')
 
@@ -475,8 +480,8 @@ async def test_linkedin_client_like_post(mock_to_thread):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_like_post_failure(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_like_post_failure(mock_run_blocking):
     """Test LinkedInAPIClient like_post handles failure."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -486,9 +491,9 @@ async def test_linkedin_client_like_post_failure(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     with pytest.raises(Exception, match='Unable to like post'):
         await client.like_post('post-123', 'urn:li:person:123')
@@ -497,8 +502,8 @@ async def test_linkedin_client_like_post_failure(mock_to_thread):
 # Share Post Tests
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_share_post(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_share_post(mock_run_blocking):
     """Test LinkedInAPIClient share_post method."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -509,9 +514,9 @@ async def test_linkedin_client_share_post(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     result = await client.share_post('post-123', 'urn:li:person:123', commentary='Shared!')
 
@@ -523,8 +528,8 @@ async def test_linkedin_client_share_post(mock_to_thread):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_share_post_failure(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_share_post_failure(mock_run_blocking):
     """Test LinkedInAPIClient share_post handles failure."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -534,9 +539,9 @@ async def test_linkedin_client_share_post_failure(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     with pytest.raises(Exception, match='Unable to share post'):
         await client.share_post('post-123', 'urn:li:person:123')
@@ -545,8 +550,8 @@ async def test_linkedin_client_share_post_failure(mock_to_thread):
 # Delete Post Tests
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_delete_post(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_delete_post(mock_run_blocking):
     """Test LinkedInAPIClient delete_post method."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -556,9 +561,9 @@ async def test_linkedin_client_delete_post(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     result = await client.delete_post('post-123')
 
@@ -569,8 +574,8 @@ async def test_linkedin_client_delete_post(mock_to_thread):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_delete_post_failure(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_delete_post_failure(mock_run_blocking):
     """Test LinkedInAPIClient delete_post handles failure."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -580,9 +585,9 @@ async def test_linkedin_client_delete_post_failure(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     with pytest.raises(Exception, match='Unable to delete post'):
         await client.delete_post('post-123')
@@ -591,8 +596,8 @@ async def test_linkedin_client_delete_post_failure(mock_to_thread):
 # Get User Info Tests
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_get_user_info(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_get_user_info(mock_run_blocking):
     """Test LinkedInAPIClient get_user_info method."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -604,9 +609,9 @@ async def test_linkedin_client_get_user_info(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     result = await client.get_user_info()
 
@@ -615,8 +620,8 @@ async def test_linkedin_client_get_user_info(mock_to_thread):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.linkedin.client.asyncio.to_thread')
-async def test_linkedin_client_get_user_info_expired_token(mock_to_thread):
+@patch('agoras.platforms.linkedin.client.run_blocking')
+async def test_linkedin_client_get_user_info_expired_token(mock_run_blocking):
     """Test LinkedInAPIClient get_user_info handles expired token."""
     client = LinkedInAPIClient('access_token')
     mock_restli = MagicMock()
@@ -628,9 +633,184 @@ async def test_linkedin_client_get_user_info_expired_token(mock_to_thread):
     client.restli_client = mock_restli
     client._authenticated = True
 
-    def execute_sync(func):
+    def execute_sync(executor, func):
         return func()
-    mock_to_thread.side_effect = execute_sync
+    mock_run_blocking.side_effect = execute_sync
 
     with pytest.raises(Exception, match='access token has expired'):
         await client.get_user_info()
+
+
+# Video Processing Tests
+
+@pytest.mark.asyncio
+@patch('agoras.core.polling.asyncio.sleep', new_callable=AsyncMock)
+async def test_linkedin_client_wait_for_video_available(mock_sleep):
+    """Test LinkedInAPIClient polls video status until AVAILABLE."""
+    client = LinkedInAPIClient('access_token')
+    client.restli_client = MagicMock()
+    statuses = ['WAITING_UPLOAD', 'PROCESSING', 'AVAILABLE']
+    client.restli_client.get.side_effect = [
+        MagicMock(response=MagicMock(json=MagicMock(return_value={'status': status}))) for status in statuses
+    ]
+
+    await client._wait_for_video_available('urn:li:video:123')
+
+    assert client.restli_client.get.call_count == 3
+    assert client.restli_client.get.call_args[1]['resource_path'] == '/videos/urn%3Ali%3Avideo%3A123'
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+@patch('agoras.core.polling.time')
+@patch('agoras.core.polling.asyncio.sleep', new_callable=AsyncMock)
+async def test_linkedin_client_wait_for_video_timeout(mock_sleep, mock_time):
+    """Test LinkedInAPIClient gives up once the processing deadline passes."""
+    mock_time.monotonic.side_effect = [0.0, 5.0, 11.0]
+    client = LinkedInAPIClient('access_token')
+    client.restli_client = MagicMock()
+    client.restli_client.get.return_value = MagicMock(
+        response=MagicMock(json=MagicMock(return_value={'status': 'PROCESSING'}))
+    )
+
+    with pytest.raises(Exception, match='Timed out waiting for LinkedIn video'):
+        await client._wait_for_video_available('urn:li:video:123', timeout_s=10)
+
+    assert client.restli_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch('agoras.core.polling.asyncio.sleep', new_callable=AsyncMock)
+@patch('requests.Session.put')
+async def test_linkedin_client_upload_video_resumes_missing_parts(mock_requests_put, mock_sleep):
+    """Test a retried LinkedIn video upload only sends parts that were not acknowledged."""
+    video_content = b'0123456789'
+    store = KeyValueStore(MEMORY)
+    UploadCheckpoint.for_upload('linkedin', UploadSource(video_content), 'urn:li:person:123', store=store).save(
+        video='urn:li:video:123',
+        uploadToken='token',
+        instructions=[
+            {'uploadUrl': 'http://upload/part-1', 'firstByte': 0, 'lastByte': 4},
+            {'uploadUrl': 'http://upload/part-2', 'firstByte': 5, 'lastByte': 9},
+        ],
+        parts={'0': 'etag-1'},
+    )
+
+    client = LinkedInAPIClient('access_token')
+    client.restli_client = MagicMock()
+    client.restli_client.get.return_value = MagicMock(
+        response=MagicMock(json=MagicMock(return_value={'status': 'AVAILABLE'}))
+    )
+    mock_requests_put.return_value = MagicMock(status_code=200, headers={'etag': 'etag-2'})
+    finalize_response = MagicMock(status_code=200, text='')
+
+    with (
+        patch('agoras.core.upload.checkpoint_store', return_value=store),
+        patch.object(client, '_post_restli_action', return_value=finalize_response) as mock_finalize,
+    ):
+        result = await client.upload_video(video_content, 'urn:li:person:123')
+
+    assert result == 'urn:li:video:123'
+    client.restli_client.action.assert_not_called()
+    mock_requests_put.assert_called_once()
+    assert mock_requests_put.call_args[0][0] == 'http://upload/part-2'
+    assert mock_requests_put.call_args[1]['data'] == b'56789'
+    finalize_request = mock_finalize.call_args[1]['action_params']['finalizeUploadRequest']
+    assert finalize_request['uploadedPartIds'] == ['etag-1', 'etag-2']
+
+
+@pytest.mark.asyncio
+@patch('agoras.core.polling.asyncio.sleep', new_callable=AsyncMock)
+@patch('requests.Session.put')
+async def test_linkedin_client_upload_video_restarts_after_rejected_finalize(mock_requests_put, mock_sleep):
+    """Test a finalize rejected with a 4xx discards the recorded parts so the next call starts a new upload."""
+    video_content = b'0123456789'
+    store = KeyValueStore(MEMORY)
+    client = LinkedInAPIClient('access_token')
+    client.restli_client = MagicMock()
+    client.restli_client.action.side_effect = [
+        MagicMock(
+            response=MagicMock(
+                json=MagicMock(
+                    return_value={
+                        'value': {
+                            'video': video_urn,
+                            'uploadToken': 'token',
+                            'uploadInstructions': [{'uploadUrl': 'http://upload/part-1', 'firstByte': 0, 'lastByte': 9}],
+                        }
+                    }
+                )
+            )
+        )
+        for video_urn in ('urn:li:video:1', 'urn:li:video:2')
+    ]
+    client.restli_client.get.return_value = MagicMock(
+        response=MagicMock(json=MagicMock(return_value={'status': 'AVAILABLE'}))
+    )
+    mock_requests_put.return_value = MagicMock(status_code=200, headers={'etag': 'etag-1'})
+    rejected = MagicMock(status_code=400, text='invalid upload token')
+    accepted = MagicMock(status_code=200, text='')
+
+    with (
+        patch('agoras.core.upload.checkpoint_store', return_value=store),
+        patch.object(client, '_post_restli_action', side_effect=[rejected, accepted]) as mock_finalize,
+    ):
+        with pytest.raises(requests.HTTPError, match='Failed to finalize video upload: 400'):
+            await client.upload_video(video_content, 'urn:li:person:123')
+        result = await client.upload_video(video_content, 'urn:li:person:123')
+
+    assert result == 'urn:li:video:2'
+    assert client.restli_client.action.call_count == 2
+    assert mock_requests_put.call_count == 2
+    assert mock_finalize.call_count == 2
+    checkpoint = UploadCheckpoint.for_upload('linkedin', UploadSource(video_content), 'urn:li:person:123', store=store)
+    assert checkpoint.load() == {}
+
+
+@pytest.mark.asyncio
+@patch('agoras.core.polling.asyncio.sleep', new_callable=AsyncMock)
+@patch('requests.Session.put')
+async def test_linkedin_client_upload_video_parts_concurrently(mock_requests_put, mock_sleep, tmp_path):
+    """Test LinkedIn video parts are uploaded in parallel from disk with ETags kept in instruction order."""
+    video_file = tmp_path / 'video.mp4'
+    video_file.write_bytes(b'aaaabbbbccccdddd')
+    active = {'now': 0, 'peak': 0}
+    lock = threading.Lock()
+
+    def put_side_effect(url, headers=None, data=None, timeout=None):
+        with lock:
+            active['now'] += 1
+            active['peak'] = max(active['peak'], active['now'])
+        # Later parts finish first
+        time.sleep(0.01 * (5 - int(url[-1])))
+        with lock:
+            active['now'] -= 1
+        return MagicMock(status_code=200, headers={'etag': f'etag-{data.decode()}'})
+
+    mock_requests_put.side_effect = put_side_effect
+
+    client = LinkedInAPIClient('access_token')
+    client.restli_client = MagicMock()
+    client.restli_client.action.return_value.response.json.return_value = {
+        'value': {
+            'video': 'urn:li:video:123',
+            'uploadToken': 'token',
+            'uploadInstructions': [
+                {'uploadUrl': f'http://upload/part-{index}', 'firstByte': index * 4, 'lastByte': index * 4 + 3}
+                for index in range(4)
+            ],
+        }
+    }
+    client.restli_client.get.return_value = MagicMock(
+        response=MagicMock(json=MagicMock(return_value={'status': 'AVAILABLE'}))
+    )
+    finalize_response = MagicMock(status_code=200, text='')
+
+    with patch.object(client, '_post_restli_action', return_value=finalize_response) as mock_finalize:
+        result = await client.upload_video(str(video_file), 'urn:li:person:123')
+
+    assert result == 'urn:li:video:123'
+    assert mock_requests_put.call_count == 4
+    assert active['peak'] > 1
+    finalize_request = mock_finalize.call_args[1]['action_params']['finalizeUploadRequest']
+    assert finalize_request['uploadedPartIds'] == ['etag-aaaa', 'etag-bbbb', 'etag-cccc', 'etag-dddd']
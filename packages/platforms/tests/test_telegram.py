@@ -16,6 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import hashlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -172,3 +173,75 @@ def test_telegram_auth_class_exists():
 def test_telegram_client_class_exists():
     """Test TelegramAPIClient class exists."""
     assert TelegramAPIClient is not None
+
+
+@pytest.mark.asyncio
+@patch("agoras.platforms.telegram.wrapper.TelegramAPI")
+async def test_telegram_broadcast_downloads_images_once(mock_api_class):
+    """Test a broadcast sends the same downloaded photo to every chat."""
+    mock_api = MagicMock()
+    mock_api.authenticate = AsyncMock()
+    mock_api.send_photo = AsyncMock(side_effect=lambda chat_id, **kwargs: f"msg-{chat_id}")
+    mock_api_class.return_value = mock_api
+
+    telegram = Telegram(telegram_bot_token="token", telegram_chat_ids="-100, mychannel")
+    await telegram._initialize_client()
+
+    image = MagicMock(url="https://example.com/a.jpg", content=b"photo", file_type=MagicMock())
+    with patch.object(telegram, "download_images", AsyncMock(return_value=[image])) as mock_download:
+        results = await telegram.broadcast(
+            telegram.telegram_chat_ids, status_text="Hello", image_urls=["https://example.com/a.jpg"]
+        )
+
+    assert results == {"-100": {"id": "msg--100"}, "@mychannel": {"id": "msg-@mychannel"}}
+    mock_download.assert_awaited_once()
+    image.cleanup.assert_called_once()
+    first_call = mock_api.send_photo.call_args_list[0]
+    assert first_call[1] == {
+        "chat_id": "-100",
+        "photo_content": b"photo",
+        "caption": "Hello",
+        "parse_mode": "HTML",
+        "digest": hashlib.sha256(b"photo").hexdigest(),
+    }
+
+
+@pytest.mark.asyncio
+@patch("agoras.platforms.telegram.wrapper.content_digest", return_value="digest")
+@patch("agoras.platforms.telegram.wrapper.TelegramAPI")
+async def test_telegram_broadcast_hashes_video_once(mock_api_class, mock_digest):
+    """Test a video broadcast hashes the downloaded file once and passes the digest to every send."""
+    mock_api = MagicMock()
+    mock_api.authenticate = AsyncMock()
+    mock_api.send_video = AsyncMock(side_effect=lambda chat_id, **kwargs: f"msg-{chat_id}")
+    mock_api_class.return_value = mock_api
+
+    telegram = Telegram(telegram_bot_token="token", telegram_chat_ids="-1,-2,-3")
+    await telegram._initialize_client()
+
+    video = MagicMock(content=b"video", file_type=MagicMock(), temp_file="/tmp/video.mp4")
+    with patch.object(telegram, "download_video", AsyncMock(return_value=video)):
+        results = await telegram.broadcast(telegram.telegram_chat_ids, video_url="https://example.com/v.mp4")
+
+    assert results == {"-1": {"id": "msg--1"}, "-2": {"id": "msg--2"}, "-3": {"id": "msg--3"}}
+    mock_digest.assert_called_once_with("/tmp/video.mp4")
+    assert [call[1]["digest"] for call in mock_api.send_video.call_args_list] == ["digest"] * 3
+
+
+@pytest.mark.asyncio
+@patch("agoras.platforms.telegram.wrapper.TelegramAPI")
+async def test_telegram_broadcast_action_reports_failed_chats(mock_api_class, capsys):
+    """Test the broadcast action prints the result map and fails when a chat failed."""
+    mock_api = MagicMock()
+    mock_api.authenticate = AsyncMock()
+    mock_api.send_message = AsyncMock(side_effect=["1", Exception("chat not found")])
+    mock_api_class.return_value = mock_api
+
+    telegram = Telegram(
+        telegram_bot_token="token", telegram_chat_ids="-1,-2", status_text="Hi", telegram_broadcast_concurrency=1
+    )
+
+    with pytest.raises(Exception, match="failed for 1 of 2 chats"):
+        await telegram.execute_action("broadcast")
+
+    assert capsys.readouterr().out.strip() == '{"-1":{"id":"1"},"-2":{"error":"chat not found"}}'
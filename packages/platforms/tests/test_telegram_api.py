@@ -112,7 +112,8 @@ async def test_telegram_api_send_photo(telegram_api):
         chat_id='chat_id',
         photo=b'image_data',
         caption='Photo caption',
-        parse_mode=None
+        parse_mode=None,
+        digest=None
     )
 
 
@@ -145,7 +146,8 @@ async def test_telegram_api_send_video(telegram_api):
         chat_id='chat_id',
         video=b'video_data',
         caption='Video caption',
-        parse_mode=None
+        parse_mode=None,
+        digest=None
     )
 
 
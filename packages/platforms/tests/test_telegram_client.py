@@ -16,14 +16,23 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import parse_qs
 
 import pytest
 
+from agoras.core.mediacache import content_digest
 from agoras.platforms.telegram.client import (
+    TELEGRAM_LOCAL_MAX_UPLOAD,
     TELEGRAM_MEDIA_WRITE_TIMEOUT,
+    TELEGRAM_MIN_UPLOAD_RATE,
     TelegramAPIClient,
     build_telegram_request,
+    media_write_timeout,
+    telegram_max_upload,
 )
 
 
@@ -724,4 +733,277 @@ async def test_telegram_client_send_media_group_videos(mock_bot_class):
     # Check that InputMediaVideo objects are created correctly
     assert isinstance(call_args[1]['media'][0], InputMediaVideo)
     assert call_args[1]['media'][0].caption == 'First video'
-    assert call_args[1]['media'][1].caption is None
\ No newline at end of file
+    assert call_args[1]['media'][1].caption is None
+
+def test_media_write_timeout_scales_with_size():
+    """Test write timeouts grow with the upload size above the configured minimum."""
+    assert media_write_timeout(None) == TELEGRAM_MEDIA_WRITE_TIMEOUT
+    assert media_write_timeout(1024) == TELEGRAM_MEDIA_WRITE_TIMEOUT
+
+    large = 2000 * 1024 * 1024
+    assert media_write_timeout(large) > TELEGRAM_MEDIA_WRITE_TIMEOUT
+    assert media_write_timeout(large) >= large / TELEGRAM_MIN_UPLOAD_RATE
+
+
+def test_media_write_timeout_env_minimum(monkeypatch):
+    """Test TELEGRAM_MEDIA_WRITE_TIMEOUT still sets the minimum."""
+    monkeypatch.setenv('TELEGRAM_MEDIA_WRITE_TIMEOUT', '900')
+
+    assert media_write_timeout(10 * 1024 * 1024) == 900.0
+
+
+@patch('agoras.platforms.telegram.client.Bot')
+@patch('agoras.platforms.telegram.client.build_telegram_request')
+def test_telegram_client_local_bot_api_server(mock_build_request, mock_bot_class, monkeypatch):
+    """Test TELEGRAM_API_URL points the bot at a local Bot API server."""
+    monkeypatch.setenv('TELEGRAM_API_URL', 'http://localhost:8081/')
+    mock_request = MagicMock()
+    mock_build_request.return_value = mock_request
+
+    TelegramAPIClient('bot_token')
+
+    mock_bot_class.assert_called_once_with(
+        token='bot_token',
+        request=mock_request,
+        base_url='http://localhost:8081/bot',
+        base_file_url='http://localhost:8081/file/bot',
+        local_mode=True,
+    )
+    assert telegram_max_upload() == TELEGRAM_LOCAL_MAX_UPLOAD
+
+
+def test_telegram_max_upload_cloud():
+    """Test the cloud Bot API keeps the platform video limits."""
+    assert telegram_max_upload() is None
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.telegram.client.Bot')
+async def test_telegram_client_send_video_file_cloud(mock_bot_class, tmp_path):
+    """Test a file path is uploaded with a write timeout sized to the file."""
+    video_file = tmp_path / 'video.mp4'
+    video_file.write_bytes(b'v' * 4096)
+    mock_bot = MagicMock()
+    mock_bot.local_mode = False
+    mock_bot.send_video = AsyncMock(return_value=MagicMock(to_dict=MagicMock(return_value={'message_id': 1})))
+    mock_bot_class.return_value = mock_bot
+
+    client = TelegramAPIClient('bot_token')
+    await client.send_video('chat_id', str(video_file))
+
+    kwargs = mock_bot.send_video.call_args[1]
+    assert kwargs['video'] == video_file
+    assert kwargs['write_timeout'] == media_write_timeout(4096)
+    assert 'read_timeout' not in kwargs
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.telegram.client.Bot')
+async def test_telegram_client_send_video_file_local_mode(mock_bot_class, tmp_path):
+    """Test a local server gets a file:// URI and time to relay the file."""
+    video_file = tmp_path / 'video.mp4'
+    video_file.write_bytes(b'v' * 4096)
+    mock_bot = MagicMock()
+    mock_bot.local_mode = True
+    mock_bot.send_video = AsyncMock(return_value=MagicMock(to_dict=MagicMock(return_value={'message_id': 1})))
+    mock_bot_class.return_value = mock_bot
+
+    client = TelegramAPIClient('bot_token')
+    await client.send_video('chat_id', str(video_file))
+
+    kwargs = mock_bot.send_video.call_args[1]
+    assert kwargs['video'] == video_file.absolute().as_uri()
+    assert kwargs['read_timeout'] == kwargs['write_timeout'] == media_write_timeout(4096)
+
+
+@pytest.mark.asyncio
+async def test_telegram_client_send_video_local_server_stand_in(tmp_path, monkeypatch):
+    """Test the request a local Bot API server receives carries the path, not the bytes."""
+    video_file = tmp_path / 'video.mp4'
+    video_file.write_bytes(b'\x00' * 65536)
+    received = {}
+
+    class StandIn(BaseHTTPRequestHandler):
+        def do_POST(self):
+            received['path'] = self.path
+            received['body'] = self.rfile.read(int(self.headers['Content-Length']))
+            body = json.dumps({
+                'ok': True,
+                'result': {'message_id': 7, 'date': 0, 'chat': {'id': 1, 'type': 'private'}},
+            }).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), StandIn)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        monkeypatch.setenv('TELEGRAM_API_URL', f'http://127.0.0.1:{server.server_port}')
+        client = TelegramAPIClient('123:token')
+        result = await client.send_video('1', str(video_file))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert result['message_id'] == 7
+    assert received['path'] == '/bot123:token/sendVideo'
+    assert parse_qs(received['body'].decode())['video'] == [video_file.absolute().as_uri()]
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.telegram.client.Bot')
+async def test_telegram_client_reuses_file_id_for_same_content(mock_bot_class):
+    """Test content sent once is sent by file_id afterwards, to any chat."""
+    uploaded = MagicMock()
+    uploaded.video.file_id = 'video-file-id'
+    uploaded.to_dict.return_value = {'message_id': 1}
+    mock_bot = MagicMock()
+    mock_bot.local_mode = False
+    mock_bot.send_video = AsyncMock(return_value=uploaded)
+    mock_bot_class.return_value = mock_bot
+
+    client = TelegramAPIClient('bot_token')
+    await client.send_video('chat-1', b'video-bytes')
+    await client.send_video('chat-2', b'video-bytes')
+
+    first, second = mock_bot.send_video.call_args_list
+    assert first[1]['video'] == b'video-bytes'
+    assert second[1]['video'] == 'video-file-id'
+    assert second[1]['chat_id'] == 'chat-2'
+    assert 'write_timeout' not in second[1]
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.telegram.client.content_digest')
+@patch('agoras.platforms.telegram.client.Bot')
+async def test_telegram_client_uses_given_digest(mock_bot_class, mock_content_digest):
+    """Test a digest passed by the caller is used as is, without hashing the content again."""
+    uploaded = MagicMock()
+    uploaded.video.file_id = 'video-file-id'
+    mock_bot = MagicMock()
+    mock_bot.local_mode = False
+    mock_bot.send_video = AsyncMock(return_value=uploaded)
+    mock_bot_class.return_value = mock_bot
+
+    client = TelegramAPIClient('bot_token')
+    await client.send_video('chat-1', b'video-bytes', digest='known-digest')
+    await client.send_video('chat-2', b'video-bytes', digest='known-digest')
+
+    mock_content_digest.assert_not_called()
+    assert mock_bot.send_video.call_args_list[1][1]['video'] == 'video-file-id'
+    assert client.media_cache.get('known-digest') == 'video-file-id'
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.telegram.client.Bot')
+async def test_telegram_client_reuses_largest_photo_file_id(mock_bot_class):
+    """Test photos are reused by the file_id of their largest size."""
+    small, large = MagicMock(file_id='small-id'), MagicMock(file_id='large-id')
+    uploaded = MagicMock()
+    uploaded.photo = (small, large)
+    mock_bot = MagicMock()
+    mock_bot.send_photo = AsyncMock(return_value=uploaded)
+    mock_bot_class.return_value = mock_bot
+
+    client = TelegramAPIClient('bot_token')
+    await client.send_photo('chat_id', b'photo-bytes')
+    await client.send_photo('chat_id', b'photo-bytes')
+
+    assert mock_bot.send_photo.call_args_list[1][1]['photo'] == 'large-id'
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.telegram.client.Bot')
+async def test_telegram_client_uploads_again_when_file_id_rejected(mock_bot_class):
+    """Test a rejected cached file_id falls back to uploading the content."""
+    from telegram.error import BadRequest
+
+    uploaded = MagicMock()
+    uploaded.video.file_id = 'new-file-id'
+    uploaded.to_dict.return_value = {'message_id': 2}
+    mock_bot = MagicMock()
+    mock_bot.local_mode = False
+    mock_bot.send_video = AsyncMock(side_effect=[BadRequest('Wrong file identifier'), uploaded])
+    mock_bot_class.return_value = mock_bot
+
+    client = TelegramAPIClient('bot_token')
+    digest = content_digest(b'video-bytes')
+    client.media_cache.put(digest, 'stale-file-id')
+
+    result = await client.send_video('chat_id', b'video-bytes')
+
+    assert result == {'message_id': 2}
+    assert [call[1]['video'] for call in mock_bot.send_video.call_args_list] == ['stale-file-id', b'video-bytes']
+    assert client.media_cache.get(digest) == 'new-file-id'
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.telegram.client.Bot')
+async def test_telegram_client_reuses_file_ids_for_albums(mock_bot_class):
+    """Test an album sent once is sent by file_id to the next chat."""
+    first, second = MagicMock(), MagicMock()
+    first.photo = (MagicMock(file_id='photo-1'),)
+    second.photo = (MagicMock(file_id='photo-2'),)
+    mock_bot = MagicMock()
+    mock_bot.send_media_group = AsyncMock(return_value=[first, second])
+    mock_bot_class.return_value = mock_bot
+
+    client = TelegramAPIClient('bot_token')
+    media = [{'type': 'photo', 'media': b'one', 'caption': 'Album'}, {'type': 'photo', 'media': b'two'}]
+    await client.send_media_group('chat-1', media)
+    await client.send_media_group('chat-2', media)
+
+    reused = mock_bot.send_media_group.call_args_list[1][1]['media']
+    assert [item.media for item in reused] == ['photo-1', 'photo-2']
+    assert reused[0].caption == 'Album'
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.telegram.client.Bot')
+async def test_telegram_client_album_uploads_again_when_file_id_rejected(mock_bot_class):
+    """Test an album with a stale cached file_id is uploaded again."""
+    from telegram.error import BadRequest
+
+    sent = MagicMock()
+    sent.photo = (MagicMock(file_id='photo-1'),)
+    mock_bot = MagicMock()
+    mock_bot.send_media_group = AsyncMock(side_effect=[BadRequest('Wrong file identifier/http url specified'), [sent]])
+    mock_bot_class.return_value = mock_bot
+
+    client = TelegramAPIClient('bot_token')
+    digest = content_digest(b'one')
+    client.media_cache.put(digest, 'stale-file-id')
+
+    await client.send_media_group('chat_id', [{'type': 'photo', 'media': b'one'}])
+
+    stale, retried = (call[1]['media'][0].media for call in mock_bot.send_media_group.call_args_list)
+    assert stale == 'stale-file-id'
+    assert retried != 'stale-file-id'
+    assert client.media_cache.get(digest) == 'photo-1'
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.telegram.client.Bot')
+async def test_telegram_client_album_keeps_file_ids_on_other_bad_requests(mock_bot_class):
+    """Test errors unrelated to file_ids neither forget the cache nor upload again."""
+    from telegram.error import BadRequest
+
+    mock_bot = MagicMock()
+    mock_bot.send_media_group = AsyncMock(side_effect=BadRequest('Message caption is too long'))
+    mock_bot_class.return_value = mock_bot
+
+    client = TelegramAPIClient('bot_token')
+    digest = content_digest(b'one')
+    client.media_cache.put(digest, 'photo-1')
+
+    with pytest.raises(Exception, match='caption is too long'):
+        await client.send_media_group('chat_id', [{'type': 'photo', 'media': b'one', 'caption': 'x' * 2000}])
+
+    mock_bot.send_media_group.assert_awaited_once()
+    assert client.media_cache.get(digest) == 'photo-1'
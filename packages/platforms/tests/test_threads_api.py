@@ -20,6 +20,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from agoras.common.store import MEMORY, KeyValueStore
+from agoras.core.ratelimit import NAMESPACE, RateLimiter
 from agoras.platforms.threads.api import ThreadsAPI
 
 
@@ -37,8 +39,8 @@ def threads_api():
         api = ThreadsAPI('app_id', 'app_secret', 'refresh_token')
         api._authenticated = True
         api.client = MagicMock()
-        api.client.create_post = MagicMock(return_value={'id': 'thread-123'})
-        api.client.create_video_post = MagicMock(return_value={'id': 'video-123'})
+        api.client.create_post = AsyncMock(return_value={'id': 'thread-123'})
+        api.client.create_video_post = AsyncMock(return_value={'id': 'video-123'})
         api.client.repost_post = MagicMock(return_value={'id': 'repost-123'})
         api.client.delete_post = MagicMock(return_value={'id': 'thread-123'})
         api.client.get_profile = MagicMock(return_value={'id': 'user123', 'username': 'testuser'})
@@ -154,6 +156,23 @@ async def test_threads_api_create_video_post(mock_media_factory, threads_api):
     mock_video.cleanup.assert_called_once()
 
 
+@pytest.mark.asyncio
+@patch('agoras.platforms.threads.api.MediaFactory')
+async def test_threads_api_posts_share_publishing_quota(mock_media_factory, threads_api):
+    """Text and video posts draw from one 250 posts per day publishing bucket."""
+    mock_video = MagicMock(content=b'video_content', url='http://video.mp4')
+    mock_video.file_type.mime = 'video/mp4'
+    mock_video.download = AsyncMock()
+    mock_media_factory.create_video = MagicMock(return_value=mock_video)
+    threads_api.rate_limiter = RateLimiter(KeyValueStore(MEMORY))
+
+    await threads_api.create_post('Text post')
+    await threads_api.create_video_post('Video caption', 'http://video.mp4')
+
+    bucket = f'threads:publish:{threads_api._rate_limit_account()}'
+    assert threads_api.rate_limiter.store.get(NAMESPACE, bucket)['tokens'] == pytest.approx(248, abs=0.01)
+
+
 # Interaction Tests
 
 @pytest.mark.asyncio
@@ -247,7 +266,7 @@ async def test_threads_api_not_authenticated(threads_api):
 @patch('agoras.platforms.threads.api.MediaFactory')
 async def test_threads_api_post_error(mock_media_factory, threads_api):
     """Test ThreadsAPI handles post errors."""
-    threads_api.client.create_post = MagicMock(side_effect=Exception('Post failed'))
+    threads_api.client.create_post = AsyncMock(side_effect=Exception('Post failed'))
 
     with pytest.raises(Exception, match='Post failed'):
         await threads_api.create_post('Test post')
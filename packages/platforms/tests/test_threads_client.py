@@ -16,10 +16,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from agoras.common.store import MEMORY, KeyValueStore
+from agoras.core.journal import CONTAINER, PublishJournal
 from agoras.platforms.threads.client import ThreadsAPIClient
 
 # Initialization Tests
@@ -34,6 +36,20 @@ def test_threads_client_init():
     assert client.base_url == "https://graph.threads.net/v1.0"
 
 
+def test_threads_client_reuses_and_closes_session():
+    """Test ThreadsAPIClient keeps one pooled session and closes it on disconnect."""
+    client = ThreadsAPIClient('access_token', 'user_id')
+    session = client.session
+
+    assert session.get_adapter('https://graph.threads.net/v1.0')._pool_maxsize >= 4
+
+    with patch.object(session, 'close') as mock_close:
+        client.disconnect()
+
+    mock_close.assert_called_once()
+    assert client.session is session
+
+
 # Get Profile Tests
 
 
@@ -65,9 +81,10 @@ def test_threads_client_get_profile_no_user_id():
 # Create Post Tests
 
 
-@patch('agoras.platforms.threads.client.time.sleep')
-@patch('agoras.platforms.threads.client.requests.post')
-def test_threads_client_create_post_text_only(mock_requests_post, mock_sleep):
+@pytest.mark.asyncio
+@patch('requests.Session.get')
+@patch('requests.Session.post')
+async def test_threads_client_create_post_text_only(mock_requests_post, mock_requests_get):
     """Test ThreadsAPIClient create_post with text-only."""
     # Mock the container creation response
     mock_container_response = MagicMock()
@@ -87,9 +104,11 @@ def test_threads_client_create_post_text_only(mock_requests_post, mock_sleep):
     mock_requests_post.side_effect = [mock_container_response, mock_publish_response]
 
     client = ThreadsAPIClient('access_token', 'user_id')
-    result = client.create_post('Test post text')
+    result = await client.create_post('Test post text')
 
     assert result == {'id': 'p1'}
+    # Text containers have no media to process, so they are published right away
+    mock_requests_get.assert_not_called()
     # Verify container creation call
     container_call = mock_requests_post.call_args_list[0]
     assert 'https://graph.threads.net/v1.0/me/threads' in container_call[0][0]
@@ -106,26 +125,34 @@ def test_threads_client_create_post_text_only(mock_requests_post, mock_sleep):
     assert publish_data['creation_id'] == 'c1'
 
 
-def test_threads_client_create_post_no_token():
+@pytest.mark.asyncio
+async def test_threads_client_create_post_no_token():
     """Test ThreadsAPIClient create_post with no token."""
     client = ThreadsAPIClient('', 'user_id')
 
     with pytest.raises(Exception, match='No access token available'):
-        client.create_post('Test post')
+        await client.create_post('Test post')
 
 
-def test_threads_client_create_post_no_user_id():
+@pytest.mark.asyncio
+async def test_threads_client_create_post_no_user_id():
     """Test ThreadsAPIClient create_post with no user_id."""
     client = ThreadsAPIClient('access_token', '')
 
     with pytest.raises(Exception, match='No user ID available'):
-        client.create_post('Test post')
+        await client.create_post('Test post')
 
 
-@patch('agoras.platforms.threads.client.time.sleep')
-@patch('agoras.platforms.threads.client.requests.post')
-def test_threads_client_create_post_single_image(mock_requests_post, mock_sleep):
+@pytest.mark.asyncio
+@patch('requests.Session.get')
+@patch('requests.Session.post')
+async def test_threads_client_create_post_single_image(mock_requests_post, mock_requests_get):
     """Test ThreadsAPIClient create_post with single image."""
+    mock_status_response = MagicMock()
+    mock_status_response.status_code = 200
+    mock_status_response.json.return_value = {'status': 'FINISHED'}
+    mock_requests_get.return_value = mock_status_response
+
     # Mock the container creation response
     mock_container_response = MagicMock()
     mock_container_response.status_code = 200
@@ -143,9 +170,12 @@ def test_threads_client_create_post_single_image(mock_requests_post, mock_sleep)
     mock_requests_post.side_effect = [mock_container_response, mock_publish_response]
 
     client = ThreadsAPIClient('access_token', 'user_id')
-    result = client.create_post('Test post', files=['http://image1.jpg'])
+    result = await client.create_post('Test post', files=['http://image1.jpg'])
 
     assert result == {'id': 'p1'}
+    status_call = mock_requests_get.call_args
+    assert status_call[0][0] == 'https://graph.threads.net/v1.0/c1'
+    assert status_call[1]['params']['fields'] == 'status'
     # Verify container creation has image_url and media_type IMAGE
     container_call = mock_requests_post.call_args_list[0]
     container_data = container_call[1]['data']
@@ -153,10 +183,16 @@ def test_threads_client_create_post_single_image(mock_requests_post, mock_sleep)
     assert container_data['image_url'] == 'http://image1.jpg'
 
 
-@patch('agoras.platforms.threads.client.time.sleep')
-@patch('agoras.platforms.threads.client.requests.post')
-def test_threads_client_create_post_carousel(mock_requests_post, mock_sleep):
+@pytest.mark.asyncio
+@patch('requests.Session.get')
+@patch('requests.Session.post')
+async def test_threads_client_create_post_carousel(mock_requests_post, mock_requests_get):
     """Test ThreadsAPIClient create_post with carousel (multiple images)."""
+    mock_status_response = MagicMock()
+    mock_status_response.status_code = 200
+    mock_status_response.json.return_value = {'status': 'FINISHED'}
+    mock_requests_get.return_value = mock_status_response
+
     # Mock item container responses
     mock_item1_response = MagicMock()
     mock_item1_response.status_code = 200
@@ -184,14 +220,20 @@ def test_threads_client_create_post_carousel(mock_requests_post, mock_sleep):
     mock_publish_response.raise_for_status.return_value = None
     mock_publish_response.text = '{"id": "p1"}'
 
-    mock_requests_post.side_effect = [
-        mock_item1_response, mock_item2_response,  # Item containers
-        mock_carousel_response,  # Carousel container
-        mock_publish_response    # Publish
-    ]
+    # Item containers are created concurrently, so route responses by payload
+    item_responses = {'http://image1.jpg': mock_item1_response, 'http://image2.jpg': mock_item2_response}
+
+    def post_side_effect(url, data=None, timeout=None):
+        if data.get('is_carousel_item'):
+            return item_responses[data['image_url']]
+        if 'creation_id' in data:
+            return mock_publish_response
+        return mock_carousel_response
+
+    mock_requests_post.side_effect = post_side_effect
 
     client = ThreadsAPIClient('access_token', 'user_id')
-    result = client.create_post('Test post', files=['http://image1.jpg', 'http://image2.jpg'])
+    result = await client.create_post('Test post', files=['http://image1.jpg', 'http://image2.jpg'])
 
     assert result == {'id': 'p1'}
 
@@ -245,10 +287,10 @@ def test_threads_client_check_response_error_no_json():
 # Create Video Post Tests
 
 
-@patch('agoras.platforms.threads.client.time.sleep')
-@patch('agoras.platforms.threads.client.requests.get')
-@patch('agoras.platforms.threads.client.requests.post')
-def test_threads_client_create_video_post_success(mock_requests_post, mock_requests_get, mock_sleep):
+@pytest.mark.asyncio
+@patch('requests.Session.get')
+@patch('requests.Session.post')
+async def test_threads_client_create_video_post_success(mock_requests_post, mock_requests_get):
     """Test ThreadsAPIClient create_video_post success."""
     mock_container_response = MagicMock()
     mock_container_response.status_code = 200
@@ -269,7 +311,7 @@ def test_threads_client_create_video_post_success(mock_requests_post, mock_reque
     mock_requests_post.side_effect = [mock_container_response, mock_publish_response]
 
     client = ThreadsAPIClient('access_token', 'user_id')
-    result = client.create_video_post('Video caption', 'http://video.mp4')
+    result = await client.create_video_post('Video caption', 'http://video.mp4')
 
     assert result == {'id': 'p1'}
     container_call = mock_requests_post.call_args_list[0]
@@ -279,18 +321,74 @@ def test_threads_client_create_video_post_success(mock_requests_post, mock_reque
     assert container_data['text'] == 'Video caption'
 
 
-def test_threads_client_create_video_post_no_url():
+@pytest.mark.asyncio
+@patch('requests.Session.get')
+@patch('requests.Session.post')
+async def test_threads_client_create_video_post_resumes_journaled_container(mock_requests_post, mock_requests_get):
+    """Test a journaled retry publishes the recorded container instead of transcoding again."""
+    mock_requests_post.return_value = MagicMock(status_code=200, json=MagicMock(return_value={'id': 'p1'}))
+    journal = PublishJournal('key', KeyValueStore(MEMORY))
+    journal.record(CONTAINER, 'c1')
+
+    client = ThreadsAPIClient('access_token', 'user_id')
+    with journal.activate():
+        result = await client.create_video_post('Video caption', 'http://video.mp4')
+
+    assert result == {'id': 'p1'}
+    mock_requests_post.assert_called_once()
+    assert mock_requests_post.call_args[0][0].endswith('/user_id/threads_publish')
+    assert mock_requests_post.call_args[1]['data']['creation_id'] == 'c1'
+    mock_requests_get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_threads_client_create_video_post_no_url():
     """Test ThreadsAPIClient create_video_post with no video URL."""
     client = ThreadsAPIClient('access_token', 'user_id')
 
     with pytest.raises(Exception, match='Video URL is required'):
-        client.create_video_post('caption', '')
+        await client.create_video_post('caption', '')
+
+
+@pytest.mark.asyncio
+@patch('agoras.core.polling.asyncio.sleep', new_callable=AsyncMock)
+@patch('requests.Session.get')
+async def test_threads_client_wait_for_container_backs_off(mock_requests_get, mock_sleep):
+    """Test ThreadsAPIClient polls container status with growing intervals."""
+    statuses = ['IN_PROGRESS', 'IN_PROGRESS', 'IN_PROGRESS', 'FINISHED']
+    mock_requests_get.side_effect = [
+        MagicMock(status_code=200, json=MagicMock(return_value={'status': status})) for status in statuses
+    ]
+
+    client = ThreadsAPIClient('access_token', 'user_id')
+    await client.wait_for_container('c1')
+
+    assert mock_requests_get.call_count == 4
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [2.0, 4.0, 8.0]
+
+
+@pytest.mark.asyncio
+@patch('agoras.core.polling.asyncio.sleep', new_callable=AsyncMock)
+@patch('requests.Session.get')
+async def test_threads_client_create_video_post_processing_error(mock_requests_get, mock_sleep):
+    """Test ThreadsAPIClient create_video_post stops polling when processing fails."""
+    mock_requests_get.return_value = MagicMock(status_code=200, json=MagicMock(return_value={'status': 'ERROR'}))
+
+    client = ThreadsAPIClient('access_token', 'user_id')
+    with patch.object(client, '_create_container', return_value='c1'), patch.object(
+        client, '_publish_container'
+    ) as mock_publish:
+        with pytest.raises(Exception, match='Threads video processing failed'):
+            await client.create_video_post('caption', 'http://video.mp4')
+
+    mock_publish.assert_not_called()
+    mock_sleep.assert_not_called()
 
 
 # Repost Post Tests
 
 
-@patch('agoras.platforms.threads.client.requests.post')
+@patch('requests.Session.post')
 def test_threads_client_repost_post_success(mock_requests_post):
     """Test ThreadsAPIClient repost_post success."""
     mock_response = MagicMock()
@@ -323,4 +421,36 @@ def test_threads_client_repost_post_no_user_id():
     client = ThreadsAPIClient('access_token', '')
 
     with pytest.raises(Exception, match='No user ID available'):
-        client.repost_post('post123')
\ No newline at end of file
+        client.repost_post('post123')
+
+@patch('agoras.core.retry.time.sleep')
+@patch('requests.Session.post')
+def test_threads_client_repost_post_not_retried_on_server_error(mock_requests_post, mock_sleep):
+    """Test ThreadsAPIClient never repeats a non-idempotent repost after a 5xx."""
+    mock_response = MagicMock()
+    mock_response.status_code = 503
+    mock_response.json.return_value = {'error': {'message': 'unavailable'}}
+    mock_requests_post.return_value = mock_response
+
+    client = ThreadsAPIClient('access_token', 'user_id')
+    with pytest.raises(Exception, match='Failed to repost'):
+        client.repost_post('post123')
+
+    mock_requests_post.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+@patch('agoras.core.retry.time.sleep')
+@patch('requests.Session.delete')
+def test_threads_client_delete_post_retries_server_error(mock_requests_delete, mock_sleep):
+    """Test ThreadsAPIClient retries an idempotent delete after a transient 503."""
+    unavailable = MagicMock(status_code=503, headers={'Retry-After': '1'})
+    deleted = MagicMock(status_code=200)
+    mock_requests_delete.side_effect = [unavailable, deleted]
+
+    client = ThreadsAPIClient('access_token', 'user_id')
+    result = client.delete_post('post123')
+
+    assert result == {'id': 'post123'}
+    assert mock_requests_delete.call_count == 2
+    mock_sleep.assert_called_once_with(1.0)
@@ -80,7 +80,7 @@ async def test_tiktok_api_disconnect(tiktok_api):
 # Upload Tests
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.tiktok.api.asyncio.sleep')
+@patch('agoras.core.polling.asyncio.sleep')
 async def test_tiktok_api_upload_video(mock_sleep, tiktok_api):
     """Test TikTokAPI upload_video."""
     result = await tiktok_api.upload_video(
@@ -94,7 +94,7 @@ async def test_tiktok_api_upload_video(mock_sleep, tiktok_api):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.tiktok.api.asyncio.sleep')
+@patch('agoras.core.polling.asyncio.sleep')
 async def test_tiktok_api_upload_with_privacy_settings(mock_sleep, tiktok_api):
     """Test TikTokAPI upload_video with privacy settings."""
     result = await tiktok_api.upload_video(
@@ -120,7 +120,7 @@ async def test_tiktok_api_upload_with_privacy_settings(mock_sleep, tiktok_api):
 
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.tiktok.api.asyncio.sleep')
+@patch('agoras.core.polling.asyncio.sleep')
 async def test_tiktok_api_upload_with_duet_stitch_options(mock_sleep, tiktok_api):
     """Test TikTokAPI upload_video with duet/stitch options."""
     result = await tiktok_api.upload_video(
@@ -246,7 +246,7 @@ async def test_tiktok_api_share_raises_exception(tiktok_api):
 # Error Handling Tests
 
 @pytest.mark.asyncio
-@patch('agoras.platforms.tiktok.api.asyncio.sleep')
+@patch('agoras.core.polling.asyncio.sleep')
 async def test_tiktok_api_upload_error(mock_sleep, tiktok_api):
     """Test TikTokAPI handles upload errors."""
     tiktok_api.client.upload_video = MagicMock(side_effect=Exception('Upload failed'))
@@ -259,6 +259,34 @@ async def test_tiktok_api_upload_error(mock_sleep, tiktok_api):
         )
 
 
+@pytest.mark.asyncio
+@patch('agoras.core.polling.asyncio.sleep', new_callable=AsyncMock)
+async def test_tiktok_api_wait_for_publish_backs_off(mock_sleep, tiktok_api):
+    """Test TikTokAPI polls publish status quickly first, then backs off."""
+    processing = {'data': {'status': 'PROCESSING_UPLOAD', 'publicaly_available_post_id': []}}
+    complete = {'data': {'status': 'PUBLISH_COMPLETE', 'publicaly_available_post_id': []}}
+    tiktok_api.client.get_publish_status = MagicMock(side_effect=[processing, processing, processing, complete])
+
+    await tiktok_api._wait_for_publish_completion('publish-123')
+
+    assert tiktok_api.client.get_publish_status.call_count == 4
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [2.0, 2.0, 4.0, 8.0]
+
+
+@pytest.mark.asyncio
+@patch('agoras.core.polling.asyncio.sleep', new_callable=AsyncMock)
+async def test_tiktok_api_wait_for_publish_failed(mock_sleep, tiktok_api):
+    """Test TikTokAPI stops polling when TikTok reports a failed publish."""
+    tiktok_api.client.get_publish_status = MagicMock(
+        return_value={'data': {'status': 'FAILED', 'fail_reason': 'file_format_check_failed'}}
+    )
+
+    with pytest.raises(Exception, match='TikTok publish failed: file_format_check_failed'):
+        await tiktok_api._wait_for_publish_completion('publish-123')
+
+    tiktok_api.client.get_publish_status.assert_called_once_with('publish-123')
+
+
 # Property Tests
 
 def test_tiktok_api_properties():
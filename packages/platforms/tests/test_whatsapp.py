@@ -20,6 +20,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from agoras.common.store import MEMORY, KeyValueStore
 from agoras.platforms.whatsapp import WhatsApp
 from agoras.platforms.whatsapp.api import WhatsAppAPI
 from agoras.platforms.whatsapp.auth import WhatsAppAuthManager
@@ -136,6 +137,32 @@ async def test_whatsapp_disconnect(mock_api_class):
     mock_api.disconnect.assert_called_once()
 
 
+@pytest.mark.asyncio
+@patch('agoras.platforms.whatsapp.wrapper.WhatsAppAPI')
+async def test_whatsapp_same_post_to_two_recipients_sends_both(mock_api_class, capsys):
+    """The publish journal keys on the recipient, not just the credentials."""
+    mock_api = MagicMock()
+    mock_api.credentials = {'access_token': 'token', 'phone_number_id': '123'}
+    mock_api.authenticate = AsyncMock()
+    mock_api.send_message = AsyncMock(side_effect=lambda to, text: f'wamid.{to}')
+    mock_api_class.return_value = mock_api
+
+    store = KeyValueStore(MEMORY)
+    with patch('agoras.core.interfaces.journal_store', return_value=store):
+        for recipient in ('15550001', '15550002'):
+            whatsapp = WhatsApp(
+                whatsapp_access_token='token',
+                whatsapp_phone_number_id='123',
+                whatsapp_recipient=recipient,
+                status_text='hello',
+            )
+            await whatsapp.execute_action('post')
+    store.close()
+
+    assert [call.kwargs['to'] for call in mock_api.send_message.await_args_list] == ['15550001', '15550002']
+    assert capsys.readouterr().out.split() == ['{"id":"wamid.15550001"}', '{"id":"wamid.15550002"}']
+
+
 # WhatsApp API Tests
 
 def test_whatsapp_api_instantiation():
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+#
+# Please refer to AUTHORS.rst for a complete list of Copyright holders.
+# Copyright (C) 2022-2026, Agoras Developers.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import io
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agoras.platforms.whatsapp.broadcast import (
+    broadcast_rate_limiter,
+    deliver,
+    read_recipients,
+    run_broadcast,
+)
+from agoras.platforms.whatsapp.client import WhatsAppAPIClient, WhatsAppRateLimitError, is_rate_limited
+from agoras.platforms.whatsapp.wrapper import WhatsApp
+
+
+def test_read_recipients_skips_comments_and_duplicates():
+    """Test recipients are read one per line or comma separated, once each."""
+    lines = ['+111\n', '\n', '# header\n', '+222, +333\n', '+111\n']
+    assert list(read_recipients(lines)) == ['+111', '+222', '+333']
+
+
+def test_broadcast_rate_limiter_uses_tier():
+    """Test the broadcast limiter allows the configured messages per second."""
+    limiter = broadcast_rate_limiter(1000)
+    assert limiter.limit_for('whatsapp', 'send_message').capacity == 1000
+    with pytest.raises(Exception, match='greater than zero'):
+        broadcast_rate_limiter(0)
+
+
+@patch('requests.Session.post')
+def test_post_object_raises_rate_limit_error_for_throughput_codes(mock_post):
+    """Test throughput rejections are reported as retryable."""
+    import requests
+
+    response = MagicMock(status_code=400, reason='Bad Request')
+    response.raise_for_status.side_effect = requests.exceptions.HTTPError('400 Client Error')
+    response.json.return_value = {'error': {'code': 130429, 'message': 'Rate limit hit'}}
+    mock_post.return_value = response
+
+    client = WhatsAppAPIClient('access_token', 'phone_number_id')
+    client.graph_api = MagicMock()
+
+    with pytest.raises(Exception, match='send_message failed') as excinfo:
+        client.send_message('+111', 'Hello')
+    assert is_rate_limited(excinfo.value)
+
+    response.json.return_value = {'error': {'code': 131026, 'message': 'Undeliverable'}}
+    with pytest.raises(Exception, match='131026') as excinfo:
+        client.send_message('+111', 'Hello')
+    assert not is_rate_limited(excinfo.value)
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.whatsapp.broadcast.asyncio.sleep', new_callable=AsyncMock)
+async def test_deliver_retries_only_throttled_sends(mock_sleep):
+    """Test throttled sends are retried and other errors are reported at once."""
+    send = AsyncMock(side_effect=[WhatsAppRateLimitError('throttled'), ['wamid.1']])
+    assert await deliver(send, '+111') == {'recipient': '+111', 'ids': ['wamid.1'], 'attempts': 2}
+    mock_sleep.assert_awaited_once()
+
+    send = AsyncMock(side_effect=Exception('Invalid recipient'))
+    assert await deliver(send, '+222') == {'recipient': '+222', 'error': 'Invalid recipient', 'attempts': 1}
+    send.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_broadcast_bounds_concurrency_and_streams_results():
+    """Test sends stay within the concurrency limit and every recipient gets a result."""
+    in_flight = 0
+    peak = 0
+
+    async def send(to):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if to == '+13':
+            raise Exception('Invalid recipient')
+        return [f'wamid.{to}']
+
+    output = io.StringIO()
+    recipients = (f'+{i}' for i in range(50))
+
+    sent, failed = await run_broadcast(recipients, send, output, concurrency=5)
+
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert (sent, failed) == (49, 1)
+    assert peak == 5
+    assert sorted(result['recipient'] for result in results) == sorted(f'+{i}' for i in range(50))
+    assert next(result for result in results if result['recipient'] == '+13')['error'] == 'Invalid recipient'
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.whatsapp.wrapper.WhatsAppAPI')
+async def test_whatsapp_broadcast_validates_images_once(mock_api_class):
+    """Test a broadcast downloads images once and sends them to every recipient."""
+    mock_api = MagicMock()
+    mock_api.authenticate = AsyncMock()
+    mock_api.send_image = AsyncMock(side_effect=lambda to, image_url, caption: f'{to}:{image_url}')
+    mock_api.rate_limiter = None
+    mock_api.send_interval = 1.0
+    mock_api_class.return_value = mock_api
+
+    whatsapp = WhatsApp(whatsapp_access_token='token', whatsapp_phone_number_id='123')
+    await whatsapp._initialize_client()
+
+    image = MagicMock(url='https://example.com/a.jpg', content=b'data', file_type=MagicMock())
+    output = io.StringIO()
+    with patch.object(whatsapp, 'download_images', AsyncMock(return_value=[image])) as mock_download:
+        sent, failed = await whatsapp.broadcast(
+            ['+111', '+222'], output, status_text='Hello', image_urls=['https://example.com/a.jpg']
+        )
+
+    assert (sent, failed) == (2, 0)
+    mock_download.assert_awaited_once()
+    image.cleanup.assert_called_once()
+    assert mock_api.send_image.await_count == 2
+    mock_api.send_image.assert_any_await(to='+222', image_url='https://example.com/a.jpg', caption='Hello')
+    assert mock_api.rate_limiter is None
+    assert mock_api.send_interval == 1.0
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.whatsapp.wrapper.WhatsAppAPI')
+async def test_whatsapp_broadcast_action_reports_failures(mock_api_class, tmp_path):
+    """Test the broadcast action writes the results file and fails when a recipient failed."""
+    mock_api = MagicMock()
+    mock_api.authenticate = AsyncMock()
+    mock_api.send_template = AsyncMock(side_effect=['wamid.1', Exception('Invalid recipient')])
+    mock_api_class.return_value = mock_api
+
+    recipients = tmp_path / 'recipients.txt'
+    recipients.write_text('+111\n+222\n')
+    results = tmp_path / 'results.jsonl'
+
+    whatsapp = WhatsApp(
+        whatsapp_access_token='token',
+        whatsapp_phone_number_id='123',
+        whatsapp_recipients=str(recipients),
+        whatsapp_broadcast_output=str(results),
+        whatsapp_broadcast_concurrency=1,
+        whatsapp_template_name='launch',
+    )
+
+    with pytest.raises(Exception, match='failed for 1 of 2 recipients'):
+        await whatsapp.execute_action('broadcast')
+
+    lines = [json.loads(line) for line in results.read_text().splitlines()]
+    assert lines[0] == {'recipient': '+111', 'ids': ['wamid.1'], 'attempts': 1}
+    assert lines[1]['error'] == 'Invalid recipient'
@@ -152,7 +152,7 @@ def test_whatsapp_client_get_object_error_handling():
 
 # Post Object Tests
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_post_object(mock_requests_post):
     """Test WhatsAppAPIClient post_object method."""
     mock_response = MagicMock()
@@ -172,7 +172,7 @@ def test_whatsapp_client_post_object(mock_requests_post):
     assert call_args[1]['json'] == {'data': 'test'}
 
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_post_object_with_empty_data(mock_requests_post):
     """Test WhatsAppAPIClient post_object with None data (uses empty dict)."""
     mock_response = MagicMock()
@@ -192,7 +192,7 @@ def test_whatsapp_client_post_object_with_empty_data(mock_requests_post):
     assert call_args[1]['json'] == {}
 
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_post_object_not_initialized(mock_requests_post):
     """Test WhatsAppAPIClient post_object raises error when not initialized."""
     mock_requests_post.side_effect = RuntimeError(
@@ -204,7 +204,7 @@ def test_whatsapp_client_post_object_not_initialized(mock_requests_post):
         client.post_object('obj123', 'messages', {})
 
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_post_object_error_handling(mock_requests_post):
     """Test WhatsAppAPIClient post_object handles HTTP errors."""
     import requests
@@ -219,7 +219,7 @@ def test_whatsapp_client_post_object_error_handling(mock_requests_post):
 
 # Send Message Tests
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_send_message(mock_requests_post):
     """Test WhatsAppAPIClient send_message method."""
     mock_response = MagicMock()
@@ -244,7 +244,7 @@ def test_whatsapp_client_send_message(mock_requests_post):
     assert call_data['text']['body'] == 'Test message'
 
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_send_message_with_buttons(mock_requests_post):
     """Test WhatsAppAPIClient send_message with buttons."""
     mock_response = MagicMock()
@@ -276,7 +276,7 @@ def test_whatsapp_client_send_message_not_initialized():
         client.send_message('+1234567890', 'Test')
 
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_send_message_api_error(mock_requests_post):
     """Test WhatsAppAPIClient send_message handles API errors."""
     mock_response = MagicMock()
@@ -292,7 +292,7 @@ def test_whatsapp_client_send_message_api_error(mock_requests_post):
         client.send_message('+1234567890', 'Test')
 
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_send_message_post_error(mock_requests_post):
     """Test WhatsAppAPIClient send_message handles post_object errors."""
     mock_requests_post.side_effect = Exception('Post failed')
@@ -307,7 +307,7 @@ def test_whatsapp_client_send_message_post_error(mock_requests_post):
 
 # Send Image Tests
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_send_image(mock_requests_post):
     """Test WhatsAppAPIClient send_image method."""
     mock_response = MagicMock()
@@ -330,7 +330,7 @@ def test_whatsapp_client_send_image(mock_requests_post):
     assert call_data['image']['caption'] == 'Image caption'
 
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_send_image_without_caption(mock_requests_post):
     """Test WhatsAppAPIClient send_image without caption."""
     mock_response = MagicMock()
@@ -353,7 +353,7 @@ def test_whatsapp_client_send_image_without_caption(mock_requests_post):
 
 # Send Video Tests
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_send_video(mock_requests_post):
     """Test WhatsAppAPIClient send_video method."""
     mock_response = MagicMock()
@@ -378,7 +378,7 @@ def test_whatsapp_client_send_video(mock_requests_post):
 
 # Send Template Tests
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_send_template(mock_requests_post):
     """Test WhatsAppAPIClient send_template method."""
     mock_response = MagicMock()
@@ -401,7 +401,7 @@ def test_whatsapp_client_send_template(mock_requests_post):
     assert call_data['template']['language']['code'] == 'en'
 
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_send_template_with_components(mock_requests_post):
     """Test WhatsAppAPIClient send_template with components."""
     mock_response = MagicMock()
@@ -450,7 +450,7 @@ def test_whatsapp_client_send_template_not_initialized():
         client.send_template('+1234567890', 'template')
 
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_whatsapp_client_send_image_api_error(mock_requests_post):
     """Test WhatsAppAPIClient send_image handles API errors."""
     mock_response = MagicMock()
@@ -16,7 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -180,41 +180,87 @@ class TestXAPIClient:
 
         mock_to_thread.assert_not_called()
 
-    @patch("asyncio.to_thread")
-    @patch("agoras.platforms.x.client.os.unlink")
-    @patch("agoras.platforms.x.client.os.path.exists")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("agoras.platforms.x.client.tempfile.mkstemp")
     @pytest.mark.asyncio
-    async def test_x_client_upload_media_success(
-        self,
-        mock_mkstemp,
-        mock_open_fn,
-        mock_exists,
-        mock_unlink,
-        mock_to_thread,
-    ):
-        """Test upload_media success."""
-        mock_mkstemp.return_value = (42, "/tmp/test_file")
-        mock_exists.return_value = True
-
+    async def test_x_client_upload_media_image_without_temp_file(self):
+        """Test image upload streams the in-memory content directly."""
         mock_media = MagicMock()
         mock_media.media_id = "media123"
 
-        mock_to_thread.side_effect = lambda func, /, *args, **kwargs: func(*args, **kwargs)
+        uploaded = {}
+
+        def simple_upload(filename, file=None, media_category=None):
+            uploaded.update(filename=filename, content=file.read(), media_category=media_category)
+            return mock_media
+
+        client = XAPIClient("ck", "cs", "ot", "os")
+        client.client_v1 = MagicMock()
+        client.client_v1.simple_upload.side_effect = simple_upload
+
+        with patch("tempfile.mkstemp") as mock_mkstemp:
+            result = await client.upload_media(b"test content", "image/png")
+
+        assert result == "media123"
+        mock_mkstemp.assert_not_called()
+        assert uploaded == {"filename": "media.png", "content": b"test content", "media_category": "tweet_image"}
+
+    @patch("agoras.platforms.x.client.APPEND_CHUNK_SIZE", 4)
+    @pytest.mark.asyncio
+    async def test_x_client_upload_media_video_chunked_from_file(self, tmp_path):
+        """Test video upload appends byte-range segments from the file, then finalizes."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"0123456789")
 
         client = XAPIClient("ck", "cs", "ot", "os")
         client.client_v1 = MagicMock()
-        client.client_v1.media_upload.return_value = mock_media
+        client.client_v1.chunked_upload_init.return_value = MagicMock(media_id="media123")
+        client.client_v1.chunked_upload_finalize.return_value = MagicMock(media_id="media123", processing_info=None)
 
-        result = await client.upload_media(b"test content", "image/png")
+        result = await client.upload_media(str(video_file), "video/mp4")
 
         assert result == "media123"
-        mock_mkstemp.assert_called_once()
-        mock_open_fn.assert_any_call("/tmp/test_file", "wb")
-        mock_open_fn().write.assert_called_once_with(b"test content")
-        mock_exists.assert_called_once_with("/tmp/test_file")
-        mock_unlink.assert_called_once_with("/tmp/test_file")
+        client.client_v1.chunked_upload_init.assert_called_once_with(10, "video/mp4", media_category="tweet_video")
+        segments = sorted(
+            (call.args[2], call.args[1][1]) for call in client.client_v1.chunked_upload_append.call_args_list
+        )
+        assert segments == [(0, b"0123"), (1, b"4567"), (2, b"89")]
+        client.client_v1.chunked_upload_finalize.assert_called_once_with("media123")
+
+    @patch("agoras.core.polling.asyncio.sleep", new_callable=AsyncMock)
+    @pytest.mark.asyncio
+    async def test_x_client_upload_media_video_waits_for_processing(self, mock_sleep):
+        """Test video upload polls processing status without blocking the event loop."""
+        client = XAPIClient("ck", "cs", "ot", "os")
+        client.client_v1 = MagicMock()
+        client.client_v1.chunked_upload_init.return_value = MagicMock(media_id="media123")
+        client.client_v1.chunked_upload_finalize.return_value = MagicMock(
+            media_id="media123", processing_info={"state": "pending", "check_after_secs": 3}
+        )
+        client.client_v1.get_media_upload_status.side_effect = [
+            MagicMock(processing_info={"state": "in_progress", "check_after_secs": 5}),
+            MagicMock(processing_info={"state": "succeeded"}),
+        ]
+
+        result = await client.upload_media(b"video", "video/mp4")
+
+        assert result == "media123"
+        assert client.client_v1.get_media_upload_status.call_count == 2
+        assert mock_sleep.call_args_list[0].args[0] == 3
+
+    @patch("agoras.core.polling.asyncio.sleep", new_callable=AsyncMock)
+    @pytest.mark.asyncio
+    async def test_x_client_upload_media_video_processing_failed(self, mock_sleep):
+        """Test video upload surfaces X processing failures."""
+        client = XAPIClient("ck", "cs", "ot", "os")
+        client.client_v1 = MagicMock()
+        client.client_v1.chunked_upload_init.return_value = MagicMock(media_id="media123")
+        client.client_v1.chunked_upload_finalize.return_value = MagicMock(
+            media_id="media123", processing_info={"state": "failed", "error": {"message": "Unsupported codec"}}
+        )
+
+        with pytest.raises(Exception, match="X media processing failed: Unsupported codec"):
+            await client.upload_media(b"video", "video/mp4")
+
+        client.client_v1.get_media_upload_status.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_x_client_create_tweet_no_client(self):
@@ -741,3 +741,42 @@ def test_x_client_instantiation():
     """Test X client can be instantiated."""
     from agoras.platforms.x.client import XAPIClient
     assert XAPIClient
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.x.wrapper.XAPI')
+async def test_x_post_uploads_media_concurrently_in_order(mock_api_class):
+    """Test X post uploads all images at once and keeps media ID order."""
+    import asyncio
+
+    in_flight = {'now': 0, 'peak': 0}
+
+    async def upload_media(content, mime):
+        in_flight['now'] += 1
+        in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+        # Later images finish first to prove ordering is preserved
+        await asyncio.sleep(0.01 * (5 - int(content[-1:])))
+        in_flight['now'] -= 1
+        return f"media-{content.decode()[-1]}"
+
+    mock_api = MagicMock()
+    mock_api.upload_media = AsyncMock(side_effect=upload_media)
+    mock_api.post = AsyncMock(return_value='tweet-123')
+    mock_api_class.return_value = mock_api
+
+    def download_images(urls):
+        media = MagicMock()
+        media.content = f"image{urls[0][-5]}".encode()
+        media.temp_file = None
+        media.file_type.mime = 'image/jpeg'
+        return [media]
+
+    x = X()
+    x.api = mock_api
+    urls = [f'http://image{i}.jpg' for i in range(1, 5)]
+
+    with patch.object(x, 'download_images', side_effect=download_images), patch.object(x, '_output_status'):
+        await x.post('Hello', '', *urls)
+
+    assert in_flight['peak'] == 4
+    mock_api.post.assert_awaited_once_with('Hello', ['media-1', 'media-2', 'media-3', 'media-4'])
@@ -16,11 +16,14 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httplib2
 import pytest
 from apiclient import errors
 
+from agoras.common.store import MEMORY, KeyValueStore
+from agoras.core.upload import UploadCheckpoint, UploadSource
 from agoras.platforms.youtube.client import YouTubeAPIClient
 
 
@@ -146,28 +149,72 @@ def test_youtube_client_simplify_upload_retriable_exception():
     assert retry == 0
 
 
-def test_youtube_client_handle_upload_retry_increments():
-    """Test _handle_upload_retry increments retry counter."""
+@pytest.mark.asyncio
+async def test_youtube_client_handle_upload_retry_increments():
+    """Test _handle_upload_retry increments retry counter and sleeps asynchronously."""
     client = YouTubeAPIClient('access_token')
 
-    with patch('agoras.platforms.youtube.client.time.sleep'):
-        retry = client._handle_upload_retry(0, "Test error")
+    with patch('agoras.platforms.youtube.client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        retry = await client._handle_upload_retry(0, "Test error")
 
     assert retry == 1
+    mock_sleep.assert_awaited_once()
+    assert 0 <= mock_sleep.await_args[0][0] <= 2
 
 
-def test_youtube_client_handle_upload_retry_max_raises():
+@pytest.mark.asyncio
+async def test_youtube_client_handle_upload_retry_max_raises():
     """Test _handle_upload_retry raises when max retries exceeded."""
     client = YouTubeAPIClient('access_token')
 
     with pytest.raises(Exception, match='No longer attempting to retry'):
-        client._handle_upload_retry(client.MAX_RETRIES, "Test error")
+        await client._handle_upload_retry(client.MAX_RETRIES, "Test error")
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.youtube.client.http.MediaFileUpload')
+async def test_youtube_client_upload_video_retries_transient_errors(mock_media_upload_class, tmp_path):
+    """Test upload_video retries retriable chunk errors without blocking the loop."""
+    video_file = tmp_path / 'video.mp4'
+    video_file.write_bytes(b'video-bytes')
+    mock_request = MagicMock()
+    mock_request.next_chunk.side_effect = [IOError('reset'), (None, {'id': 'video123'})]
+    mock_youtube = MagicMock()
+    mock_youtube.videos.return_value.insert.return_value = mock_request
+
+    client = YouTubeAPIClient('access_token')
+    client.youtube_client = mock_youtube
+
+    with patch('agoras.platforms.youtube.client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        result = await client.upload_video(str(video_file), 'Title', 'Description', '22', 'public')
+
+    assert result == {'id': 'video123'}
+    assert mock_request.next_chunk.call_count == 2
+    mock_sleep.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_youtube_client_like_video_retries_server_errors():
+    """Test like_video retries 503 responses from the API."""
+    failure = errors.HttpError(MagicMock(status=503), b'unavailable')
+    mock_youtube = MagicMock()
+    mock_youtube.videos.return_value.rate.return_value.execute.side_effect = [failure, {}]
+
+    client = YouTubeAPIClient('access_token')
+    client.youtube_client = mock_youtube
+
+    with patch('agoras.core.retry.asyncio.sleep', new_callable=AsyncMock):
+        await client.like_video('video123')
+
+    assert mock_youtube.videos.return_value.rate.return_value.execute.call_count == 2
 
 
 @pytest.mark.asyncio
 @patch('agoras.platforms.youtube.client.http.MediaFileUpload')
-async def test_youtube_client_upload_video_success(mock_media_upload_class):
+async def test_youtube_client_upload_video_success(mock_media_upload_class, tmp_path):
     """Test YouTubeAPIClient upload_video success."""
+    video_file = tmp_path / 'video.mp4'
+    video_file.write_bytes(b'video-bytes')
     mock_media_upload = MagicMock()
     mock_media_upload_class.return_value = mock_media_upload
 
@@ -183,10 +230,138 @@ async def test_youtube_client_upload_video_success(mock_media_upload_class):
     client.youtube_client = mock_youtube_client
     client._authenticated = True
 
-    result = await client.upload_video('video.mp4', 'Title', 'Description', '22', 'public')
+    result = await client.upload_video(str(video_file), 'Title', 'Description', '22', 'public')
 
     assert result == {'id': 'vid123'}
     mock_videos.insert.assert_called_once()
+    assert mock_media_upload_class.call_args[1]['chunksize'] == client.UPLOAD_CHUNK_SIZE
+
+
+def _youtube_with_requests(*requests, channel_id='channel-1'):
+    mock_youtube = MagicMock()
+    mock_youtube.videos.return_value.insert.side_effect = list(requests)
+    mock_youtube.channels.return_value.list.return_value.execute.return_value = {'items': [{'id': channel_id}]}
+    return mock_youtube
+
+
+def _request_failing_after_session_started():
+    request = MagicMock()
+
+    def fail_after_session_started():
+        request.resumable_uri = 'https://upload.youtube.com/session-1'
+        raise errors.HttpError(httplib2.Response({'status': '400'}), b'bad request')
+
+    request.next_chunk.side_effect = fail_after_session_started
+    return request
+
+
+def _resumed_request(status, **headers):
+    request = MagicMock()
+    request.resumable_uri = None
+    request.resumable.size.return_value = 11
+    request.http.request.return_value = (httplib2.Response({'status': str(status), **headers}), b'{}')
+    request.postproc.return_value = {'id': 'vid123'}
+    request.next_chunk.return_value = (None, {'id': 'vid123'})
+    return request
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.youtube.client.http.MediaFileUpload')
+async def test_youtube_client_upload_video_resumes_saved_session(mock_media_upload_class, tmp_path):
+    """Test a failed upload is resumed from its saved upload session by the next attempt."""
+    video_file = tmp_path / 'video.mp4'
+    video_file.write_bytes(b'video-bytes')
+    second_request = _resumed_request(308, range='bytes=0-4')
+
+    client = YouTubeAPIClient('access_token')
+    client.youtube_client = _youtube_with_requests(_request_failing_after_session_started(), second_request)
+    store = KeyValueStore(MEMORY)
+
+    with patch('agoras.core.upload.checkpoint_store', return_value=store):
+        with pytest.raises(errors.HttpError):
+            await client.upload_video(str(video_file), 'Title', 'Description', '22', 'public')
+
+        result = await client.upload_video(str(video_file), 'Title', 'Description', '22', 'public')
+
+    assert result == {'id': 'vid123'}
+    second_request.http.request.assert_called_once_with(
+        'https://upload.youtube.com/session-1', method='PUT', body='',
+        headers={'Content-Range': 'bytes */11', 'Content-Length': '0'},
+    )
+    assert second_request.resumable_uri == 'https://upload.youtube.com/session-1'
+    assert second_request.resumable_progress == 5
+    # Completed uploads leave no checkpoint behind
+    source = UploadSource(str(video_file))
+    checkpoint = UploadCheckpoint.for_upload('youtube', source, 'channel-1', 'Title', '22', 'public', store=store)
+    assert checkpoint.load() == {}
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.youtube.client.http.MediaFileUpload')
+async def test_youtube_client_upload_video_returns_finished_session(mock_media_upload_class, tmp_path):
+    """Test a saved session YouTube already completed returns its video without sending chunks."""
+    video_file = tmp_path / 'video.mp4'
+    video_file.write_bytes(b'video-bytes')
+    second_request = _resumed_request(200)
+
+    client = YouTubeAPIClient('access_token')
+    client.youtube_client = _youtube_with_requests(_request_failing_after_session_started(), second_request)
+
+    with patch('agoras.core.upload.checkpoint_store', return_value=KeyValueStore(MEMORY)):
+        with pytest.raises(errors.HttpError):
+            await client.upload_video(str(video_file), 'Title', 'Description', '22', 'public')
+
+        result = await client.upload_video(str(video_file), 'Title', 'Description', '22', 'public')
+
+    assert result == {'id': 'vid123'}
+    second_request.next_chunk.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.youtube.client.http.MediaFileUpload')
+async def test_youtube_client_upload_video_restarts_when_resume_is_rejected(mock_media_upload_class, tmp_path):
+    """Test any 4xx on resuming drops the saved session and uploads from scratch."""
+    video_file = tmp_path / 'video.mp4'
+    video_file.write_bytes(b'video-bytes')
+    rejected = _resumed_request(403)
+    fresh = _resumed_request(308)
+
+    client = YouTubeAPIClient('access_token')
+    client.youtube_client = _youtube_with_requests(_request_failing_after_session_started(), rejected, fresh)
+
+    with patch('agoras.core.upload.checkpoint_store', return_value=KeyValueStore(MEMORY)):
+        with pytest.raises(errors.HttpError):
+            await client.upload_video(str(video_file), 'Title', 'Description', '22', 'public')
+
+        result = await client.upload_video(str(video_file), 'Title', 'Description', '22', 'public')
+
+    assert result == {'id': 'vid123'}
+    rejected.next_chunk.assert_not_called()
+    fresh.http.request.assert_not_called()
+    fresh.next_chunk.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch('agoras.platforms.youtube.client.http.MediaFileUpload')
+async def test_youtube_client_upload_video_scopes_session_to_channel(mock_media_upload_class, tmp_path):
+    """Test a saved session is only resumed by the channel that started it."""
+    video_file = tmp_path / 'video.mp4'
+    video_file.write_bytes(b'video-bytes')
+    other_request = _resumed_request(308)
+
+    first = YouTubeAPIClient('token-1')
+    first.youtube_client = _youtube_with_requests(_request_failing_after_session_started(), channel_id='channel-1')
+    second = YouTubeAPIClient('token-2')
+    second.youtube_client = _youtube_with_requests(other_request, channel_id='channel-2')
+
+    with patch('agoras.core.upload.checkpoint_store', return_value=KeyValueStore(MEMORY)):
+        with pytest.raises(errors.HttpError):
+            await first.upload_video(str(video_file), 'Title', 'Description', '22', 'public')
+
+        await second.upload_video(str(video_file), 'Title', 'Description', '22', 'public')
+
+    other_request.http.request.assert_not_called()
+    assert other_request.resumable_uri is None
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Measure cold-start import time of Agoras CLI entry points in fresh interpreters."""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# label -> Python snippet executed in a fresh interpreter
+SCENARIOS = {
+    "cli.main": "import agoras.cli.main",
+    "--version parser": (
+        "from agoras.cli.main import commandline\ntry:\n    commandline(['--version'])\nexcept SystemExit:\n    pass"
+    ),
+    "utils tokens parser": "from agoras.cli.main import commandline\ncommandline(['utils', 'tokens', 'list'])",
+    "x wrapper": "from agoras.cli.main import commandline\nimport agoras.platforms.x.wrapper",
+    "all platforms": (
+        "import agoras.platforms\nfor name in agoras.platforms.__all__:\n    getattr(agoras.platforms, name)"
+    ),
+}
+
+HEAVY_MODULES = ("tweepy", "discord", "telegram", "googleapiclient", "gspread", "cv2", "PIL", "pyfacebook")
+
+
+def measure(snippet: str) -> tuple[float, list[str]]:
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{snippet}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = [name for name in {HEAVY_MODULES!r} if name in sys.modules]\n"
+        "print(elapsed)\n"
+        "print(','.join(heavy))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    elapsed, heavy = result.stdout.splitlines()[-2:]
+    return float(elapsed), [name for name in heavy.split(",") if name]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per scenario (default: 5)")
+    args = parser.parse_args(argv)
+
+    print(f"{'scenario':22} {'median':>9} {'min':>9}  heavy modules loaded")
+    for label, snippet in SCENARIOS.items():
+        timings = []
+        heavy: list[str] = []
+        for _ in range(args.runs):
+            elapsed, heavy = measure(snippet)
+            timings.append(elapsed)
+        print(
+            f"{label:22} {statistics.median(timings) * 1000:7.1f}ms {min(timings) * 1000:7.1f}ms  "
+            f"{', '.join(heavy) or '-'}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())